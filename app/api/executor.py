@@ -0,0 +1,300 @@
+"""Compute executor for the async API endpoints.
+
+Handlers are ``async def`` but data loading, signal generation and backtests
+are blocking. Run inline, they stall the event loop, so one slow ranking
+request delays every other client (including /health). ComputeExecutor
+moves that work off the loop:
+
+- run_io(): bounded thread pool, for DataStore reads, SQLite and services
+- run_cpu(): process pool, for backtests (the function and its arguments
+  must be picklable, i.e. module-level)
+- process_pool(): the same process pool, for services that fan their own
+  tasks out (e.g. the global ranking grid) instead of starting a pool per call
+
+Every call is tagged with an endpoint name. Each endpoint has a concurrency
+limit and a queue bound: calls beyond the limit wait for a slot, calls beyond
+the queue bound are rejected with 503, and calls that exceed their timeout
+(waiting included) fail with 504. Work that has already started keeps its
+slot until it finishes, so a timeout never lets more than the limit run.
+
+Usage:
+    @router.post("/run")
+    async def run_backtest(request: BacktestRequest):
+        executor = get_compute_executor()
+        df = await executor.run_io("backtest", load_bars, request.symbol)
+        result = await executor.run_cpu("backtest", run_engine, df, config)
+"""
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+# Concurrent calls allowed per endpoint (others use the default limit)
+ENDPOINT_LIMITS: Dict[str, int] = {
+    "backtest": 2,
+    "global_ranking": 1,
+    "recommendation": 2,
+    "strategy_ranking": 2,
+}
+
+
+class _EndpointState:
+    """Concurrency slot and counters of one endpoint."""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+    
+    def get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Get the slot semaphore bound to the running loop."""
+        if self.semaphore is None or self.loop is not loop:
+            self.semaphore = asyncio.Semaphore(self.limit)
+            self.loop = loop
+        return self.semaphore
+
+
+class ComputeExecutor:
+    """Thread and process pools behind the async endpoints."""
+    
+    def __init__(
+        self,
+        io_workers: int = 16,
+        cpu_workers: int = 0,
+        default_limit: int = 4,
+        max_queue: int = 32,
+        timeout: float = 120.0,
+        endpoint_limits: Optional[Dict[str, int]] = None
+    ):
+        """Initialize compute executor.
+        
+        Args:
+            io_workers: Threads for blocking I/O and service calls
+            cpu_workers: Processes for backtests (0 = all cores)
+            default_limit: Concurrent calls per endpoint without an explicit limit
+            max_queue: Calls allowed to wait for a slot per endpoint
+            timeout: Default seconds before a call fails with 504
+            endpoint_limits: Per-endpoint concurrency limits
+        """
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.default_limit = default_limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.endpoint_limits = dict(ENDPOINT_LIMITS if endpoint_limits is None else endpoint_limits)
+        
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._endpoints: Dict[str, _EndpointState] = {}
+        self._pending = {'io': 0, 'cpu': 0}
+        self._lock = threading.Lock()
+    
+    def _pool(self, kind: str) -> Executor:
+        """Get (creating on first use) the thread or process pool."""
+        with self._lock:
+            if kind == 'io':
+                if self._io_pool is None:
+                    self._io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="api-io")
+                return self._io_pool
+            if self._cpu_pool is None:
+                self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+            return self._cpu_pool
+    
+    def process_pool(self) -> Executor:
+        """Get the process pool shared by run_cpu() and services submitting to it directly."""
+        return self._pool('cpu')
+    
+    def _endpoint(self, name: str) -> _EndpointState:
+        """Get the state of an endpoint."""
+        state = self._endpoints.get(name)
+        if state is None:
+            state = _EndpointState(self.endpoint_limits.get(name, self.default_limit))
+            self._endpoints[name] = state
+        return state
+    
+    async def run_io(self, endpoint: str, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run a blocking call in the thread pool.
+        
+        Args:
+            endpoint: Endpoint name (concurrency limit and metrics key)
+            func: Blocking function
+            *args: Positional arguments for func
+            timeout: Seconds before failing with 504 (default: executor timeout)
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Return value of func
+        """
+        return await self._run(endpoint, 'io', func, args, kwargs, timeout)
+    
+    async def run_cpu(self, endpoint: str, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run a CPU-bound call in the process pool.
+        
+        Args:
+            endpoint: Endpoint name (concurrency limit and metrics key)
+            func: Module-level function (must be picklable, as must its arguments)
+            *args: Positional arguments for func
+            timeout: Seconds before failing with 504 (default: executor timeout)
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Return value of func
+        """
+        return await self._run(endpoint, 'cpu', func, args, kwargs, timeout)
+    
+    async def _run(
+        self,
+        endpoint: str,
+        kind: str,
+        func: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        timeout: Optional[float]
+    ) -> Any:
+        """Wait for an endpoint slot, then run func in the given pool."""
+        loop = asyncio.get_running_loop()
+        state = self._endpoint(endpoint)
+        semaphore = state.get_semaphore(loop)
+        timeout = self.timeout if timeout is None else timeout
+        deadline = loop.time() + timeout
+        
+        # Reject once every slot is taken and max_queue calls are waiting
+        if state.active + state.waiting >= state.limit + self.max_queue:
+            state.rejected += 1
+            raise HTTPException(status_code=503, detail=f"Too many queued {endpoint} requests, try again later")
+        
+        state.waiting += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            state.timeouts += 1
+            raise HTTPException(status_code=504, detail=f"Timed out waiting for a {endpoint} worker")
+        finally:
+            state.waiting -= 1
+        
+        started = time.perf_counter()
+        try:
+            future = self._pool(kind).submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+        
+        state.active += 1
+        with self._lock:
+            self._pending[kind] += 1
+        
+        def on_done(done: Future):
+            # Called from a worker or pool management thread
+            try:
+                loop.call_soon_threadsafe(self._release, state, semaphore, kind, done, started)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+        
+        future.add_done_callback(on_done)
+        
+        # Mark late results and errors as retrieved once nobody awaits them
+        wrapped = asyncio.wrap_future(future)
+        wrapped.add_done_callback(lambda done: done.cancelled() or done.exception())
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(wrapped), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            state.timeouts += 1
+            # Drops the call if it has not started; running work keeps its slot
+            future.cancel()
+            logger.warning(f"{endpoint} call exceeded {timeout:.0f}s timeout")
+            raise HTTPException(status_code=504, detail=f"{endpoint} request timed out after {timeout:.0f}s")
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+    
+    def _release(
+        self,
+        state: _EndpointState,
+        semaphore: asyncio.Semaphore,
+        kind: str,
+        future: Future,
+        started: float
+    ) -> None:
+        """Free the endpoint slot of a finished call (runs on the event loop)."""
+        state.active -= 1
+        state.busy_seconds += time.perf_counter() - started
+        if future.cancelled() or future.exception() is not None:
+            state.failed += 1
+        else:
+            state.completed += 1
+        
+        with self._lock:
+            self._pending[kind] -= 1
+        semaphore.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get pool and per-endpoint queue statistics."""
+        with self._lock:
+            pending = dict(self._pending)
+        
+        endpoints = {}
+        for name, state in self._endpoints.items():
+            finished = state.completed + state.failed
+            endpoints[name] = {
+                'limit': state.limit,
+                'active': state.active,
+                'queued': state.waiting,
+                'completed': state.completed,
+                'failed': state.failed,
+                'timeouts': state.timeouts,
+                'rejected': state.rejected,
+                'avg_seconds': state.busy_seconds / finished if finished > 0 else 0.0
+            }
+        
+        return {
+            'io': {'workers': self.io_workers, 'pending': pending['io']},
+            'cpu': {'workers': self.cpu_workers, 'pending': pending['cpu']},
+            'endpoints': endpoints
+        }
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down both pools (pending calls are cancelled)."""
+        with self._lock:
+            pools = [self._io_pool, self._cpu_pool]
+            self._io_pool = None
+            self._cpu_pool = None
+        
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global instance
+_compute_executor = None
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Get global compute executor instance."""
+    global _compute_executor
+    if _compute_executor is None:
+        from app.config.settings import settings
+        _compute_executor = ComputeExecutor(
+            io_workers=settings.API_IO_WORKERS,
+            cpu_workers=settings.API_CPU_WORKERS,
+            default_limit=settings.API_ENDPOINT_CONCURRENCY,
+            max_queue=settings.API_MAX_QUEUED_REQUESTS,
+            timeout=settings.API_REQUEST_TIMEOUT
+        )
+    return _compute_executor
@@ -11,6 +11,9 @@ import logging
 import json
 import pandas as pd
 
+from app.api.executor import get_compute_executor
+from app.config.settings import settings
+from app.core.job_queue import Job, ProgressCallback, get_job_queue
 from app.research.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult
 from app.data import DataStore, DataFetcher
 from app.research.signals import generate_signal, get_strategy_list
@@ -44,6 +47,48 @@ def get_data_fetcher() -> DataFetcher:
     return data_fetcher
 
 
+def _load_bars(
+    symbol: str,
+    timeframe: str,
+    since: Optional[datetime],
+    until: Optional[datetime]
+) -> Optional[pd.DataFrame]:
+    """Read bars as a DataFrame sorted by timestamp (None when there are none)."""
+    df = get_data_store().read_bars(
+        symbol=symbol,
+        timeframe=timeframe,
+        since=since,
+        until=until
+    )
+    
+    if df is None or len(df) == 0:
+        return None
+    
+    # Convert to DataFrame if needed
+    if isinstance(df, list):
+        df = pd.DataFrame([bar.to_dict() for bar in df])
+        df = df.sort_values('timestamp').reset_index(drop=True)
+    
+    return df
+
+
+def _run_strategy_backtest(
+    df: pd.DataFrame,
+    strategy: str,
+    config: BacktestConfig
+) -> Optional[BacktestResult]:
+    """Generate signals and run the engine (runs in the compute process pool).
+    
+    Returns None when the strategy produces no signals.
+    """
+    signal_output = generate_signal(normalize_strategy_name(strategy), df)
+    if signal_output is None or signal_output.signal.empty:
+        return None
+    
+    engine = BacktestEngine(config)
+    return engine.run(df, signal_output.signal, strategy, verbose=False)
+
+
 class BacktestRequest(BaseModel):
     """Request model for backtest execution."""
     
@@ -120,10 +165,114 @@ class BacktestResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
 
 
+def _backtest_config(request: BacktestRequest) -> BacktestConfig:
+    """Build the engine configuration of a backtest request."""
+    return BacktestConfig(
+        initial_capital=request.initial_capital,
+        risk_per_trade=request.risk_per_trade,
+        commission=request.commission,
+        slippage=request.slippage,
+        use_trading_windows=request.use_trading_windows,
+        force_close=request.force_close,
+        one_trade_per_day=request.one_trade_per_day,
+        atr_sl_multiplier=request.atr_sl_multiplier,
+        atr_tp_multiplier=request.atr_tp_multiplier,
+        atr_period=request.atr_period
+    )
+
+
+def _build_response(
+    request: BacktestRequest,
+    result: BacktestResult,
+    execution_time: float,
+    created_at: datetime
+) -> BacktestResponse:
+    """Build the API response of a finished backtest."""
+    return BacktestResponse(
+        success=True,
+        symbol=request.symbol,
+        timeframe=request.timeframe,
+        strategy=request.strategy,
+        
+        # Performance metrics
+        total_return=result.total_return,
+        cagr=result.cagr,
+        sharpe_ratio=result.sharpe_ratio,
+        max_drawdown=result.max_drawdown,
+        win_rate=result.win_rate,
+        profit_factor=result.profit_factor,
+        expectancy=result.expectancy,
+        
+        # Trade statistics
+        total_trades=result.total_trades,
+        winning_trades=result.winning_trades,
+        losing_trades=result.losing_trades,
+        avg_win=result.avg_win,
+        avg_loss=result.avg_loss,
+        
+        # Risk metrics
+        volatility=result.volatility,
+        calmar_ratio=result.calmar_ratio,
+        sortino_ratio=result.sortino_ratio,
+        
+        # Capital
+        initial_capital=result.initial_capital,
+        final_capital=result.final_capital,
+        profit=result.profit,
+        
+        # Period
+        from_date=datetime.fromtimestamp(result.from_timestamp / 1000, tz=timezone.utc),
+        to_date=datetime.fromtimestamp(result.to_timestamp / 1000, tz=timezone.utc),
+        
+        # Data integrity
+        dataset_hash=result.dataset_hash,
+        params_hash=result.params_hash,
+        
+        # Trades data
+        trades=result.trades,
+        
+        # Metadata
+        execution_time=execution_time,
+        created_at=created_at
+    )
+
+
+def run_backtest_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Run a backtest as a background job (see POST /backtest/jobs).
+    
+    Args:
+        params: BacktestRequest fields
+        progress: Job progress callback
+    
+    Returns:
+        BacktestResponse as a JSON-serializable dict
+    """
+    start_time = datetime.utcnow()
+    request = BacktestRequest(**params)
+    
+    progress(0.1, f"Loading {request.symbol} {request.timeframe} data")
+    df = _load_bars(request.symbol, request.timeframe, request.from_date, request.to_date)
+    if df is None:
+        raise ValueError(f"No data found for {request.symbol} {request.timeframe}")
+    
+    progress(0.3, f"Running {request.strategy} backtest on {len(df)} bars")
+    result = _run_strategy_backtest(df, request.strategy, _backtest_config(request))
+    if result is None:
+        raise ValueError(f"No signals generated for strategy {request.strategy}")
+    if result.total_trades == 0:
+        raise ValueError(f"No trades executed for {request.strategy}")
+    
+    execution_time = (datetime.utcnow() - start_time).total_seconds()
+    return _build_response(request, result, execution_time, start_time).model_dump(mode='json')
+
+
 @router.post("/run", response_model=BacktestResponse)
 async def run_backtest(request: BacktestRequest):
     """Run unified backtest using the same engine as UI.
     
+    Waits up to settings.API_BACKTEST_TIMEOUT; long backtests should go
+    through POST /backtest/jobs.
+    
     Args:
         request: Backtest request parameters
         
@@ -135,57 +284,32 @@ async def run_backtest(request: BacktestRequest):
     try:
         logger.info(f"Starting backtest for {request.symbol} {request.timeframe} with {request.strategy}")
         
-        # Get data store
-        store = get_data_store()
+        executor = get_compute_executor()
         
-        # Load data
-        df = store.read_bars(
-            symbol=request.symbol,
-            timeframe=request.timeframe,
-            since=request.from_date,
-            until=request.to_date
+        # Load data (thread pool)
+        df = await executor.run_io(
+            "backtest", _load_bars, request.symbol, request.timeframe, request.from_date, request.to_date
         )
         
-        if not df:
+        if df is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"No data found for {request.symbol} {request.timeframe}"
             )
         
-        # Convert to DataFrame if needed
-        if isinstance(df, list):
-            df = pd.DataFrame([bar.to_dict() for bar in df])
-            df = df.sort_values('timestamp').reset_index(drop=True)
+        config = _backtest_config(request)
         
-        # Normalize strategy name
-        normalized_strategy = normalize_strategy_name(request.strategy)
-        
-        # Generate signals
-        signal_output = generate_signal(normalized_strategy, df)
-        if signal_output is None or signal_output.signal.empty:
+        # Generate signals and run backtest (process pool)
+        result = await executor.run_cpu(
+            "backtest", _run_strategy_backtest, df, request.strategy, config,
+            timeout=settings.API_BACKTEST_TIMEOUT
+        )
+        if result is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"No signals generated for strategy {request.strategy}"
             )
         
-        # Create backtest configuration
-        config = BacktestConfig(
-            initial_capital=request.initial_capital,
-            risk_per_trade=request.risk_per_trade,
-            commission=request.commission,
-            slippage=request.slippage,
-            use_trading_windows=request.use_trading_windows,
-            force_close=request.force_close,
-            one_trade_per_day=request.one_trade_per_day,
-            atr_sl_multiplier=request.atr_sl_multiplier,
-            atr_tp_multiplier=request.atr_tp_multiplier,
-            atr_period=request.atr_period
-        )
-        
-        # Run backtest
-        engine = BacktestEngine(config)
-        result = engine.run(df, signal_output.signal, request.strategy, verbose=False)
-        
         if not result or result.total_trades == 0:
             raise HTTPException(
                 status_code=400,
@@ -195,54 +319,7 @@ async def run_backtest(request: BacktestRequest):
         # Calculate execution time
         execution_time = (datetime.utcnow() - start_time).total_seconds()
         
-        # Create response
-        response = BacktestResponse(
-            success=True,
-            symbol=request.symbol,
-            timeframe=request.timeframe,
-            strategy=request.strategy,
-            
-            # Performance metrics
-            total_return=result.total_return,
-            cagr=result.cagr,
-            sharpe_ratio=result.sharpe_ratio,
-            max_drawdown=result.max_drawdown,
-            win_rate=result.win_rate,
-            profit_factor=result.profit_factor,
-            expectancy=result.expectancy,
-            
-            # Trade statistics
-            total_trades=result.total_trades,
-            winning_trades=result.winning_trades,
-            losing_trades=result.losing_trades,
-            avg_win=result.avg_win,
-            avg_loss=result.avg_loss,
-            
-            # Risk metrics
-            volatility=result.volatility,
-            calmar_ratio=result.calmar_ratio,
-            sortino_ratio=result.sortino_ratio,
-            
-            # Capital
-            initial_capital=result.initial_capital,
-            final_capital=result.final_capital,
-            profit=result.profit,
-            
-            # Period
-            from_date=datetime.fromtimestamp(result.from_timestamp / 1000, tz=timezone.utc),
-            to_date=datetime.fromtimestamp(result.to_timestamp / 1000, tz=timezone.utc),
-            
-            # Data integrity
-            dataset_hash=result.dataset_hash,
-            params_hash=result.params_hash,
-            
-            # Trades data
-            trades=result.trades,
-            
-            # Metadata
-            execution_time=execution_time,
-            created_at=start_time
-        )
+        response = _build_response(request, result, execution_time, start_time)
         
         logger.info(f"Backtest completed: {result.total_trades} trades, Sharpe={result.sharpe_ratio:.2f}")
         return response
@@ -254,6 +331,30 @@ async def run_backtest(request: BacktestRequest):
         raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
 
 
+@router.post("/jobs", response_model=Job, status_code=202)
+async def submit_backtest_job(request: BacktestRequest):
+    """Queue a backtest and return its job immediately.
+    
+    Poll GET /jobs/{job_id} or stream GET /jobs/{job_id}/events for
+    progress; the result is the same as POST /backtest/run returns.
+    
+    Args:
+        request: Backtest request parameters
+    
+    Returns:
+        The queued job
+    """
+    try:
+        return await get_compute_executor().run_io(
+            "jobs", get_job_queue().submit, "backtest", run_backtest_job, request.model_dump(mode='json')
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queueing backtest job: {e}")
+        raise HTTPException(status_code=500, detail=f"Error queueing backtest: {str(e)}")
+
+
 @router.get("/strategies")
 async def get_available_strategies():
     """Get list of available strategies.
@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 import logging
 
 from app.data import DataFetcher, DataStore, DataSyncRequest, DataSyncResponse, DatasetMetadata
+from app.data.frame_cache import get_frame_cache, invalidate_frames
+from app.research.backtest.result_cache import get_backtest_cache
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,7 @@ async def sync_data(request: DataSyncRequest, background_tasks: BackgroundTasks)
             
             # Store data
             metadata = store.write_bars(bars)
+            invalidate_frames(request.symbol, request.tf)
             
             logger.info(f"Successfully synced {request.symbol} {request.tf}: {len(bars)} bars")
             return DataSyncResponse(
@@ -184,7 +187,9 @@ async def health_check() -> Dict[str, Any]:
             "data_store": {
                 "path": str(store.base_path),
                 "db_path": str(store.db_path)
-            }
+            },
+            "frame_cache": get_frame_cache().stats(),
+            "backtest_cache": get_backtest_cache().stats()
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -8,7 +8,10 @@ from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from pydantic import BaseModel, Field
 import logging
 
-from app.service.global_ranking import GlobalRankingService, GlobalRankingConfig
+from app.api.executor import get_compute_executor
+from app.config.settings import settings
+from app.core.job_queue import Job, ProgressCallback, get_job_queue
+from app.service.global_ranking import GlobalRankingService, GlobalRankingConfig, GlobalRankingResult
 from app.jobs.global_ranking_job import GlobalRankingJob
 
 logger = logging.getLogger(__name__)
@@ -57,13 +60,59 @@ class RankingResponse(BaseModel):
     best_strategy: Optional[str] = Field(None, description="Best strategy name")
     best_score: Optional[float] = Field(None, description="Best strategy score")
     rankings: List[Dict[str, Any]] = Field(default_factory=list, description="Strategy rankings")
-    consolidated_metrics: Dict[str, float] = Field(default_factory=dict, description="Consolidated metrics")
+    consolidated_metrics: Dict[str, Any] = Field(default_factory=dict, description="Consolidated metrics")
+
+
+def _build_response(request: RankingRequest, result: GlobalRankingResult) -> RankingResponse:
+    """Build the API response of a finished global ranking."""
+    return RankingResponse(
+        success=True,
+        symbol=request.symbol,
+        date=request.date or datetime.now().strftime("%Y-%m-%d"),
+        total_strategies=result.total_strategies,
+        valid_strategies=result.valid_strategies,
+        execution_time=result.execution_time,
+        best_strategy=result.consolidated_metrics.get('best_strategy'),
+        best_score=result.consolidated_metrics.get('best_score'),
+        rankings=result.rankings,
+        consolidated_metrics=result.consolidated_metrics
+    )
+
+
+def run_global_ranking_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Run a global ranking as a background job (see POST /global-ranking/jobs).
+    
+    Args:
+        params: RankingRequest fields
+        progress: Job progress callback
+    
+    Returns:
+        RankingResponse as a JSON-serializable dict
+    """
+    request = RankingRequest(**params)
+    
+    def backtest_progress(fraction: float, message: str):
+        # Backtests are most of the work; ranking and saving take the rest
+        progress(0.05 + 0.9 * fraction, message)
+    
+    progress(0.05, f"Ranking strategies for {request.symbol}")
+    result = get_ranking_service().run_global_ranking(
+        symbol=request.symbol,
+        date=request.date,
+        executor=get_compute_executor().process_pool(),
+        progress=backtest_progress
+    )
+    
+    return _build_response(request, result).model_dump(mode='json')
 
 
 @router.post("/run", response_model=RankingResponse)
 async def run_global_ranking(request: RankingRequest):
     """Run global ranking for a symbol.
     
+    Waits up to settings.API_GLOBAL_RANKING_TIMEOUT; rankings that take
+    longer should go through POST /global-ranking/jobs.
+    
     Args:
         request: Ranking request parameters
         
@@ -75,35 +124,55 @@ async def run_global_ranking(request: RankingRequest):
         
         # Get ranking service
         service = get_ranking_service()
+        compute = get_compute_executor()
         
-        # Run global ranking
-        result = service.run_global_ranking(
+        # Run global ranking (off the event loop, one at a time); backtests
+        # go to the executor's long-lived process pool
+        result = await compute.run_io(
+            "global_ranking",
+            service.run_global_ranking,
             symbol=request.symbol,
-            date=request.date
+            date=request.date,
+            executor=compute.process_pool(),
+            timeout=settings.API_GLOBAL_RANKING_TIMEOUT
         )
         
-        # Create response
-        response = RankingResponse(
-            success=True,
-            symbol=request.symbol,
-            date=request.date or datetime.now().strftime("%Y-%m-%d"),
-            total_strategies=result.total_strategies,
-            valid_strategies=result.valid_strategies,
-            execution_time=result.execution_time,
-            best_strategy=result.consolidated_metrics.get('best_strategy'),
-            best_score=result.consolidated_metrics.get('best_score'),
-            rankings=result.rankings,
-            consolidated_metrics=result.consolidated_metrics
-        )
+        response = _build_response(request, result)
         
         logger.info(f"Global ranking completed: {result.valid_strategies} valid strategies")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in global ranking: {e}")
         raise HTTPException(status_code=500, detail=f"Global ranking failed: {str(e)}")
 
 
+@router.post("/jobs", response_model=Job, status_code=202)
+async def submit_global_ranking_job(request: RankingRequest):
+    """Queue a global ranking and return its job immediately.
+    
+    Poll GET /jobs/{job_id} or stream GET /jobs/{job_id}/events for
+    progress; the result is the same as POST /global-ranking/run returns.
+    
+    Args:
+        request: Ranking request parameters
+    
+    Returns:
+        The queued job
+    """
+    try:
+        return await get_compute_executor().run_io(
+            "jobs", get_job_queue().submit, "global_ranking", run_global_ranking_job, request.model_dump(mode='json')
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queueing global ranking job: {e}")
+        raise HTTPException(status_code=500, detail=f"Error queueing global ranking: {str(e)}")
+
+
 @router.get("/rankings/{symbol}")
 async def get_daily_rankings(
     symbol: str,
@@ -125,7 +194,7 @@ async def get_daily_rankings(
             date = datetime.now().strftime("%Y-%m-%d")
         
         service = get_ranking_service()
-        rankings = service.get_daily_rankings(symbol, date)
+        rankings = await get_compute_executor().run_io("global_ranking_read", service.get_daily_rankings, symbol, date)
         
         if not rankings:
             raise HTTPException(
@@ -169,7 +238,7 @@ async def get_consolidated_metrics(
             date = datetime.now().strftime("%Y-%m-%d")
         
         service = get_ranking_service()
-        metrics = service.get_consolidated_metrics(symbol, date)
+        metrics = await get_compute_executor().run_io("global_ranking_read", service.get_consolidated_metrics, symbol, date)
         
         if not metrics:
             raise HTTPException(
@@ -207,7 +276,7 @@ async def get_top_strategies(
             date = datetime.now().strftime("%Y-%m-%d")
         
         job = get_ranking_job()
-        top_strategies = job.get_top_strategies(symbol, date, limit)
+        top_strategies = await get_compute_executor().run_io("global_ranking_read", job.get_top_strategies, symbol, date, limit)
         
         if not top_strategies:
             raise HTTPException(
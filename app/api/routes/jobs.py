@@ -0,0 +1,143 @@
+"""Background job API endpoints for One Market platform.
+
+Long-running work is submitted to the job queue by the owning router
+(POST /backtest/jobs, POST /global-ranking/jobs). These endpoints poll,
+stream, list and cancel those jobs.
+"""
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+import logging
+
+from app.api.executor import get_compute_executor
+from app.core.job_queue import Job, JobStatus, get_job_queue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Seconds between progress checks of an event stream
+EVENT_POLL_INTERVAL = 0.5
+
+
+def _format_event(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("")
+async def list_jobs(
+    kind: Optional[str] = Query(None, description="Job kind (backtest, global_ranking)"),
+    status: Optional[JobStatus] = Query(None, description="Job status"),
+    limit: int = Query(50, ge=1, le=500, description="Number of jobs to return")
+):
+    """List recent jobs, newest first (without results).
+    
+    Args:
+        kind: Only jobs of this kind
+        status: Only jobs in this status
+        limit: Number of jobs to return
+    
+    Returns:
+        Jobs and queue statistics
+    """
+    try:
+        queue = get_job_queue()
+        jobs = await get_compute_executor().run_io("jobs", queue.list_jobs, kind, status, limit)
+        
+        return {
+            "jobs": [job.model_dump(mode='json') for job in jobs],
+            "count": len(jobs),
+            "queue": queue.stats()
+        }
+    
+    except Exception as e:
+        logger.error(f"Error listing jobs: {e}")
+        raise HTTPException(status_code=500, detail=f"Error listing jobs: {str(e)}")
+
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(job_id: str):
+    """Get a job's status, progress and (once finished) result.
+    
+    Args:
+        job_id: Job identifier
+    
+    Returns:
+        The job
+    """
+    job = await get_compute_executor().run_io("jobs", get_job_queue().get, job_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or expired")
+    
+    return job
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Stream job progress as server-sent events.
+    
+    Sends a ``progress`` event whenever status, progress or message change
+    and a final ``done`` event with the complete job, then closes.
+    
+    Args:
+        job_id: Job identifier
+    
+    Returns:
+        text/event-stream response
+    """
+    queue = get_job_queue()
+    executor = get_compute_executor()
+    
+    if await executor.run_io("jobs", queue.get, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or expired")
+    
+    async def events():
+        last_state = None
+        while True:
+            job = await executor.run_io("jobs", queue.get, job_id)
+            if job is None:
+                yield _format_event("error", {"job_id": job_id, "detail": "Job not found or expired"})
+                return
+            
+            state = (job.status, job.progress, job.message)
+            if state != last_state:
+                last_state = state
+                yield _format_event("progress", job.model_dump(mode='json', exclude={'params', 'result'}))
+            
+            if job.is_finished:
+                yield _format_event("done", job.model_dump(mode='json'))
+                return
+            
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a job that has not started yet.
+    
+    Args:
+        job_id: Job identifier
+    
+    Returns:
+        Cancellation status
+    """
+    queue = get_job_queue()
+    
+    if queue.cancel(job_id):
+        return {"job_id": job_id, "status": JobStatus.CANCELLED.value}
+    
+    job = await get_compute_executor().run_io("jobs", queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or expired")
+    
+    raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status.value} and cannot be cancelled")
@@ -4,11 +4,12 @@ This module provides endpoints for daily recommendations and
 recommendation history.
 """
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 import logging
 
+from app.api.executor import get_compute_executor
 from app.service.daily_recommendation import DailyRecommendationService
 from app.service.recommendation_contract import Recommendation, RecommendationRequest, RecommendationResponse
 
@@ -28,6 +29,46 @@ def get_recommendation_service() -> DailyRecommendationService:
     return recommendation_service
 
 
+def _build_daily_recommendation(
+    symbol: str,
+    date: str,
+    capital: float,
+    risk_percentage: float,
+    include_freshness: bool,
+    use_strategy_ranking: bool
+) -> Tuple[Recommendation, Optional[Dict[str, Any]]]:
+    """Generate a recommendation and optional freshness check (blocking)."""
+    # Get service with custom parameters
+    service = DailyRecommendationService(capital=capital, max_risk_pct=risk_percentage)
+    
+    # Generate recommendation using the main method with real engines
+    recommendation = service.get_daily_recommendation(
+        symbol=symbol,
+        date=date,
+        timeframes=["1h", "4h", "1d"],
+        use_strategy_ranking=use_strategy_ranking
+    )
+    
+    freshness_check = None
+    if include_freshness:
+        freshness_check = service._validate_data_freshness(symbol, date, ["1h", "4h", "1d"])
+    
+    return recommendation, freshness_check
+
+
+def _generate_recommendation(request: RecommendationRequest) -> Recommendation:
+    """Generate a recommendation with custom parameters (blocking)."""
+    service = DailyRecommendationService(
+        capital=request.capital,
+        max_risk_pct=request.risk_percentage
+    )
+    return service.get_daily_recommendation(
+        request.symbol, 
+        request.date,
+        request.timeframes
+    )
+
+
 @router.get("/daily")
 async def get_daily_recommendation(
     symbol: str = Query(..., description="Trading symbol"),
@@ -64,15 +105,11 @@ async def get_daily_recommendation(
                 detail="Invalid date format. Use YYYY-MM-DD"
             )
         
-        # Get service with custom parameters
-        service = DailyRecommendationService(capital=capital, max_risk_pct=risk_percentage)
-        
-        # Generate recommendation using the main method with real engines
-        recommendation = service.get_daily_recommendation(
-            symbol=symbol,
-            date=date,
-            timeframes=["1h", "4h", "1d"],
-            use_strategy_ranking=use_strategy_ranking
+        # Generate recommendation (and freshness check) off the event loop
+        recommendation, freshness_check = await get_compute_executor().run_io(
+            "recommendation",
+            _build_daily_recommendation,
+            symbol, date, capital, risk_percentage, include_freshness, use_strategy_ranking
         )
         
         # Add freshness validation if requested
@@ -88,7 +125,6 @@ async def get_daily_recommendation(
         }
 
         if include_freshness:
-            freshness_check = service._validate_data_freshness(symbol, date, ["1h", "4h", "1d"])
             response_data["data_freshness"] = freshness_check
             
             # Check if data refresh was needed and executed
@@ -168,7 +204,9 @@ async def get_recommendation_history(
         service = get_recommendation_service()
         
         # Get history
-        recommendations = service.get_recommendation_history(symbol, from_date, to_date)
+        recommendations = await get_compute_executor().run_io(
+            "recommendation_read", service.get_recommendation_history, symbol, from_date, to_date
+        )
         
         logger.info(f"Retrieved {len(recommendations)} recommendations for {symbol} from {from_date} to {to_date}")
         return recommendations
@@ -191,18 +229,8 @@ async def generate_recommendation(request: RecommendationRequest):
         RecommendationResponse with results
     """
     try:
-        # Get service with custom parameters
-        service = DailyRecommendationService(
-            capital=request.capital,
-            max_risk_pct=request.risk_percentage
-        )
-        
-        # Generate recommendation
-        recommendation = service.get_daily_recommendation(
-            request.symbol, 
-            request.date,
-            request.timeframes
-        )
+        # Generate recommendation off the event loop
+        recommendation = await get_compute_executor().run_io("recommendation", _generate_recommendation, request)
         
         # Calculate data quality metrics
         data_quality = {
@@ -223,6 +251,8 @@ async def generate_recommendation(request: RecommendationRequest):
             analysis_time=analysis_time
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating recommendation: {e}")
         return RecommendationResponse(
@@ -252,7 +282,9 @@ async def get_recommendation_stats(symbol: str):
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
         
-        recommendations = service.get_recommendation_history(symbol, start_date, end_date)
+        recommendations = await get_compute_executor().run_io(
+            "recommendation_read", service.get_recommendation_history, symbol, start_date, end_date
+        )
         
         if not recommendations:
             return {
@@ -100,6 +100,10 @@ class Settings(BaseSettings):
     MAX_RETRY_ATTEMPTS: int = Field(default=3, ge=1, description="Max retry attempts for failed requests")
     RETRY_BACKOFF_FACTOR: float = Field(default=2.0, description="Exponential backoff factor")
     
+    # Scheduled job fan-out (update data, daily ranking)
+    DATA_SYNC_CONCURRENCY: int = Field(default=4, ge=1, description="Symbol/timeframe syncs run at once by the update data job")
+    RANKING_SYMBOL_CONCURRENCY: int = Field(default=4, ge=1, description="Symbols ranked at once by the daily ranking job")
+    
     # Data validation
     ALLOW_GAPS: bool = Field(default=True, description="Allow temporal gaps in data")
     MAX_GAP_TOLERANCE: int = Field(default=2, description="Max allowed gap multiplier for timeframe")
@@ -109,6 +113,20 @@ class Settings(BaseSettings):
     PARQUET_COMPRESSION: str = Field(default="snappy", description="Parquet compression codec")
     SCHEMA_VERSION: str = Field(default="1.0", description="Current schema version")
     
+    # In-memory OHLCV frame cache (shared by all services in the process)
+    FRAME_CACHE_ENABLED: bool = Field(default=True, description="Cache Parquet partitions in memory")
+    FRAME_CACHE_MAX_BYTES: int = Field(default=512 * 1024 * 1024, ge=0, description="Frame cache memory budget (bytes)")
+    
+    # Shared SQLite connections (service databases)
+    SQLITE_WAL_ENABLED: bool = Field(default=True, description="Use write-ahead logging for SQLite databases")
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(default=5000, ge=0, description="Wait on a locked SQLite database (ms)")
+    SQLITE_CACHE_KB: int = Field(default=16384, ge=0, description="SQLite page cache per connection (KiB)")
+    
+    # Backtest result cache (content-addressed, shared by all services)
+    BACKTEST_CACHE_ENABLED: bool = Field(default=True, description="Reuse results of identical backtests")
+    BACKTEST_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, ge=0, description="Backtest results kept in memory (bytes)")
+    BACKTEST_CACHE_DISK_MAX_BYTES: int = Field(default=1024 * 1024 * 1024, ge=0, description="Backtest results kept on disk (bytes)")
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FORMAT: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -121,6 +139,15 @@ class Settings(BaseSettings):
     API_PORT: int = Field(default=8000, description="API port")
     API_RELOAD: bool = Field(default=False, description="Auto-reload on code changes")
     API_WORKERS: int = Field(default=1, description="Number of worker processes")
+    API_IO_WORKERS: int = Field(default=16, ge=1, description="Threads for blocking work behind async endpoints")
+    API_CPU_WORKERS: int = Field(default=0, ge=0, description="Processes for API backtests (0 = all cores)")
+    API_ENDPOINT_CONCURRENCY: int = Field(default=4, ge=1, description="Default concurrent calls per endpoint")
+    API_MAX_QUEUED_REQUESTS: int = Field(default=32, ge=0, description="Requests waiting per endpoint before 503")
+    API_REQUEST_TIMEOUT: float = Field(default=120.0, gt=0, description="Seconds before compute requests fail with 504")
+    API_BACKTEST_TIMEOUT: float = Field(default=600.0, gt=0, description="Seconds before POST /backtest/run fails with 504")
+    API_GLOBAL_RANKING_TIMEOUT: float = Field(default=1800.0, gt=0, description="Seconds before POST /global-ranking/run fails with 504")
+    JOB_WORKERS: int = Field(default=2, ge=1, description="Background jobs (backtests, rankings) run at once")
+    JOB_RESULT_TTL_HOURS: float = Field(default=24.0, gt=0, description="Hours finished job results are kept")
     
     # CORS
     CORS_ORIGINS: list = Field(default=["*"], description="Allowed CORS origins")
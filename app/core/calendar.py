@@ -6,6 +6,8 @@ and timezone conversions between UTC and local time (UTC-3).
 from datetime import datetime, time, timedelta
 from typing import Optional, Tuple, Literal
 from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field
 
 
@@ -23,6 +25,53 @@ DEFAULT_WINDOW_B_END = time(17, 0)    # 17:00 local (20:00 UTC)
 # Forced close time (in local time UTC-3)
 DEFAULT_FORCED_CLOSE_TIME = time(16, 45)  # 16:45 local (19:45 UTC)
 
+US_PER_DAY = 24 * 60 * 60 * 1_000_000
+NS_PER_HOUR = 60 * 60 * 1_000_000_000
+
+
+def time_to_us(t: time) -> int:
+    """Convert a wall-clock time to microseconds since midnight."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _utc_offsets_ns(utc_ns: np.ndarray, tz: ZoneInfo) -> np.ndarray:
+    """Get the UTC offset in nanoseconds of tz at each UTC instant."""
+    utc = pd.DatetimeIndex(utc_ns, tz='UTC')
+    return utc.tz_convert(tz).tz_localize(None).asi8 - utc_ns
+
+
+def local_time_of_day_us(timestamps_ms, local_tz: str = "America/Argentina/Buenos_Aires") -> np.ndarray:
+    """Get the local wall-clock time of day for millisecond timestamps.
+    
+    Vectorized equivalent of ``ts.astimezone(ZoneInfo(local_tz)).time()`` for
+    every timestamp, expressed as microseconds since local midnight so it can
+    be compared against time_to_us() of window bounds.
+    
+    The timezone offset is resolved once per distinct UTC hour; only hours
+    containing a DST/offset transition are resolved bar by bar.
+    
+    Args:
+        timestamps_ms: Array-like of UTC timestamps in milliseconds
+        local_tz: Local timezone name
+        
+    Returns:
+        int64 array of microseconds since local midnight
+    """
+    tz = ZoneInfo(local_tz)
+    utc_ns = pd.to_datetime(np.asarray(timestamps_ms), unit='ms').asi8
+    
+    hours, unique_hours = pd.factorize(utc_ns // NS_PER_HOUR)
+    hour_start = unique_hours.astype(np.int64) * NS_PER_HOUR
+    offset_start = _utc_offsets_ns(hour_start, tz)
+    offset_end = _utc_offsets_ns(hour_start + NS_PER_HOUR - 1, tz)
+    
+    offsets = offset_start[hours]
+    transition = (offset_start != offset_end)[hours]
+    if transition.any():
+        offsets[transition] = _utc_offsets_ns(utc_ns[transition], tz)
+    
+    return ((utc_ns + offsets) // 1000) % US_PER_DAY
+
 
 class TradingWindow(BaseModel):
     """Definition of a trading window with start and end times."""
@@ -55,6 +104,29 @@ class TradingWindow(BaseModel):
         else:
             return current_time >= self.start_time or current_time <= self.end_time
     
+    def within_window_mask(self, time_of_day_us: np.ndarray) -> np.ndarray:
+        """Vectorized is_within_window over precomputed local times of day.
+        
+        Args:
+            time_of_day_us: Local times of day in this window's timezone
+                (see local_time_of_day_us)
+            
+        Returns:
+            Boolean array, True where within window
+        """
+        time_of_day_us = np.asarray(time_of_day_us)
+        if not self.enabled:
+            return np.zeros(len(time_of_day_us), dtype=bool)
+        
+        start = time_to_us(self.start_time)
+        end = time_to_us(self.end_time)
+        
+        # Handle windows that cross midnight
+        if start <= end:
+            return (time_of_day_us >= start) & (time_of_day_us <= end)
+        else:
+            return (time_of_day_us >= start) | (time_of_day_us <= end)
+    
     def get_next_window_start(self, from_time: datetime) -> datetime:
         """Get the next occurrence of this window's start time.
         
@@ -201,6 +273,47 @@ class TradingCalendar:
         # Check if current time is at or past forced close time
         return current_time >= self.forced_close_time
     
+    def window_masks(self, timestamps_ms) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized window membership for millisecond timestamps.
+        
+        Args:
+            timestamps_ms: Array-like of UTC timestamps in milliseconds
+            
+        Returns:
+            Tuple of (in_window_a, in_window_b) boolean arrays
+        """
+        times_by_tz = {}
+        masks = []
+        for window in (self.window_a, self.window_b):
+            if window.timezone not in times_by_tz:
+                times_by_tz[window.timezone] = local_time_of_day_us(timestamps_ms, window.timezone)
+            masks.append(window.within_window_mask(times_by_tz[window.timezone]))
+        return masks[0], masks[1]
+    
+    def trading_hours_mask(self, timestamps_ms) -> np.ndarray:
+        """Vectorized is_trading_hours for millisecond timestamps.
+        
+        Args:
+            timestamps_ms: Array-like of UTC timestamps in milliseconds
+            
+        Returns:
+            Boolean array, True where within any trading window
+        """
+        in_a, in_b = self.window_masks(timestamps_ms)
+        return in_a | in_b
+    
+    def force_close_mask(self, timestamps_ms) -> np.ndarray:
+        """Vectorized should_force_close for millisecond timestamps.
+        
+        Args:
+            timestamps_ms: Array-like of UTC timestamps in milliseconds
+            
+        Returns:
+            Boolean array, True where at or past forced close time
+        """
+        time_of_day = local_time_of_day_us(timestamps_ms, self.local_tz.key)
+        return time_of_day >= time_to_us(self.forced_close_time)
+    
     def time_until_forced_close(self, check_time: Optional[datetime] = None) -> timedelta:
         """Get time remaining until forced close.
         
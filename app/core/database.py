@@ -0,0 +1,251 @@
+"""Shared SQLite connections for the service databases.
+
+Services used to open a new sqlite3 connection for every read and write.
+SQLiteConnectionManager keeps one persistent connection per (thread,
+database file) instead, configured once with:
+
+- WAL journaling, so readers never block the writer (and vice versa)
+- synchronous=NORMAL, which is durable under WAL except on power loss
+- a busy timeout, so concurrent writers wait instead of failing
+- a larger page cache and statement cache (prepared statements are reused
+  for the lifetime of the connection)
+
+Writes go through transaction(), which commits when the outermost block
+exits. Nesting blocks batches every write inside them into one commit:
+
+    with get_connection_manager().transaction(db_path):
+        for decision in decisions:
+            paper_db.save_decision(decision)  # single commit at the end
+
+Connections are never shared between threads, and a forked child process
+opens its own instead of reusing its parent's. Connections of threads that
+have exited (e.g. per-run thread pools) are closed the next time a
+connection is opened.
+"""
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class _PooledConnection:
+    """A pooled connection and its open transaction depth."""
+    
+    __slots__ = ('conn', 'depth')
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.depth = 0
+
+
+class SQLiteConnectionManager:
+    """Per-thread pool of persistent, tuned SQLite connections."""
+    
+    def __init__(
+        self,
+        busy_timeout_ms: int = 5000,
+        cache_kb: int = 16384,
+        cached_statements: int = 256,
+        max_connections_per_thread: int = 16,
+        wal: bool = True
+    ):
+        """Initialize connection manager.
+        
+        Args:
+            busy_timeout_ms: How long a statement waits on a locked database
+            cache_kb: Page cache size per connection (KiB)
+            cached_statements: Prepared statements kept per connection
+            max_connections_per_thread: Idle connections kept per thread
+                before the least recently used one is closed
+            wal: Switch databases to write-ahead logging
+        """
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cache_kb = cache_kb
+        self.cached_statements = cached_statements
+        self.max_connections_per_thread = max_connections_per_thread
+        self.wal = wal
+        
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Every open connection with its owning (process id, thread)
+        self._connections: Dict[sqlite3.Connection, Tuple[int, threading.Thread]] = {}
+        
+        self.opened = 0
+        self.reused = 0
+        self.commits = 0
+        self.released = 0
+    
+    def _pool(self) -> "OrderedDict[str, _PooledConnection]":
+        """Get this thread's pool (a fresh one after a fork)."""
+        pid = os.getpid()
+        if getattr(self._local, 'pid', None) != pid:
+            self._local.pid = pid
+            self._local.pool = OrderedDict()
+        return self._local.pool
+    
+    def _open(self, path: str) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        self._release_dead_threads()
+        
+        conn = sqlite3.connect(
+            path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        if self.wal:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_kb)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        
+        with self._lock:
+            self._connections[conn] = (os.getpid(), threading.current_thread())
+            self.opened += 1
+        return conn
+    
+    def _close(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and stop tracking it."""
+        with self._lock:
+            self._connections.pop(conn, None)
+        conn.close()
+    
+    def _release_dead_threads(self) -> None:
+        """Close the connections of this process's threads that have exited.
+        
+        Their thread-local pools are gone, so nothing can borrow these
+        connections again; without this, every short-lived thread would
+        leave a connection, a file descriptor and its page cache behind.
+        """
+        pid = os.getpid()
+        with self._lock:
+            dead = [
+                conn for conn, (owner_pid, owner) in self._connections.items()
+                if owner_pid == pid and not owner.is_alive()
+            ]
+            for conn in dead:
+                del self._connections[conn]
+            self.released += len(dead)
+        
+        for conn in dead:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing SQLite connection: {e}")
+    
+    def _acquire(self, db_path: PathLike) -> _PooledConnection:
+        """Get this thread's connection to db_path, opening it on first use."""
+        path = str(Path(db_path).resolve())
+        pool = self._pool()
+        
+        pooled = pool.get(path)
+        if pooled is not None:
+            pool.move_to_end(path)
+            self.reused += 1
+            return pooled
+        
+        pooled = _PooledConnection(self._open(path))
+        pool[path] = pooled
+        
+        # Close least recently used idle connections beyond the limit
+        idle = [key for key, entry in pool.items() if entry.depth == 0 and key != path]
+        for key in idle[:max(0, len(pool) - self.max_connections_per_thread)]:
+            self._close(pool.pop(key).conn)
+        
+        return pooled
+    
+    @contextmanager
+    def connection(self, db_path: PathLike) -> Iterator[sqlite3.Connection]:
+        """Borrow this thread's connection for reads.
+        
+        Nothing is committed on exit; use transaction() for writes.
+        
+        Args:
+            db_path: Database file
+        
+        Yields:
+            Pooled sqlite3 connection
+        """
+        yield self._acquire(db_path).conn
+    
+    @contextmanager
+    def transaction(self, db_path: PathLike) -> Iterator[sqlite3.Connection]:
+        """Borrow this thread's connection for writes.
+        
+        The outermost block commits on success and rolls back on error;
+        nested blocks join it.
+        
+        Args:
+            db_path: Database file
+        
+        Yields:
+            Pooled sqlite3 connection
+        """
+        pooled = self._acquire(db_path)
+        pooled.depth += 1
+        try:
+            yield pooled.conn
+        except BaseException:
+            pooled.depth -= 1
+            if pooled.depth == 0:
+                pooled.conn.rollback()
+            raise
+        
+        pooled.depth -= 1
+        if pooled.depth == 0:
+            pooled.conn.commit()
+            self.commits += 1
+    
+    def close_all(self) -> None:
+        """Close every pooled connection in every thread."""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections = {}
+        
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing SQLite connection: {e}")
+        
+        # Start every thread over with an empty pool
+        self._local = threading.local()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get connection statistics."""
+        self._release_dead_threads()
+        
+        with self._lock:
+            return {
+                'open_connections': len(self._connections),
+                'opened': self.opened,
+                'released': self.released,
+                'reused': self.reused,
+                'commits': self.commits,
+                'wal': self.wal
+            }
+
+
+# Global instance
+_connection_manager = None
+
+
+def get_connection_manager() -> SQLiteConnectionManager:
+    """Get global SQLite connection manager instance."""
+    global _connection_manager
+    if _connection_manager is None:
+        from app.config.settings import settings
+        _connection_manager = SQLiteConnectionManager(
+            busy_timeout_ms=settings.SQLITE_BUSY_TIMEOUT_MS,
+            cache_kb=settings.SQLITE_CACHE_KB,
+            wal=settings.SQLITE_WAL_ENABLED
+        )
+    return _connection_manager
@@ -0,0 +1,450 @@
+"""Background job queue for long-running API work.
+
+Backtests and global rankings can take longer than an HTTP client is
+willing to wait. JobQueue runs them on a worker pool instead: submit()
+stores the job and returns its id immediately, clients poll get() (or
+stream progress events), and finished jobs keep their result in SQLite
+until the result TTL expires.
+
+A job handler takes the job parameters and a progress callback and
+returns a JSON-serializable result:
+
+    def run_backtest_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+        progress(0.5, "Running backtest")
+        return {...}
+    
+    job = get_job_queue().submit("backtest", run_backtest_job, request.model_dump(mode="json"))
+
+Each job row records the process that owns it (boot id and pid). Jobs that
+were queued or running when their process stopped are marked failed the
+next time a queue is created on the same database; jobs of processes that
+are still alive (e.g. other API workers) are left alone.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.core.database import get_connection_manager
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[float, str], None]
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Dict[str, Any]]
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def _boot_id() -> str:
+    """Get an identifier of the current boot (empty if unavailable)."""
+    try:
+        return Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+    except OSError:
+        return ""
+
+
+def _process_owner() -> str:
+    """Get the owner recorded on jobs run by this process."""
+    return f"{_boot_id()}:{os.getpid()}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """Check whether the process that owns a job is still running.
+    
+    Args:
+        owner: Owner recorded on the job row (None for rows without one)
+    
+    Returns:
+        True if the owner is this process or another live process of this boot
+    """
+    if not owner:
+        return False
+    
+    boot_id, _, pid = owner.rpartition(":")
+    if boot_id != _boot_id() or not pid.isdigit() or int(pid) <= 0:
+        return False
+    if int(pid) == os.getpid():
+        return True
+    
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class Job(BaseModel):
+    """A submitted job and (once finished) its result."""
+    
+    job_id: str = Field(..., description="Job identifier")
+    kind: str = Field(..., description="Job kind (e.g. backtest, global_ranking)")
+    status: JobStatus = Field(default=JobStatus.QUEUED, description="Current status")
+    progress: float = Field(default=0.0, description="Completed fraction (0-1)")
+    message: str = Field(default="", description="Current step")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Job parameters")
+    result: Optional[Dict[str, Any]] = Field(None, description="Result of a succeeded job")
+    error: Optional[str] = Field(None, description="Error of a failed job")
+    created_at: datetime = Field(default_factory=datetime.utcnow, description="Submission time")
+    started_at: Optional[datetime] = Field(None, description="Start time")
+    finished_at: Optional[datetime] = Field(None, description="Finish time")
+    expires_at: Optional[datetime] = Field(None, description="Time the stored result is deleted")
+    
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job succeeded, failed or was cancelled."""
+        return self.status in FINISHED_STATUSES
+
+
+class JobQueue:
+    """Worker pool running jobs with progress tracking and persisted results."""
+    
+    def __init__(self, db_path: Path, workers: int = 2, result_ttl_hours: float = 24.0):
+        """Initialize job queue.
+        
+        Args:
+            db_path: SQLite database storing jobs and results
+            workers: Jobs run concurrently
+            result_ttl_hours: Hours finished jobs are kept
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.result_ttl = timedelta(hours=result_ttl_hours)
+        self._owner = _process_owner()
+        
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._active: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        
+        self._create_tables()
+        self._fail_interrupted()
+    
+    def _create_tables(self):
+        """Create database tables if they don't exist."""
+        with get_connection_manager().transaction(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress REAL,
+                    message TEXT,
+                    params TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    expires_at TEXT,
+                    owner TEXT
+                )
+            """)
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(jobs)")]
+            if 'owner' not in columns:
+                cursor.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_expires ON jobs(expires_at)")
+    
+    def _fail_interrupted(self):
+        """Mark jobs left queued or running by processes that have stopped as failed."""
+        now = datetime.utcnow()
+        with get_connection_manager().transaction(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT job_id, owner FROM jobs WHERE status IN (?, ?)",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+            ).fetchall()
+            interrupted = [job_id for job_id, owner in rows if not _owner_alive(owner)]
+            
+            conn.executemany("""
+                UPDATE jobs SET status = ?, error = ?, finished_at = ?, expires_at = ?
+                WHERE job_id = ?
+            """, [(
+                JobStatus.FAILED.value, "Interrupted by server restart",
+                now.isoformat(), (now + self.result_ttl).isoformat(), job_id
+            ) for job_id in interrupted])
+            if interrupted:
+                logger.warning(f"Marked {len(interrupted)} interrupted jobs as failed")
+    
+    def _save(self, job: Job):
+        """Insert or replace a job row."""
+        with get_connection_manager().transaction(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO jobs (
+                    job_id, kind, status, progress, message, params, result, error,
+                    created_at, started_at, finished_at, expires_at, owner
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                job.job_id, job.kind, job.status.value, job.progress, job.message,
+                json.dumps(job.params, default=str),
+                json.dumps(job.result, default=str) if job.result is not None else None,
+                job.error,
+                job.created_at.isoformat(),
+                job.started_at.isoformat() if job.started_at else None,
+                job.finished_at.isoformat() if job.finished_at else None,
+                job.expires_at.isoformat() if job.expires_at else None,
+                self._owner
+            ))
+    
+    @staticmethod
+    def _row_to_job(row) -> Job:
+        """Build a Job from a database row."""
+        return Job(
+            job_id=row['job_id'],
+            kind=row['kind'],
+            status=JobStatus(row['status']),
+            progress=row['progress'] or 0.0,
+            message=row['message'] or "",
+            params=json.loads(row['params']) if row['params'] else {},
+            result=json.loads(row['result']) if row['result'] else None,
+            error=row['error'],
+            created_at=datetime.fromisoformat(row['created_at']),
+            started_at=datetime.fromisoformat(row['started_at']) if row['started_at'] else None,
+            finished_at=datetime.fromisoformat(row['finished_at']) if row['finished_at'] else None,
+            expires_at=datetime.fromisoformat(row['expires_at']) if row['expires_at'] else None
+        )
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get (creating on first use) the worker pool."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+        return self._pool
+    
+    def submit(self, kind: str, handler: JobHandler, params: Optional[Dict[str, Any]] = None) -> Job:
+        """Queue a job.
+        
+        Args:
+            kind: Job kind
+            handler: Function run with (params, progress)
+            params: JSON-serializable job parameters
+        
+        Returns:
+            The queued job
+        """
+        self.purge_expired()
+        
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, params=params or {}, message="Queued")
+        self._save(job)
+        
+        with self._lock:
+            self._active[job.job_id] = job
+            self._futures[job.job_id] = self._get_pool().submit(self._execute, job, handler)
+        
+        logger.info(f"Queued {kind} job {job.job_id}")
+        return job.model_copy()
+    
+    def _execute(self, job: Job, handler: JobHandler):
+        """Run a job in a worker thread and store its outcome."""
+        with self._lock:
+            if job.status != JobStatus.QUEUED:
+                return
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            job.message = "Running"
+        self._save(job)
+        
+        def progress(fraction: float, message: str = ""):
+            with self._lock:
+                job.progress = min(max(float(fraction), 0.0), 1.0)
+                if message:
+                    job.message = message
+        
+        try:
+            result = handler(job.params, progress)
+            with self._lock:
+                job.result = result
+                job.status = JobStatus.SUCCEEDED
+                job.progress = 1.0
+                job.message = "Completed"
+        except Exception as e:
+            logger.error(f"{job.kind} job {job.job_id} failed: {e}")
+            with self._lock:
+                job.error = str(e)
+                job.status = JobStatus.FAILED
+                job.message = "Failed"
+        
+        self._finish(job)
+    
+    def _finish(self, job: Job):
+        """Persist a finished job and drop it from the active set."""
+        job.finished_at = datetime.utcnow()
+        job.expires_at = job.finished_at + self.result_ttl
+        self._save(job)
+        
+        with self._lock:
+            self._active.pop(job.job_id, None)
+            self._futures.pop(job.job_id, None)
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job (None if unknown or its result expired).
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            Copy of the job with its current progress
+        """
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is not None:
+                return job.model_copy()
+        
+        with get_connection_manager().connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            row = cursor.fetchone()
+        
+        if row is None:
+            return None
+        
+        job = self._row_to_job(row)
+        if job.expires_at is not None and job.expires_at <= datetime.utcnow():
+            return None
+        return job
+    
+    def list_jobs(
+        self,
+        kind: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        limit: int = 50
+    ) -> List[Job]:
+        """List recent jobs, newest first (results omitted).
+        
+        Args:
+            kind: Only jobs of this kind
+            status: Only jobs in this status
+            limit: Maximum number of jobs
+        
+        Returns:
+            List of jobs
+        """
+        query = "SELECT * FROM jobs WHERE (expires_at IS NULL OR expires_at > ?)"
+        params: List[Any] = [datetime.utcnow().isoformat()]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        if status:
+            query += " AND status = ?"
+            params.append(JobStatus(status).value)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        
+        with get_connection_manager().connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        
+        jobs = []
+        for row in rows:
+            job = self._row_to_job(row)
+            with self._lock:
+                active = self._active.get(job.job_id)
+                if active is not None:
+                    job = active.model_copy()
+            jobs.append(job.model_copy(update={'result': None}))
+        
+        return jobs
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            True if the job was cancelled (running jobs cannot be)
+        """
+        with self._lock:
+            job = self._active.get(job_id)
+            future = self._futures.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return False
+            job.status = JobStatus.CANCELLED
+            job.message = "Cancelled"
+            if future is not None:
+                future.cancel()
+        
+        self._finish(job)
+        logger.info(f"Cancelled {job.kind} job {job_id}")
+        return True
+    
+    def purge_expired(self) -> int:
+        """Delete finished jobs whose result TTL has passed.
+        
+        Returns:
+            Number of jobs deleted
+        """
+        with get_connection_manager().transaction(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (datetime.utcnow().isoformat(),)
+            )
+            return cursor.rowcount
+    
+    def stats(self) -> Dict[str, int]:
+        """Get the number of queued and running jobs."""
+        with self._lock:
+            statuses = [job.status for job in self._active.values()]
+        
+        return {
+            'workers': self.workers,
+            'queued': statuses.count(JobStatus.QUEUED),
+            'running': statuses.count(JobStatus.RUNNING)
+        }
+    
+    def shutdown(self, wait: bool = False):
+        """Stop the worker pool (queued jobs are dropped and marked failed on restart)."""
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global instance
+_job_queue = None
+
+
+def shutdown_job_queue(wait: bool = False):
+    """Shut down the global job queue if it was created."""
+    if _job_queue is not None:
+        _job_queue.shutdown(wait=wait)
+
+
+def get_job_queue() -> JobQueue:
+    """Get global job queue instance."""
+    global _job_queue
+    if _job_queue is None:
+        from app.config.settings import settings
+        _job_queue = JobQueue(
+            db_path=settings.STORAGE_PATH / "jobs.db",
+            workers=settings.JOB_WORKERS,
+            result_ttl_hours=settings.JOB_RESULT_TTL_HOURS
+        )
+    return _job_queue
@@ -0,0 +1,198 @@
+"""Process-wide in-memory cache of Parquet OHLCV partitions.
+
+Every DataStore instance in a process shares this cache, so repeated reads of
+the same symbol/timeframe (freshness checks, dataset hashes, signal paths,
+orchestrator backtests) hit memory instead of disk.
+
+Entries are keyed by (storage root, symbol, timeframe, year, month) and are
+validated against the partition file's mtime and size on every lookup, so
+writes from another process (e.g. scripts/sync_data.py run by cron) are picked
+up automatically. In-process writers call invalidate() after syncing.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# (storage root, symbol, timeframe, year, month)
+PartitionKey = Tuple[str, str, str, int, int]
+
+
+def _symbol_key(symbol: str) -> str:
+    """Normalize a symbol the way partition directories name it ('BTC/USDT' -> 'BTC-USDT')."""
+    return symbol.replace('/', '-')
+
+
+class FrameCache:
+    """LRU cache of partition tables bounded by a byte budget."""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, enabled: bool = True):
+        """Initialize frame cache.
+
+        Args:
+            max_bytes: Maximum total Arrow buffer size kept in memory
+            enabled: If False, every read goes to disk
+        """
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[PartitionKey, Tuple[int, int, pa.Table]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(path: Path, base_path: Path, symbol: str, timeframe: str) -> PartitionKey:
+        """Build the cache key for a partition file."""
+        year = int(path.parent.parent.name.split('=', 1)[1])
+        month = int(path.parent.name.split('=', 1)[1])
+        return (str(Path(base_path).resolve()), _symbol_key(symbol), timeframe, year, month)
+
+    def get_partition(
+        self,
+        path: Path,
+        base_path: Path,
+        symbol: str,
+        timeframe: str
+    ) -> pa.Table:
+        """Get a full partition table, reading from disk on miss or change.
+
+        Args:
+            path: Partition file path
+            base_path: Storage root
+            symbol: Trading symbol
+            timeframe: Timeframe
+
+        Returns:
+            Arrow table with every column of the partition
+        """
+        if not self.enabled:
+            return pq.read_table(path)
+
+        key = self.make_key(path, base_path, symbol, timeframe)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0], entry[1]) == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+        table = pq.read_table(path)
+
+        with self._lock:
+            self.misses += 1
+            self._remove(key)
+            if table.nbytes <= self.max_bytes:
+                self._entries[key] = (signature[0], signature[1], table)
+                self._bytes += table.nbytes
+                self._evict()
+
+        return table
+
+    def invalidate(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        base_path: Optional[Path] = None
+    ) -> int:
+        """Drop cached partitions matching the given filters.
+
+        Args:
+            symbol: Only drop this symbol, in either 'BTC/USDT' or 'BTC-USDT' form (None = all symbols)
+            timeframe: Only drop this timeframe (None = all timeframes)
+            base_path: Only drop partitions under this storage root
+
+        Returns:
+            Number of partitions dropped
+        """
+        root = str(Path(base_path).resolve()) if base_path is not None else None
+        symbol_key = _symbol_key(symbol) if symbol is not None else None
+
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (root is None or key[0] == root)
+                and (symbol_key is None or key[1] == symbol_key)
+                and (timeframe is None or key[2] == timeframe)
+            ]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+
+        if keys:
+            logger.debug(f"Frame cache invalidated {len(keys)} partitions (symbol={symbol}, timeframe={timeframe})")
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached partition and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'partitions': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups > 0 else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+    def _remove(self, key: PartitionKey) -> None:
+        """Remove one entry (caller holds the lock)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2].nbytes
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within budget (caller holds the lock)."""
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, _, table) = self._entries.popitem(last=False)
+            self._bytes -= table.nbytes
+            self.evictions += 1
+
+
+# Global instance
+_frame_cache = None
+
+
+def get_frame_cache() -> FrameCache:
+    """Get global frame cache instance."""
+    global _frame_cache
+    if _frame_cache is None:
+        from app.config.settings import settings
+        _frame_cache = FrameCache(
+            max_bytes=settings.FRAME_CACHE_MAX_BYTES,
+            enabled=settings.FRAME_CACHE_ENABLED
+        )
+    return _frame_cache
+
+
+def invalidate_frames(symbol: Optional[str] = None, timeframe: Optional[str] = None) -> int:
+    """Invalidate cached partitions after new bars are written (convenience function)."""
+    return get_frame_cache().invalidate(symbol, timeframe)
@@ -0,0 +1,244 @@
+"""Columnar read path for the Parquet OHLCV store.
+
+This module reads the partitioned storage layout written by DataStore
+(symbol=X/tf=Y/year=YYYY/month=MM/data.parquet) straight into a typed
+DataFrame, without materializing one OHLCVBar per candle.
+"""
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from app.data.frame_cache import get_frame_cache
+
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# Column dtypes enforced on every frame returned by read_frame
+OHLCV_DTYPES = {
+    'timestamp': 'int64',
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'float64',
+}
+
+TimeBound = Optional[Union[datetime, int]]
+
+
+def _to_ms(value: TimeBound) -> Optional[int]:
+    """Convert a datetime or millisecond timestamp to milliseconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
+def _month_key(ts_ms: int) -> Tuple[int, int]:
+    """Get (year, month) of a millisecond timestamp in UTC."""
+    dt = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
+    return dt.year, dt.month
+
+
+def _parse_partition(path: Path) -> Optional[Tuple[int, int]]:
+    """Extract (year, month) from a .../year=YYYY/month=MM/data.parquet path."""
+    try:
+        year = int(path.parent.parent.name.split('=', 1)[1])
+        month = int(path.parent.name.split('=', 1)[1])
+    except (IndexError, ValueError):
+        return None
+    return year, month
+
+
+def list_partition_files(
+    base_path: Union[str, Path],
+    symbol: str,
+    timeframe: str,
+    since_ms: Optional[int] = None,
+    until_ms: Optional[int] = None
+) -> List[Path]:
+    """List partition files for a symbol/timeframe, oldest first.
+
+    Partitions entirely outside [since_ms, until_ms] are pruned. A one-day
+    margin is kept on both ends so bars near a month boundary are never lost.
+
+    Args:
+        base_path: Storage root directory
+        symbol: Trading symbol (e.g. "BTC/USDT")
+        timeframe: Timeframe (e.g. "1h")
+        since_ms: Optional lower timestamp bound (ms)
+        until_ms: Optional upper timestamp bound (ms)
+
+    Returns:
+        Sorted list of partition file paths
+    """
+    tf_dir = Path(base_path) / f"symbol={symbol.replace('/', '-')}" / f"tf={timeframe}"
+    if not tf_dir.exists():
+        return []
+
+    margin_ms = int(timedelta(days=1).total_seconds() * 1000)
+    lower = _month_key(since_ms - margin_ms) if since_ms is not None else None
+    upper = _month_key(until_ms + margin_ms) if until_ms is not None else None
+
+    partitions = []
+    for path in tf_dir.glob("year=*/month=*/data.parquet"):
+        key = _parse_partition(path)
+        if key is None:
+            continue
+        if lower is not None and key < lower:
+            continue
+        if upper is not None and key > upper:
+            continue
+        partitions.append((key, path))
+
+    partitions.sort(key=lambda item: item[0])
+    return [path for _, path in partitions]
+
+
+def _empty_frame(columns: List[str]) -> pd.DataFrame:
+    """Create an empty frame with the expected column dtypes."""
+    return pd.DataFrame({col: pd.Series(dtype=OHLCV_DTYPES.get(col, 'object')) for col in columns})
+
+
+def _slice_table(
+    table: pa.Table,
+    columns: Optional[List[str]],
+    since_ms: Optional[int],
+    until_ms: Optional[int]
+) -> pa.Table:
+    """Apply timestamp bounds and column projection to a cached partition."""
+    if since_ms is not None or until_ms is not None:
+        ts = table['timestamp']
+        mask = None
+        if since_ms is not None:
+            mask = pc.greater_equal(ts, since_ms)
+        if until_ms is not None:
+            upper = pc.less_equal(ts, until_ms)
+            mask = upper if mask is None else pc.and_(mask, upper)
+        table = table.filter(mask)
+
+    if columns is not None:
+        table = table.select([col for col in columns if col in table.column_names])
+
+    return table
+
+
+def read_table(
+    store: Any,
+    symbol: str,
+    timeframe: str,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    columns: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    use_cache: bool = True
+) -> Optional[pa.Table]:
+    """Read matching partitions into a single Arrow table.
+
+    Args:
+        store: DataStore instance (or storage root path)
+        symbol: Trading symbol
+        timeframe: Timeframe
+        since: Optional start bound (datetime or ms timestamp, inclusive)
+        until: Optional end bound (datetime or ms timestamp, inclusive)
+        columns: Columns to read (default: all). 'timestamp' is always read.
+        max_rows: Stop reading older partitions once this many rows are loaded
+        use_cache: Serve partitions from the process-wide frame cache
+
+    Returns:
+        Arrow table (unsorted, may contain duplicates) or None if no data
+    """
+    base_path = getattr(store, 'base_path', store)
+    since_ms = _to_ms(since)
+    until_ms = _to_ms(until)
+
+    read_columns = None
+    if columns is not None:
+        read_columns = list(dict.fromkeys(['timestamp'] + list(columns)))
+
+    filters = []
+    if since_ms is not None:
+        filters.append(('timestamp', '>=', since_ms))
+    if until_ms is not None:
+        filters.append(('timestamp', '<=', until_ms))
+
+    cache = get_frame_cache() if use_cache else None
+
+    # Newest partitions first so a max_rows read can stop early
+    tables = []
+    loaded_rows = 0
+    for path in reversed(list_partition_files(base_path, symbol, timeframe, since_ms, until_ms)):
+        if cache is not None and cache.enabled:
+            table = _slice_table(cache.get_partition(path, base_path, symbol, timeframe), read_columns, since_ms, until_ms)
+        else:
+            table = pq.read_table(path, columns=read_columns, filters=filters or None)
+        if table.num_rows > 0:
+            tables.append(table)
+            loaded_rows += table.num_rows
+        if max_rows is not None and loaded_rows >= max_rows:
+            break
+
+    if not tables:
+        return None
+
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def read_frame(
+    store: Any,
+    symbol: str,
+    timeframe: str,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    max_bars: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """Read OHLCV bars as a typed DataFrame sorted by timestamp.
+
+    Equivalent to building pd.DataFrame([bar.to_dict() for bar in
+    store.read_bars(...)]) but goes straight from Parquet to columns.
+
+    Args:
+        store: DataStore instance (or storage root path)
+        symbol: Trading symbol
+        timeframe: Timeframe
+        since: Optional start bound (datetime or ms timestamp, inclusive)
+        until: Optional end bound (datetime or ms timestamp, inclusive)
+        max_bars: Keep only the most recent N bars
+        columns: Columns to return (default: all stored columns)
+        use_cache: Serve partitions from the process-wide frame cache
+
+    Returns:
+        DataFrame with a RangeIndex, sorted by timestamp, one row per bar.
+        Empty DataFrame if no data is stored.
+    """
+    table = read_table(
+        store, symbol, timeframe,
+        since=since, until=until, columns=columns,
+        max_rows=max_bars if max_bars is not None and max_bars > 0 else None,
+        use_cache=use_cache
+    )
+
+    if table is None:
+        return _empty_frame(list(columns) if columns is not None else OHLCV_COLUMNS)
+
+    df = table.to_pandas()
+    df = df.sort_values('timestamp', kind='stable')
+    df = df.drop_duplicates(subset='timestamp', keep='last')
+
+    if max_bars is not None and max_bars > 0:
+        df = df.tail(max_bars)
+
+    df = df.reset_index(drop=True)
+    df = df.astype({col: dtype for col, dtype in OHLCV_DTYPES.items() if col in df.columns})
+
+    if columns is not None:
+        df = df[list(columns)]
+
+    return df
@@ -16,6 +16,7 @@ from typing import Optional, Dict, Any
 from app.config.settings import settings
 from app.data.store import DataStore
 from app.data.fetch import DataFetcher
+from app.data.frame_cache import invalidate_frames
 from app.service import DecisionEngine, MarketAdvisor, PaperTradingDB
 from app.service.tp_sl_engine import TPSLConfig
 from app.research.signals import ma_crossover, rsi_regime_pullback, trend_following_ema
@@ -70,6 +71,7 @@ async def update_data_job():
                     if bars:
                         # Store
                         stats = store.write_bars(bars)
+                        invalidate_frames(symbol, timeframe)
                         print(f"  ✓ {symbol} {timeframe}: {len(bars)} new bars")
                     
                 except Exception as e:
@@ -245,14 +247,15 @@ async def forced_close_job():
         open_trades = db.get_open_trades()
         
         closed_count = 0
-        for trade in open_trades:
-            trade.close_trade(
-                exit_price=trade.entry_price,  # Simplified - would get actual price
-                exit_time=datetime.now(),
-                exit_reason="forced_close"
-            )
-            db.save_trade(trade)
-            closed_count += 1
+        with db.batch():
+            for trade in open_trades:
+                trade.close_trade(
+                    exit_price=trade.entry_price,  # Simplified - would get actual price
+                    exit_time=datetime.now(),
+                    exit_reason="forced_close"
+                )
+                db.save_trade(trade)
+                closed_count += 1
         
         # Clear state
         job_state.open_positions.clear()
@@ -0,0 +1,204 @@
+"""Bounded-concurrency fan-out for scheduled jobs.
+
+Scheduled jobs call blocking code (exchange syncs, rankings) once per
+symbol or per (symbol, timeframe). fan_out() runs those calls on a thread
+pool with at most ``concurrency`` in flight, so an async job never blocks
+the event loop and the job window grows with the slowest item instead of
+the number of items:
+
+    report = await fan_out(sync_one, [("BTC/USDT", "1h"), ...], concurrency=4,
+                           rate_limiter=RateLimiter(1200, cooldown=0.1))
+    report.metrics()  # tasks, succeeded, failed, retries, elapsed_seconds, ...
+
+Each item is isolated: an exception fails only that item's outcome.
+Rate-limit errors are retried with exponential backoff, and the backoff
+pauses every item sharing the RateLimiter, not just the one that hit it.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# Lower-cased fragments of exchange errors that mean "slow down"
+RATE_LIMIT_MARKERS = ("ratelimit", "rate limit", "too many requests", "429", "ddosprotection")
+
+
+class RateLimitExceeded(Exception):
+    """Raised by a fan-out task when the exchange rejected it for rate limiting."""
+
+
+def is_rate_limit_error(error: Any) -> bool:
+    """Check whether an exception or error message is a rate-limit rejection.
+    
+    Args:
+        error: Exception or error message
+    
+    Returns:
+        True if the error asks the caller to slow down
+    """
+    if isinstance(error, RateLimitExceeded):
+        return True
+    
+    if isinstance(error, BaseException):
+        text = f"{type(error).__name__} {error}"
+    else:
+        text = str(error)
+    
+    text = text.lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+class RateLimiter:
+    """Spaces call starts evenly across all tasks of a fan-out.
+    
+    Args:
+        requests_per_minute: Maximum call starts per minute (0 = unlimited)
+        cooldown: Minimum seconds between two call starts
+    """
+    
+    def __init__(self, requests_per_minute: int, cooldown: float = 0.0):
+        per_request = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.min_interval = max(per_request, cooldown)
+        self.backoffs = 0
+        self._next_slot = 0.0
+    
+    async def acquire(self):
+        """Wait for the next free call slot."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.min_interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def backoff(self, seconds: float):
+        """Hold back every caller for at least ``seconds`` from now.
+        
+        Args:
+            seconds: Pause length
+        """
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+        self.backoffs += 1
+
+
+class FanOutOutcome(BaseModel):
+    """Result of one fan-out item."""
+    
+    key: Any = Field(..., description="Item the task was called with")
+    success: bool = Field(..., description="Whether the task returned without raising")
+    result: Any = Field(default=None, description="Task return value")
+    error: Optional[str] = Field(default=None, description="Error message if the task failed")
+    attempts: int = Field(default=1, description="Calls made, including rate-limit retries")
+    duration: float = Field(default=0.0, description="Seconds spent in the task (all attempts)")
+
+
+class FanOutReport(BaseModel):
+    """Outcomes of a fan-out, in item order, and run-level timing."""
+    
+    outcomes: List[FanOutOutcome] = Field(default_factory=list, description="One outcome per item")
+    concurrency: int = Field(..., description="Maximum tasks in flight")
+    elapsed_seconds: float = Field(..., description="Wall-clock seconds for the whole fan-out")
+    rate_limit_backoffs: int = Field(default=0, description="Times the shared rate limiter backed off")
+    
+    @property
+    def failed(self) -> List[FanOutOutcome]:
+        """Outcomes of tasks that raised."""
+        return [outcome for outcome in self.outcomes if not outcome.success]
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Aggregate metrics for logging and job results.
+        
+        Returns:
+            Task counts, retries and timing of the fan-out
+        """
+        task_seconds = sum(outcome.duration for outcome in self.outcomes)
+        slowest = max(self.outcomes, key=lambda outcome: outcome.duration, default=None)
+        
+        return {
+            'tasks': len(self.outcomes),
+            'succeeded': len(self.outcomes) - len(self.failed),
+            'failed': len(self.failed),
+            'retries': sum(outcome.attempts - 1 for outcome in self.outcomes),
+            'rate_limit_backoffs': self.rate_limit_backoffs,
+            'concurrency': self.concurrency,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'task_seconds': round(task_seconds, 3),
+            'slowest': str(slowest.key) if slowest else None,
+            'slowest_seconds': round(slowest.duration, 3) if slowest else 0.0
+        }
+
+
+async def fan_out(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    concurrency: int,
+    rate_limiter: Optional[RateLimiter] = None,
+    max_retries: int = 3,
+    backoff_seconds: float = 1.0,
+    backoff_factor: float = 2.0,
+    executor: Optional[Executor] = None
+) -> FanOutReport:
+    """Call blocking ``func(item)`` for every item with bounded concurrency.
+    
+    Args:
+        func: Blocking function taking one item
+        items: Items to process
+        concurrency: Maximum calls in flight
+        rate_limiter: Limiter shared by all calls (None = no spacing)
+        max_retries: Retries per item after a rate-limit error
+        backoff_seconds: Pause before the first retry
+        backoff_factor: Multiplier applied to the pause on every further retry
+        executor: Thread pool to run calls on (default: one sized to concurrency)
+    
+    Returns:
+        FanOutReport with one outcome per item, in item order
+    """
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    own_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fanout") if executor is None else None
+    pool = executor or own_pool
+    
+    async def run_one(item: Any) -> FanOutOutcome:
+        async with semaphore:
+            started = time.perf_counter()
+            attempt = 0
+            while True:
+                attempt += 1
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                try:
+                    result = await loop.run_in_executor(pool, func, item)
+                    return FanOutOutcome(key=item, success=True, result=result, attempts=attempt,
+                                         duration=time.perf_counter() - started)
+                except Exception as e:
+                    if is_rate_limit_error(e) and attempt <= max_retries:
+                        delay = backoff_seconds * backoff_factor ** (attempt - 1)
+                        logger.warning(f"Rate limited on {item}, retrying in {delay:.1f}s ({attempt}/{max_retries})")
+                        if rate_limiter is not None:
+                            rate_limiter.backoff(delay)
+                        else:
+                            await asyncio.sleep(delay)
+                        continue
+                    
+                    logger.error(f"Fan-out task {item} failed: {e}")
+                    return FanOutOutcome(key=item, success=False, error=str(e), attempts=attempt,
+                                         duration=time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    try:
+        outcomes = await asyncio.gather(*(run_one(item) for item in items))
+    finally:
+        if own_pool is not None:
+            own_pool.shutdown(wait=False)
+    
+    return FanOutReport(
+        outcomes=list(outcomes),
+        concurrency=concurrency,
+        elapsed_seconds=time.perf_counter() - started,
+        rate_limit_backoffs=rate_limiter.backoffs if rate_limiter is not None else 0
+    )
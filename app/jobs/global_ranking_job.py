@@ -1,14 +1,21 @@
 """Global ranking job for automated daily strategy execution and ranking.
 
 This job runs daily to execute all strategies, calculate rankings, and persist results.
+Symbols are ranked concurrently (settings.RANKING_SYMBOL_CONCURRENCY) and every
+symbol's backtests go to one process pool shared by the whole run, so adding
+symbols does not multiply worker processes.
 """
 import asyncio
+import functools
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from app.service.global_ranking import GlobalRankingService, GlobalRankingConfig
 from app.config.settings import settings
+from app.jobs.fanout import fan_out
+from app.research.optimization.parallel import resolve_n_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +35,37 @@ class GlobalRankingJob:
         # Default symbols to process
         self.default_symbols = ["BTC/USDT", "ETH/USDT", "ADA/USDT"]
         
+        # Aggregate metrics of the last run_daily_ranking call
+        self.last_metrics: Dict[str, Any] = {}
+        
         logger.info("GlobalRankingJob initialized")
     
+    def _rank_symbol(self, symbol: str, date: str, executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """Rank one symbol and summarize the result.
+        
+        Args:
+            symbol: Trading symbol
+            date: Date for ranking
+            executor: Process pool shared by all symbols of the run
+        
+        Returns:
+            Per-symbol summary
+        """
+        logger.info(f"Processing {symbol}")
+        
+        ranking_result = self.ranking_service.run_global_ranking(symbol, date, executor=executor)
+        
+        logger.info(f"Completed {symbol}: {ranking_result.valid_strategies} valid strategies")
+        
+        return {
+            'success': True,
+            'total_strategies': ranking_result.total_strategies,
+            'valid_strategies': ranking_result.valid_strategies,
+            'execution_time': ranking_result.execution_time,
+            'best_strategy': ranking_result.consolidated_metrics.get('best_strategy'),
+            'best_score': ranking_result.consolidated_metrics.get('best_score')
+        }
+    
     async def run_daily_ranking(
         self, 
         symbols: Optional[List[str]] = None,
@@ -42,7 +78,8 @@ class GlobalRankingJob:
             date: Date for ranking (default: today)
             
         Returns:
-            Dictionary with results for each symbol
+            Dictionary with results for each symbol (aggregate metrics are
+            kept in last_metrics)
         """
         if symbols is None:
             symbols = self.default_symbols
@@ -52,36 +89,44 @@ class GlobalRankingJob:
         
         logger.info(f"Running daily ranking for {len(symbols)} symbols on {date}")
         
-        results = {}
+        # One pool for every symbol's backtests; symbols only overlap data loading and saving
+        n_workers = resolve_n_jobs(self.config.n_jobs)
+        pool = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+        try:
+            report = await fan_out(
+                functools.partial(self._rank_symbol, date=date, executor=pool),
+                symbols,
+                concurrency=settings.RANKING_SYMBOL_CONCURRENCY,
+                max_retries=0
+            )
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False)
         
-        for symbol in symbols:
-            try:
-                logger.info(f"Processing {symbol}")
-                
-                # Run global ranking
-                ranking_result = self.ranking_service.run_global_ranking(symbol, date)
-                
-                results[symbol] = {
-                    'success': True,
-                    'total_strategies': ranking_result.total_strategies,
-                    'valid_strategies': ranking_result.valid_strategies,
-                    'execution_time': ranking_result.execution_time,
-                    'best_strategy': ranking_result.consolidated_metrics.get('best_strategy'),
-                    'best_score': ranking_result.consolidated_metrics.get('best_score')
-                }
-                
-                logger.info(f"Completed {symbol}: {ranking_result.valid_strategies} valid strategies")
-                
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
-                results[symbol] = {
+        results = {}
+        for outcome in report.outcomes:
+            if outcome.success:
+                results[outcome.key] = outcome.result
+            else:
+                results[outcome.key] = {
                     'success': False,
-                    'error': str(e)
+                    'error': outcome.error
                 }
         
+        self.last_metrics = {
+            **report.metrics(),
+            'backtest_workers': n_workers,
+            'ranking_seconds': round(sum(r.get('execution_time', 0.0) for r in results.values()), 3),
+            'failed_symbols': [symbol for symbol, r in results.items() if not r.get('success', False)]
+        }
+        
         # Log summary
         successful = sum(1 for r in results.values() if r.get('success', False))
-        logger.info(f"Daily ranking completed: {successful}/{len(symbols)} symbols successful")
+        logger.info(
+            f"Daily ranking completed: {successful}/{len(symbols)} symbols successful in "
+            f"{self.last_metrics['elapsed_seconds']:.1f}s ({self.last_metrics['ranking_seconds']:.1f}s of ranking, "
+            f"{n_workers} backtest worker(s), slowest {self.last_metrics['slowest']})"
+        )
         
         return results
     
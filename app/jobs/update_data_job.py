@@ -1,14 +1,19 @@
 """Update data job.
 
-This job runs to update market data from exchanges.
+This job runs to update market data from exchanges. Symbol/timeframe
+syncs run concurrently (settings.DATA_SYNC_CONCURRENCY) behind a shared
+rate limiter; a failing pair only fails its own entry in the results.
 """
 import logging
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 import traceback
 
-from app.data import DataFetcher, DataStore
+from app.data import DataFetcher
+from app.data.frame_cache import invalidate_frames
 from app.config.settings import settings
+from app.jobs.fanout import RateLimiter, RateLimitExceeded, fan_out, is_rate_limit_error
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +26,53 @@ class UpdateDataJob:
         self.last_run = None
         self.last_success = None
         self.last_error = None
+        self._local = threading.local()
         
         logger.info("UpdateDataJob initialized")
     
+    def _fetcher(self) -> DataFetcher:
+        """Get the calling thread's DataFetcher (exchange clients are not shared across threads)."""
+        fetcher = getattr(self._local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = self._local.fetcher = DataFetcher()
+        return fetcher
+    
+    def _sync_timeframe(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """Sync one symbol/timeframe and drop its cached frames if bars were added.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe to sync
+        
+        Returns:
+            Result entry for the symbol/timeframe
+        
+        Raises:
+            RateLimitExceeded: If the exchange rejected the sync for rate limiting
+            RuntimeError: If the sync failed for any other reason
+        """
+        logger.info(f"Updating {symbol} {timeframe}")
+        
+        sync_result = self._fetcher().sync_symbol_timeframe(symbol, timeframe)
+        
+        if sync_result["success"]:
+            bars_added = sync_result.get("bars_added", 0)
+            
+            if bars_added > 0:
+                invalidate_frames(symbol, timeframe)
+            
+            logger.info(f"Updated {symbol} {timeframe}: {bars_added} bars added")
+            return {
+                "success": True,
+                "bars_added": bars_added,
+                "message": sync_result.get("message", "")
+            }
+        
+        message = sync_result.get("message", "Unknown error")
+        if is_rate_limit_error(message):
+            raise RateLimitExceeded(message)
+        raise RuntimeError(message)
+    
     async def run(self) -> Dict[str, Any]:
         """Run the update data job.
         
@@ -35,50 +84,39 @@ class UpdateDataJob:
         try:
             logger.info("Starting update data job")
             
-            # Initialize services
-            fetcher = DataFetcher()
-            store = DataStore()
-            
             # Get symbols and timeframes to update
             symbols = getattr(settings, 'SYMBOLS', ["BTC/USDT", "ETH/USDT"])
             timeframes = getattr(settings, 'TARGET_TIMEFRAMES', ["15m", "1h", "4h", "1d"])
             
-            results = {}
-            total_bars_updated = 0
+            rate_limiter = None
+            if settings.RATE_LIMIT_ENABLED:
+                rate_limiter = RateLimiter(settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_COOLDOWN)
             
-            for symbol in symbols:
-                results[symbol] = {}
-                
-                for timeframe in timeframes:
-                    try:
-                        logger.info(f"Updating {symbol} {timeframe}")
-                        
-                        # Sync data
-                        sync_result = fetcher.sync_symbol_timeframe(symbol, timeframe)
-                        
-                        if sync_result["success"]:
-                            bars_added = sync_result.get("bars_added", 0)
-                            total_bars_updated += bars_added
-                            
-                            results[symbol][timeframe] = {
-                                "success": True,
-                                "bars_added": bars_added,
-                                "message": sync_result.get("message", "")
-                            }
-                            logger.info(f"Updated {symbol} {timeframe}: {bars_added} bars added")
-                        else:
-                            results[symbol][timeframe] = {
-                                "success": False,
-                                "error": sync_result.get("message", "Unknown error")
-                            }
-                            logger.warning(f"Failed to update {symbol} {timeframe}: {sync_result.get('message')}")
-                            
-                    except Exception as e:
-                        logger.error(f"Error updating {symbol} {timeframe}: {e}")
-                        results[symbol][timeframe] = {
-                            "success": False,
-                            "error": str(e)
-                        }
+            report = await fan_out(
+                lambda key: self._sync_timeframe(*key),
+                [(symbol, timeframe) for symbol in symbols for timeframe in timeframes],
+                concurrency=settings.DATA_SYNC_CONCURRENCY,
+                rate_limiter=rate_limiter,
+                max_retries=settings.MAX_RETRY_ATTEMPTS,
+                backoff_factor=settings.RETRY_BACKOFF_FACTOR
+            )
+            
+            results = {symbol: {} for symbol in symbols}
+            for outcome in report.outcomes:
+                symbol, timeframe = outcome.key
+                if outcome.success:
+                    results[symbol][timeframe] = outcome.result
+                else:
+                    results[symbol][timeframe] = {
+                        "success": False,
+                        "error": outcome.error
+                    }
+            
+            total_bars_updated = sum(
+                tf_result.get("bars_added", 0)
+                for symbol_results in results.values()
+                for tf_result in symbol_results.values()
+            )
             
             # Check if any updates were successful
             successful_updates = sum(
@@ -87,6 +125,18 @@ class UpdateDataJob:
                 if tf_result.get("success", False)
             )
             
+            failed_symbols = [
+                symbol for symbol, symbol_results in results.items()
+                if not any(tf_result.get("success", False) for tf_result in symbol_results.values())
+            ]
+            
+            metrics = report.metrics()
+            logger.info(
+                f"Synced {metrics['tasks']} symbol/timeframes in {metrics['elapsed_seconds']:.1f}s "
+                f"(concurrency {metrics['concurrency']}, {metrics['retries']} rate-limit retries, "
+                f"slowest {metrics['slowest']} {metrics['slowest_seconds']:.1f}s)"
+            )
+            
             if successful_updates == 0:
                 self.last_error = "No successful data updates"
                 logger.warning("Update data job completed with no successful updates")
@@ -94,7 +144,8 @@ class UpdateDataJob:
                     "success": False,
                     "error": "No successful data updates",
                     "results": results,
-                    "total_bars_updated": total_bars_updated
+                    "total_bars_updated": total_bars_updated,
+                    "metrics": metrics
                 }
             
             self.last_success = datetime.now(timezone.utc)
@@ -108,7 +159,9 @@ class UpdateDataJob:
                 "total_symbols": len(symbols),
                 "total_timeframes": len(timeframes),
                 "total_bars_updated": total_bars_updated,
-                "results": results
+                "failed_symbols": failed_symbols,
+                "results": results,
+                "metrics": metrics
             }
             
         except Exception as e:
@@ -137,37 +190,14 @@ class UpdateDataJob:
         try:
             logger.info(f"Starting update data job for {symbol}")
             
-            # Initialize services
-            fetcher = DataFetcher()
-            store = DataStore()
-            
             results = {}
             total_bars_updated = 0
             
             for timeframe in timeframes:
                 try:
-                    logger.info(f"Updating {symbol} {timeframe}")
-                    
-                    # Sync data
-                    sync_result = fetcher.sync_symbol_timeframe(symbol, timeframe)
-                    
-                    if sync_result["success"]:
-                        bars_added = sync_result.get("bars_added", 0)
-                        total_bars_updated += bars_added
-                        
-                        results[timeframe] = {
-                            "success": True,
-                            "bars_added": bars_added,
-                            "message": sync_result.get("message", "")
-                        }
-                        logger.info(f"Updated {symbol} {timeframe}: {bars_added} bars added")
-                    else:
-                        results[timeframe] = {
-                            "success": False,
-                            "error": sync_result.get("message", "Unknown error")
-                        }
-                        logger.warning(f"Failed to update {symbol} {timeframe}: {sync_result.get('message')}")
-                        
+                    results[timeframe] = self._sync_timeframe(symbol, timeframe)
+                    total_bars_updated += results[timeframe].get("bars_added", 0)
+                
                 except Exception as e:
                     logger.error(f"Error updating {symbol} {timeframe}: {e}")
                     results[timeframe] = {
@@ -2,7 +2,9 @@
 
 This package provides a comprehensive backtesting engine with support for:
 - Vectorized backtesting using vectorbt
+- Native array engine when vectorbt is not installed
 - Walk-forward analysis
+- Content-addressed result cache
 - One trade per day rule
 - Trading windows enforcement
 - OCO TP/SL orders
@@ -13,6 +15,8 @@ This package provides a comprehensive backtesting engine with support for:
 __version__ = "1.0.0"
 
 from app.research.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult
+from app.research.backtest.result_cache import BacktestResultCache, get_backtest_cache
+from app.research.backtest.simulator import simulate_signals
 from app.research.backtest.metrics import calculate_metrics
 from app.research.backtest.walk_forward import WalkForwardOptimizer, WalkForwardConfig, WalkForwardSummary
 from app.research.backtest.rules import (
@@ -26,6 +30,8 @@ from app.research.backtest.monte_carlo import (
     run_monte_carlo,
     MonteCarloResult,
     permute_returns_by_blocks,
+    bootstrap_returns,
+    simulate_block_bootstrap,
     calculate_risk_of_ruin,
     generate_monte_carlo_report
 )
@@ -34,6 +40,9 @@ __all__ = [
     'BacktestEngine',
     'BacktestConfig',
     'BacktestResult',
+    'BacktestResultCache',
+    'get_backtest_cache',
+    'simulate_signals',
     'calculate_metrics',
     'WalkForwardOptimizer',
     'WalkForwardConfig',
@@ -46,6 +55,8 @@ __all__ = [
     'run_monte_carlo',
     'MonteCarloResult',
     'permute_returns_by_blocks',
+    'bootstrap_returns',
+    'simulate_block_bootstrap',
     'calculate_risk_of_ruin',
     'generate_monte_carlo_report'
 ]
@@ -10,8 +10,9 @@ This module provides the main backtesting engine with support for:
 """
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any, Tuple, List
-from datetime import datetime
+from typing import Optional, Dict, Any, Tuple, List, Union
+from datetime import datetime, timedelta
+import hashlib
 from pydantic import BaseModel, Field
 import warnings
 
@@ -30,8 +31,18 @@ from app.core.calendar import TradingCalendar
 from app.core.risk import compute_levels
 from app.research.backtest.rules import (
     enforce_one_trade_per_day,
+    enforce_one_trade_per_day_array,
     filter_by_trading_windows,
-    apply_forced_close
+    apply_forced_close,
+    utc_days
+)
+from app.research.backtest.simulator import (
+    simulate_signals,
+    simulate_arrays,
+    ohlc_arrays,
+    TRADE_FIELD_INDEX,
+    EXIT_REASONS,
+    EXIT_END_OF_DATA
 )
 
 
@@ -61,6 +72,17 @@ class BacktestConfig(BaseModel):
     forced_close_time: str = Field(default="16:45", description="Forced close time (HH:MM)")
 
 
+# Columns of the results table returned by BacktestEngine.run_batch
+BATCH_RESULT_COLUMNS = [
+    'total_return', 'cagr', 'sharpe_ratio', 'sortino_ratio', 'calmar_ratio', 'max_drawdown',
+    'total_trades', 'winning_trades', 'losing_trades', 'win_rate', 'profit_factor',
+    'avg_trade', 'avg_win', 'avg_loss',
+    'volatility', 'downside_deviation', 'max_consecutive_losses', 'exposure_time',
+    'expectancy', 'recovery_factor', 'mar_ratio',
+    'initial_capital', 'final_capital', 'profit'
+]
+
+
 class BacktestResult(BaseModel):
     """Structured backtest results."""
     
@@ -127,14 +149,19 @@ class BacktestEngine:
         self.calendar = None
         
         if self.config.use_trading_windows:
-            from datetime import time
-            self.calendar = TradingCalendar(
-                window_a_start=time(*map(int, self.config.window_a_start.split(':'))),
-                window_a_end=time(*map(int, self.config.window_a_end.split(':'))),
-                window_b_start=time(*map(int, self.config.window_b_start.split(':'))),
-                window_b_end=time(*map(int, self.config.window_b_end.split(':'))),
-                forced_close_time=time(*map(int, self.config.forced_close_time.split(':')))
-            )
+            self.calendar = self._build_calendar(self.config)
+    
+    @staticmethod
+    def _build_calendar(config: BacktestConfig) -> TradingCalendar:
+        """Build the trading calendar for a config's windows and forced close time."""
+        from datetime import time
+        return TradingCalendar(
+            window_a_start=time(*map(int, config.window_a_start.split(':'))),
+            window_a_end=time(*map(int, config.window_a_end.split(':'))),
+            window_b_start=time(*map(int, config.window_b_start.split(':'))),
+            window_b_end=time(*map(int, config.window_b_end.split(':'))),
+            forced_close_time=time(*map(int, config.forced_close_time.split(':')))
+        )
     
     def run(
         self,
@@ -185,6 +212,132 @@ class BacktestEngine:
         
         return result
     
+    def run_batch(
+        self,
+        df: pd.DataFrame,
+        signal_matrix: Union[np.ndarray, pd.DataFrame],
+        configs: Optional[Union[BacktestConfig, List[BacktestConfig]]] = None,
+        names: Optional[List[str]] = None,
+        verbose: bool = False
+    ) -> pd.DataFrame:
+        """Run many signal variants on the same bars.
+        
+        Rule inputs (UTC days, trading window and forced close masks) and ATR
+        are computed once and shared by every variant, then each variant runs
+        through the native array engine. Each row matches running the native
+        engine (_run_fallback_backtest) with that variant's signals and config.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            signal_matrix: Signals as a (bars x variants) array or DataFrame.
+                DataFrame columns are used as variant names.
+            configs: One BacktestConfig per variant, a single config shared by
+                all variants, or None to use this engine's config
+            names: Variant names (default: variant_0, variant_1, ...)
+            verbose: Print progress
+            
+        Returns:
+            DataFrame indexed by variant name with BATCH_RESULT_COLUMNS
+        """
+        if isinstance(signal_matrix, pd.DataFrame):
+            if names is None:
+                names = [str(col) for col in signal_matrix.columns]
+            matrix = signal_matrix.to_numpy(dtype=np.float64)
+        else:
+            matrix = np.asarray(signal_matrix, dtype=np.float64)
+        
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(-1, 1)
+        
+        n_bars, n_variants = matrix.shape
+        if n_bars != len(df):
+            raise ValueError(f"Signal matrix has {n_bars} rows, expected {len(df)} (one per bar)")
+        
+        if configs is None:
+            configs = [self.config] * n_variants
+        elif isinstance(configs, BacktestConfig):
+            configs = [configs] * n_variants
+        elif len(configs) != n_variants:
+            raise ValueError(f"Got {len(configs)} configs for {n_variants} signal variants")
+        
+        if names is None:
+            names = [f"variant_{i}" for i in range(n_variants)]
+        elif len(names) != n_variants:
+            raise ValueError(f"Got {len(names)} names for {n_variants} signal variants")
+        
+        index = pd.Index(names, name='variant')
+        
+        if n_bars == 0:
+            rows = [
+                {col: getattr(self._empty_result(name), col) for col in BATCH_RESULT_COLUMNS}
+                for name in names
+            ]
+            return pd.DataFrame(rows, index=index, columns=BATCH_RESULT_COLUMNS)
+        
+        if verbose:
+            print(f"\nRunning batch backtest: {n_variants} variants x {n_bars} bars")
+        
+        # Shared inputs
+        timestamps = df['timestamp'].to_numpy()
+        ohlc = ohlc_arrays(df)
+        days = utc_days(timestamps) if any(cfg.one_trade_per_day for cfg in configs) else None
+        
+        atr_val = None
+        if n_bars >= 2 and any(cfg.use_atr_stops for cfg in configs):
+            from app.research.indicators import atr
+            atr_val = atr(df['high'], df['low'], df['close'], period=14)
+        
+        # (trading hours mask, forced close mask) per distinct calendar
+        calendar_masks = {}
+        
+        rows = []
+        for j, cfg in enumerate(configs):
+            values = matrix[:, j]
+            
+            # One trade per day
+            if cfg.one_trade_per_day:
+                values = enforce_one_trade_per_day_array(values, days)
+            
+            # Trading windows and forced close
+            force_close = None
+            if cfg.use_trading_windows:
+                key = (cfg.window_a_start, cfg.window_a_end, cfg.window_b_start, cfg.window_b_end, cfg.forced_close_time)
+                if key not in calendar_masks:
+                    calendar = self._build_calendar(cfg)
+                    calendar_masks[key] = (calendar.trading_hours_mask(timestamps), calendar.force_close_mask(timestamps))
+                trading_mask, force_mask = calendar_masks[key]
+                
+                values = np.where((values != 0) & ~trading_mask, 0.0, values)
+                if cfg.use_forced_close:
+                    force_close = force_mask
+            
+            # ATR stops
+            tp_stops = None
+            sl_stops = None
+            if cfg.use_atr_stops and atr_val is not None:
+                tp_stops = ((atr_val * cfg.atr_multiplier_tp) / df['close']).to_numpy()
+                sl_stops = ((atr_val * cfg.atr_multiplier_sl) / df['close']).to_numpy()
+            
+            equity, records = simulate_arrays(
+                ohlc,
+                values,
+                tp_pct=tp_stops,
+                sl_pct=sl_stops,
+                force_close=force_close,
+                commission=cfg.commission,
+                slippage=cfg.slippage,
+                risk_per_trade=cfg.risk_per_trade,
+                initial_capital=cfg.initial_capital
+            )
+            rows.append(self._summary_metrics(equity, records, df, cfg.initial_capital))
+        
+        results = pd.DataFrame(rows, index=index, columns=BATCH_RESULT_COLUMNS)
+        
+        if verbose:
+            print(f"Batch backtest completed: best Sharpe {results['sharpe_ratio'].max():.2f}")
+        
+        return results
+    
     def _apply_rules(self, df: pd.DataFrame, signals: pd.Series, verbose: bool) -> pd.Series:
         """Apply trading rules to signals.
         
@@ -399,12 +552,7 @@ class BacktestEngine:
         profit = final_capital - self.config.initial_capital
         
         # Generate hashes
-        import hashlib
-        dataset_content = f"{df['timestamp'].iloc[0]}_{df['timestamp'].iloc[-1]}_{len(df)}"
-        dataset_hash = hashlib.sha256(dataset_content.encode('utf-8')).hexdigest()[:16]
-        
-        params_content = str(self.config.dict())
-        params_hash = hashlib.sha256(params_content.encode('utf-8')).hexdigest()[:16]
+        dataset_hash, params_hash = self._compute_hashes(df)
         
         # Timestamps
         from_timestamp = int(df['timestamp'].iloc[0])
@@ -444,6 +592,23 @@ class BacktestEngine:
             to_timestamp=to_timestamp
         )
     
+    def _compute_hashes(self, df: pd.DataFrame) -> Tuple[str, str]:
+        """Compute dataset and parameters hashes.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            
+        Returns:
+            Tuple of (dataset_hash, params_hash)
+        """
+        dataset_content = f"{df['timestamp'].iloc[0]}_{df['timestamp'].iloc[-1]}_{len(df)}"
+        dataset_hash = hashlib.sha256(dataset_content.encode('utf-8')).hexdigest()[:16]
+        
+        params_content = str(self.config.dict())
+        params_hash = hashlib.sha256(params_content.encode('utf-8')).hexdigest()[:16]
+        
+        return dataset_hash, params_hash
+    
     def _print_summary(self, result: BacktestResult):
         """Print backtest summary.
         
@@ -494,7 +659,10 @@ class BacktestEngine:
         strategy_name: str = "Strategy",
         verbose: bool = True
     ) -> BacktestResult:
-        """Run fallback backtest without vectorbt.
+        """Run backtest with the native array engine (no vectorbt).
+        
+        Applies the same trading rules and ATR stops as the vectorbt path,
+        plus forced close of open positions, and records a trade ledger.
         
         Args:
             df: DataFrame with OHLCV data
@@ -503,190 +671,316 @@ class BacktestEngine:
             verbose: Print progress
             
         Returns:
-            BacktestResult with metrics
+            BacktestResult with metrics and trades
         """
         if verbose:
             print(f"\n{'='*60}")
             print(f"Running fallback backtest: {strategy_name}")
             print(f"{'='*60}")
         
-        # Simple backtest logic
+        if len(df) == 0:
+            return self._empty_result(strategy_name)
+        
+        # Align signals with bars by position (missing bars are flat)
+        signal_values = np.zeros(len(df))
+        n_aligned = min(len(signals), len(df))
+        signal_values[:n_aligned] = np.asarray(signals, dtype=np.float64)[:n_aligned]
+        signals = pd.Series(signal_values, index=df.index)
+        
+        # 1. Apply trading rules
+        signals = self._apply_rules(df, signals, verbose)
+        
+        # 2. Calculate TP/SL levels if using ATR
+        tp_stops = None
+        sl_stops = None
+        if self.config.use_atr_stops and len(df) >= 2:
+            tp_stops, sl_stops = self._calculate_atr_stops(df, signals)
+        
+        # 3. Forced close mask (only when a calendar is configured)
+        force_close = None
+        if self.config.use_forced_close and self.calendar:
+            force_close = self.calendar.force_close_mask(df['timestamp'].to_numpy())
+        
+        # 4. Simulate
+        equity, records = simulate_signals(
+            df,
+            signals,
+            tp_pct=tp_stops,
+            sl_pct=sl_stops,
+            force_close=force_close,
+            commission=self.config.commission,
+            slippage=self.config.slippage,
+            risk_per_trade=self.config.risk_per_trade,
+            initial_capital=self.config.initial_capital
+        )
+        
+        # 5. Calculate metrics
+        result = self._calculate_array_metrics(equity, records, strategy_name, df, verbose)
+        
+        if verbose:
+            self._print_summary(result)
+        
+        return result
+    
+    def _build_trade_ledger(self, records: np.ndarray, df: pd.DataFrame) -> List[Dict]:
+        """Convert simulator trade records to the trade ledger format.
+        
+        Args:
+            records: Trade records from simulate_signals
+            df: DataFrame with OHLCV data
+            
+        Returns:
+            List of trade dicts
+        """
+        if len(records) == 0:
+            return []
+        
+        col = TRADE_FIELD_INDEX
+        timestamps = df['timestamp'].to_numpy()
+        entry_idx = records[:, col['entry_idx']].astype(np.int64)
+        exit_idx = records[:, col['exit_idx']].astype(np.int64)
+        entry_times = pd.to_datetime(timestamps[entry_idx], unit='ms')
+        exit_times = pd.to_datetime(timestamps[exit_idx], unit='ms')
+        notional = records[:, col['quantity']] * records[:, col['entry_price']]
+        
         trades = []
-        capital = self.config.initial_capital
-        position = 0
-        entry_price = 0
-        entry_time = None
-        
-        for i, (timestamp, row) in enumerate(df.iterrows()):
-            signal = signals.iloc[i] if i < len(signals) else 0
-            price = row['close']
+        for k in range(len(records)):
+            row = records[k]
+            reason = int(row[col['exit_reason']])
+            trades.append({
+                'entry_time': entry_times[k].to_pydatetime(),
+                'exit_time': exit_times[k].to_pydatetime(),
+                'entry_price': float(row[col['entry_price']]),
+                'exit_price': float(row[col['exit_price']]),
+                'quantity': float(row[col['quantity']]),
+                'side': 'LONG' if row[col['side']] > 0 else 'SHORT',
+                'pnl': float(row[col['pnl']]),
+                'pnl_pct': float(row[col['pnl']] / notional[k]) if notional[k] > 0 else 0.0,
+                'pnl_gross': float(row[col['pnl_gross']]),
+                'commission': float(row[col['commission']]),
+                'slippage': float(row[col['slippage']]),
+                'holding_time_hours': float((timestamps[exit_idx[k]] - timestamps[entry_idx[k]]) / (1000 * 60 * 60)),
+                'exit_reason': EXIT_REASONS[reason],
+                'status': 'OPEN' if reason == EXIT_END_OF_DATA else 'CLOSED'
+            })
+        
+        return trades
+    
+    def _summary_metrics(
+        self,
+        equity: np.ndarray,
+        records: np.ndarray,
+        df: pd.DataFrame,
+        initial_capital: float
+    ) -> Dict[str, float]:
+        """Calculate summary metrics from an equity curve and trade records.
+        
+        Uses the same definitions as _calculate_metrics.
+        
+        Args:
+            equity: Equity curve (one value per bar)
+            records: Trade records from simulate_signals
+            df: Original DataFrame
+            initial_capital: Initial capital
             
-            # Entry logic
-            if signal != 0 and position == 0:
-                # Calculate position size based on risk
-                risk_amount = capital * self.config.risk_per_trade
-                position_size = risk_amount / price
-                
-                position = position_size
-                entry_price = price
-                entry_time = timestamp
-                
-                if verbose and i % 100 == 0:
-                    print(f"Entry at {price:.2f}, position: {position:.4f}")
+        Returns:
+            Dictionary with one value per BATCH_RESULT_COLUMNS entry
+        """
+        # Returns
+        previous = np.concatenate(([initial_capital], equity[:-1]))
+        returns = pd.Series(np.divide(equity - previous, previous, out=np.zeros(len(equity)), where=previous != 0))
+        final_capital = float(equity[-1])
+        total_return = final_capital / initial_capital - 1
+        
+        # Drawdown
+        running_max = np.maximum.accumulate(equity)
+        drawdown = (equity - running_max) / running_max
+        max_dd = float(drawdown.min())
+        
+        # Trades
+        col = TRADE_FIELD_INDEX
+        pnls = records[:, col['pnl']]
+        num_trades = len(records)
+        
+        if num_trades > 0:
+            wins = pnls[pnls > 0]
+            losses = pnls[pnls < 0]
+            winning_trades = len(wins)
+            losing_trades = len(losses)
+            win_rate = winning_trades / num_trades
             
-            # Exit logic
-            elif position != 0 and signal == 0:
-                # Calculate PnL
-                pnl = (price - entry_price) * position
-                pnl_pct = pnl / (entry_price * position) if position > 0 else 0
-                
-                # Apply commission and slippage
-                commission = abs(position * price * self.config.commission)
-                slippage = abs(position * price * self.config.slippage)
-                net_pnl = pnl - commission - slippage
-                
-                # Calculate holding time
-                holding_time = (timestamp - entry_time).total_seconds() / 3600 if isinstance(timestamp, datetime) and isinstance(entry_time, datetime) else 0
-                
-                trades.append({
-                    'entry_time': entry_time,
-                    'exit_time': timestamp,
-                    'entry_price': entry_price,
-                    'exit_price': price,
-                    'quantity': position,
-                    'side': 'LONG',  # Simplified for fallback
-                    'pnl': net_pnl,
-                    'pnl_pct': pnl_pct,
-                    'pnl_gross': pnl,
-                    'commission': commission,
-                    'slippage': slippage,
-                    'holding_time_hours': holding_time,
-                    'status': 'CLOSED'
-                })
-                
-                capital += net_pnl
-                position = 0
-                entry_price = 0
-                entry_time = None
-        
-        # Calculate metrics
-        if not trades:
-            # Handle empty DataFrame
-            if len(df) == 0:
-                start_date = datetime.now() - timedelta(days=30)
-                end_date = datetime.now()
-            else:
-                start_date = df.index[0]
-                end_date = df.index[-1]
+            avg_win = wins.mean() if len(wins) > 0 else 0
+            avg_loss = abs(losses.mean()) if len(losses) > 0 else 0
+            avg_trade = pnls.mean()
             
-            return BacktestResult(
-                strategy_name=strategy_name,
-                start_date=start_date,
-                end_date=end_date,
-                initial_capital=self.config.initial_capital,
-                final_capital=self.config.initial_capital,
-                profit=0.0,
-                total_return=0.0,
-                cagr=0.0,
-                sharpe_ratio=0.0,
-                sortino_ratio=0.0,
-                calmar_ratio=0.0,
-                max_drawdown=0.0,
-                volatility=0.0,
-                win_rate=0.0,
-                profit_factor=0.0,
-                expectancy=0.0,
-                total_trades=0,
-                winning_trades=0,
-                losing_trades=0,
-                avg_win=0.0,
-                avg_loss=0.0,
-                dataset_hash="empty_hash",
-                params_hash="empty_params",
-                from_timestamp=int(start_date.timestamp() * 1000),
-                to_timestamp=int(end_date.timestamp() * 1000),
-                trades=trades
-            )
+            profit_factor = abs(wins.sum() / losses.sum()) if len(losses) > 0 and losses.sum() != 0 else 0
+            
+            # Expectancy
+            expectancy = (win_rate * avg_win) - ((1 - win_rate) * avg_loss)
+            
+            # Max consecutive losses
+            max_consecutive = 0
+            current_consecutive = 0
+            for is_loss in pnls < 0:
+                if is_loss:
+                    current_consecutive += 1
+                    max_consecutive = max(max_consecutive, current_consecutive)
+                else:
+                    current_consecutive = 0
+        else:
+            winning_trades = 0
+            losing_trades = 0
+            win_rate = 0
+            avg_win = 0
+            avg_loss = 0
+            avg_trade = 0
+            profit_factor = 0
+            expectancy = 0
+            max_consecutive = 0
         
-        # Calculate comprehensive metrics
-        from app.utils.metrics_helper import MetricsCalculator
+        # Risk metrics
+        returns_std = returns.std() if len(returns) > 1 else 0.0
+        volatility = returns_std * np.sqrt(252)  # Annualized
         
-        calculator = MetricsCalculator()
-        equity_curve = [self.config.initial_capital]
-        for trade in trades:
-            equity_curve.append(equity_curve[-1] + trade['pnl'])
+        # Downside deviation
+        downside_returns = returns[returns < 0]
+        downside_deviation = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 1 else 0
         
-        # Handle empty DataFrame
-        if len(df) == 0:
-            start_date = datetime.now() - timedelta(days=30)
-            end_date = datetime.now()
-        else:
-            start_date = df.index[0]
-            end_date = df.index[-1]
+        # Sharpe ratio
+        sharpe = (returns.mean() / returns_std * np.sqrt(252)) if returns_std != 0 else 0
         
-        metrics = calculator.calculate_comprehensive_metrics(
-            trades=trades,
-            equity_curve=equity_curve,
-            initial_capital=self.config.initial_capital,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # Sortino ratio
+        sortino = (returns.mean() / downside_deviation * np.sqrt(252)) if downside_deviation != 0 else 0
+        
+        # CAGR
+        days = (df['timestamp'].iloc[-1] - df['timestamp'].iloc[0]) / (1000 * 60 * 60 * 24)
+        years = days / 365.25
+        cagr = ((1 + total_return) ** (1 / years) - 1) if years > 0 and total_return > -1 else 0
+        
+        # Calmar ratio
+        calmar = cagr / abs(max_dd) if max_dd != 0 else 0
+        
+        # Recovery factor
+        recovery_factor = total_return / abs(max_dd) if max_dd != 0 else 0
+        
+        # MAR ratio (using average drawdown)
+        avg_dd = abs(drawdown.mean())
+        mar_ratio = cagr / avg_dd if avg_dd != 0 else 0
+        
+        # Exposure time (bars between entry and exit)
+        bars_in_market = (records[:, col['exit_idx']] - records[:, col['entry_idx']]).sum() if num_trades > 0 else 0
+        exposure = bars_in_market / len(df)
+        
+        return {
+            'total_return': float(total_return),
+            'cagr': float(cagr),
+            'sharpe_ratio': float(sharpe),
+            'sortino_ratio': float(sortino),
+            'calmar_ratio': float(calmar),
+            'max_drawdown': float(max_dd),
+            'total_trades': int(num_trades),
+            'winning_trades': int(winning_trades),
+            'losing_trades': int(losing_trades),
+            'win_rate': float(win_rate),
+            'profit_factor': float(profit_factor),
+            'avg_trade': float(avg_trade),
+            'avg_win': float(avg_win),
+            'avg_loss': float(avg_loss),
+            'volatility': float(volatility),
+            'downside_deviation': float(downside_deviation),
+            'max_consecutive_losses': int(max_consecutive),
+            'exposure_time': float(exposure),
+            'expectancy': float(expectancy),
+            'recovery_factor': float(recovery_factor),
+            'mar_ratio': float(mar_ratio),
+            'initial_capital': float(initial_capital),
+            'final_capital': final_capital,
+            'profit': final_capital - initial_capital
+        }
+    
+    def _calculate_array_metrics(
+        self,
+        equity: np.ndarray,
+        records: np.ndarray,
+        strategy_name: str,
+        df: pd.DataFrame,
+        verbose: bool
+    ) -> BacktestResult:
+        """Calculate performance metrics from the native engine output.
         
+        Args:
+            equity: Equity curve (one value per bar)
+            records: Trade records from simulate_signals
+            strategy_name: Strategy name
+            df: Original DataFrame
+            verbose: Print info
+            
+        Returns:
+            BacktestResult with all metrics
+        """
         if verbose:
-            print(f"Fallback backtest completed: {len(trades)} trades")
-            print(f"Final capital: ${capital:.2f}")
+            print("\nCalculating metrics...")
         
-        # Calculate profit
-        profit = capital - self.config.initial_capital
-        
-        # Generate hashes for data integrity
-        import hashlib
-        import json
-        
-        # Dataset hash (simplified)
-        dataset_content = json.dumps({
-            "start": start_date.isoformat(),
-            "end": end_date.isoformat(),
-            "bars": len(df)
-        }, sort_keys=True)
-        dataset_hash = hashlib.sha256(dataset_content.encode()).hexdigest()
-        
-        # Parameters hash
-        params_content = json.dumps({
-            "risk_per_trade": self.config.risk_per_trade,
-            "commission": self.config.commission,
-            "slippage": self.config.slippage,
-            "one_trade_per_day": self.config.one_trade_per_day,
-            "use_trading_windows": self.config.use_trading_windows
-        }, sort_keys=True)
-        params_hash = hashlib.sha256(params_content.encode()).hexdigest()
+        metrics = self._summary_metrics(equity, records, df, self.config.initial_capital)
+        
+        # Generate hashes
+        dataset_hash, params_hash = self._compute_hashes(df)
         
         return BacktestResult(
+            **metrics,
             strategy_name=strategy_name,
-            start_date=start_date,
-            end_date=end_date,
-            initial_capital=self.config.initial_capital,
-            final_capital=capital,
-            profit=profit,
-            total_return=metrics['total_return'],
-            cagr=metrics['cagr'],
-            sharpe_ratio=metrics['sharpe_ratio'],
-            sortino_ratio=metrics['sortino_ratio'],
-            calmar_ratio=metrics['calmar_ratio'],
-            max_drawdown=metrics['max_drawdown'],
-            volatility=metrics['volatility'],
-            win_rate=metrics['win_rate'],
-            profit_factor=metrics['profit_factor'],
-            expectancy=metrics['expectancy'],
-            total_trades=metrics['total_trades'],
-            winning_trades=metrics['winning_trades'],
-            losing_trades=metrics['losing_trades'],
-            avg_win=metrics['avg_win'],
-            avg_loss=metrics['avg_loss'],
+            start_date=pd.to_datetime(df['timestamp'].iloc[0], unit='ms'),
+            end_date=pd.to_datetime(df['timestamp'].iloc[-1], unit='ms'),
             dataset_hash=dataset_hash,
             params_hash=params_hash,
+            from_timestamp=int(df['timestamp'].iloc[0]),
+            to_timestamp=int(df['timestamp'].iloc[-1]),
+            trades=self._build_trade_ledger(records, df)
+        )
+    
+    def _empty_result(self, strategy_name: str) -> BacktestResult:
+        """Build a zero result for an empty dataset.
+        
+        Args:
+            strategy_name: Strategy name
+            
+        Returns:
+            BacktestResult with no trades
+        """
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=30)
+        
+        return BacktestResult(
+            total_return=0.0,
+            cagr=0.0,
+            sharpe_ratio=0.0,
+            sortino_ratio=0.0,
+            calmar_ratio=0.0,
+            max_drawdown=0.0,
+            total_trades=0,
+            winning_trades=0,
+            losing_trades=0,
+            win_rate=0.0,
+            profit_factor=0.0,
+            avg_trade=0.0,
+            avg_win=0.0,
+            avg_loss=0.0,
+            volatility=0.0,
+            downside_deviation=0.0,
+            max_consecutive_losses=0,
+            exposure_time=0.0,
+            expectancy=0.0,
+            recovery_factor=0.0,
+            mar_ratio=0.0,
+            strategy_name=strategy_name,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=float(self.config.initial_capital),
+            final_capital=float(self.config.initial_capital),
+            profit=0.0,
+            dataset_hash="empty_hash",
+            params_hash="empty_params",
             from_timestamp=int(start_date.timestamp() * 1000),
             to_timestamp=int(end_date.timestamp() * 1000),
-            trades=trades
+            trades=[]
         )
-
@@ -1,20 +1,33 @@
 """Monte Carlo simulation and stability analysis.
 
 This module provides Monte Carlo simulation for:
-- Return permutation by blocks
+- Return resampling by blocks (permutation, circular and stationary bootstrap)
 - Risk of ruin estimation
 - Expected drawdown
 - Confidence intervals
 - Stability metrics
 """
+import os
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple, Union
 from pydantic import BaseModel, Field
 import warnings
 
 warnings.filterwarnings('ignore')
 
+# Upper bound on simulated bars held in memory per chunk (~64 MB per float64 matrix)
+MAX_CHUNK_ELEMENTS = 8_000_000
+
+BOOTSTRAP_METHODS = ("permutation", "circular", "stationary")
+
+METHOD_LABELS = {
+    "permutation": "Block permutation",
+    "circular": "Circular block bootstrap",
+    "stationary": "Stationary bootstrap (geometric block lengths)"
+}
+
 
 class MonteCarloResult(BaseModel):
     """Monte Carlo simulation result."""
@@ -53,6 +66,8 @@ class MonteCarloResult(BaseModel):
     # Simulation metadata
     num_simulations: int = Field(..., description="Number of simulations")
     block_size: int = Field(..., description="Block size used")
+    method: str = Field("permutation", description="Resampling method")
+    seed: Optional[int] = Field(None, description="Seed entropy that reproduces the run")
     
     # Raw results
     all_returns: List[float] = Field(default_factory=list, description="All simulated returns")
@@ -60,6 +75,151 @@ class MonteCarloResult(BaseModel):
     all_sharpes: List[float] = Field(default_factory=list, description="All Sharpe ratios")
 
 
+def block_permutation_indices(
+    n_blocks: int,
+    num_simulations: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Draw one random block ordering per simulation.
+    
+    Args:
+        n_blocks: Number of blocks
+        num_simulations: Number of simulations
+        rng: Random generator
+    
+    Returns:
+        (num_simulations x n_blocks) matrix of block indices
+    """
+    order = np.broadcast_to(np.arange(n_blocks), (num_simulations, n_blocks))
+    return rng.permuted(order, axis=1)
+
+
+def circular_bootstrap_indices(
+    n_bars: int,
+    block_size: int,
+    num_simulations: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Draw circular block bootstrap paths.
+    
+    Blocks of block_size bars start at uniformly random bars and wrap
+    around the end of the series, so every bar is equally likely.
+    
+    Args:
+        n_bars: Number of historical bars
+        block_size: Bars per block
+        num_simulations: Number of simulations
+        rng: Random generator
+    
+    Returns:
+        (num_simulations x n_bars) matrix of bar indices
+    """
+    n_blocks = -(-n_bars // block_size)
+    starts = rng.integers(0, n_bars, size=(num_simulations, n_blocks))
+    index = (starts[:, :, None] + np.arange(block_size)) % n_bars
+    return index.reshape(num_simulations, -1)[:, :n_bars]
+
+
+def stationary_bootstrap_indices(
+    n_bars: int,
+    block_size: int,
+    num_simulations: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Draw stationary bootstrap paths (Politis & Romano).
+    
+    Like the circular bootstrap, but block lengths are geometric with
+    mean block_size: each bar starts a new block with probability
+    1 / block_size.
+    
+    Args:
+        n_bars: Number of historical bars
+        block_size: Mean bars per block
+        num_simulations: Number of simulations
+        rng: Random generator
+    
+    Returns:
+        (num_simulations x n_bars) matrix of bar indices
+    """
+    starts = rng.integers(0, n_bars, size=(num_simulations, n_bars))
+    new_block = rng.random((num_simulations, n_bars)) < 1.0 / block_size
+    new_block[:, 0] = True
+    
+    # Position where the current block began, for every bar
+    positions = np.arange(n_bars)
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    
+    index = np.take_along_axis(starts, block_start, axis=1) + (positions - block_start)
+    return index % n_bars
+
+
+def bootstrap_indices(
+    n_bars: int,
+    block_size: int,
+    num_simulations: int,
+    rng: np.random.Generator,
+    method: str = "permutation"
+) -> np.ndarray:
+    """Draw resampled paths as bar indices into the historical returns.
+    
+    Args:
+        n_bars: Number of historical bars
+        block_size: Bars per block (mean block length for 'stationary')
+        num_simulations: Number of simulations
+        rng: Random generator
+        method: 'permutation', 'circular' or 'stationary'
+    
+    Returns:
+        (num_simulations x path_length) matrix of bar indices. Paths have
+        n_bars bars, except for 'permutation' which drops the incomplete
+        last block.
+    """
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size}")
+    
+    if method == "permutation":
+        n_blocks = n_bars // block_size
+        if n_blocks == 0:
+            raise ValueError(f"Need at least {block_size} returns for block size {block_size}, got {n_bars}")
+        order = block_permutation_indices(n_blocks, num_simulations, rng)
+        return (order[:, :, None] * block_size + np.arange(block_size)).reshape(num_simulations, -1)
+    
+    if n_bars == 0:
+        raise ValueError("Need at least one return to bootstrap")
+    
+    if method == "circular":
+        return circular_bootstrap_indices(n_bars, block_size, num_simulations, rng)
+    if method == "stationary":
+        return stationary_bootstrap_indices(n_bars, block_size, num_simulations, rng)
+    
+    raise ValueError(f"Unknown bootstrap method '{method}'. Expected one of {BOOTSTRAP_METHODS}")
+
+
+def bootstrap_returns(
+    returns: pd.Series,
+    block_size: int = 5,
+    num_simulations: int = 1000,
+    method: str = "permutation",
+    seed: Optional[int] = None
+) -> List[pd.Series]:
+    """Resample returns by blocks to preserve autocorrelation.
+    
+    Args:
+        returns: Original returns series
+        block_size: Bars per block (mean block length for 'stationary')
+        num_simulations: Number of simulations
+        method: 'permutation', 'circular' or 'stationary'
+        seed: Random seed for reproducibility
+    
+    Returns:
+        List of resampled return series
+    """
+    values = np.asarray(returns, dtype=np.float64)
+    index = bootstrap_indices(len(values), block_size, num_simulations, np.random.default_rng(seed), method)
+    
+    return [pd.Series(path) for path in values[index]]
+
+
 def permute_returns_by_blocks(
     returns: pd.Series,
     block_size: int = 5,
@@ -73,60 +233,146 @@ def permute_returns_by_blocks(
         block_size: Size of blocks to permute
         num_simulations: Number of simulations
         seed: Random seed for reproducibility
-        
+    
     Returns:
         List of permuted return series
     """
-    if seed is not None:
-        np.random.seed(seed)
+    return bootstrap_returns(returns, block_size, num_simulations, "permutation", seed)
+
+
+def _simulate_paths(
+    values: np.ndarray,
+    index: np.ndarray,
+    initial_capital: float
+) -> Dict[str, np.ndarray]:
+    """Compute per-simulation metrics for a batch of resampled paths.
+    
+    NaN returns are skipped (equity carried forward), as in pandas.
+    
+    Args:
+        values: Historical returns
+        index: (n_sims x path_length) bar indices into values
+        initial_capital: Initial capital
+    
+    Returns:
+        Dict of 'total_return', 'sharpe', 'max_dd' arrays (one value per simulation)
+    """
+    paths = values[index]
+    
+    # Sharpe
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nanmean(paths, axis=1)
+        std = np.nanstd(paths, axis=1, ddof=1)
+        sharpe = np.where(std > 0, mean / std * np.sqrt(252), 0.0)
+    
+    # Equity curves
+    equity = np.nan_to_num(paths, nan=0.0)
+    equity += 1.0
+    np.cumprod(equity, axis=1, out=equity)
+    total_return = equity[:, -1] - 1
+    equity *= initial_capital
+    
+    # Max drawdown
+    drawdown = np.maximum.accumulate(equity, axis=1)
+    np.subtract(equity, drawdown, out=equity)
+    np.divide(equity, drawdown, out=equity)
+    max_dd = np.abs(equity.min(axis=1))
+    
+    return {'total_return': total_return, 'sharpe': sharpe, 'max_dd': max_dd}
+
+
+def simulate_block_bootstrap(
+    returns: pd.Series,
+    block_size: int = 5,
+    num_simulations: int = 1000,
+    initial_capital: float = 100000.0,
+    method: str = "permutation",
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+    chunk_size: Optional[int] = None,
+    n_jobs: int = 1
+) -> Dict[str, np.ndarray]:
+    """Simulate block-resampled return paths in batched NumPy.
+    
+    Simulations are generated as (chunk_size x n_bars) matrices so that
+    memory stays bounded, and chunks can run on several threads (NumPy
+    releases the GIL in the heavy kernels). Each chunk draws from its own
+    child of SeedSequence(seed), so results depend on seed and chunk_size
+    but not on n_jobs.
+    
+    To split a run across processes, spawn children from one SeedSequence
+    and pass one child as seed to each process; the combined output is
+    reproducible from the parent entropy.
+    
+    Args:
+        returns: Historical returns series
+        block_size: Bars per block (mean block length for 'stationary')
+        num_simulations: Number of simulations
+        initial_capital: Initial capital
+        method: 'permutation', 'circular' or 'stationary'
+        seed: Random seed or SeedSequence
+        chunk_size: Simulations per chunk (default: ~MAX_CHUNK_ELEMENTS bars)
+        n_jobs: Worker threads (-1 = all cores)
+    
+    Returns:
+        Dict of 'total_return', 'sharpe', 'max_dd' arrays of length num_simulations
+    """
+    values = np.asarray(returns, dtype=np.float64)
     
-    # Split returns into blocks
-    n_returns = len(returns)
-    n_blocks = n_returns // block_size
+    # Validate inputs before spawning workers
+    path_length = bootstrap_indices(len(values), block_size, 1, np.random.default_rng(0), method).shape[1]
     
-    # Trim to fit blocks
-    trimmed_returns = returns.iloc[:n_blocks * block_size].values
-    blocks = trimmed_returns.reshape(n_blocks, block_size)
+    if chunk_size is None:
+        chunk_size = max(1, MAX_CHUNK_ELEMENTS // path_length)
     
-    # Simulate
-    simulated_returns = []
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
     
-    for _ in range(num_simulations):
-        # Randomly permute blocks
-        shuffled_blocks = blocks[np.random.permutation(n_blocks)]
-        
-        # Flatten back to series
-        shuffled_returns = shuffled_blocks.flatten()
-        simulated_returns.append(pd.Series(shuffled_returns))
+    sizes = [min(chunk_size, num_simulations - start) for start in range(0, num_simulations, chunk_size)]
+    seeds = seed.spawn(len(sizes))
     
-    return simulated_returns
+    def run_chunk(i: int) -> Dict[str, np.ndarray]:
+        rng = np.random.default_rng(seeds[i])
+        index = bootstrap_indices(len(values), block_size, sizes[i], rng, method)
+        return _simulate_paths(values, index, initial_capital)
+    
+    n_workers = min(n_jobs if n_jobs >= 1 else (os.cpu_count() or 1), len(sizes))
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            chunks = list(executor.map(run_chunk, range(len(sizes))))
+    else:
+        chunks = [run_chunk(i) for i in range(len(sizes))]
+    
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in ('total_return', 'sharpe', 'max_dd')}
 
 
 def calculate_risk_of_ruin(
-    equity_curves: List[pd.Series],
+    equity_curves: Union[List[pd.Series], np.ndarray],
     ruin_threshold: float = 0.5
 ) -> float:
     """Calculate risk of ruin (probability of losing X% of capital).
     
     Args:
-        equity_curves: List of equity curve series
+        equity_curves: List of equity curve series, or a (n_sims x n_bars) matrix
         ruin_threshold: Threshold for ruin (0.5 = 50% loss)
-        
+    
     Returns:
         Probability of ruin (0-1)
     """
-    num_ruined = 0
-    
-    for equity in equity_curves:
-        # Calculate drawdown
-        running_max = equity.expanding().max()
-        drawdown = (equity - running_max) / running_max
-        
-        # Check if ruin occurred
-        if abs(drawdown.min()) >= ruin_threshold:
-            num_ruined += 1
-    
-    risk = num_ruined / len(equity_curves)
+    if isinstance(equity_curves, np.ndarray):
+        matrices = [np.atleast_2d(equity_curves)]
+    elif len({len(equity) for equity in equity_curves}) == 1:
+        matrices = [np.vstack([np.asarray(equity, dtype=np.float64) for equity in equity_curves])]
+    else:
+        matrices = [np.asarray(equity, dtype=np.float64)[None, :] for equity in equity_curves]
+    
+    # Max drawdown per curve (NaN values skipped)
+    max_dds = []
+    for matrix in matrices:
+        running_max = np.fmax.accumulate(matrix, axis=1)
+        with np.errstate(invalid='ignore'):
+            max_dds.append(np.abs(np.nanmin((matrix - running_max) / running_max, axis=1)))
+    
+    risk = np.mean(np.concatenate(max_dds) >= ruin_threshold)
     return float(risk)
 
 
@@ -138,7 +384,7 @@ def calculate_stability_index(returns_list: List[float]) -> float:
     
     Args:
         returns_list: List of returns from simulations
-        
+    
     Returns:
         Stability index (higher is better)
     """
@@ -167,19 +413,25 @@ def run_monte_carlo(
     num_simulations: int = 1000,
     ruin_threshold: float = 0.5,
     seed: Optional[int] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    chunk_size: Optional[int] = None,
+    n_jobs: int = 1,
+    method: str = "permutation"
 ) -> MonteCarloResult:
     """Run Monte Carlo simulation.
     
     Args:
         returns: Historical returns series
         initial_capital: Initial capital
-        block_size: Block size for permutation
+        block_size: Bars per block (mean block length for 'stationary')
         num_simulations: Number of simulations
         ruin_threshold: Threshold for risk of ruin
-        seed: Random seed
+        seed: Random seed (fresh entropy if None, recorded in the result)
         verbose: Print progress
-        
+        chunk_size: Simulations per batch (default: bounded by MAX_CHUNK_ELEMENTS)
+        n_jobs: Worker threads for simulation chunks (-1 = all cores)
+        method: Resampling method: 'permutation', 'circular' or 'stationary'
+    
     Returns:
         MonteCarloResult with all metrics
     """
@@ -188,47 +440,28 @@ def run_monte_carlo(
         print(f"Monte Carlo Simulation")
         print(f"{'='*60}")
         print(f"Simulations: {num_simulations}")
+        print(f"Method: {method}")
         print(f"Block size: {block_size}")
         print(f"Ruin threshold: {ruin_threshold:.0%}")
     
-    # Permute returns
+    # Run simulations
     if verbose:
-        print(f"\nPermuting returns...")
+        print(f"\nRunning simulations...")
     
-    simulated_returns_list = permute_returns_by_blocks(
-        returns, block_size, num_simulations, seed
+    seed_sequence = np.random.SeedSequence(seed)
+    simulated = simulate_block_bootstrap(
+        returns,
+        block_size=block_size,
+        num_simulations=num_simulations,
+        initial_capital=initial_capital,
+        method=method,
+        seed=seed_sequence,
+        chunk_size=chunk_size,
+        n_jobs=n_jobs
     )
-    
-    # Run simulations
-    if verbose:
-        print(f"Running simulations...")
-    
-    all_returns = []
-    all_max_dds = []
-    all_sharpes = []
-    all_equity_curves = []
-    
-    for i, sim_returns in enumerate(simulated_returns_list):
-        if verbose and (i + 1) % 100 == 0:
-            print(f"  Completed: {i+1}/{num_simulations}")
-        
-        # Calculate metrics
-        total_return = (1 + sim_returns).prod() - 1
-        all_returns.append(total_return)
-        
-        # Sharpe
-        sharpe = (sim_returns.mean() / sim_returns.std() * np.sqrt(252)) if sim_returns.std() > 0 else 0
-        all_sharpes.append(sharpe)
-        
-        # Max drawdown
-        equity = (1 + sim_returns).cumprod() * initial_capital
-        running_max = equity.expanding().max()
-        drawdown = (equity - running_max) / running_max
-        max_dd = abs(drawdown.min())
-        all_max_dds.append(max_dd)
-        
-        # Store equity curve
-        all_equity_curves.append(equity)
+    all_returns = simulated['total_return']
+    all_max_dds = simulated['max_dd']
+    all_sharpes = simulated['sharpe']
     
     # Calculate statistics
     if verbose:
@@ -246,12 +479,12 @@ def run_monte_carlo(
     # Drawdown stats
     mean_max_dd = np.mean(all_max_dds)
     median_max_dd = np.median(all_max_dds)
-    worst_dd = max(all_max_dds)
+    worst_dd = np.max(all_max_dds)
     dd_95_percentile = np.percentile(all_max_dds, 95)
     
     # Risk metrics
-    risk_ruin = calculate_risk_of_ruin(all_equity_curves, ruin_threshold)
-    prob_profit = sum(1 for r in all_returns if r > 0) / len(all_returns)
+    risk_ruin = np.mean(all_max_dds >= ruin_threshold)
+    prob_profit = np.mean(all_returns > 0)
     
     # Sharpe distribution
     mean_sharpe = np.mean(all_sharpes)
@@ -284,9 +517,11 @@ def run_monte_carlo(
         stability_index=float(stability),
         num_simulations=num_simulations,
         block_size=block_size,
-        all_returns=all_returns,
-        all_max_dds=all_max_dds,
-        all_sharpes=all_sharpes
+        method=method,
+        seed=seed_sequence.entropy,
+        all_returns=all_returns.tolist(),
+        all_max_dds=all_max_dds.tolist(),
+        all_sharpes=all_sharpes.tolist()
     )
     
     if verbose:
@@ -333,6 +568,7 @@ def print_monte_carlo_summary(result: MonteCarloResult):
     
     print(f"\n📌 Simulation Info:")
     print(f"  Simulations: {result.num_simulations}")
+    print(f"  Method: {result.method}")
     print(f"  Block Size: {result.block_size}")
     
     print(f"{'='*60}\n")
@@ -343,7 +579,7 @@ def generate_monte_carlo_report(result: MonteCarloResult) -> str:
     
     Args:
         result: MonteCarloResult
-        
+    
     Returns:
         Formatted report string
     """
@@ -355,7 +591,8 @@ METHODOLOGY
 -----------
 - Simulations: {result.num_simulations:,}
 - Block Size: {result.block_size} (preserves autocorrelation)
-- Method: Block permutation
+- Method: {METHOD_LABELS.get(result.method, result.method)}
+- Seed: {result.seed}
 
 RETURNS ANALYSIS
 ----------------
@@ -390,7 +627,7 @@ Stability Index: {result.stability_index:.2f}
 INTERPRETATION
 --------------
 """
-    
+
     # Add interpretation
     if result.risk_of_ruin > 0.05:
         report += f"⚠️  HIGH RISK: {result.risk_of_ruin:.1%} chance of 50% loss\n"
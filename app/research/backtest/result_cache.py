@@ -0,0 +1,370 @@
+"""Content-addressed cache of backtest results.
+
+The orchestrator, the ranking and recommendation services and the
+multi-strategy engine re-run the same backtests many times a day, and
+between two data syncs the bars do not change. This cache keys each
+BacktestResult by (strategy, parameters hash, config hash, dataset hash),
+keeps recent results in memory and every result on disk, and bounds both
+by a byte budget (least recently used entries go first).
+
+The dataset hash covers every OHLCV value, so a sync that adds or corrects
+a bar produces a new key; nothing has to be invalidated after writes. The
+disk directory is shared by all processes (API workers, backtest pools,
+scheduled jobs) using the same storage path.
+
+    result = get_backtest_cache().get_or_run(
+        strategy_def.name, strategy_def.params, config, df,
+        lambda: engine.run(df, signals_for(df), strategy_def.name)
+    )
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+
+from app.research.backtest.engine import VBT_AVAILABLE, BacktestConfig, BacktestResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when engine or strategy logic changes so stale results on disk are ignored
+CACHE_VERSION = 1
+
+# Columns a backtest reads from the bars
+DATASET_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+# Trade ledger fields stored as ISO strings and restored to datetimes on load
+TRADE_TIME_FIELDS = ('entry_time', 'exit_time')
+
+
+def _digest(content: bytes) -> str:
+    """Short hex digest used for every hash in the key."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def dataset_hash(df: pd.DataFrame) -> str:
+    """Hash the OHLCV values of a frame.
+    
+    Args:
+        df: DataFrame with OHLCV data
+    
+    Returns:
+        Hex digest that changes whenever any bar changes
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str(len(df)).encode('utf-8'))
+    for column in DATASET_COLUMNS:
+        if column in df.columns:
+            hasher.update(column.encode('utf-8'))
+            hasher.update(np.ascontiguousarray(df[column].to_numpy(dtype=np.float64)).tobytes())
+    return hasher.hexdigest()
+
+
+def _load(data: bytes) -> BacktestResult:
+    """Deserialize a cached result, restoring trade timestamps."""
+    result = BacktestResult.model_validate_json(data)
+    for trade in result.trades:
+        for field in TRADE_TIME_FIELDS:
+            if isinstance(trade.get(field), str):
+                trade[field] = datetime.fromisoformat(trade[field])
+    return result
+
+
+def params_hash(params: Optional[Dict[str, Any]]) -> str:
+    """Hash strategy parameters independently of key order."""
+    return _digest(json.dumps(params or {}, sort_keys=True, default=str).encode('utf-8'))
+
+
+def config_hash(config: BacktestConfig) -> str:
+    """Hash a backtest configuration."""
+    return _digest(json.dumps(config.model_dump(mode='json'), sort_keys=True).encode('utf-8'))
+
+
+def make_key(
+    strategy: str,
+    params: Optional[Dict[str, Any]],
+    config: BacktestConfig,
+    df: pd.DataFrame
+) -> str:
+    """Build the cache key of one backtest.
+    
+    Args:
+        strategy: Strategy name
+        params: Strategy parameters
+        config: Backtest configuration
+        df: Bars the backtest runs on
+    
+    Returns:
+        Hex key
+    """
+    engine = "vectorbt" if VBT_AVAILABLE else "native"
+    content = f"{CACHE_VERSION}|{engine}|{strategy}|{params_hash(params)}|{config_hash(config)}|{dataset_hash(df)}"
+    return _digest(content.encode('utf-8'))
+
+
+class BacktestResultCache:
+    """Two-level (memory LRU + disk) cache of backtest results bounded by byte budgets."""
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+        enabled: bool = True
+    ):
+        """Initialize result cache.
+        
+        Args:
+            cache_dir: Directory for result files (None = memory only)
+            max_bytes: Maximum total size of serialized results kept in memory
+            max_disk_bytes: Maximum total size of result files on disk
+            enabled: If False, every lookup runs the backtest
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.enabled = enabled
+        
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._disk_bytes: Optional[int] = None
+        
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+    
+    def get(self, key: str) -> Optional[BacktestResult]:
+        """Get a cached result from memory, then disk.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached result or None on miss
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _load(data)
+        
+        data = self._read_file(key)
+        
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, data)
+        
+        return _load(data)
+    
+    def put(self, key: str, result: BacktestResult) -> None:
+        """Store a result in memory and on disk.
+        
+        Args:
+            key: Cache key from make_key
+            result: Backtest result
+        """
+        data = result.model_dump_json().encode('utf-8')
+        
+        with self._lock:
+            self.stores += 1
+            self._remember(key, data)
+        
+        self._write_file(key, data)
+    
+    def get_or_run(
+        self,
+        strategy: str,
+        params: Optional[Dict[str, Any]],
+        config: BacktestConfig,
+        df: pd.DataFrame,
+        run: Callable[[], Optional[BacktestResult]]
+    ) -> Optional[BacktestResult]:
+        """Return the cached result of a backtest, running it on a miss.
+        
+        Args:
+            strategy: Strategy name
+            params: Strategy parameters
+            config: Backtest configuration
+            df: Bars the backtest runs on
+            run: Runs the backtest (signal generation included) on a miss
+        
+        Returns:
+            Backtest result (None results are returned but not cached)
+        """
+        if not self.enabled or len(df) == 0:
+            return run()
+        
+        key = make_key(strategy, params, config, df)
+        result = self.get(key)
+        if result is not None:
+            return result
+        
+        result = run()
+        if result is not None:
+            self.put(key, result)
+        return result
+    
+    def clear(self, disk: bool = False) -> None:
+        """Drop cached results and reset counters.
+        
+        Args:
+            disk: Also delete result files
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.evictions = 0
+            self.disk_evictions = 0
+            
+            if disk and self.cache_dir is not None and self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*.json"):
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups > 0 else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'disk_evictions': self.disk_evictions
+            }
+    
+    def _path(self, key: str) -> Path:
+        """Result file of a key (two-character fan-out directories)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def _remember(self, key: str, data: bytes) -> None:
+        """Insert into the memory LRU and evict (caller holds the lock)."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        
+        if len(data) > self.max_bytes:
+            return
+        
+        self._entries[key] = data
+        self._bytes += len(data)
+        
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+    
+    def _read_file(self, key: str) -> Optional[bytes]:
+        """Read a result file and mark it recently used."""
+        if self.cache_dir is None:
+            return None
+        
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read cached backtest {path}: {e}")
+            return None
+    
+    def _write_file(self, key: str, data: bytes) -> None:
+        """Write a result file atomically and enforce the disk budget."""
+        if self.cache_dir is None or len(data) > self.max_disk_bytes:
+            return
+        
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cached backtest {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+    
+    def _scan_disk_bytes(self) -> int:
+        """Total size of result files on disk."""
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*/*.json"))
+    
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until within budget (caller holds the lock).
+        
+        Files written by other processes are included, so the budget holds
+        for the whole directory.
+        """
+        files = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.disk_evictions += 1
+        
+        self._disk_bytes = total
+
+
+# Global instance
+_backtest_cache = None
+
+
+def get_backtest_cache() -> BacktestResultCache:
+    """Get global backtest result cache instance."""
+    global _backtest_cache
+    if _backtest_cache is None:
+        from app.config.settings import settings
+        _backtest_cache = BacktestResultCache(
+            cache_dir=settings.STORAGE_PATH / "backtest_cache",
+            max_bytes=settings.BACKTEST_CACHE_MAX_BYTES,
+            max_disk_bytes=settings.BACKTEST_CACHE_DISK_MAX_BYTES,
+            enabled=settings.BACKTEST_CACHE_ENABLED
+        )
+    return _backtest_cache
@@ -11,47 +11,109 @@ from typing import Optional
 from datetime import datetime
 from app.core.calendar import TradingCalendar
 
+# Optional: compile the one-trade-per-day state machine with numba
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-def enforce_one_trade_per_day(signals: pd.Series, timestamps: pd.Series) -> pd.Series:
-    """Enforce maximum one trade per day rule.
-    
-    If multiple signals occur on the same day, only the first is kept.
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+
+def utc_days(timestamps) -> np.ndarray:
+    """Get the UTC calendar day (days since epoch) of millisecond timestamps.
     
     Args:
-        signals: Signal series (1=long, -1=short, 0=flat)
-        timestamps: Timestamp series (milliseconds)
+        timestamps: Array-like of timestamps (milliseconds)
         
     Returns:
-        Filtered signal series
+        int64 array of day numbers
     """
-    # Convert timestamps to dates
-    dates = pd.to_datetime(timestamps, unit='ms').dt.date
-    
-    # Create result series
-    filtered_signals = pd.Series(0, index=signals.index)
+    ns = pd.to_datetime(np.asarray(timestamps), unit='ms').asi8
+    return ns // (MS_PER_DAY * 1_000_000)
+
+
+def _one_trade_per_day_kernel(values, days, out):
+    """One-trade-per-day state machine over plain arrays.
     
-    # Track last signal date
-    last_signal_date = None
+    Writes entry signals into out (pre-filled with zeros). A position opened
+    on an entry bar is exited when the signal goes flat or no longer matches
+    the side of the previous output bar.
+    """
     in_position = False
+    has_last_day = False
+    last_day = 0
     
-    for i in range(len(signals)):
-        current_date = dates.iloc[i]
-        current_signal = signals.iloc[i]
+    for i in range(len(values)):
+        value = values[i]
         
         # Entry signal
-        if current_signal != 0 and not in_position:
+        if value != 0 and not in_position:
             # Check if we already traded today
-            if last_signal_date != current_date:
-                filtered_signals.iloc[i] = current_signal
-                last_signal_date = current_date
+            if not has_last_day or days[i] != last_day:
+                out[i] = value
+                last_day = days[i]
+                has_last_day = True
                 in_position = True
         
         # Exit signal (when signal becomes 0 or reverses)
-        elif in_position and (current_signal == 0 or np.sign(current_signal) != np.sign(filtered_signals.iloc[i-1])):
-            filtered_signals.iloc[i] = 0
-            in_position = False
+        elif in_position:
+            prev = out[i - 1]
+            same_side = (value > 0 and prev > 0) or (value < 0 and prev < 0)
+            if not same_side:
+                in_position = False
     
-    return filtered_signals
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _one_trade_per_day_jit = njit(cache=True)(_one_trade_per_day_kernel)
+
+
+def enforce_one_trade_per_day_array(values: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """Array version of enforce_one_trade_per_day.
+    
+    Args:
+        values: Signal values (float64)
+        days: UTC day number per bar (see utc_days)
+        
+    Returns:
+        float64 array of filtered signals
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.zeros(len(values), dtype=np.float64)
+    
+    if NUMBA_AVAILABLE:
+        _one_trade_per_day_jit(values, np.asarray(days, dtype=np.int64), out)
+    else:
+        _one_trade_per_day_kernel(values.tolist(), np.asarray(days).tolist(), out)
+    
+    return out
+
+
+def enforce_one_trade_per_day(signals: pd.Series, timestamps: pd.Series) -> pd.Series:
+    """Enforce maximum one trade per day rule.
+    
+    If multiple signals occur on the same day, only the first is kept.
+    Days are UTC calendar days.
+    
+    Args:
+        signals: Signal series (1=long, -1=short, 0=flat)
+        timestamps: Timestamp series (milliseconds)
+        
+    Returns:
+        Filtered signal series
+    """
+    if len(signals) == 0:
+        return pd.Series(0, index=signals.index)
+    
+    out = enforce_one_trade_per_day_array(signals.to_numpy(dtype=np.float64), utc_days(timestamps))
+    
+    # Keep integer output unless a non-integer signal was kept
+    if np.isfinite(out).all() and (out == np.round(out)).all():
+        return pd.Series(out.astype(np.int64), index=signals.index)
+    return pd.Series(out, index=signals.index)
 
 
 def filter_by_trading_windows(
@@ -71,13 +133,13 @@ def filter_by_trading_windows(
     """
     filtered_signals = signals.copy()
     
-    for i in range(len(signals)):
-        if signals.iloc[i] != 0:  # Only check entry signals
-            ts = pd.to_datetime(timestamps.iloc[i], unit='ms').tz_localize('UTC')
-            
-            # Check if within trading hours
-            if not calendar.is_trading_hours(ts):
-                filtered_signals.iloc[i] = 0
+    # Only check entry signals
+    entries = np.flatnonzero(signals.to_numpy() != 0)
+    if len(entries) == 0:
+        return filtered_signals
+    
+    in_window = calendar.trading_hours_mask(np.asarray(timestamps)[entries])
+    filtered_signals.iloc[entries[~in_window]] = 0
     
     return filtered_signals
 
@@ -89,6 +151,9 @@ def apply_forced_close(
 ) -> pd.Series:
     """Force close all positions at end of day.
     
+    Any bar holding a position (non-zero signal) at or after the forced close
+    time is flattened.
+    
     Args:
         signals: Signal series
         timestamps: Timestamp series (milliseconds)
@@ -99,26 +164,12 @@ def apply_forced_close(
     """
     modified_signals = signals.copy()
     
-    in_position = False
-    position_type = 0
+    in_position = np.flatnonzero(signals.to_numpy() != 0)
+    if len(in_position) == 0:
+        return modified_signals
     
-    for i in range(len(signals)):
-        current_signal = signals.iloc[i]
-        ts = pd.to_datetime(timestamps.iloc[i], unit='ms').tz_localize('UTC')
-        
-        # Track position state
-        if current_signal != 0:
-            in_position = True
-            position_type = current_signal
-        elif current_signal == 0 and in_position:
-            in_position = False
-            position_type = 0
-        
-        # Force close if needed
-        if in_position and calendar.should_force_close(ts):
-            modified_signals.iloc[i] = 0  # Force exit
-            in_position = False
-            position_type = 0
+    force_close = calendar.force_close_mask(np.asarray(timestamps)[in_position])
+    modified_signals.iloc[in_position[force_close]] = 0  # Force exit
     
     return modified_signals
 
@@ -212,21 +263,12 @@ def get_trading_statistics(
     
     # Window statistics if calendar provided
     if calendar:
-        window_a_signals = 0
-        window_b_signals = 0
-        outside_window_signals = 0
+        entries = np.flatnonzero(signals.to_numpy() != 0)
+        in_a, in_b = calendar.window_masks(np.asarray(timestamps)[entries])
         
-        for i in range(len(signals)):
-            if signals.iloc[i] != 0:
-                ts = dt_timestamps.iloc[i].tz_localize('UTC')
-                window = calendar.get_current_window(ts)
-                
-                if window == "A":
-                    window_a_signals += 1
-                elif window == "B":
-                    window_b_signals += 1
-                else:
-                    outside_window_signals += 1
+        window_a_signals = int(in_a.sum())
+        window_b_signals = int((~in_a & in_b).sum())
+        outside_window_signals = int((~in_a & ~in_b).sum())
         
         stats['window_a_signals'] = window_a_signals
         stats['window_b_signals'] = window_b_signals
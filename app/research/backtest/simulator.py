@@ -0,0 +1,293 @@
+"""Array-based signal simulator.
+
+This module is the native engine used when vectorbt is not installed. It runs
+a single-position, bar-by-bar state machine over NumPy arrays with support for:
+- Long and short entries (reversal on opposite signal)
+- TP/SL stops as a fraction of the entry price (e.g. ATR-based)
+- Commission and slippage on both legs
+- Forced close
+- Risk-based position sizing
+
+The inner loop is compiled with numba when available.
+"""
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+# Optional: compile the simulation loop with numba
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Columns of the trade records array returned by simulate_signals
+TRADE_FIELDS = [
+    'entry_idx',
+    'exit_idx',
+    'side',
+    'quantity',
+    'entry_price',
+    'exit_price',
+    'commission',
+    'slippage',
+    'pnl_gross',
+    'pnl',
+    'exit_reason',
+]
+TRADE_FIELD_INDEX = {name: i for i, name in enumerate(TRADE_FIELDS)}
+
+# Exit reason codes stored in the 'exit_reason' column
+EXIT_SIGNAL = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_FORCED_CLOSE = 3
+EXIT_END_OF_DATA = 4
+
+EXIT_REASONS = {
+    EXIT_SIGNAL: 'signal',
+    EXIT_STOP_LOSS: 'stop_loss',
+    EXIT_TAKE_PROFIT: 'take_profit',
+    EXIT_FORCED_CLOSE: 'forced_close',
+    EXIT_END_OF_DATA: 'end_of_data',
+}
+
+
+def _simulate_kernel(
+    open_, high, low, close, signals, tp_pct, sl_pct, force_close,
+    commission, slippage, risk_per_trade, initial_capital,
+    equity, records
+):
+    """Bar-by-bar simulation over plain arrays.
+
+    Entries fill at the bar close. Stops are checked intrabar from the next
+    bar on (stop loss first when both levels are touched), filling at the
+    stop level or at the open if the bar gapped through it. Forced close and
+    reversals fill at the close.
+
+    Writes the equity curve into equity and one row per trade into records.
+
+    Returns:
+        Number of trades written
+    """
+    n = len(close)
+    capital = initial_capital
+
+    side = 0
+    qty = 0.0
+    entry_idx = 0
+    entry_raw = 0.0
+    entry_fill = 0.0
+    entry_fee = 0.0
+    tp_price = np.nan
+    sl_price = np.nan
+    n_trades = 0
+
+    for i in range(n):
+        sig = signals[i]
+        want = 1 if sig > 0 else (-1 if sig < 0 else 0)
+        blocked = False
+
+        # Exits
+        if side != 0:
+            reason = -1
+            exit_raw = 0.0
+
+            if side == 1:
+                if sl_price == sl_price and low[i] <= sl_price:
+                    exit_raw = min(open_[i], sl_price)
+                    reason = 1
+                elif tp_price == tp_price and high[i] >= tp_price:
+                    exit_raw = max(open_[i], tp_price)
+                    reason = 2
+            else:
+                if sl_price == sl_price and high[i] >= sl_price:
+                    exit_raw = max(open_[i], sl_price)
+                    reason = 1
+                elif tp_price == tp_price and low[i] <= tp_price:
+                    exit_raw = min(open_[i], tp_price)
+                    reason = 2
+
+            if reason < 0 and force_close[i]:
+                exit_raw = close[i]
+                reason = 3
+            if reason < 0 and want == -side:
+                exit_raw = close[i]
+                reason = 0
+            if reason < 0 and i == n - 1:
+                exit_raw = close[i]
+                reason = 4
+
+            if reason >= 0:
+                exit_fill = exit_raw * (1.0 - side * slippage)
+                exit_fee = qty * exit_fill * commission
+                pnl_gross = side * qty * (exit_raw - entry_raw)
+                slippage_cost = qty * (abs(entry_fill - entry_raw) + abs(exit_raw - exit_fill))
+                capital += side * qty * (exit_fill - entry_fill) - exit_fee
+
+                records[n_trades, 0] = entry_idx
+                records[n_trades, 1] = i
+                records[n_trades, 2] = side
+                records[n_trades, 3] = qty
+                records[n_trades, 4] = entry_fill
+                records[n_trades, 5] = exit_fill
+                records[n_trades, 6] = entry_fee + exit_fee
+                records[n_trades, 7] = slippage_cost
+                records[n_trades, 8] = pnl_gross
+                records[n_trades, 9] = pnl_gross - slippage_cost - entry_fee - exit_fee
+                records[n_trades, 10] = reason
+                n_trades += 1
+
+                side = 0
+                qty = 0.0
+                # Only a reversal may re-enter on the same bar
+                blocked = reason != 0
+
+        # Entries
+        if side == 0 and want != 0 and not blocked and not force_close[i] and i < n - 1 and capital > 0:
+            entry_raw = close[i]
+            entry_fill = entry_raw * (1.0 + want * slippage)
+            sl = sl_pct[i]
+            tp = tp_pct[i]
+
+            # Size so that hitting the stop loses risk_per_trade of capital
+            if sl == sl and sl > 0:
+                qty = capital * risk_per_trade / (entry_fill * sl)
+                sl_price = entry_fill * (1.0 - want * sl)
+            else:
+                qty = capital * risk_per_trade / entry_fill
+                sl_price = np.nan
+            qty = min(qty, capital / entry_fill)
+            tp_price = entry_fill * (1.0 + want * tp) if (tp == tp and tp > 0) else np.nan
+
+            entry_fee = qty * entry_fill * commission
+            capital -= entry_fee
+            entry_idx = i
+            side = want
+
+        # Mark to market
+        if side != 0:
+            equity[i] = capital + side * qty * (close[i] - entry_fill)
+        else:
+            equity[i] = capital
+
+    return n_trades
+
+
+if NUMBA_AVAILABLE:
+    _simulate_jit = njit(cache=True)(_simulate_kernel)
+
+
+def ohlc_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Extract float64 (open, high, low, close) arrays from an OHLCV frame.
+
+    Missing open/high/low columns fall back to close.
+    """
+    close = df['close'].to_numpy(dtype=np.float64)
+    open_ = df['open'].to_numpy(dtype=np.float64) if 'open' in df.columns else close
+    high = df['high'].to_numpy(dtype=np.float64) if 'high' in df.columns else close
+    low = df['low'].to_numpy(dtype=np.float64) if 'low' in df.columns else close
+    return open_, high, low, close
+
+
+def simulate_arrays(
+    ohlc: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    signals: np.ndarray,
+    tp_pct: Optional[np.ndarray] = None,
+    sl_pct: Optional[np.ndarray] = None,
+    force_close: Optional[np.ndarray] = None,
+    commission: float = 0.001,
+    slippage: float = 0.0005,
+    risk_per_trade: float = 0.02,
+    initial_capital: float = 100000.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate trading a signal array on precomputed OHLC arrays.
+
+    Same as simulate_signals, for callers that run many signal variants on
+    the same bars (see BacktestEngine.run_batch).
+
+    Args:
+        ohlc: Tuple of (open, high, low, close) float64 arrays (see ohlc_arrays)
+        signals: Signal array (1=long, -1=short, 0=flat)
+        tp_pct: Take profit distance as a fraction of entry price (optional)
+        sl_pct: Stop loss distance as a fraction of entry price (optional)
+        force_close: Boolean array, True on bars where positions must be closed
+        commission: Commission rate per leg
+        slippage: Slippage rate per leg
+        risk_per_trade: Fraction of capital lost if the stop is hit
+        initial_capital: Initial capital
+
+    Returns:
+        Tuple of (equity curve, trade records)
+    """
+    open_, high, low, close = ohlc
+    n = len(close)
+
+    signal_values = np.nan_to_num(np.asarray(signals, dtype=np.float64), nan=0.0)
+    nan_stops = np.full(n, np.nan)
+    tp_values = np.asarray(tp_pct, dtype=np.float64) if tp_pct is not None else nan_stops
+    sl_values = np.asarray(sl_pct, dtype=np.float64) if sl_pct is not None else nan_stops
+    force_values = np.asarray(force_close, dtype=np.bool_) if force_close is not None else np.zeros(n, dtype=np.bool_)
+
+    equity = np.empty(n, dtype=np.float64)
+    # At most one trade per non-zero signal
+    records = np.empty((int(np.count_nonzero(signal_values)), len(TRADE_FIELDS)), dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        n_trades = _simulate_jit(
+            open_, high, low, close, signal_values, tp_values, sl_values, force_values,
+            float(commission), float(slippage), float(risk_per_trade), float(initial_capital),
+            equity, records
+        )
+    else:
+        n_trades = _simulate_kernel(
+            open_.tolist(), high.tolist(), low.tolist(), close.tolist(),
+            signal_values.tolist(), tp_values.tolist(), sl_values.tolist(), force_values.tolist(),
+            float(commission), float(slippage), float(risk_per_trade), float(initial_capital),
+            equity, records
+        )
+
+    return equity, records[:n_trades]
+
+
+def simulate_signals(
+    df: pd.DataFrame,
+    signals: pd.Series,
+    tp_pct: Optional[pd.Series] = None,
+    sl_pct: Optional[pd.Series] = None,
+    force_close: Optional[np.ndarray] = None,
+    commission: float = 0.001,
+    slippage: float = 0.0005,
+    risk_per_trade: float = 0.02,
+    initial_capital: float = 100000.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate trading a signal series on OHLC bars.
+
+    Args:
+        df: DataFrame with open/high/low/close columns
+        signals: Signal series aligned with df (1=long, -1=short, 0=flat)
+        tp_pct: Take profit distance as a fraction of entry price (optional)
+        sl_pct: Stop loss distance as a fraction of entry price (optional)
+        force_close: Boolean array, True on bars where positions must be closed
+        commission: Commission rate per leg
+        slippage: Slippage rate per leg
+        risk_per_trade: Fraction of capital lost if the stop is hit. Without
+            a stop, fraction of capital used as position notional.
+        initial_capital: Initial capital
+
+    Returns:
+        Tuple of (equity curve, trade records). Records have one row per
+        trade with columns TRADE_FIELDS.
+    """
+    return simulate_arrays(
+        ohlc_arrays(df),
+        np.asarray(signals, dtype=np.float64),
+        tp_pct=np.asarray(tp_pct, dtype=np.float64) if tp_pct is not None else None,
+        sl_pct=np.asarray(sl_pct, dtype=np.float64) if sl_pct is not None else None,
+        force_close=force_close,
+        commission=commission,
+        slippage=slippage,
+        risk_per_trade=risk_per_trade,
+        initial_capital=initial_capital
+    )
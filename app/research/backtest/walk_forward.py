@@ -5,9 +5,14 @@ and out-of-sample validation.
 """
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Tuple, Callable, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
+from itertools import product
+
+# Prefix of precomputed signal columns in the shared worker frame
+SIGNAL_COLUMN_PREFIX = "__signal_"
 
 
 class WalkForwardConfig(BaseModel):
@@ -18,6 +23,12 @@ class WalkForwardConfig(BaseModel):
     step_size: int = Field(default=30, description="Step size for rolling window")
     anchored: bool = Field(default=False, description="Use anchored (expanding) window")
     min_train_size: int = Field(default=60, description="Minimum training size in days")
+    n_jobs: int = Field(default=1, description="Parallel fold workers (-1 = all cores)")
+    precompute_signals: bool = Field(
+        default=False,
+        description="Generate signals once on the full series and slice them per fold (strategy must be causal)"
+    )
+    warmup_bars: int = Field(default=0, ge=0, description="Leading bars of each signal series treated as flat")
 
 
 class WalkForwardResult(BaseModel):
@@ -98,13 +109,25 @@ class WalkForwardOptimizer:
     ) -> WalkForwardSummary:
         """Run walk-forward optimization.
         
+        With config.n_jobs != 1, iterations run in a process pool. Workers read
+        the numeric columns from memory-mapped files and receive only the
+        iteration number, so strategy_func must be picklable (a module-level
+        function).
+        
+        With config.precompute_signals, signals for every parameter combination
+        are generated once on the full series and each fold slices them,
+        instead of regenerating them on every train and test slice. This is
+        only free of lookahead for causal strategies (the signal at a bar
+        depends on that bar and earlier ones). config.warmup_bars are masked
+        once at the start of the data rather than at the start of every slice.
+        
         Args:
             df: DataFrame with OHLCV data
             strategy_func: Function that generates signals given df and params
             param_grid: Dictionary of parameter ranges to test
             objective: Optimization objective ('sharpe', 'return', 'calmar')
             verbose: Print progress
-            
+        
         Returns:
             WalkForwardSummary with all results
         """
@@ -134,24 +157,129 @@ class WalkForwardOptimizer:
             print(f"\nTotal days: {total_days}")
             print(f"Iterations: {num_iterations}")
         
+        # Signals on the full series, one column per parameter combination
+        signal_frame = None
+        if self.config.precompute_signals:
+            signal_frame = self._precompute_signals(df, strategy_func, param_grid, verbose)
+        
         # Run iterations
-        results = []
-        for i in range(num_iterations):
-            if verbose:
-                print(f"\nIteration {i+1}/{num_iterations}")
-            
-            result = self._run_iteration(
-                df, i, strategy_func, param_grid, objective, verbose
+        if self.config.n_jobs == 1 or num_iterations <= 1:
+            results = []
+            for i in range(num_iterations):
+                if verbose:
+                    print(f"\nIteration {i+1}/{num_iterations}")
+                
+                result = self._run_iteration(
+                    df, i, strategy_func, param_grid, objective, verbose, signal_frame
+                )
+                
+                if result:
+                    results.append(result)
+        else:
+            results = self._run_parallel(
+                df, num_iterations, strategy_func, param_grid, objective, verbose, signal_frame
             )
-            
-            if result:
-                results.append(result)
         
         # Calculate summary
         summary = self._calculate_summary(results, verbose)
         
         return summary
     
+    def _precompute_signals(
+        self,
+        df: pd.DataFrame,
+        strategy_func: Callable,
+        param_grid: Dict[str, List[Any]],
+        verbose: bool
+    ) -> pd.DataFrame:
+        """Generate signals on the full series for every parameter combination.
+        
+        Args:
+            df: Full DataFrame
+            strategy_func: Strategy function
+            param_grid: Parameter grid
+            verbose: Print progress
+        
+        Returns:
+            DataFrame indexed like df with one column per combination, keyed by
+            its position in _param_combinations (failed combinations omitted)
+        """
+        columns = {}
+        for k, params in enumerate(_param_combinations(param_grid)):
+            try:
+                columns[k] = self._mask_warmup(strategy_func(df, **params))
+            except Exception as e:
+                if verbose:
+                    print(f"    Error with params {params}: {e}")
+        
+        return pd.DataFrame(columns, index=df.index, dtype=np.float64)
+    
+    def _mask_warmup(self, signals: pd.Series) -> pd.Series:
+        """Treat the first config.warmup_bars signals as flat."""
+        if self.config.warmup_bars == 0:
+            return signals
+        signals = signals.astype(np.float64)
+        signals.iloc[:self.config.warmup_bars] = 0.0
+        return signals
+    
+    def _run_parallel(
+        self,
+        df: pd.DataFrame,
+        num_iterations: int,
+        strategy_func: Callable,
+        param_grid: Dict[str, List[Any]],
+        objective: str,
+        verbose: bool,
+        signal_frame: Optional[pd.DataFrame] = None
+    ) -> List[WalkForwardResult]:
+        """Run iterations in a process pool over a shared memory-mapped frame.
+        
+        Args:
+            df: Full DataFrame (with datetime column)
+            num_iterations: Number of iterations
+            strategy_func: Strategy function (picklable)
+            param_grid: Parameter grid
+            objective: Optimization objective
+            verbose: Print progress
+            signal_frame: Precomputed signals (shared alongside the OHLCV columns)
+        
+        Returns:
+            Iteration results in iteration order
+        """
+        from app.research.optimization.parallel import SharedFrame, resolve_n_jobs
+        
+        n_jobs = min(resolve_n_jobs(self.config.n_jobs), num_iterations)
+        columns = list(df.select_dtypes(include=['number', 'datetime']).columns)
+        
+        if verbose:
+            print(f"\nRunning {num_iterations} iterations on {n_jobs} workers")
+        
+        shared_df = df[columns]
+        if signal_frame is not None:
+            shared_df = pd.concat([shared_df, signal_frame.add_prefix(SIGNAL_COLUMN_PREFIX)], axis=1)
+        
+        with SharedFrame(shared_df) as shared:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(
+                        _run_shared_iteration,
+                        shared.spec, self.config, i, strategy_func, param_grid, objective
+                    )
+                    for i in range(num_iterations)
+                ]
+                results = [future.result() for future in futures]
+        
+        results = [result for result in results if result]
+        
+        if verbose:
+            for result in results:
+                print(f"\nIteration {result.iteration+1}/{num_iterations}")
+                print(f"  Train: {result.train_start.date()} to {result.train_end.date()}")
+                print(f"  Test:  {result.test_start.date()} to {result.test_end.date()}")
+                print(f"  Optimal params: {result.optimal_params}")
+        
+        return results
+    
     def _run_iteration(
         self,
         df: pd.DataFrame,
@@ -159,7 +287,8 @@ class WalkForwardOptimizer:
         strategy_func: Callable,
         param_grid: Dict[str, List[Any]],
         objective: str,
-        verbose: bool
+        verbose: bool,
+        signal_frame: Optional[pd.DataFrame] = None
     ) -> Optional[WalkForwardResult]:
         """Run single walk-forward iteration.
         
@@ -170,7 +299,8 @@ class WalkForwardOptimizer:
             param_grid: Parameter grid
             objective: Optimization objective
             verbose: Print progress
-            
+            signal_frame: Precomputed full-series signals (optional)
+        
         Returns:
             WalkForwardResult or None if insufficient data
         """
@@ -207,9 +337,15 @@ class WalkForwardOptimizer:
             print(f"  Train: {train_start.date()} to {train_end.date()}")
             print(f"  Test:  {test_start.date()} to {test_end.date()}")
         
+        # Slice precomputed signals
+        train_signals = test_signals = None
+        if signal_frame is not None:
+            train_signals = signal_frame.iloc[train_start_idx:train_end_idx]
+            test_signals = signal_frame.iloc[test_start_idx:test_end_idx]
+        
         # Optimize on training data
         optimal_params, is_metrics = self._optimize_params(
-            train_df, strategy_func, param_grid, objective, verbose
+            train_df, strategy_func, param_grid, objective, verbose, train_signals
         )
         
         if verbose:
@@ -217,8 +353,12 @@ class WalkForwardOptimizer:
             print(f"  IS {objective}: {is_metrics[objective]:.4f}")
         
         # Test on out-of-sample data
+        oos_signals = None
+        if test_signals is not None:
+            oos_signals = test_signals[_param_combinations(param_grid).index(optimal_params)]
+        
         oos_metrics = self._backtest_params(
-            test_df, strategy_func, optimal_params, verbose
+            test_df, strategy_func, optimal_params, verbose, oos_signals
         )
         
         if verbose:
@@ -253,7 +393,8 @@ class WalkForwardOptimizer:
         strategy_func: Callable,
         param_grid: Dict[str, List[Any]],
         objective: str,
-        verbose: bool
+        verbose: bool,
+        signals: Optional[pd.DataFrame] = None
     ) -> Tuple[Dict[str, Any], Dict[str, float]]:
         """Optimize parameters on training data.
         
@@ -263,26 +404,25 @@ class WalkForwardOptimizer:
             param_grid: Parameter grid
             objective: Optimization objective
             verbose: Print progress
-            
+            signals: Precomputed training signals, one column per combination
+                (optional; combinations without a column are skipped)
+        
         Returns:
             Tuple of (optimal_params, metrics)
         """
-        # Generate parameter combinations
-        from itertools import product
-        
-        keys = list(param_grid.keys())
-        values = list(param_grid.values())
-        combinations = list(product(*values))
-        
         best_params = None
         best_score = -np.inf
         best_metrics = None
         
-        for combo in combinations:
-            params = dict(zip(keys, combo))
+        for k, params in enumerate(_param_combinations(param_grid)):
+            combo_signals = None
+            if signals is not None:
+                if k not in signals.columns:
+                    continue
+                combo_signals = signals[k]
             
             try:
-                metrics = self._backtest_params(df, strategy_func, params, False)
+                metrics = self._backtest_params(df, strategy_func, params, False, combo_signals)
                 score = metrics[objective]
                 
                 if score > best_score:
@@ -301,7 +441,8 @@ class WalkForwardOptimizer:
         df: pd.DataFrame,
         strategy_func: Callable,
         params: Dict[str, Any],
-        verbose: bool
+        verbose: bool,
+        signals: Optional[pd.Series] = None
     ) -> Dict[str, float]:
         """Backtest with specific parameters.
         
@@ -310,12 +451,14 @@ class WalkForwardOptimizer:
             strategy_func: Strategy function
             params: Parameters
             verbose: Print progress
-            
+            signals: Precomputed signals for df (generated if None)
+        
         Returns:
             Dictionary of metrics
         """
         # Generate signals
-        signals = strategy_func(df, **params)
+        if signals is None:
+            signals = self._mask_warmup(strategy_func(df, **params))
         
         # Simple return calculation (vectorized)
         returns = df['close'].pct_change()
@@ -352,7 +495,7 @@ class WalkForwardOptimizer:
         Args:
             results: List of iteration results
             verbose: Print summary
-            
+        
         Returns:
             WalkForwardSummary
         """
@@ -426,3 +569,36 @@ class WalkForwardOptimizer:
         
         print(f"{'='*60}\n")
 
+
+def _run_shared_iteration(
+    frame_spec: Dict[str, Any],
+    config: WalkForwardConfig,
+    iteration: int,
+    strategy_func: Callable,
+    param_grid: Dict[str, List[Any]],
+    objective: str
+) -> Optional[WalkForwardResult]:
+    """Worker entry point: attach to the shared frame and run one iteration."""
+    from app.research.optimization.parallel import attach_frame
+    
+    shared_df = attach_frame(frame_spec)
+
+    # Split precomputed signal columns back out of the OHLCV frame
+    signal_columns = [col for col in shared_df.columns if col.startswith(SIGNAL_COLUMN_PREFIX)]
+    signal_frame = None
+    if config.precompute_signals:
+        signal_frame = pd.DataFrame(
+            {int(col[len(SIGNAL_COLUMN_PREFIX):]): shared_df[col].to_numpy() for col in signal_columns},
+            copy=False
+        )
+    df = shared_df.drop(columns=signal_columns)
+    
+    return WalkForwardOptimizer(config)._run_iteration(
+        df, iteration, strategy_func, param_grid, objective, False, signal_frame
+    )
+
+
+def _param_combinations(param_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Expand a parameter grid into parameter dicts (in product order)."""
+    keys = list(param_grid.keys())
+    return [dict(zip(keys, combo)) for combo in product(*param_grid.values())]
@@ -5,7 +5,7 @@ a single consensus signal using various weighting schemes.
 """
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Literal
+from typing import List, Dict, Optional, Literal, Tuple
 from pydantic import BaseModel, Field
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
@@ -266,13 +266,97 @@ def majority_vote(
     )
 
 
+def _warm_started_logistic(
+    X: np.ndarray,
+    y: np.ndarray,
+    train_period: int,
+    refit_frequency: int
+) -> Tuple[np.ndarray, Optional[LogisticRegression]]:
+    """Rolling logistic regression with running scaler statistics.
+    
+    Same windows as the cold-start loop in logistic_model, but:
+    - rows with NaN features are masked once up front
+    - scaler mean/std are updated incrementally as the window slides
+    - one LogisticRegression(warm_start=True) is refit from the previous
+      coefficients, so each refit converges in a few iterations
+    
+    The problem is convex, so fits converge to the same optimum as cold
+    starts (up to solver tolerance).
+    
+    Args:
+        X: (n_bars x n_features) feature matrix
+        y: Binary target per bar
+        train_period: Training window size
+        refit_frequency: Bars between refits
+    
+    Returns:
+        Tuple of (probability of positive return per bar, last fitted model)
+    """
+    n_bars, n_features = X.shape
+    valid = ~np.isnan(X).any(axis=1)
+    probabilities = np.full(n_bars, np.nan)
+    
+    if not valid.any():
+        return probabilities, None
+    
+    # Running sums of valid rows, shifted by a reference row for precision
+    reference = X[valid][0]
+    shifted = np.where(valid[:, None], X - reference, 0.0)
+    count = 0
+    total = np.zeros(n_features)
+    total_sq = np.zeros(n_features)
+    window_start = window_end = 0
+    
+    model = LogisticRegression(max_iter=1000, random_state=42, warm_start=True)
+    fitted = False
+    
+    for i in range(train_period, n_bars, refit_frequency):
+        train_start = max(0, i - train_period)
+        
+        # Slide the window: add [window_end, i), then drop [window_start, train_start)
+        added = shifted[window_end:i]
+        count += int(valid[window_end:i].sum())
+        total += added.sum(axis=0)
+        total_sq += (added ** 2).sum(axis=0)
+        
+        dropped = shifted[window_start:train_start]
+        count -= int(valid[window_start:train_start].sum())
+        total -= dropped.sum(axis=0)
+        total_sq -= (dropped ** 2).sum(axis=0)
+        
+        window_start, window_end = train_start, i
+        
+        if count < 20:  # Need minimum data
+            continue
+        
+        # Scaler statistics (as StandardScaler: population std, 1 for constant features)
+        shift_mean = total / count
+        mean = reference + shift_mean
+        scale = np.sqrt(np.maximum(total_sq / count - shift_mean ** 2, 0.0))
+        scale[scale < 10 * np.finfo(np.float64).eps * np.maximum(np.abs(mean), 1.0)] = 1.0
+        
+        # Train model
+        rows = train_start + np.flatnonzero(valid[train_start:i])
+        model.fit((X[rows] - mean) / scale, y[rows])
+        fitted = True
+        
+        # Predict for next refit_frequency periods
+        predict_end = min(i + refit_frequency, n_bars)
+        pred_rows = i + np.flatnonzero(valid[i:predict_end])
+        if len(pred_rows) > 0:
+            probabilities[pred_rows] = model.predict_proba((X[pred_rows] - mean) / scale)[:, 1]
+    
+    return probabilities, model if fitted else None
+
+
 def logistic_model(
     signals: Dict[str, pd.Series],
     returns: pd.Series,
     features: Optional[pd.DataFrame] = None,
     train_period: int = 252,
     refit_frequency: int = 21,
-    threshold: float = 0.5
+    threshold: float = 0.5,
+    warm_start: bool = False
 ) -> CombinedSignal:
     """Combine signals using logistic regression model.
     
@@ -286,6 +370,9 @@ def logistic_model(
         train_period: Training window size
         refit_frequency: How often to refit model (in periods)
         threshold: Probability threshold for signal generation
+        warm_start: Refit incrementally (running scaler statistics and
+            warm-started coefficients) instead of fitting every window
+            from scratch. Much faster for long series with frequent refits.
         
     Returns:
         CombinedSignal with combined signal
@@ -310,49 +397,57 @@ def logistic_model(
     predictions = pd.Series(np.nan, index=X.index)
     probabilities = pd.Series(np.nan, index=X.index)
     
-    # Rolling window training and prediction
-    for i in range(train_period, len(X), refit_frequency):
-        # Define training window
-        train_start = max(0, i - train_period)
-        train_end = i
-        
-        # Training data
-        X_train = X.iloc[train_start:train_end]
-        y_train = y.iloc[train_start:train_end]
-        
-        # Remove NaN rows
-        valid_idx = ~(X_train.isna().any(axis=1) | y_train.isna())
-        X_train = X_train[valid_idx]
-        y_train = y_train[valid_idx]
-        
-        if len(X_train) < 20:  # Need minimum data
-            continue
-        
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        
-        # Train model
-        model = LogisticRegression(max_iter=1000, random_state=42)
-        model.fit(X_train_scaled, y_train)
-        
-        # Predict for next refit_frequency periods
-        predict_end = min(i + refit_frequency, len(X))
-        X_pred = X.iloc[i:predict_end]
-        
-        # Remove NaN rows for prediction
-        valid_pred_idx = ~X_pred.isna().any(axis=1)
-        if valid_pred_idx.sum() == 0:
-            continue
-        
-        X_pred_valid = X_pred[valid_pred_idx]
-        X_pred_scaled = scaler.transform(X_pred_valid)
-        
-        # Predict probabilities
-        proba = model.predict_proba(X_pred_scaled)[:, 1]  # Probability of positive return
-        
-        # Store predictions
-        probabilities.loc[X_pred_valid.index] = proba
+    if warm_start:
+        proba, last_model = _warm_started_logistic(
+            X.to_numpy(dtype=np.float64), y.to_numpy(), train_period, refit_frequency
+        )
+        probabilities[:] = proba
+        if last_model is not None:
+            model = last_model
+    else:
+        # Rolling window training and prediction
+        for i in range(train_period, len(X), refit_frequency):
+            # Define training window
+            train_start = max(0, i - train_period)
+            train_end = i
+            
+            # Training data
+            X_train = X.iloc[train_start:train_end]
+            y_train = y.iloc[train_start:train_end]
+            
+            # Remove NaN rows
+            valid_idx = ~(X_train.isna().any(axis=1) | y_train.isna())
+            X_train = X_train[valid_idx]
+            y_train = y_train[valid_idx]
+            
+            if len(X_train) < 20:  # Need minimum data
+                continue
+            
+            # Scale features
+            scaler = StandardScaler()
+            X_train_scaled = scaler.fit_transform(X_train)
+            
+            # Train model
+            model = LogisticRegression(max_iter=1000, random_state=42)
+            model.fit(X_train_scaled, y_train)
+            
+            # Predict for next refit_frequency periods
+            predict_end = min(i + refit_frequency, len(X))
+            X_pred = X.iloc[i:predict_end]
+            
+            # Remove NaN rows for prediction
+            valid_pred_idx = ~X_pred.isna().any(axis=1)
+            if valid_pred_idx.sum() == 0:
+                continue
+            
+            X_pred_valid = X_pred[valid_pred_idx]
+            X_pred_scaled = scaler.transform(X_pred_valid)
+            
+            # Predict probabilities
+            proba = model.predict_proba(X_pred_scaled)[:, 1]  # Probability of positive return
+            
+            # Store predictions
+            probabilities.loc[X_pred_valid.index] = proba
     
     # Generate signals from probabilities
     combined = pd.Series(0, index=X.index)
@@ -380,7 +475,8 @@ def logistic_model(
             "num_strategies": len(signals),
             "train_period": train_period,
             "refit_frequency": refit_frequency,
-            "threshold": threshold
+            "threshold": threshold,
+            "warm_start": warm_start
         }
     )
 
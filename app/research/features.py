@@ -94,6 +94,13 @@ def normalized_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: in
     return natr
 
 
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """Sums over each full window of length period along the last axis."""
+    cumulative = np.cumsum(values, axis=-1)
+    cumulative = np.concatenate([np.zeros(cumulative.shape[:-1] + (1,)), cumulative], axis=-1)
+    return cumulative[..., period:] - cumulative[..., :-period]
+
+
 def trend_strength(close: pd.Series, period: int = 20) -> pd.Series:
     """Calculate trend strength using linear regression R-squared.
     
@@ -108,29 +115,48 @@ def trend_strength(close: pd.Series, period: int = 20) -> pd.Series:
     """
     validate_series(close, "Close price")
     
-    def calc_r_squared(window):
-        """Calculate R-squared for a window."""
-        if len(window) < 2:
-            return np.nan
+    n = len(close)
+    y = close.to_numpy(dtype=np.float64)
+    r_squared = np.full(n, np.nan)
+    
+    if period >= 2 and n >= period:
+        # Sum of squared deviations of x = 0..period-1
+        sxx = period * (period ** 2 - 1) / 12
         
-        x = np.arange(len(window))
-        y = window.values
+        # Outputs are computed in blocks; each block's windows are summed
+        # over a short segment centered on its own mean so that the
+        # cancellation in cov/var below keeps full precision
+        block = max(period, 16)
+        n_windows = n - period + 1
+        n_blocks = -(-n_windows // block)
+        padded = np.full(n_blocks * block + period - 1, np.nan)
+        padded[:n] = y
+        segments = np.lib.stride_tricks.sliding_window_view(padded, block + period - 1)[::block]
         
-        # Remove NaN
-        mask = ~np.isnan(y)
-        if mask.sum() < 2:
-            return np.nan
+        valid = ~np.isnan(segments)
+        offsets = np.where(valid, segments, 0.0).sum(axis=1) / np.maximum(valid.sum(axis=1), 1)
+        centered = np.where(valid, segments - offsets[:, None], 0.0)
+        x = np.arange(block + period - 1, dtype=np.float64) - (block + period - 2) / 2
         
-        x = x[mask]
-        y = y[mask]
+        sum_y = _window_sums(centered, period)
+        sum_yy = _window_sums(centered * centered, period)
+        sum_xy = _window_sums(x * centered, period)
         
-        # Calculate correlation
-        corr = np.corrcoef(x, y)[0, 1]
-        r_squared = corr ** 2
+        # Center on each window's mean x and y
+        x_mean = x[period - 1:] - (period - 1) / 2
+        cov_xy = sum_xy - x_mean * sum_y
+        var_y = sum_yy - sum_y * sum_y / period
         
-        return r_squared
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_squared[period - 1:] = (cov_xy * cov_xy / (sxx * var_y)).ravel()[:n_windows]
+        
+        # Windows with missing values or no variance have no correlation
+        rolling = close.rolling(window=period, min_periods=period)
+        undefined = (rolling.max() == rolling.min()).to_numpy() | np.isnan(rolling.sum().to_numpy())
+        r_squared[undefined] = np.nan
+        r_squared = np.clip(r_squared, 0.0, 1.0)
     
-    trend_str = close.rolling(window=period, min_periods=period).apply(calc_r_squared, raw=False)
+    trend_str = pd.Series(r_squared, index=close.index)
     
     return trend_str
 
@@ -233,6 +259,68 @@ def cumulative_return(returns: pd.Series) -> pd.Series:
     return (1 + returns).cumprod() - 1
 
 
+def _rolling_max_drawdown(values: np.ndarray, period: int) -> np.ndarray:
+    """Maximum drawdown of each trailing window of a positive value series.
+    
+    The series is cut into blocks of length period so that every window is
+    the suffix of one block followed by a prefix of the next. Prefix and
+    suffix (max, min, drawdown) summaries are cumulative scans within each
+    block, and two summaries A, B combine as
+    dd = min(A.dd, B.dd, (B.min - A.max) / A.max), giving O(n) overall.
+    
+    Args:
+        values: Value (equity) series
+        period: Window length
+        
+    Returns:
+        Drawdown per bar (NaN for incomplete windows or windows with NaN)
+    """
+    n = len(values)
+    result = np.full(n, np.nan)
+    if period < 2 or n < period:
+        return result
+    
+    n_blocks = -(-n // period)
+    blocks = np.full(n_blocks * period, np.nan)
+    blocks[:n] = values
+    blocks = blocks.reshape(n_blocks, period)
+    
+    with np.errstate(invalid='ignore'):
+        # Block start .. i
+        prefix_max = np.maximum.accumulate(blocks, axis=1)
+        prefix_min = np.minimum.accumulate(blocks, axis=1)
+        prefix_dd = np.minimum.accumulate((blocks - prefix_max) / prefix_max, axis=1)
+        
+        # i .. block end
+        reversed_blocks = blocks[:, ::-1]
+        suffix_max = np.maximum.accumulate(reversed_blocks, axis=1)[:, ::-1]
+        suffix_min = np.minimum.accumulate(reversed_blocks, axis=1)[:, ::-1]
+        # Drawdown from a peak at i: lowest later value in the block
+        later_min = np.concatenate([suffix_min[:, 1:], np.full((n_blocks, 1), np.inf)], axis=1)
+        peak_dd = np.minimum((later_min - blocks) / blocks, 0.0)
+        suffix_dd = np.minimum.accumulate(peak_dd[:, ::-1], axis=1)[:, ::-1]
+        
+        prefix_max, prefix_min, prefix_dd = (a.ravel()[:n] for a in (prefix_max, prefix_min, prefix_dd))
+        suffix_max, suffix_min, suffix_dd = (a.ravel()[:n] for a in (suffix_max, suffix_min, suffix_dd))
+        
+        end = np.arange(period - 1, n)
+        start = end - period + 1
+        combined = np.minimum(
+            np.minimum(suffix_dd[start], prefix_dd[end]),
+            (prefix_min[end] - suffix_max[start]) / suffix_max[start]
+        )
+        # Windows aligned to a block are the block itself
+        aligned = start % period == 0
+        combined[aligned] = prefix_dd[end[aligned]]
+    
+    # Windows containing NaN are undefined
+    has_nan = _window_sums(np.isnan(values).astype(np.float64), period) > 0
+    combined[has_nan] = np.nan
+    result[period - 1:] = combined
+    
+    return result
+
+
 def rolling_max_dd(returns: pd.Series, period: int = 252) -> pd.Series:
     """Calculate rolling maximum drawdown.
     
@@ -247,16 +335,7 @@ def rolling_max_dd(returns: pd.Series, period: int = 252) -> pd.Series:
     
     cum_returns = (1 + returns).cumprod()
     
-    def calc_max_dd(window):
-        """Calculate max drawdown for a window."""
-        if len(window) < 2:
-            return np.nan
-        
-        running_max = np.maximum.accumulate(window)
-        dd = (window - running_max) / running_max
-        return dd.min()
-    
-    rolling_dd = cum_returns.rolling(window=period, min_periods=period).apply(calc_max_dd, raw=False)
+    rolling_dd = pd.Series(_rolling_max_drawdown(cum_returns.to_numpy(dtype=np.float64), period), index=returns.index)
     
     return rolling_dd
 
@@ -422,6 +501,14 @@ def candle_direction(open_price: pd.Series, close: pd.Series) -> pd.Series:
     return direction
 
 
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """Length of the current run of True values at each position (0 where False)."""
+    counts = np.cumsum(mask, dtype=np.int64)
+    # Count at the most recent False position
+    resets = np.maximum.accumulate(np.where(mask, 0, counts))
+    return counts - resets
+
+
 def consecutive_closes(close: pd.Series) -> Tuple[pd.Series, pd.Series]:
     """Count consecutive up and down closes.
     
@@ -433,29 +520,11 @@ def consecutive_closes(close: pd.Series) -> Tuple[pd.Series, pd.Series]:
     """
     validate_series(close, "Close price")
     
-    # Calculate price changes
-    changes = close.diff()
-    
-    # Initialize
-    consecutive_up = pd.Series(0, index=close.index)
-    consecutive_down = pd.Series(0, index=close.index)
-    
-    up_count = 0
-    down_count = 0
-    
-    for i in range(1, len(changes)):
-        if changes.iloc[i] > 0:
-            up_count += 1
-            down_count = 0
-        elif changes.iloc[i] < 0:
-            down_count += 1
-            up_count = 0
-        else:
-            up_count = 0
-            down_count = 0
-        
-        consecutive_up.iloc[i] = up_count
-        consecutive_down.iloc[i] = down_count
+    # Calculate price changes (first bar and NaN changes reset both counts)
+    changes = close.diff().to_numpy()
+    
+    consecutive_up = pd.Series(_run_lengths(changes > 0), index=close.index)
+    consecutive_down = pd.Series(_run_lengths(changes < 0), index=close.index)
     
     return consecutive_up, consecutive_down
 
@@ -0,0 +1,140 @@
+"""Scoped memo for indicator calculations.
+
+Strategies evaluated on the same DataFrame recompute the same primitives
+(EMAs, RSI, ATR, ...). Inside an indicator_cache() block, every indicator
+decorated with @cached_indicator is computed once per (indicator, parameters,
+input series) and reused by later callers:
+
+    with indicator_cache():
+        for strategy in strategies:
+            strategy(df['close'])  # ema(close, 20) computed once
+
+Input series are fingerprinted by their data buffer, length, strides and
+index object rather than by hashing their contents, so lookups are O(1).
+The cache keeps a reference to every input it has seen, which keeps those
+buffers alive and their fingerprints unique for the lifetime of the block.
+Frames must not be modified in place inside the block.
+
+Outside a block the decorator calls straight through. The active cache is
+held in a ContextVar, so concurrent requests and threads do not share it.
+"""
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class IndicatorCache:
+    """Memo of indicator results for one evaluation."""
+    
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        # Inputs referenced by the keys above (keeps their buffers alive)
+        self._inputs: List[pd.Series] = []
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def fingerprint(series: pd.Series) -> Tuple:
+        """Identify a series by its buffer, shape and index object."""
+        values = series.to_numpy(copy=False)
+        if not isinstance(values, np.ndarray):
+            values = np.asarray(values)
+        interface = values.__array_interface__
+        return (interface['data'][0], values.shape, interface['strides'], values.dtype.str, id(series.index))
+    
+    def get_or_compute(self, key: Hashable, inputs: List[pd.Series], compute: Callable[[], Any]) -> Any:
+        """Return the cached result for key, computing it on first use.
+        
+        Args:
+            key: Indicator name, parameters and input fingerprints
+            inputs: Input series (kept referenced while cached)
+            compute: Function computing the result
+        
+        Returns:
+            Indicator result
+        """
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+        
+        self.misses += 1
+        result = compute()
+        self._results[key] = result
+        self._inputs.extend(inputs)
+        return result
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {
+            'entries': len(self._results),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+_active_cache: ContextVar[Optional[IndicatorCache]] = ContextVar('indicator_cache', default=None)
+
+
+@contextmanager
+def indicator_cache() -> Iterator[IndicatorCache]:
+    """Share indicator results between all calls inside the block.
+    
+    Nested blocks reuse the outer cache.
+    
+    Yields:
+        The active IndicatorCache
+    """
+    cache = _active_cache.get()
+    if cache is not None:
+        yield cache
+        return
+    
+    cache = IndicatorCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def cached_indicator(func: Callable) -> Callable:
+    """Memoize an indicator function inside indicator_cache() blocks.
+    
+    Series arguments are keyed by IndicatorCache.fingerprint and all other
+    arguments by value (defaults applied, so ema(close) and ema(close, 20)
+    share an entry). Calls with unhashable arguments are not cached.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _active_cache.get()
+        if cache is None:
+            return func(*args, **kwargs)
+        
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        
+        inputs = []
+        key_parts = [func.__qualname__]
+        for name, value in bound.arguments.items():
+            if isinstance(value, pd.Series):
+                inputs.append(value)
+                key_parts.append((name, IndicatorCache.fingerprint(value)))
+            else:
+                key_parts.append((name, value))
+        
+        key = tuple(key_parts)
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        
+        return cache.get_or_compute(key, inputs, lambda: func(*args, **kwargs))
+    
+    return wrapper
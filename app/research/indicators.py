@@ -8,6 +8,15 @@ import numpy as np
 from typing import Optional, Union, Tuple
 import warnings
 
+from app.research.indicator_cache import cached_indicator
+
+# Optional: compile recursive indicators with numba
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Suppress pandas warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 
@@ -20,6 +29,7 @@ def validate_series(series: pd.Series, name: str = "Series") -> None:
         raise ValueError(f"{name} contains only NaN values")
 
 
+@cached_indicator
 def ema(close: pd.Series, period: int = 20, adjust: bool = False) -> pd.Series:
     """Calculate Exponential Moving Average without lookahead.
     
@@ -35,6 +45,7 @@ def ema(close: pd.Series, period: int = 20, adjust: bool = False) -> pd.Series:
     return close.ewm(span=period, adjust=adjust, min_periods=period).mean()
 
 
+@cached_indicator
 def sma(close: pd.Series, period: int = 20) -> pd.Series:
     """Calculate Simple Moving Average without lookahead.
     
@@ -49,6 +60,7 @@ def sma(close: pd.Series, period: int = 20) -> pd.Series:
     return close.rolling(window=period, min_periods=period).mean()
 
 
+@cached_indicator
 def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Relative Strength Index without lookahead.
     
@@ -79,6 +91,7 @@ def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
+@cached_indicator
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Average True Range without lookahead.
     
@@ -100,8 +113,8 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     high_close_prev = abs(high - close.shift(1))
     low_close_prev = abs(low - close.shift(1))
     
-    # True Range is the max of the three
-    tr = pd.concat([high_low, high_close_prev, low_close_prev], axis=1).max(axis=1)
+    # True Range is the max of the three (ignoring the NaN on the first bar)
+    tr = pd.Series(np.fmax(np.fmax(high_low, high_close_prev), low_close_prev), index=close.index)
     
     # ATR is EMA of True Range
     atr_series = tr.ewm(span=period, adjust=False, min_periods=period).mean()
@@ -109,6 +122,7 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     return atr_series
 
 
+@cached_indicator
 def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Average Directional Index without lookahead.
     
@@ -149,6 +163,7 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     return adx_series
 
 
+@cached_indicator
 def donchian_channels(high: pd.Series, low: pd.Series, period: int = 20) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate Donchian Channels without lookahead.
     
@@ -170,6 +185,7 @@ def donchian_channels(high: pd.Series, low: pd.Series, period: int = 20) -> Tupl
     return upper_band, middle_band, lower_band
 
 
+@cached_indicator
 def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate MACD without lookahead.
     
@@ -198,6 +214,7 @@ def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> T
     return macd_line, signal_line, histogram
 
 
+@cached_indicator
 def bollinger_bands(close: pd.Series, period: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate Bollinger Bands without lookahead.
     
@@ -220,6 +237,7 @@ def bollinger_bands(close: pd.Series, period: int = 20, std_dev: float = 2.0) ->
     return upper_band, middle_band, lower_band
 
 
+@cached_indicator
 def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, k_period: int = 14, d_period: int = 3) -> Tuple[pd.Series, pd.Series]:
     """Calculate Stochastic Oscillator without lookahead.
     
@@ -250,6 +268,7 @@ def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, k_period: int
     return k, d
 
 
+@cached_indicator
 def cci(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) -> pd.Series:
     """Calculate Commodity Channel Index without lookahead.
     
@@ -281,6 +300,7 @@ def cci(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) ->
     return cci_series
 
 
+@cached_indicator
 def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Williams %R without lookahead.
     
@@ -355,6 +375,7 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     return obv_series
 
 
+@cached_indicator
 def vwap_intraday(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series, timestamp: pd.Series) -> pd.Series:
     """Calculate intraday VWAP that resets daily.
     
@@ -394,6 +415,42 @@ def vwap_intraday(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.
     return vwap_series
 
 
+def _supertrend_kernel(upper_band, lower_band, close, supertrend_out, direction_out):
+    """Supertrend recursion over plain arrays.
+    
+    Bars with NaN bands carry the previous value forward.
+    """
+    supertrend_out[0] = upper_band[0]
+    direction_out[0] = 1
+    
+    for i in range(1, len(close)):
+        if upper_band[i] != upper_band[i] or lower_band[i] != lower_band[i]:
+            supertrend_out[i] = supertrend_out[i - 1]
+            direction_out[i] = direction_out[i - 1]
+            continue
+        
+        # Update bands
+        if close[i - 1] <= supertrend_out[i - 1]:
+            supertrend_out[i] = upper_band[i]
+            direction_out[i] = -1
+        else:
+            supertrend_out[i] = lower_band[i]
+            direction_out[i] = 1
+        
+        # Check for trend change
+        if direction_out[i] == 1 and close[i] < supertrend_out[i]:
+            supertrend_out[i] = upper_band[i]
+            direction_out[i] = -1
+        elif direction_out[i] == -1 and close[i] > supertrend_out[i]:
+            supertrend_out[i] = lower_band[i]
+            direction_out[i] = 1
+
+
+if NUMBA_AVAILABLE:
+    _supertrend_jit = njit(cache=True)(_supertrend_kernel)
+
+
+@cached_indicator
 def supertrend(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 10, multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
     """Calculate Supertrend indicator without lookahead.
     
@@ -419,39 +476,26 @@ def supertrend(high: pd.Series, low: pd.Series, close: pd.Series, period: int =
     upper_band = hl2 + (multiplier * atr_val)
     lower_band = hl2 - (multiplier * atr_val)
     
-    # Initialize
-    supertrend_series = pd.Series(index=close.index, dtype=float)
-    direction = pd.Series(index=close.index, dtype=int)
+    supertrend_values = np.empty(len(close), dtype=np.float64)
+    direction_values = np.empty(len(close), dtype=np.float64)
+    bands = (
+        upper_band.to_numpy(dtype=np.float64),
+        lower_band.to_numpy(dtype=np.float64),
+        close.to_numpy(dtype=np.float64)
+    )
     
-    supertrend_series.iloc[0] = upper_band.iloc[0]
-    direction.iloc[0] = 1
+    if NUMBA_AVAILABLE:
+        _supertrend_jit(*bands, supertrend_values, direction_values)
+    else:
+        _supertrend_kernel(*(b.tolist() for b in bands), supertrend_values, direction_values)
     
-    # Calculate Supertrend
-    for i in range(1, len(close)):
-        if pd.isna(upper_band.iloc[i]) or pd.isna(lower_band.iloc[i]):
-            supertrend_series.iloc[i] = supertrend_series.iloc[i-1]
-            direction.iloc[i] = direction.iloc[i-1]
-            continue
-            
-        # Update bands
-        if close.iloc[i-1] <= supertrend_series.iloc[i-1]:
-            supertrend_series.iloc[i] = upper_band.iloc[i]
-            direction.iloc[i] = -1
-        else:
-            supertrend_series.iloc[i] = lower_band.iloc[i]
-            direction.iloc[i] = 1
-            
-        # Check for trend change
-        if direction.iloc[i] == 1 and close.iloc[i] < supertrend_series.iloc[i]:
-            supertrend_series.iloc[i] = upper_band.iloc[i]
-            direction.iloc[i] = -1
-        elif direction.iloc[i] == -1 and close.iloc[i] > supertrend_series.iloc[i]:
-            supertrend_series.iloc[i] = lower_band.iloc[i]
-            direction.iloc[i] = 1
+    supertrend_series = pd.Series(supertrend_values, index=close.index)
+    direction = pd.Series(direction_values, index=close.index)
     
     return supertrend_series, direction
 
 
+@cached_indicator
 def keltner_channels(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20, multiplier: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate Keltner Channels without lookahead.
     
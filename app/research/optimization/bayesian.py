@@ -2,25 +2,36 @@
 
 This module provides Bayesian optimization using scikit-optimize
 for efficient parameter search with fewer iterations.
+
+The search runs as an ask/tell loop: each round the optimizer proposes
+batch_size points (constant-liar batching), the points are backtested
+together, optionally across a process pool that shares the OHLCV columns,
+and the round is persisted before the next proposal.
 """
 import uuid
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Literal, Optional, Tuple
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 try:
-    from skopt import gp_minimize
+    from skopt import Optimizer
     from skopt.space import Real, Integer, Categorical
-    from skopt.utils import use_named_args
     SKOPT_AVAILABLE = True
 except ImportError:
     SKOPT_AVAILABLE = False
 
-from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.backtest.engine import BacktestConfig
+from app.research.optimization.grid_search import _evaluate_combinations, _evaluate_shared_chunk, check_scoring_metric
+from app.research.optimization.parallel import SharedFrame, resolve_n_jobs
 from app.research.optimization.storage import OptimizationStorage, OptimizationResult
 
 
+# Objective reported to the optimizer for failed backtests (it minimizes)
+FAILED_OBJECTIVE = 1e10
+
+
 class BayesianConfig(BaseModel):
     """Configuration for Bayesian optimization."""
     
@@ -33,6 +44,22 @@ class BayesianConfig(BaseModel):
     n_calls: int = Field(default=50, description="Number of optimization calls")
     n_initial_points: int = Field(default=10, description="Number of random initial points")
     random_state: Optional[int] = Field(default=42, description="Random state for reproducibility")
+    batch_size: int = Field(default=1, ge=1, description="Points proposed and evaluated per round")
+    liar_strategy: Literal["cl_min", "cl_mean", "cl_max"] = Field(
+        default="cl_min", description="Constant-liar value used for pending points in a batch"
+    )
+    n_jobs: int = Field(default=1, description="Number of parallel jobs (-1 = all cores)")
+    
+    @field_validator('scoring_metric')
+    @classmethod
+    def validate_scoring_metric(cls, v):
+        """Ensure the scoring metric is recorded for every backtest."""
+        return check_scoring_metric(v)
+
+
+def _to_python(value: Any) -> Any:
+    """Convert numpy scalars proposed by the optimizer to Python values."""
+    return value.item() if isinstance(value, np.generic) else value
 
 
 def _create_skopt_space(param_space: Dict[str, Dict[str, Any]]) -> List[Any]:
@@ -89,6 +116,11 @@ def bayesian_optimize(
 ) -> List[OptimizationResult]:
     """Run Bayesian optimization.
     
+    Each round asks the optimizer for config.batch_size points and evaluates
+    them with BacktestEngine.run_batch; with config.n_jobs != 1 the batch is
+    split across a process pool reading the OHLCV columns from memory-mapped
+    files. Results are saved to storage after every round.
+    
     Args:
         df: DataFrame with OHLCV data
         config: Bayesian optimization configuration
@@ -114,86 +146,108 @@ def bayesian_optimize(
     
     # Create search space
     dimensions, param_names = _create_skopt_space(config.param_space)
+    n_jobs = min(resolve_n_jobs(config.n_jobs), config.batch_size)
     
     if verbose:
-        print(f"Bayesian optimization: {config.n_calls} iterations")
+        print(f"Bayesian optimization: {config.n_calls} iterations ({config.batch_size} per round, {n_jobs} jobs)")
         print(f"Parameters: {param_names}")
     
+    optimizer = Optimizer(
+        dimensions,
+        base_estimator="GP",
+        n_initial_points=config.n_initial_points,
+        random_state=config.random_state
+    )
+    
     # Store results
     results = []
-    engine = BacktestEngine(backtest_config)
+    shared = None
+    executor = None
+    if n_jobs > 1:
+        shared = SharedFrame(df, list(df.select_dtypes(include=['number', 'datetime']).columns))
+        executor = ProcessPoolExecutor(max_workers=n_jobs)
     
-    # Objective function
-    @use_named_args(dimensions)
-    def objective(**params):
-        run_id = str(uuid.uuid4())
+    def evaluate(points: List[List[Any]]) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, float]]], List[str]]:
+        if executor is None:
+            return _evaluate_combinations(df, config.strategy_name, param_names, points, backtest_config)
         
-        try:
-            # Run backtest with these parameters
-            backtest_result = engine.run(
-                df=df,
-                strategy_name=config.strategy_name,
-                strategy_params=params,
-                timeframe=config.timeframe
-            )
-            
-            # Extract metrics from backtest result
-            metrics_result = backtest_result
-            
-            # Extract score
-            score = getattr(metrics_result, config.scoring_metric)
-            
-            # Create optimization result
-            opt_result = OptimizationResult(
-                run_id=run_id,
-                strategy_name=config.strategy_name,
-                symbol=config.symbol,
-                timeframe=config.timeframe,
-                parameters=params,
-                metrics={
-                    'sharpe_ratio': metrics_result.sharpe_ratio,
-                    'total_return': metrics_result.total_return,
-                    'total_return_pct': metrics_result.total_return_pct,
-                    'max_drawdown': metrics_result.max_drawdown,
-                    'win_rate': metrics_result.win_rate,
-                    'total_trades': metrics_result.total_trades,
-                    'avg_win': metrics_result.avg_win,
-                    'avg_loss': metrics_result.avg_loss,
-                    'profit_factor': metrics_result.profit_factor
-                },
-                score=score
+        chunk_size = -(-len(points) // n_jobs)
+        futures = [
+            executor.submit(
+                _evaluate_shared_chunk,
+                shared.spec, config.strategy_name, param_names, points[i:i + chunk_size], backtest_config
             )
+            for i in range(0, len(points), chunk_size)
+        ]
+        rows, errors = [], []
+        for future in futures:
+            chunk_rows, chunk_errors = future.result()
+            rows.extend(chunk_rows)
+            errors.extend(chunk_errors)
+        return rows, errors
+    
+    try:
+        n_evaluated = 0
+        while n_evaluated < config.n_calls:
+            n_points = min(config.batch_size, config.n_calls - n_evaluated)
+            if n_points == 1:
+                points = [optimizer.ask()]
+            else:
+                points = optimizer.ask(n_points=n_points, strategy=config.liar_strategy)
+            points = [[_to_python(value) for value in point] for point in points]
             
-            results.append(opt_result)
+            rows, errors = evaluate(points)
+            metrics_by_point = {tuple(params[name] for name in param_names): metrics for params, metrics in rows}
             
             if verbose:
-                print(f"Iteration {len(results)}: score={score:.4f}, params={params}")
+                for error in errors:
+                    print(error)
             
-            # Return negative score if minimizing
-            return -score if config.maximize else score
+            objectives = []
+            round_results = []
+            for point in points:
+                n_evaluated += 1
+                params = dict(zip(param_names, point))
+                metrics = metrics_by_point.get(tuple(point))
+                score = metrics[config.scoring_metric] if metrics is not None else None
+                
+                if score is None or not np.isfinite(score):
+                    # Failed or unscorable run: report the worst objective
+                    objectives.append(FAILED_OBJECTIVE)
+                    continue
+                
+                opt_result = OptimizationResult(
+                    run_id=str(uuid.uuid4()),
+                    strategy_name=config.strategy_name,
+                    symbol=config.symbol,
+                    timeframe=config.timeframe,
+                    parameters=params,
+                    metrics=metrics,
+                    score=score
+                )
+                round_results.append(opt_result)
+                
+                if verbose:
+                    print(f"Iteration {n_evaluated}: score={score:.4f}, params={params}")
+                
+                # The optimizer minimizes
+                objectives.append(-score if config.maximize else score)
             
-        except Exception as e:
-            if verbose:
-                print(f"Error with params {params}: {e}")
-            # Return worst possible score
-            return 1e10 if config.maximize else -1e10
-    
-    # Run optimization
-    result = gp_minimize(
-        func=objective,
-        dimensions=dimensions,
-        n_calls=config.n_calls,
-        n_initial_points=config.n_initial_points,
-        random_state=config.random_state,
-        verbose=False
-    )
+            optimizer.tell(points, objectives)
+            
+            # Persist each round as it completes
+            if round_results:
+                storage.save_results_batch(round_results)
+                results.extend(round_results)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if shared is not None:
+            shared.close()
     
     # Sort results by score
     results.sort(key=lambda x: x.score, reverse=True)
     
-    # Save results
-    storage.save_results_batch(results)
-    
     if verbose:
         print(f"\nCompleted Bayesian optimization: {len(results)} iterations")
         if results:
@@ -233,16 +287,13 @@ def suggest_next_parameters(
         X.append(param_values)
         y.append(-r.score)  # Minimize negative score
     
-    # Use Gaussian Process to suggest next points
-    from skopt import Optimizer
-    
+    # Use Gaussian Process to suggest next points (distinct via constant liar)
     opt = Optimizer(dimensions, random_state=42)
     opt.tell(X, y)
     
     suggestions = []
-    for _ in range(n_suggestions):
-        suggested = opt.ask()
-        param_dict = dict(zip(param_names, suggested))
+    for suggested in opt.ask(n_points=n_suggestions):
+        param_dict = dict(zip(param_names, [_to_python(value) for value in suggested]))
         suggestions.append(param_dict)
     
     return suggestions
@@ -4,14 +4,43 @@ This module provides grid search optimization capabilities for systematic
 parameter tuning using exhaustive search.
 """
 import uuid
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 from itertools import product
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from tqdm import tqdm
 
-from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.backtest.engine import BATCH_RESULT_COLUMNS, BacktestEngine, BacktestConfig
+from app.research.optimization.parallel import SharedFrame, attach_frame, resolve_n_jobs
 from app.research.optimization.storage import OptimizationStorage, OptimizationResult
+from app.research.signals import generate_signal
+
+
+# Metrics recorded for every parameter combination (any of them can be scored)
+SCORING_METRICS = BATCH_RESULT_COLUMNS + ['total_return_pct']
+
+# Metrics that are counts rather than ratios or amounts
+COUNT_METRICS = {'total_trades', 'winning_trades', 'losing_trades', 'max_consecutive_losses'}
+
+
+def check_scoring_metric(metric: str) -> str:
+    """Check that a scoring metric is recorded for every backtest.
+    
+    Args:
+        metric: Metric name
+    
+    Returns:
+        The metric name
+    
+    Raises:
+        ValueError: If the metric is not one of SCORING_METRICS
+    """
+    if metric not in SCORING_METRICS:
+        raise ValueError(f"Unknown scoring metric: {metric}. Must be one of {SCORING_METRICS}")
+    return metric
 
 
 class GridSearchConfig(BaseModel):
@@ -23,8 +52,77 @@ class GridSearchConfig(BaseModel):
     param_grid: Dict[str, List[Any]] = Field(..., description="Parameter grid")
     scoring_metric: str = Field(default="sharpe_ratio", description="Metric to optimize")
     maximize: bool = Field(default=True, description="Maximize metric (False to minimize)")
-    n_jobs: int = Field(default=1, description="Number of parallel jobs")
+    n_jobs: int = Field(default=1, description="Number of parallel jobs (-1 = all cores)")
+    chunk_size: int = Field(default=16, ge=1, description="Parameter combinations per task")
+    save_batch_size: int = Field(default=500, ge=1, description="Results per storage write")
     save_all_results: bool = Field(default=True, description="Save all results or only best")
+    
+    @field_validator('scoring_metric')
+    @classmethod
+    def validate_scoring_metric(cls, v):
+        """Ensure the scoring metric is recorded for every combination."""
+        return check_scoring_metric(v)
+
+
+def _evaluate_combinations(
+    df: pd.DataFrame,
+    strategy_name: str,
+    param_names: List[str],
+    combinations: List[Tuple],
+    backtest_config: BacktestConfig
+) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, float]]], List[str]]:
+    """Backtest a chunk of parameter combinations in one batch.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        strategy_name: Strategy name
+        param_names: Parameter names
+        combinations: Parameter value tuples
+        backtest_config: Backtest configuration
+    
+    Returns:
+        Tuple of ([(params, metrics), ...], error messages)
+    """
+    params_list = []
+    signals = []
+    errors = []
+    
+    for param_tuple in combinations:
+        params = dict(zip(param_names, param_tuple))
+        try:
+            signal_output = generate_signal(strategy_name, df, params)
+            signals.append(np.asarray(signal_output.signal, dtype=np.float64))
+            params_list.append(params)
+        except Exception as e:
+            errors.append(f"Error with params {params}: {e}")
+    
+    if not params_list:
+        return [], errors
+    
+    table = BacktestEngine(backtest_config).run_batch(df, np.column_stack(signals))
+    
+    rows = []
+    for params, (_, metrics) in zip(params_list, table.iterrows()):
+        row = {
+            column: int(metrics[column]) if column in COUNT_METRICS else float(metrics[column])
+            for column in BATCH_RESULT_COLUMNS
+        }
+        row['total_return_pct'] = row['total_return'] * 100
+        rows.append((params, row))
+    
+    return rows, errors
+
+
+def _evaluate_shared_chunk(
+    frame_spec: Dict[str, Any],
+    strategy_name: str,
+    param_names: List[str],
+    combinations: List[Tuple],
+    backtest_config: BacktestConfig
+) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, float]]], List[str]]:
+    """Worker entry point: attach to the shared OHLCV frame and evaluate a chunk."""
+    df = attach_frame(frame_spec)
+    return _evaluate_combinations(df, strategy_name, param_names, combinations, backtest_config)
 
 
 def grid_search_optimize(
@@ -32,16 +130,24 @@ def grid_search_optimize(
     config: GridSearchConfig,
     backtest_config: Optional[BacktestConfig] = None,
     storage: Optional[OptimizationStorage] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    cancel_event: Optional[threading.Event] = None
 ) -> List[OptimizationResult]:
     """Run grid search optimization.
     
+    Combinations are evaluated in chunks with BacktestEngine.run_batch. With
+    config.n_jobs != 1 the chunks run in a process pool that reads the OHLCV
+    columns from memory-mapped files. Results are written to storage in
+    batches as chunks complete.
+    
     Args:
         df: DataFrame with OHLCV data
         config: Grid search configuration
         backtest_config: Backtest configuration (optional)
         storage: Optimization storage (optional)
         verbose: Show progress bar
+        cancel_event: Set to stop early; results collected so far are
+            saved and returned
         
     Returns:
         List of optimization results sorted by score
@@ -60,73 +166,88 @@ def grid_search_optimize(
     param_names = list(config.param_grid.keys())
     param_values = list(config.param_grid.values())
     param_combinations = list(product(*param_values))
+    chunks = [
+        param_combinations[i:i + config.chunk_size]
+        for i in range(0, len(param_combinations), config.chunk_size)
+    ]
+    n_jobs = min(resolve_n_jobs(config.n_jobs), max(len(chunks), 1))
     
     if verbose:
-        print(f"Grid search: {len(param_combinations)} parameter combinations")
+        print(f"Grid search: {len(param_combinations)} parameter combinations ({n_jobs} jobs)")
     
     results = []
+    unsaved = []
+    progress = tqdm(total=len(param_combinations)) if verbose else None
     
-    # Initialize backtest engine
-    engine = BacktestEngine(backtest_config)
-    
-    # Iterate through parameter combinations
-    iterator = tqdm(param_combinations) if verbose else param_combinations
-    
-    for param_tuple in iterator:
-        params = dict(zip(param_names, param_tuple))
-        run_id = str(uuid.uuid4())
+    def collect(chunk_output):
+        rows, errors = chunk_output
         
-        try:
-            # Run backtest with these parameters
-            backtest_result = engine.run(
-                df=df,
-                strategy_name=config.strategy_name,
-                strategy_params=params,
-                timeframe=config.timeframe
-            )
-            
-            # Extract metrics from backtest result
-            metrics_result = backtest_result
-            
-            # Extract score
-            score = getattr(metrics_result, config.scoring_metric)
+        for params, metrics in rows:
+            score = metrics[config.scoring_metric]
             if not config.maximize:
                 score = -score
             
-            # Create optimization result
             opt_result = OptimizationResult(
-                run_id=run_id,
+                run_id=str(uuid.uuid4()),
                 strategy_name=config.strategy_name,
                 symbol=config.symbol,
                 timeframe=config.timeframe,
                 parameters=params,
-                metrics={
-                    'sharpe_ratio': metrics_result.sharpe_ratio,
-                    'total_return': metrics_result.total_return,
-                    'total_return_pct': metrics_result.total_return_pct,
-                    'max_drawdown': metrics_result.max_drawdown,
-                    'win_rate': metrics_result.win_rate,
-                    'total_trades': metrics_result.total_trades,
-                    'avg_win': metrics_result.avg_win,
-                    'avg_loss': metrics_result.avg_loss,
-                    'profit_factor': metrics_result.profit_factor
-                },
+                metrics=metrics,
                 score=score
             )
-            
             results.append(opt_result)
-            
-        except Exception as e:
-            if verbose:
-                print(f"Error with params {params}: {e}")
-            continue
+            unsaved.append(opt_result)
+        
+        if verbose:
+            for error in errors:
+                print(error)
+            progress.update(len(rows) + len(errors))
+        
+        # Stream results to storage
+        if config.save_all_results and len(unsaved) >= config.save_batch_size:
+            storage.save_results_batch(unsaved)
+            unsaved.clear()
+    
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+    
+    if n_jobs == 1:
+        for chunk in chunks:
+            if cancelled():
+                break
+            collect(_evaluate_combinations(df, config.strategy_name, param_names, chunk, backtest_config))
+    else:
+        with SharedFrame(df) as shared:
+            executor = ProcessPoolExecutor(max_workers=n_jobs)
+            try:
+                futures = [
+                    executor.submit(
+                        _evaluate_shared_chunk,
+                        shared.spec, config.strategy_name, param_names, chunk, backtest_config
+                    )
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    if cancelled():
+                        break
+                    collect(future.result())
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    if progress is not None:
+        progress.close()
+    
+    if cancelled() and verbose:
+        print(f"Grid search cancelled after {len(results)} combinations")
     
     # Sort by score
     results.sort(key=lambda x: x.score, reverse=True)
     
     # Save results
     if config.save_all_results:
-        storage.save_results_batch(results)
+        if unsaved:
+            storage.save_results_batch(unsaved)
     else:
         if results:
             storage.save_result(results[0])
@@ -0,0 +1,95 @@
+"""Helpers for running optimization work in worker processes.
+
+OHLCV columns are published once as memory-mapped .npy files so worker
+processes attach to the same pages instead of receiving a pickled DataFrame
+with every task.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Resolve an n_jobs setting to a worker count.
+    
+    Args:
+        n_jobs: Number of workers; -1 (or any value < 1) means all cores
+    
+    Returns:
+        Worker count (>= 1)
+    """
+    cpu_count = os.cpu_count() or 1
+    if n_jobs is None or n_jobs < 1:
+        return cpu_count
+    return min(n_jobs, cpu_count)
+
+
+class SharedFrame:
+    """DataFrame columns published as memory-mapped files for worker processes.
+    
+    Usage:
+        with SharedFrame(df) as shared:
+            executor.submit(task, shared.spec, ...)
+        
+        # In the worker
+        df = attach_frame(spec)
+    """
+    
+    def __init__(self, df: pd.DataFrame, columns: Optional[List[str]] = None):
+        """Publish DataFrame columns.
+        
+        Args:
+            df: Source DataFrame (numeric columns)
+            columns: Columns to publish (default: all)
+        """
+        self._dir = Path(tempfile.mkdtemp(prefix="shared_frame_"))
+        
+        column_files = {}
+        for col in (columns or list(df.columns)):
+            path = self._dir / f"{len(column_files)}.npy"
+            np.save(path, np.ascontiguousarray(df[col].to_numpy()))
+            column_files[col] = str(path)
+        
+        self.spec: Dict[str, Any] = {
+            'key': str(self._dir),
+            'columns': column_files
+        }
+    
+    def close(self):
+        """Remove the backing files."""
+        shutil.rmtree(self._dir, ignore_errors=True)
+    
+    def __enter__(self) -> "SharedFrame":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# Frames attached by this (worker) process, keyed by SharedFrame directory
+_attached_frames: Dict[str, pd.DataFrame] = {}
+
+
+def attach_frame(spec: Dict[str, Any]) -> pd.DataFrame:
+    """Attach to a SharedFrame published by the parent process.
+    
+    The frame is built once per process and reused by later tasks.
+    
+    Args:
+        spec: SharedFrame.spec
+    
+    Returns:
+        DataFrame backed by read-only memory maps
+    """
+    df = _attached_frames.get(spec['key'])
+    if df is None:
+        columns = {col: np.load(path, mmap_mode='r') for col, path in spec['columns'].items()}
+        df = pd.DataFrame(columns, copy=False)
+        # Forget frames from earlier runs (their files are gone)
+        _attached_frames.clear()
+        _attached_frames[spec['key']] = df
+    return df
@@ -2,15 +2,60 @@
 
 This module provides storage and retrieval of optimization results
 using SQLite and Parquet formats.
+
+Two backends are available:
+
+- "sqlite": one row per result, parameters and metrics as JSON text.
+- "parquet": an append-only columnar store partitioned by
+  strategy/symbol/timeframe. Every parameter and metric is its own typed
+  column (param_<name>, metric_<name>), and each written file is sorted by
+  score, so top-N queries read row groups in order of their max score and
+  stop as soon as no unread row group can beat the current N-th result.
+  A column whose values have no common Arrow type (e.g. ma_type='ema' in
+  one run and ma_type=3 in another) is stored as JSON text and listed in
+  the table's "json_columns" schema metadata.
+
+Existing SQLite databases can be copied into the columnar store with
+OptimizationStorage.migrate_to_parquet().
 """
 import json
-import sqlite3
+import math
+import os
+import shutil
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pydantic import BaseModel, Field
 
+from app.core.database import get_connection_manager
+
+
+BACKENDS = ("sqlite", "parquet")
+
+PARAM_PREFIX = "param_"
+METRIC_PREFIX = "metric_"
+
+# Columns shared by every result file, in file order
+RESULT_SCHEMA = pa.schema([
+    ('run_id', pa.string()),
+    ('strategy_name', pa.string()),
+    ('symbol', pa.string()),
+    ('timeframe', pa.string()),
+    ('score', pa.float64()),
+    ('timestamp', pa.timestamp('us'))
+])
+
+# Rows per Parquet row group (the unit of top-N pruning)
+ROW_GROUP_SIZE = 10_000
+
+# Schema metadata key listing the columns stored as JSON text
+JSON_COLUMNS_KEY = b'json_columns'
+
 
 class OptimizationResult(BaseModel):
     """Single optimization result."""
@@ -28,50 +73,376 @@ class OptimizationResult(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class ColumnarResultStore:
+    """Append-only Parquet store of optimization results.
+    
+    Layout: strategy=S/symbol=X/timeframe=T/part-<ns>-<id>.parquet, with "/"
+    in symbols written as "-" (the original values are kept as columns).
+    Files are never rewritten except by compact(); saving a run_id twice
+    keeps both rows.
+    """
+    
+    def __init__(self, root: Path):
+        """Initialize columnar store.
+        
+        Args:
+            root: Directory holding the partitions
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def _partition_dir(self, strategy_name: str, symbol: str, timeframe: str) -> Path:
+        """Directory of one strategy/symbol/timeframe partition."""
+        return (
+            self.root / f"strategy={strategy_name}"
+            / f"symbol={symbol.replace('/', '-')}" / f"timeframe={timeframe}"
+        )
+    
+    def _partition_files(
+        self,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None
+    ) -> List[Path]:
+        """List result files in matching partitions, oldest first."""
+        pattern = (
+            f"strategy={strategy_name or '*'}/symbol={symbol.replace('/', '-') if symbol else '*'}"
+            f"/timeframe={timeframe or '*'}/part-*.parquet"
+        )
+        return sorted(self.root.glob(pattern), key=lambda path: path.name)
+    
+    @staticmethod
+    def _to_table(results: List[OptimizationResult]) -> pa.Table:
+        """Build a score-sorted table with one column per parameter and metric."""
+        columns: Dict[str, List[Any]] = {name: [] for name in RESULT_SCHEMA.names}
+        extra: Dict[str, List[Any]] = {}
+        
+        for i, r in enumerate(results):
+            columns['run_id'].append(r.run_id)
+            columns['strategy_name'].append(r.strategy_name)
+            columns['symbol'].append(r.symbol)
+            columns['timeframe'].append(r.timeframe)
+            columns['score'].append(r.score)
+            columns['timestamp'].append(r.timestamp)
+            
+            values = [(f"{PARAM_PREFIX}{k}", v) for k, v in r.parameters.items()]
+            values += [(f"{METRIC_PREFIX}{k}", v) for k, v in r.metrics.items()]
+            for name, value in values:
+                extra.setdefault(name, [None] * i).append(value)
+            for column in extra.values():
+                if len(column) == i:
+                    column.append(None)
+        
+        arrays = [pa.array(columns[field.name], type=field.type) for field in RESULT_SCHEMA]
+        json_columns = set()
+        for name, values in extra.items():
+            try:
+                arrays.append(pa.array(values))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed types in one batch (e.g. 'ema' and 3)
+                arrays.append(_json_array(values))
+                json_columns.add(name)
+        
+        table = pa.Table.from_arrays(arrays, names=RESULT_SCHEMA.names + list(extra))
+        if json_columns:
+            table = table.replace_schema_metadata(_json_metadata(json_columns))
+        return table.sort_by([('score', 'descending')])
+    
+    def append(self, results: List[OptimizationResult]):
+        """Write results as new files, one per partition.
+        
+        Args:
+            results: Optimization results to append
+        """
+        partitions: Dict[Tuple[str, str, str], List[OptimizationResult]] = {}
+        for r in results:
+            partitions.setdefault((r.strategy_name, r.symbol, r.timeframe), []).append(r)
+        
+        for key, group in partitions.items():
+            directory = self._partition_dir(*key)
+            directory.mkdir(parents=True, exist_ok=True)
+            name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+            
+            # Write under a temporary name so readers never see partial files
+            tmp_path = directory / f".{name}.tmp"
+            pq.write_table(self._to_table(group), tmp_path, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+            os.replace(tmp_path, directory / name)
+    
+    def top_n(self, strategy_name: str, symbol: str, timeframe: str, n: int) -> pa.Table:
+        """Get the n highest-scoring rows of one partition.
+        
+        Row groups are visited in order of their max score (from the Parquet
+        column statistics) until the current n-th score is at least the max
+        of every remaining row group.
+        
+        Args:
+            strategy_name: Strategy name
+            symbol: Trading symbol
+            timeframe: Timeframe
+            n: Number of rows to return
+        
+        Returns:
+            Table sorted by score, best first (empty if n <= 0)
+        """
+        if n <= 0:
+            return RESULT_SCHEMA.empty_table()
+        
+        files: Dict[Path, pq.ParquetFile] = {}
+        row_groups = []
+        for path in self._partition_files(strategy_name, symbol, timeframe):
+            files[path] = pq.ParquetFile(path)
+            metadata = files[path].metadata
+            score_idx = metadata.schema.names.index('score')
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(score_idx).statistics
+                upper = stats.max if stats is not None and stats.has_min_max else math.inf
+                row_groups.append((upper, path, i))
+        
+        row_groups.sort(key=lambda item: item[0], reverse=True)
+        
+        top = None
+        for upper, path, i in row_groups:
+            if top is not None and top.num_rows >= n and top['score'][n - 1].as_py() >= upper:
+                break
+            
+            table = files[path].read_row_group(i)
+            if top is not None:
+                table = _concat_tables([top, table])
+            top = table.sort_by([('score', 'descending')]).slice(0, n)
+        
+        return top if top is not None else RESULT_SCHEMA.empty_table()
+    
+    def query(
+        self,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        min_score: Optional[float] = None
+    ) -> pa.Table:
+        """Get all rows of matching partitions.
+        
+        Args:
+            strategy_name: Filter by strategy name
+            symbol: Filter by symbol
+            timeframe: Filter by timeframe
+            min_score: Minimum score (row groups below it are skipped)
+        
+        Returns:
+            Table sorted by score, best first
+        """
+        filters = [('score', '>=', min_score)] if min_score is not None else None
+        tables = [
+            pq.read_table(path, filters=filters)
+            for path in self._partition_files(strategy_name, symbol, timeframe)
+        ]
+        if not tables:
+            return RESULT_SCHEMA.empty_table()
+        
+        table = _concat_tables(tables)
+        return table.sort_by([('score', 'descending')])
+    
+    def compact(
+        self,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None
+    ) -> int:
+        """Merge the files of each matching partition into one sorted file.
+        
+        Args:
+            strategy_name: Filter by strategy name
+            symbol: Filter by symbol
+            timeframe: Filter by timeframe
+        
+        Returns:
+            Number of files removed
+        """
+        by_directory: Dict[Path, List[Path]] = {}
+        for path in self._partition_files(strategy_name, symbol, timeframe):
+            by_directory.setdefault(path.parent, []).append(path)
+        
+        removed = 0
+        for directory, paths in by_directory.items():
+            if len(paths) < 2:
+                continue
+            
+            table = _concat_tables([pq.read_table(path) for path in paths])
+            name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = directory / f".{name}.tmp"
+            pq.write_table(
+                table.sort_by([('score', 'descending')]), tmp_path,
+                row_group_size=ROW_GROUP_SIZE, compression='zstd'
+            )
+            os.replace(tmp_path, directory / name)
+            for path in paths:
+                path.unlink()
+            removed += len(paths) - 1
+        
+        return removed
+    
+    def clear(
+        self,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None
+    ):
+        """Delete matching partitions.
+        
+        Args:
+            strategy_name: Filter by strategy name
+            symbol: Filter by symbol
+            timeframe: Filter by timeframe
+        """
+        for directory in {path.parent for path in self._partition_files(strategy_name, symbol, timeframe)}:
+            shutil.rmtree(directory)
+
+
+def _json_array(values: List[Any]) -> pa.Array:
+    """Encode values as a JSON text column (nulls kept)."""
+    return pa.array([json.dumps(v) if v is not None else None for v in values], type=pa.string())
+
+
+def _json_metadata(names: Set[str]) -> Dict[bytes, bytes]:
+    """Schema metadata listing the columns stored as JSON text."""
+    return {JSON_COLUMNS_KEY: json.dumps(sorted(names)).encode('utf-8')}
+
+
+def _json_columns(table: pa.Table) -> Set[str]:
+    """Names of the columns a table stores as JSON text."""
+    metadata = table.schema.metadata or {}
+    return set(json.loads(metadata.get(JSON_COLUMNS_KEY, b'[]')))
+
+
+def _with_json_columns(table: pa.Table, names: Set[str]) -> pa.Table:
+    """Store the given columns as JSON text and record them in the schema metadata."""
+    encoded = _json_columns(table)
+    for name in (names - encoded) & set(table.column_names):
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, _json_array(table[name].to_pylist()))
+    return table.replace_schema_metadata(_json_metadata(names | encoded))
+
+
+def _concat_tables(tables: List[pa.Table]) -> pa.Table:
+    """Concatenate result tables, promoting column types across files.
+    
+    Columns whose types cannot be promoted (a parameter written as a string
+    by one run and an integer by another), or that any table already stores
+    as JSON, are stored as JSON text in every table first.
+    """
+    json_columns = set().union(*(_json_columns(table) for table in tables))
+    if not json_columns:
+        try:
+            return pa.concat_tables(tables, promote_options='permissive')
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    
+    fields: Dict[str, List[pa.Field]] = {}
+    for table in tables:
+        for field in table.schema:
+            if field.name not in json_columns:
+                fields.setdefault(field.name, []).append(field)
+    
+    for name, same_name in fields.items():
+        try:
+            pa.unify_schemas([pa.schema([field]) for field in same_name], promote_options='permissive')
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            json_columns.add(name)
+    
+    return pa.concat_tables(
+        [_with_json_columns(table, json_columns) for table in tables], promote_options='permissive'
+    )
+
+
+def _decoded_rows(table: pa.Table) -> List[Dict[str, Any]]:
+    """Table rows as dicts, with JSON text columns decoded."""
+    json_columns = _json_columns(table)
+    rows = table.to_pylist()
+    for row in rows:
+        for name in json_columns:
+            if row.get(name) is not None:
+                row[name] = json.loads(row[name])
+    return rows
+
+
+def _table_to_results(table: pa.Table) -> List[OptimizationResult]:
+    """Convert result rows back into OptimizationResult objects.
+    
+    Missing (null) parameter and metric cells are dropped.
+    """
+    results = []
+    for row in _decoded_rows(table):
+        results.append(OptimizationResult(
+            run_id=row['run_id'],
+            strategy_name=row['strategy_name'],
+            symbol=row['symbol'],
+            timeframe=row['timeframe'],
+            parameters={
+                k[len(PARAM_PREFIX):]: v for k, v in row.items()
+                if k.startswith(PARAM_PREFIX) and v is not None
+            },
+            metrics={
+                k[len(METRIC_PREFIX):]: v for k, v in row.items()
+                if k.startswith(METRIC_PREFIX) and v is not None
+            },
+            score=row['score'],
+            timestamp=row['timestamp']
+        ))
+    return results
+
+
 class OptimizationStorage:
     """Storage manager for optimization results."""
     
-    def __init__(self, storage_path: str = "storage/optimization"):
+    def __init__(self, storage_path: str = "storage/optimization", backend: str = "sqlite"):
         """Initialize optimization storage.
         
         Args:
             storage_path: Path to storage directory
+            backend: "sqlite" (optimization.db) or "parquet" (columnar store
+                under results/)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown storage backend '{backend}' (expected one of {BACKENDS})")
+        
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.backend = backend
         self.db_path = self.storage_path / "optimization.db"
-        self._init_database()
+        self.results_path = self.storage_path / "results"
+        
+        self.columnar: Optional[ColumnarResultStore] = None
+        if backend == "parquet":
+            self.columnar = ColumnarResultStore(self.results_path)
+        else:
+            self._init_database()
     
     def _init_database(self):
         """Initialize SQLite database."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS optimization_results (
-                run_id TEXT PRIMARY KEY,
-                strategy_name TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                timeframe TEXT NOT NULL,
-                parameters TEXT NOT NULL,
-                metrics TEXT NOT NULL,
-                score REAL NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_strategy_symbol 
-            ON optimization_results(strategy_name, symbol, timeframe)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_score 
-            ON optimization_results(score DESC)
-        """)
-        
-        conn.commit()
-        conn.close()
+        with get_connection_manager().transaction(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS optimization_results (
+                    run_id TEXT PRIMARY KEY,
+                    strategy_name TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    parameters TEXT NOT NULL,
+                    metrics TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_strategy_symbol 
+                ON optimization_results(strategy_name, symbol, timeframe)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_score 
+                ON optimization_results(score DESC)
+            """)
     
     def save_result(self, result: OptimizationResult):
         """Save optimization result to database.
@@ -79,26 +450,27 @@ class OptimizationStorage:
         Args:
             result: Optimization result to save
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO optimization_results 
-            (run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            result.run_id,
-            result.strategy_name,
-            result.symbol,
-            result.timeframe,
-            json.dumps(result.parameters),
-            json.dumps(result.metrics),
-            result.score,
-            result.timestamp.isoformat()
-        ))
+        if self.columnar is not None:
+            self.columnar.append([result])
+            return
         
-        conn.commit()
-        conn.close()
+        with get_connection_manager().transaction(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                INSERT OR REPLACE INTO optimization_results 
+                (run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                result.run_id,
+                result.strategy_name,
+                result.symbol,
+                result.timeframe,
+                json.dumps(result.parameters),
+                json.dumps(result.metrics),
+                result.score,
+                result.timestamp.isoformat()
+            ))
     
     def save_results_batch(self, results: List[OptimizationResult]):
         """Save multiple optimization results.
@@ -106,31 +478,32 @@ class OptimizationStorage:
         Args:
             results: List of optimization results
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        data = [
-            (
-                r.run_id,
-                r.strategy_name,
-                r.symbol,
-                r.timeframe,
-                json.dumps(r.parameters),
-                json.dumps(r.metrics),
-                r.score,
-                r.timestamp.isoformat()
-            )
-            for r in results
-        ]
+        if self.columnar is not None:
+            self.columnar.append(results)
+            return
         
-        cursor.executemany("""
-            INSERT OR REPLACE INTO optimization_results 
-            (run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, data)
-        
-        conn.commit()
-        conn.close()
+        with get_connection_manager().transaction(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            
+            data = [
+                (
+                    r.run_id,
+                    r.strategy_name,
+                    r.symbol,
+                    r.timeframe,
+                    json.dumps(r.parameters),
+                    json.dumps(r.metrics),
+                    r.score,
+                    r.timestamp.isoformat()
+                )
+                for r in results
+            ]
+            
+            cursor.executemany("""
+                INSERT OR REPLACE INTO optimization_results 
+                (run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, data)
     
     def get_best_parameters(
         self,
@@ -150,31 +523,33 @@ class OptimizationStorage:
         Returns:
             List of best optimization results
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp
-            FROM optimization_results
-            WHERE strategy_name = ? AND symbol = ? AND timeframe = ?
-            ORDER BY score DESC
-            LIMIT ?
-        """, (strategy_name, symbol, timeframe, top_n))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append(OptimizationResult(
-                run_id=row[0],
-                strategy_name=row[1],
-                symbol=row[2],
-                timeframe=row[3],
-                parameters=json.loads(row[4]),
-                metrics=json.loads(row[5]),
-                score=row[6],
-                timestamp=datetime.fromisoformat(row[7])
-            ))
+        if self.columnar is not None:
+            return _table_to_results(self.columnar.top_n(strategy_name, symbol, timeframe, top_n))
+        
+        with get_connection_manager().connection(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp
+                FROM optimization_results
+                WHERE strategy_name = ? AND symbol = ? AND timeframe = ?
+                ORDER BY score DESC
+                LIMIT ?
+            """, (strategy_name, symbol, timeframe, top_n))
+            
+            results = []
+            for row in cursor.fetchall():
+                results.append(OptimizationResult(
+                    run_id=row[0],
+                    strategy_name=row[1],
+                    symbol=row[2],
+                    timeframe=row[3],
+                    parameters=json.loads(row[4]),
+                    metrics=json.loads(row[5]),
+                    score=row[6],
+                    timestamp=datetime.fromisoformat(row[7])
+                ))
         
-        conn.close()
         return results
     
     def get_all_results(
@@ -195,61 +570,76 @@ class OptimizationStorage:
         Returns:
             List of optimization results
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        query = "SELECT run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp FROM optimization_results WHERE 1=1"
-        params = []
-        
-        if strategy_name:
-            query += " AND strategy_name = ?"
-            params.append(strategy_name)
-        
-        if symbol:
-            query += " AND symbol = ?"
-            params.append(symbol)
-        
-        if timeframe:
-            query += " AND timeframe = ?"
-            params.append(timeframe)
-        
-        if min_score is not None:
-            query += " AND score >= ?"
-            params.append(min_score)
-        
-        query += " ORDER BY score DESC"
-        
-        cursor.execute(query, params)
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append(OptimizationResult(
-                run_id=row[0],
-                strategy_name=row[1],
-                symbol=row[2],
-                timeframe=row[3],
-                parameters=json.loads(row[4]),
-                metrics=json.loads(row[5]),
-                score=row[6],
-                timestamp=datetime.fromisoformat(row[7])
-            ))
+        if self.columnar is not None:
+            return _table_to_results(self.columnar.query(strategy_name, symbol, timeframe, min_score))
+        
+        with get_connection_manager().connection(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            
+            query = "SELECT run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp FROM optimization_results WHERE 1=1"
+            params = []
+            
+            if strategy_name:
+                query += " AND strategy_name = ?"
+                params.append(strategy_name)
+            
+            if symbol:
+                query += " AND symbol = ?"
+                params.append(symbol)
+            
+            if timeframe:
+                query += " AND timeframe = ?"
+                params.append(timeframe)
+            
+            if min_score is not None:
+                query += " AND score >= ?"
+                params.append(min_score)
+            
+            query += " ORDER BY score DESC"
+            
+            cursor.execute(query, params)
+            
+            results = []
+            for row in cursor.fetchall():
+                results.append(OptimizationResult(
+                    run_id=row[0],
+                    strategy_name=row[1],
+                    symbol=row[2],
+                    timeframe=row[3],
+                    parameters=json.loads(row[4]),
+                    metrics=json.loads(row[5]),
+                    score=row[6],
+                    timestamp=datetime.fromisoformat(row[7])
+                ))
         
-        conn.close()
         return results
     
-    def export_to_parquet(self, output_path: Optional[str] = None) -> str:
-        """Export all results to Parquet file.
+    def get_results_frame(
+        self,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        min_score: Optional[float] = None
+    ) -> pd.DataFrame:
+        """Get results as a flat DataFrame with param_* and metric_* columns.
         
         Args:
-            output_path: Output file path (default: storage/optimization/results.parquet)
+            strategy_name: Filter by strategy name
+            symbol: Filter by symbol
+            timeframe: Filter by timeframe
+            min_score: Minimum score threshold
             
         Returns:
-            Path to exported file
+            DataFrame sorted by score, best first
         """
-        if output_path is None:
-            output_path = str(self.storage_path / "results.parquet")
+        if self.columnar is not None:
+            table = self.columnar.query(strategy_name, symbol, timeframe, min_score)
+            frame = table.to_pandas()
+            for name in _json_columns(table):
+                frame[name] = frame[name].map(lambda v: json.loads(v) if v is not None else None)
+            return frame
         
-        results = self.get_all_results()
+        results = self.get_all_results(strategy_name, symbol, timeframe, min_score)
         
         # Convert to DataFrame
         data = []
@@ -269,11 +659,72 @@ class OptimizationStorage:
                 row[f'metric_{k}'] = v
             data.append(row)
         
-        df = pd.DataFrame(data)
+        return pd.DataFrame(data)
+    
+    def export_to_parquet(self, output_path: Optional[str] = None) -> str:
+        """Export all results to Parquet file.
+        
+        Args:
+            output_path: Output file path (default: storage/optimization/results.parquet)
+        
+        Returns:
+            Path to exported file
+        """
+        if output_path is None:
+            output_path = str(self.storage_path / "results.parquet")
+        
+        df = self.get_results_frame()
         df.to_parquet(output_path, index=False)
         
         return output_path
     
+    def migrate_to_parquet(self, batch_size: int = 100_000) -> int:
+        """Copy every row of the SQLite database into the columnar store.
+        
+        Rows are streamed in batches; the database is left untouched. Open
+        the storage with backend="parquet" afterwards to use the copy.
+        
+        Args:
+            batch_size: Rows per read (and per written file)
+        
+        Returns:
+            Number of rows copied
+        """
+        if not self.db_path.exists():
+            return 0
+        
+        columnar = self.columnar or ColumnarResultStore(self.results_path)
+        
+        with get_connection_manager().connection(str(self.db_path)) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT run_id, strategy_name, symbol, timeframe, parameters, metrics, score, timestamp "
+                "FROM optimization_results"
+            )
+            
+            copied = 0
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                
+                columnar.append([
+                    OptimizationResult(
+                        run_id=row[0],
+                        strategy_name=row[1],
+                        symbol=row[2],
+                        timeframe=row[3],
+                        parameters=json.loads(row[4]),
+                        metrics=json.loads(row[5]),
+                        score=row[6],
+                        timestamp=datetime.fromisoformat(row[7])
+                    )
+                    for row in rows
+                ])
+                copied += len(rows)
+        
+        return copied
+    
     def clear_results(
         self,
         strategy_name: Optional[str] = None,
@@ -287,29 +738,30 @@ class OptimizationStorage:
             symbol: Filter by symbol
             timeframe: Filter by timeframe
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        if self.columnar is not None:
+            self.columnar.clear(strategy_name, symbol, timeframe)
+            return
         
-        if strategy_name or symbol or timeframe:
-            query = "DELETE FROM optimization_results WHERE 1=1"
-            params = []
+        with get_connection_manager().transaction(str(self.db_path)) as conn:
+            cursor = conn.cursor()
             
-            if strategy_name:
-                query += " AND strategy_name = ?"
-                params.append(strategy_name)
-            
-            if symbol:
-                query += " AND symbol = ?"
-                params.append(symbol)
-            
-            if timeframe:
-                query += " AND timeframe = ?"
-                params.append(timeframe)
-            
-            cursor.execute(query, params)
-        else:
-            cursor.execute("DELETE FROM optimization_results")
-        
-        conn.commit()
-        conn.close()
+            if strategy_name or symbol or timeframe:
+                query = "DELETE FROM optimization_results WHERE 1=1"
+                params = []
+                
+                if strategy_name:
+                    query += " AND strategy_name = ?"
+                    params.append(strategy_name)
+                
+                if symbol:
+                    query += " AND symbol = ?"
+                    params.append(symbol)
+                
+                if timeframe:
+                    query += " AND timeframe = ?"
+                    params.append(timeframe)
+                
+                cursor.execute(query, params)
+            else:
+                cursor.execute("DELETE FROM optimization_results")
 
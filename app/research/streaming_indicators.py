@@ -0,0 +1,468 @@
+"""Streaming technical indicators with O(1) per-bar updates.
+
+Each class here is a stateful counterpart of a function in
+app.research.indicators. It carries the recursive state of the batch
+calculation (EWM accumulators, rolling sums, monotonic deques) so that a new
+bar is folded in with update() instead of recomputing the full history.
+
+Values match the batch functions bar for bar, including the NaN warm-up
+period:
+
+    atr = StreamingATR(period=14)
+    for bar in history:
+        atr.update(bar.high, bar.low, bar.close)
+    
+    # On each new bar
+    current_atr = atr.update(high, low, close)
+"""
+import math
+from collections import deque
+from typing import Tuple
+
+
+NAN = float('nan')
+
+
+class StreamingEWM:
+    """Exponentially weighted mean, same as Series.ewm(span, adjust=False).mean().
+    
+    NaN inputs are handled like pandas with ignore_na=False: the output is
+    carried forward and the next observation is weighted against the decayed
+    previous value.
+    """
+    
+    def __init__(self, span: float, min_periods: int = 0):
+        """Initialize EWM state.
+        
+        Args:
+            span: EWM span
+            min_periods: Observations required before a value is returned
+        """
+        if span < 1:
+            raise ValueError("span must satisfy: span >= 1")
+        
+        com = (span - 1) / 2
+        self.alpha = 1.0 / (1.0 + com)
+        self.min_periods = max(int(min_periods), 1)
+        self._decay = 1.0 - self.alpha
+        self._weighted = NAN
+        self._old_wt = 1.0
+        self._nobs = 0
+    
+    def update(self, x: float) -> float:
+        """Add an observation and return the current mean."""
+        is_observation = x == x
+        self._nobs += is_observation
+        weighted = self._weighted
+        
+        if weighted == weighted:
+            self._old_wt *= self._decay
+            if is_observation:
+                if weighted != x:
+                    weighted = (self._old_wt * weighted + self.alpha * x) / (self._old_wt + self.alpha)
+                self._old_wt = 1.0
+        elif is_observation:
+            weighted = x
+        
+        self._weighted = weighted
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        """Current mean (NaN during warm-up)."""
+        return self._weighted if self._nobs >= self.min_periods else NAN
+
+
+class StreamingRollingMean:
+    """Rolling mean over a ring buffer, same as Series.rolling(window).mean().
+    
+    The running sum is Kahan-compensated so that it does not drift over long
+    streams.
+    """
+    
+    def __init__(self, window: int, min_periods: int = None):
+        """Initialize rolling state.
+        
+        Args:
+            window: Window length
+            min_periods: Valid observations required (default: window)
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._buffer = deque(maxlen=window)
+        self._nobs = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+    
+    def _add(self, x: float):
+        y = x - self._compensation
+        t = self._sum + y
+        self._compensation = (t - self._sum) - y
+        self._sum = t
+    
+    def update(self, x: float) -> float:
+        """Add an observation and return the current mean."""
+        if len(self._buffer) == self.window:
+            old = self._buffer[0]
+            if old == old:
+                self._nobs -= 1
+                self._add(-old)
+        
+        self._buffer.append(x)
+        if x == x:
+            self._nobs += 1
+            self._add(x)
+        
+        if self._nobs == 0:
+            # Reset accumulated rounding error when the window empties
+            self._sum = 0.0
+            self._compensation = 0.0
+        
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        """Current mean (NaN during warm-up)."""
+        if self._nobs < max(self.min_periods, 1):
+            return NAN
+        return self._sum / self._nobs
+
+
+class StreamingRollingStd:
+    """Rolling sample standard deviation, same as Series.rolling(window).std().
+    
+    Uses Welford's update with removal so each bar is O(1). A window of
+    identical values gives exactly 0, as in pandas.
+    """
+    
+    def __init__(self, window: int, ddof: int = 1):
+        """Initialize rolling state.
+        
+        Args:
+            window: Window length
+            ddof: Delta degrees of freedom
+        """
+        self.window = window
+        self.ddof = ddof
+        self._buffer = deque(maxlen=window)
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._last = NAN
+        self._run_length = 0
+    
+    def update(self, x: float) -> float:
+        """Add an observation and return the current standard deviation."""
+        if len(self._buffer) == self.window:
+            old = self._buffer[0]
+            if old == old:
+                self._nobs -= 1
+                if self._nobs:
+                    delta = old - self._mean
+                    self._mean -= delta / self._nobs
+                    self._ssqdm -= (self._nobs + 1) * delta * delta / self._nobs
+                else:
+                    self._mean = 0.0
+                    self._ssqdm = 0.0
+        
+        self._buffer.append(x)
+        self._run_length = self._run_length + 1 if x == self._last else 1
+        self._last = x
+        if x == x:
+            self._nobs += 1
+            delta = x - self._mean
+            self._mean += delta / self._nobs
+            self._ssqdm += delta * (x - self._mean)
+        
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        """Current standard deviation (NaN during warm-up)."""
+        if self._nobs < self.window or self._nobs <= self.ddof:
+            return NAN
+        if self._run_length >= self.window:
+            return 0.0
+        return math.sqrt(max(self._ssqdm, 0.0) / (self._nobs - self.ddof))
+
+
+class StreamingRollingExtreme:
+    """Rolling max or min over a monotonic deque (amortized O(1) per bar)."""
+    
+    def __init__(self, window: int, mode: str = "max"):
+        """Initialize rolling state.
+        
+        Args:
+            window: Window length
+            mode: 'max' or 'min'
+        """
+        if mode not in ("max", "min"):
+            raise ValueError(f"mode must be 'max' or 'min', got {mode}")
+        
+        self.window = window
+        self._is_max = mode == "max"
+        self._candidates = deque()
+        self._nan_positions = deque()
+        self._count = 0
+    
+    def update(self, x: float) -> float:
+        """Add an observation and return the current extreme."""
+        position = self._count
+        self._count += 1
+        expired = position - self.window
+        
+        while self._candidates and self._candidates[0][0] <= expired:
+            self._candidates.popleft()
+        while self._nan_positions and self._nan_positions[0] <= expired:
+            self._nan_positions.popleft()
+        
+        if x == x:
+            if self._is_max:
+                while self._candidates and self._candidates[-1][1] <= x:
+                    self._candidates.pop()
+            else:
+                while self._candidates and self._candidates[-1][1] >= x:
+                    self._candidates.pop()
+            self._candidates.append((position, x))
+        else:
+            self._nan_positions.append(position)
+        
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        """Current extreme (NaN until the window holds `window` valid values)."""
+        if self._count < self.window or self._nan_positions or not self._candidates:
+            return NAN
+        return self._candidates[0][1]
+
+
+class StreamingEMA:
+    """Streaming counterpart of indicators.ema."""
+    
+    def __init__(self, period: int = 20):
+        self._ewm = StreamingEWM(period, min_periods=period)
+    
+    def update(self, close: float) -> float:
+        """Add a close and return the EMA."""
+        return self._ewm.update(close)
+    
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+
+class StreamingSMA:
+    """Streaming counterpart of indicators.sma."""
+    
+    def __init__(self, period: int = 20):
+        self._mean = StreamingRollingMean(period)
+    
+    def update(self, close: float) -> float:
+        """Add a close and return the SMA."""
+        return self._mean.update(close)
+    
+    @property
+    def value(self) -> float:
+        return self._mean.value
+
+
+class StreamingRSI:
+    """Streaming counterpart of indicators.rsi."""
+    
+    def __init__(self, period: int = 14):
+        self._gains = StreamingEWM(period, min_periods=period)
+        self._losses = StreamingEWM(period, min_periods=period)
+        self._prev_close = NAN
+        self.value = NAN
+    
+    def update(self, close: float) -> float:
+        """Add a close and return the RSI."""
+        delta = close - self._prev_close
+        self._prev_close = close
+        
+        avg_gain = self._gains.update(delta if delta > 0 else 0.0)
+        avg_loss = self._losses.update(-delta if delta < 0 else 0.0)
+        
+        self.value = 100 - (100 / (1 + _divide(avg_gain, avg_loss)))
+        return self.value
+
+
+class StreamingATR:
+    """Streaming counterpart of indicators.atr."""
+    
+    def __init__(self, period: int = 14):
+        self._ewm = StreamingEWM(period, min_periods=period)
+        self._prev_close = NAN
+        self.true_range = NAN
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add a bar and return the ATR."""
+        self.true_range = _nanmax(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        return self._ewm.update(self.true_range)
+    
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+
+class StreamingADX:
+    """Streaming counterpart of indicators.adx."""
+    
+    def __init__(self, period: int = 14):
+        self._atr = StreamingATR(period)
+        self._plus_dm = StreamingEWM(period, min_periods=period)
+        self._minus_dm = StreamingEWM(period, min_periods=period)
+        self._dx = StreamingEWM(period, min_periods=period)
+        self._prev_high = NAN
+        self._prev_low = NAN
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add a bar and return the ADX."""
+        up = high - self._prev_high
+        down = -(low - self._prev_low)
+        self._prev_high = high
+        self._prev_low = low
+        
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        
+        atr_val = self._atr.update(high, low, close)
+        plus_di = _divide(100 * self._plus_dm.update(plus_dm), atr_val)
+        minus_di = _divide(100 * self._minus_dm.update(minus_dm), atr_val)
+        
+        dx = _divide(100 * abs(plus_di - minus_di), plus_di + minus_di)
+        return self._dx.update(dx)
+    
+    @property
+    def value(self) -> float:
+        return self._dx.value
+
+
+class StreamingMACD:
+    """Streaming counterpart of indicators.macd."""
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = StreamingEWM(fast, min_periods=fast)
+        self._slow = StreamingEWM(slow, min_periods=slow)
+        self._signal = StreamingEWM(signal, min_periods=signal)
+        self.value = (NAN, NAN, NAN)
+    
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """Add a close and return (macd_line, signal_line, histogram)."""
+        macd_line = self._fast.update(close) - self._slow.update(close)
+        signal_line = self._signal.update(macd_line)
+        self.value = (macd_line, signal_line, macd_line - signal_line)
+        return self.value
+
+
+class StreamingBollingerBands:
+    """Streaming counterpart of indicators.bollinger_bands."""
+    
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.std_dev = std_dev
+        self._mean = StreamingRollingMean(period)
+        self._std = StreamingRollingStd(period)
+        self.value = (NAN, NAN, NAN)
+    
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """Add a close and return (upper_band, middle_band, lower_band)."""
+        middle = self._mean.update(close)
+        std = self._std.update(close)
+        self.value = (middle + std * self.std_dev, middle, middle - std * self.std_dev)
+        return self.value
+
+
+class StreamingStochastic:
+    """Streaming counterpart of indicators.stochastic."""
+    
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self._highest = StreamingRollingExtreme(k_period, "max")
+        self._lowest = StreamingRollingExtreme(k_period, "min")
+        self._d = StreamingRollingMean(d_period)
+        self.value = (NAN, NAN)
+    
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        """Add a bar and return (%K, %D)."""
+        highest_high = self._highest.update(high)
+        lowest_low = self._lowest.update(low)
+        
+        k = _divide(100 * (close - lowest_low), highest_high - lowest_low)
+        self.value = (k, self._d.update(k))
+        return self.value
+
+
+class StreamingSupertrend:
+    """Streaming counterpart of indicators.supertrend."""
+    
+    def __init__(self, period: int = 10, multiplier: float = 3.0):
+        self.multiplier = multiplier
+        self._atr = StreamingATR(period)
+        self._prev_close = NAN
+        self._count = 0
+        self.value = (NAN, 1)
+    
+    def update(self, high: float, low: float, close: float) -> Tuple[float, int]:
+        """Add a bar and return (supertrend, direction)."""
+        atr_val = self._atr.update(high, low, close)
+        hl2 = (high + low) / 2
+        upper_band = hl2 + self.multiplier * atr_val
+        lower_band = hl2 - self.multiplier * atr_val
+        prev_supertrend, prev_direction = self.value
+        
+        if self._count == 0:
+            self.value = (upper_band, 1)
+        elif upper_band != upper_band or lower_band != lower_band:
+            self.value = (prev_supertrend, prev_direction)
+        else:
+            if self._prev_close <= prev_supertrend:
+                supertrend, direction = upper_band, -1
+            else:
+                supertrend, direction = lower_band, 1
+            
+            # Check for trend change
+            if direction == 1 and close < supertrend:
+                supertrend, direction = upper_band, -1
+            elif direction == -1 and close > supertrend:
+                supertrend, direction = lower_band, 1
+            self.value = (supertrend, direction)
+        
+        self._prev_close = close
+        self._count += 1
+        return self.value
+
+
+class StreamingKeltnerChannels:
+    """Streaming counterpart of indicators.keltner_channels."""
+    
+    def __init__(self, period: int = 20, multiplier: float = 2.0):
+        self.multiplier = multiplier
+        self._ema = StreamingEWM(period, min_periods=period)
+        self._atr = StreamingATR(period)
+        self.value = (NAN, NAN, NAN)
+    
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float, float]:
+        """Add a bar and return (upper_band, middle_band, lower_band)."""
+        middle = self._ema.update(close)
+        atr_val = self._atr.update(high, low, close)
+        self.value = (middle + self.multiplier * atr_val, middle, middle - self.multiplier * atr_val)
+        return self.value
+
+
+def _divide(a: float, b: float) -> float:
+    """Float division with pandas semantics (x/0 -> +-inf, 0/0 -> NaN)."""
+    if b == 0:
+        if a == 0 or a != a:
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+def _nanmax(*values: float) -> float:
+    """Max ignoring NaN (NaN if all values are NaN)."""
+    result = NAN
+    for v in values:
+        if v == v and not (result >= v):
+            result = v
+    return result
@@ -5,7 +5,6 @@ multi-timeframe signals and generates actionable trading recommendations.
 """
 import hashlib
 import json
-import sqlite3
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 import pandas as pd
@@ -13,11 +12,14 @@ import numpy as np
 import logging
 
 from app.data import DataStore, DataFetcher
+from app.data.frames import read_frame
+from app.data.frame_cache import invalidate_frames
 from app.research.signals import generate_signal, get_strategy_list
 from app.service.recommendation_contract import Recommendation, PlanDirection, RecommendationRequest, RecommendationResponse
 from app.service.strategy_ranking import StrategyRankingService, StrategyRecommendation
 from app.service.recommendation_weights import RecommendationWeightCalculator, WeightConfig
 from app.config.settings import settings
+from app.core.database import get_connection_manager
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +66,7 @@ class DailyRecommendationService:
         """Initialize SQLite database for recommendations."""
         db_path = self.store.base_path / "recommendations.db"
         
-        with sqlite3.connect(db_path) as conn:
+        with get_connection_manager().transaction(db_path) as conn:
             cursor = conn.cursor()
             
             # Create recommendations table with all fields
@@ -99,8 +101,6 @@ class DailyRecommendationService:
                     UNIQUE(date, symbol, timeframe)
                 )
             """)
-            
-            conn.commit()
     
     def get_daily_recommendation(
         self, 
@@ -151,7 +151,7 @@ class DailyRecommendationService:
         try:
             db_path = self.store.base_path / "recommendations.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().connection(db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -289,28 +289,25 @@ class DailyRecommendationService:
         """Fallback ranking method using real quantitative analysis."""
         try:
             from app.research.signals import generate_signal, get_strategy_list
-            from app.research.backtest.engine import BacktestEngine
-            from app.research.backtest.metrics import calculate_metrics
+            from app.research.backtest.engine import BacktestEngine, BacktestConfig
+            from app.research.backtest.result_cache import get_backtest_cache
             
             # Get available strategies
             strategies = get_strategy_list()
             fallback_rankings = []
             
             # Get data for analysis
-            bars = self.store.read_bars(symbol, timeframe)
-            if not bars or len(bars) < 50:
+            df = read_frame(self.store, symbol, timeframe)
+            if len(df) < 50:
                 logger.warning(f"Insufficient data for fallback analysis: {symbol} {timeframe}")
                 return []
             
-            # Convert to DataFrame
-            df = pd.DataFrame([bar.to_dict() for bar in bars])
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            
             # Initialize backtest engine for real quantitative analysis
-            backtest_engine = BacktestEngine(
+            backtest_engine = BacktestEngine(BacktestConfig(
                 initial_capital=10000.0,
                 risk_per_trade=0.02
-            )
+            ))
+            backtest_cache = get_backtest_cache()
             
             # Analyze each strategy with real backtesting
             for strategy in strategies[:3]:  # Limit to top 3 strategies for performance
@@ -324,11 +321,17 @@ class DailyRecommendationService:
                     
                     # Run real backtest for quantitative metrics
                     try:
-                        backtest_result = backtest_engine.run_backtest(
-                            df=df,
-                            signals=signal_output.signal,
-                            strategy_name=strategy,
-                            verbose=False
+                        backtest_result = backtest_cache.get_or_run(
+                            strategy,
+                            None,
+                            backtest_engine.config,
+                            df,
+                            lambda: backtest_engine.run(
+                                df=df,
+                                signals=signal_output.signal,
+                                strategy_name=strategy,
+                                verbose=False
+                            )
                         )
                         
                         # Extract real quantitative metrics
@@ -508,15 +511,15 @@ class DailyRecommendationService:
         try:
             # Try to get the latest price from data store
             target_date = datetime.now()
-            bars = self.store.read_bars(symbol, "1h", since=target_date - timedelta(hours=1), until=target_date)
+            df = read_frame(self.store, symbol, "1h", since=target_date - timedelta(hours=1), until=target_date, columns=['timestamp', 'close'])
             
-            if bars and len(bars) > 0:
-                return bars[-1].close
+            if not df.empty:
+                return float(df['close'].iloc[-1])
                 
             # Fallback: try to get any recent data
-            bars = self.store.read_bars(symbol, "1h", since=target_date - timedelta(days=7), until=target_date)
-            if bars and len(bars) > 0:
-                return bars[-1].close
+            df = read_frame(self.store, symbol, "1h", since=target_date - timedelta(days=7), until=target_date, columns=['timestamp', 'close'])
+            if not df.empty:
+                return float(df['close'].iloc[-1])
                 
             # If no data available, use a mock price for testing
             logger.warning(f"No price data available for {symbol}, using mock price")
@@ -859,6 +862,9 @@ class DailyRecommendationService:
             bars_added = sync_result.get("bars_added", 0)
             attempts = 1
             
+            if bars_added > 0:
+                invalidate_frames(symbol, timeframe)
+            
             if sync_result["success"] and bars_added > 0:
                 logger.info(f"Successfully refreshed {symbol} {timeframe}: {bars_added} bars added")
                 return {
@@ -890,6 +896,7 @@ class DailyRecommendationService:
                     if bars and len(bars) > 0:
                         # Write bars to store
                         meta = self.store.write_bars(bars, mode="append")
+                        invalidate_frames(symbol, timeframe)
                         bars_added = len(bars)
                         
                         logger.info(f"Fallback successful: {bars_added} bars added for {symbol} {timeframe}")
@@ -1081,11 +1088,10 @@ class DailyRecommendationService:
             # Use a simple strategy: if price is above a moving average, go LONG
             try:
                 # Get recent data for simple analysis
-                bars = self.store.read_bars(symbol, "1h", since=datetime.now() - timedelta(days=7))
-                if bars and len(bars) > 20:
+                df = read_frame(self.store, symbol, "1h", since=datetime.now() - timedelta(days=7), columns=['timestamp', 'close'])
+                if len(df) > 20:
                     # Simple moving average calculation
-                    recent_prices = [bar.close for bar in bars[-20:]]
-                    ma_20 = sum(recent_prices) / len(recent_prices)
+                    ma_20 = float(df['close'].iloc[-20:].mean())
                     
                     # Simple signal: if current price > MA, go LONG
                     if current_price > ma_20:
@@ -1288,9 +1294,9 @@ class DailyRecommendationService:
             timestamp_metadata = []
             for tf in timeframes:
                 try:
-                    bars = self.store.read_bars(symbol, tf)
-                    if bars:
-                        latest_timestamp = max(bar.timestamp for bar in bars)
+                    df = read_frame(self.store, symbol, tf, max_bars=1, columns=['timestamp'])
+                    if not df.empty:
+                        latest_timestamp = int(df['timestamp'].iloc[-1])
                         timestamp_metadata.append(f"{tf}:{latest_timestamp}")
                     else:
                         timestamp_metadata.append(f"{tf}:none")
@@ -1321,7 +1327,7 @@ class DailyRecommendationService:
         try:
             db_path = self.store.base_path / "recommendations.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().transaction(db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -1360,8 +1366,6 @@ class DailyRecommendationService:
                     (datetime.now() + timedelta(hours=24)).isoformat()
                 ))
                 
-                conn.commit()
-                
         except Exception as e:
             logger.error(f"Error saving recommendation: {e}")
     
@@ -1375,7 +1379,7 @@ class DailyRecommendationService:
         try:
             db_path = self.store.base_path / "recommendations.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().connection(db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
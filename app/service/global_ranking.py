@@ -5,16 +5,18 @@ normalizes metrics, and creates global rankings with configurable weights.
 """
 import pandas as pd
 import numpy as np
+from concurrent.futures import Executor
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 import logging
-import sqlite3
 from pathlib import Path
 
 from app.service.strategy_orchestrator import StrategyOrchestrator, StrategyBacktestResult
 from app.data import DataStore
 from app.config.settings import settings
+from app.core.database import get_connection_manager
+from app.core.job_queue import ProgressCallback
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ class GlobalRankingConfig(BaseModel):
     lookback_days: int = Field(default=90, description="Lookback period for backtesting")
     capital: float = Field(default=10000.0, description="Capital for backtesting")
     risk_pct: float = Field(default=0.02, description="Risk percentage per trade")
+    n_jobs: int = Field(default=-1, description="Worker processes for the timeframe x strategy backtests when no shared pool is given (-1 = all cores, 1 = serial)")
 
 
 class GlobalRankingResult(BaseModel):
@@ -41,8 +44,9 @@ class GlobalRankingResult(BaseModel):
     total_strategies: int
     valid_strategies: int
     rankings: List[Dict[str, Any]]
-    consolidated_metrics: Dict[str, float]
+    consolidated_metrics: Dict[str, Any]
     execution_time: float
+    task_times: Dict[str, float] = Field(default_factory=dict, description="Seconds per backtest, keyed by timeframe/strategy")
 
 
 class GlobalRankingService:
@@ -71,7 +75,7 @@ class GlobalRankingService:
         """Initialize SQLite database for rankings."""
         db_path = self.store.base_path / "global_rankings.db"
         
-        with sqlite3.connect(db_path) as conn:
+        with get_connection_manager().transaction(db_path) as conn:
             cursor = conn.cursor()
             
             # Create daily rankings table
@@ -138,19 +142,23 @@ class GlobalRankingService:
                     UNIQUE(date, symbol)
                 )
             """)
-            
-            conn.commit()
     
     def run_global_ranking(
         self,
         symbol: str, 
-        date: Optional[str] = None
+        date: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        progress: Optional[ProgressCallback] = None
     ) -> GlobalRankingResult:
         """Run global ranking for all strategies across timeframes.
         
         Args:
             symbol: Trading symbol
             date: Date for ranking (default: today)
+            executor: Process pool shared across symbols (default: one pool
+                per call sized by config.n_jobs)
+            progress: Called with (completed fraction, message) as each
+                (timeframe, strategy) backtest finishes
             
         Returns:
             GlobalRankingResult with complete ranking
@@ -163,12 +171,11 @@ class GlobalRankingService:
         logger.info(f"Running global ranking for {symbol} on {date}")
         
         try:
-            # Run backtests for all timeframes
-        all_results = []
-            for tf in self.config.target_timeframes:
-                logger.info(f"Running backtests for {symbol} {tf}")
-                results = self.orchestrator.run_all_backtests(symbol, tf)
-                all_results.extend(results)
+            # Run backtests for all timeframes and strategies
+            all_results, task_times = self.orchestrator.run_backtest_grid(
+                symbol, self.config.target_timeframes, n_jobs=self.config.n_jobs,
+                executor=executor, progress=progress
+            )
             
             if not all_results:
                 logger.warning(f"No backtest results for {symbol}")
@@ -202,7 +209,8 @@ class GlobalRankingService:
                 valid_strategies=len(valid_results),
                 rankings=rankings,
                 consolidated_metrics=consolidated_metrics,
-                execution_time=execution_time
+                execution_time=execution_time,
+                task_times=task_times
             )
             
         except Exception as e:
@@ -299,7 +307,7 @@ class GlobalRankingService:
         try:
             db_path = self.store.base_path / "global_rankings.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().transaction(db_path) as conn:
                 cursor = conn.cursor()
                 
                 # Save daily rankings
@@ -330,8 +338,6 @@ class GlobalRankingService:
                     consolidated_metrics['best_score'], 0.0  # execution_time will be updated
                 ))
                 
-                conn.commit()
-                
         except Exception as e:
             logger.error(f"Error saving rankings: {e}")
     
@@ -364,7 +370,7 @@ class GlobalRankingService:
         try:
             db_path = self.store.base_path / "global_rankings.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().connection(db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -399,7 +405,7 @@ class GlobalRankingService:
         try:
             db_path = self.store.base_path / "global_rankings.db"
             
-            with sqlite3.connect(db_path) as conn:
+            with get_connection_manager().connection(db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
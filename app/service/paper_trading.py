@@ -13,6 +13,7 @@ import json
 
 from app.data.paper_trading_schemas import DecisionRecord, TradeRecord, PerformanceMetrics
 from app.config.settings import settings
+from app.core.database import get_connection_manager
 
 
 class PaperTradingDB:
@@ -32,9 +33,19 @@ class PaperTradingDB:
         
         self._create_tables()
     
+    def batch(self):
+        """Group several writes into one transaction (single commit).
+        
+        Usage:
+            with db.batch():
+                for trade in trades:
+                    db.save_trade(trade)
+        """
+        return get_connection_manager().transaction(self.db_path)
+    
     def _create_tables(self):
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Decisions table
@@ -206,15 +217,13 @@ class PaperTradingDB:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)")
             
-            conn.commit()
-    
     def save_decision(self, decision: DecisionRecord):
         """Save decision to database.
         
         Args:
             decision: DecisionRecord to save
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO decisions VALUES (
@@ -240,7 +249,6 @@ class PaperTradingDB:
                 decision.skip_reason,
                 decision.window
             ))
-            conn.commit()
     
     def save_trade(self, trade: TradeRecord):
         """Save trade to database.
@@ -248,7 +256,7 @@ class PaperTradingDB:
         Args:
             trade: TradeRecord to save
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO trades VALUES (
@@ -273,7 +281,6 @@ class PaperTradingDB:
                 trade.exit_reason,
                 trade.status
             ))
-            conn.commit()
     
     def get_open_trades(self, symbol: Optional[str] = None) -> List[TradeRecord]:
         """Get all open trades.
@@ -284,9 +291,9 @@ class PaperTradingDB:
         Returns:
             List of open TradeRecords
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             if symbol:
                 cursor.execute("SELECT * FROM trades WHERE status = 'open' AND symbol = ?", (symbol,))
@@ -328,9 +335,9 @@ class PaperTradingDB:
         Returns:
             List of all TradeRecords
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             if symbol:
                 cursor.execute("SELECT * FROM trades WHERE symbol = ? ORDER BY entry_time DESC", (symbol,))
@@ -372,9 +379,9 @@ class PaperTradingDB:
         Returns:
             List of DecisionRecords
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM decisions WHERE trading_day = ?", (trading_day,))
             rows = cursor.fetchall()
             
@@ -414,7 +421,7 @@ class PaperTradingDB:
         rank: int
     ):
         """Save strategy ranking to database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO strategy_rankings (
@@ -450,7 +457,6 @@ class PaperTradingDB:
                 result.risk_pct,
                 result.lookback_days
             ))
-            conn.commit()
     
     def get_strategy_rankings(
         self,
@@ -459,9 +465,9 @@ class PaperTradingDB:
         limit: int = 10
     ) -> List[Dict]:
         """Get latest strategy rankings."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             query = "SELECT * FROM strategy_rankings WHERE 1=1"
             params = []
@@ -492,14 +498,13 @@ class PaperTradingDB:
         metric_value: float
     ):
         """Save daily performance metric for a strategy."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO strategy_performance 
                 (date, symbol, timeframe, strategy_name, metric_name, metric_value)
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (date, symbol, timeframe, strategy_name, metric_name, metric_value))
-            conn.commit()
     
     def get_strategy_performance_history(
         self,
@@ -510,9 +515,9 @@ class PaperTradingDB:
         days: int = 30
     ) -> List[Dict]:
         """Get performance history for a strategy."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT * FROM strategy_performance
@@ -558,7 +563,7 @@ class PaperTradingDB:
             alert_triggered = True
             alert_reason = f"Win rate divergence: {wr_div:.1f}%"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection_manager().transaction(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO truth_data (
@@ -583,16 +588,15 @@ class PaperTradingDB:
                 alert_triggered,
                 alert_reason
             ))
-            conn.commit()
     
     def get_truth_data_alerts(
         self,
         days: int = 7
     ) -> List[Dict]:
         """Get recent divergence alerts."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT * FROM truth_data
@@ -611,9 +615,9 @@ class PaperTradingDB:
         days: int = 30
     ) -> List[Dict]:
         """Get real vs simulated comparison for all strategies."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection_manager().connection(self.db_path) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT * FROM truth_data
@@ -3,13 +3,14 @@
 This module handles storing and retrieving detailed breakdowns of
 recommendation calculations for transparency and auditability.
 """
-import sqlite3
 import json
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field
 import logging
 
+from app.core.database import get_connection_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,7 +57,7 @@ class RecommendationBreakdownDB:
     def _init_db(self):
         """Initialize database tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().transaction(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 # Create breakdown table
@@ -90,7 +91,6 @@ class RecommendationBreakdownDB:
                     ON recommendation_breakdowns(symbol, date)
                 """)
                 
-                conn.commit()
                 logger.info("Recommendation breakdown database initialized")
                 
         except Exception as e:
@@ -107,7 +107,7 @@ class RecommendationBreakdownDB:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().transaction(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -133,7 +133,6 @@ class RecommendationBreakdownDB:
                     breakdown.updated_at.isoformat()
                 ))
                 
-                conn.commit()
                 logger.info(f"Breakdown saved for recommendation {breakdown.recommendation_id}")
                 return True
                 
@@ -151,7 +150,7 @@ class RecommendationBreakdownDB:
             Breakdown if found, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -184,7 +183,7 @@ class RecommendationBreakdownDB:
             List of breakdowns
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -210,7 +209,7 @@ class RecommendationBreakdownDB:
             List of recent breakdowns
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -258,7 +257,7 @@ class RecommendationBreakdownDB:
             cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
             cutoff_date = cutoff_date.replace(day=cutoff_date.day - days)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with get_connection_manager().transaction(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -267,7 +266,6 @@ class RecommendationBreakdownDB:
                 """, (cutoff_date.isoformat(),))
                 
                 deleted_count = cursor.rowcount
-                conn.commit()
                 
                 logger.info(f"Deleted {deleted_count} old breakdowns")
                 return deleted_count
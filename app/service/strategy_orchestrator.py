@@ -2,8 +2,10 @@
 
 This module runs backtests on all registered strategies and ranks them by performance.
 """
+import time
 import pandas as pd
 import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
@@ -15,8 +17,13 @@ from app.research.signals import (
     trend_following_ema,
     SignalOutput
 )
+from app.core.job_queue import ProgressCallback
 from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.backtest.result_cache import get_backtest_cache
+from app.research.indicator_cache import indicator_cache
+from app.research.optimization.parallel import SharedFrame, attach_frame, resolve_n_jobs
 from app.data.store import DataStore
+from app.data.frames import read_frame
 
 logger = logging.getLogger(__name__)
 
@@ -152,20 +159,146 @@ class StrategyOrchestrator:
         
         results = []
         
-        for strategy_def in self.STRATEGY_REGISTRY:
-            if not strategy_def.enabled:
-                continue
-            
-            try:
-                result = self._backtest_strategy(strategy_def, df, symbol, timeframe)
-                if result:
-                    results.append(result)
-                    logger.info(f"✅ {strategy_def.name}: Sharpe={result.sharpe_ratio:.2f}, WR={result.win_rate:.1%}")
-            except Exception as e:
-                logger.error(f"Failed to backtest {strategy_def.name}: {e}")
+        # Strategies share EMA/RSI/ATR computations on this frame
+        with indicator_cache():
+            for strategy_def in self.STRATEGY_REGISTRY:
+                if not strategy_def.enabled:
+                    continue
+                
+                try:
+                    result = self._backtest_strategy(strategy_def, df, symbol, timeframe)
+                    if result:
+                        results.append(result)
+                        logger.info(f"✅ {strategy_def.name}: Sharpe={result.sharpe_ratio:.2f}, WR={result.win_rate:.1%}")
+                except Exception as e:
+                    logger.error(f"Failed to backtest {strategy_def.name}: {e}")
         
         return results
     
+    def run_backtest_grid(
+        self,
+        symbol: str,
+        timeframes: List[str],
+        end_date: Optional[datetime] = None,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[List[StrategyBacktestResult], Dict[str, float]]:
+        """Run every enabled strategy on every timeframe.
+        
+        Data is loaded once per timeframe. With n_jobs != 1, each
+        (timeframe, strategy) backtest is a separate task in a process pool
+        that reads the timeframe's bars from memory-mapped files.
+        
+        Args:
+            symbol: Trading symbol
+            timeframes: Timeframes to test
+            end_date: End date for backtest (default: now)
+            n_jobs: Worker processes (-1 = all cores)
+            executor: Process pool shared with other symbols' grids; when
+                given, n_jobs is ignored and tasks are submitted to it
+            progress: Called with (completed fraction, message) after each
+                (timeframe, strategy) backtest
+        
+        Returns:
+            Tuple of (results in timeframe then registry order, seconds per
+            task keyed by "timeframe/strategy")
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        
+        frames = {}
+        for timeframe in timeframes:
+            df = self._load_data(symbol, timeframe, end_date)
+            if df is None or len(df) < 100:
+                logger.warning(f"Insufficient data for {symbol} {timeframe}")
+                continue
+            frames[timeframe] = df
+        
+        tasks = [
+            (timeframe, strategy_def)
+            for timeframe in frames
+            for strategy_def in self.STRATEGY_REGISTRY
+            if strategy_def.enabled
+        ]
+        if not tasks:
+            return [], {}
+        
+        n_workers = min(resolve_n_jobs(n_jobs), len(tasks))
+        if executor is None:
+            logger.info(f"Running {len(tasks)} backtests for {symbol} on {n_workers} worker(s)")
+        else:
+            logger.info(f"Submitting {len(tasks)} backtests for {symbol} to the shared pool")
+        
+        if executor is None and n_workers == 1:
+            outcomes = []
+            for timeframe, df in frames.items():
+                # Strategies share EMA/RSI/ATR computations on this frame
+                with indicator_cache():
+                    for task_timeframe, strategy_def in tasks:
+                        if task_timeframe == timeframe:
+                            outcomes.append(_timed_backtest(self, strategy_def, df, symbol, timeframe))
+                            _report_task(progress, len(outcomes), len(tasks), timeframe, strategy_def)
+        else:
+            outcomes = self._run_grid_parallel(frames, tasks, symbol, n_workers, executor, progress)
+        
+        results = []
+        task_times = {}
+        for (timeframe, strategy_def), (result, seconds) in zip(tasks, outcomes):
+            task_times[f"{timeframe}/{strategy_def.name}"] = seconds
+            if result:
+                results.append(result)
+                logger.info(f"✅ {timeframe} {strategy_def.name}: Sharpe={result.sharpe_ratio:.2f}, WR={result.win_rate:.1%}")
+        
+        return results, task_times
+    
+    def _run_grid_parallel(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        tasks: List[Tuple[str, StrategyDefinition]],
+        symbol: str,
+        n_workers: int,
+        executor: Optional[Executor] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> List[Tuple[Optional[StrategyBacktestResult], float]]:
+        """Run (timeframe, strategy) backtests in a process pool.
+        
+        Args:
+            frames: Bars per timeframe
+            tasks: (timeframe, strategy) pairs
+            symbol: Trading symbol
+            n_workers: Worker processes of the pool created when no executor is given
+            executor: Existing process pool to submit to (left running)
+            progress: Called as each task completes (in completion order)
+        
+        Returns:
+            (result, seconds) per task, in task order
+        """
+        shared = {
+            timeframe: SharedFrame(df, list(df.select_dtypes(include=['number', 'datetime']).columns))
+            for timeframe, df in frames.items()
+        }
+        own_pool = ProcessPoolExecutor(max_workers=n_workers) if executor is None else None
+        try:
+            futures = [
+                (executor or own_pool).submit(
+                    _backtest_shared_strategy,
+                    shared[timeframe].spec, self.capital, self.max_risk_pct, self.lookback_days,
+                    strategy_def, symbol, timeframe
+                )
+                for timeframe, strategy_def in tasks
+            ]
+            if progress is not None:
+                task_of = dict(zip(futures, tasks))
+                for done, future in enumerate(as_completed(futures), 1):
+                    _report_task(progress, done, len(tasks), *task_of[future])
+            return [future.result() for future in futures]
+        finally:
+            if own_pool is not None:
+                own_pool.shutdown()
+            for frame in shared.values():
+                frame.close()
+    
     def validate_data_availability(
         self,
         symbol: str,
@@ -373,68 +506,70 @@ class StrategyOrchestrator:
         
         results = []
         
-        for combo_name, combo_func in combinations:
-            try:
-                # Generate signals for combination
-                signal_output = combo_func(df['close'])
-                if signal_output is None:
-                    continue
-                
-                # Run backtest
-                config = BacktestConfig(
-                    initial_capital=self.capital,
-                    risk_per_trade=self.max_risk_pct,
-                    commission=0.001,
-                    slippage=0.0005,
-                    # Disable trading windows for daily timeframes
-                    use_trading_windows=(timeframe not in ['1d', '1w', '1M'])
-                )
-                
-                engine = BacktestEngine(config)
-                backtest_result = engine.run(df, signal_output.signal, combo_name, verbose=False)
-                
-                if not backtest_result or backtest_result.total_trades == 0:
-                    continue
-                
-                # Create StrategyBacktestResult from BacktestResult
-                result = StrategyBacktestResult(
-                    strategy_name=combo_name,
-                    timestamp=end_date,
-                    timeframe=timeframe,
+        # Combinations reuse each member strategy's indicators
+        with indicator_cache():
+            for combo_name, combo_func in combinations:
+                try:
+                    # Generate signals for combination
+                    signal_output = combo_func(df['close'])
+                    if signal_output is None:
+                        continue
                     
-                    # Performance (from BacktestResult)
-                    total_return=backtest_result.total_return,
-                    cagr=backtest_result.cagr,
-                    sharpe_ratio=backtest_result.sharpe_ratio,
-                    max_drawdown=backtest_result.max_drawdown,
-                    win_rate=backtest_result.win_rate,
-                    profit_factor=backtest_result.profit_factor,
-                    expectancy=backtest_result.expectancy,
+                    # Run backtest
+                    config = BacktestConfig(
+                        initial_capital=self.capital,
+                        risk_per_trade=self.max_risk_pct,
+                        commission=0.001,
+                        slippage=0.0005,
+                        # Disable trading windows for daily timeframes
+                        use_trading_windows=(timeframe not in ['1d', '1w', '1M'])
+                    )
                     
-                    # Risk (from BacktestResult)
-                    volatility=backtest_result.volatility,
-                    calmar_ratio=backtest_result.calmar_ratio,
-                    sortino_ratio=backtest_result.sortino_ratio,
+                    engine = BacktestEngine(config)
+                    backtest_result = engine.run(df, signal_output.signal, combo_name, verbose=False)
                     
-                    # Trade stats (from BacktestResult)
-                    total_trades=backtest_result.total_trades,
-                    winning_trades=backtest_result.winning_trades,
-                    losing_trades=backtest_result.losing_trades,
-                    avg_win=backtest_result.avg_win,
-                    avg_loss=backtest_result.avg_loss,
+                    if not backtest_result or backtest_result.total_trades == 0:
+                        continue
                     
-                    # Config
-                    capital=self.capital,
-                    risk_pct=self.max_risk_pct,
-                    lookback_days=self.lookback_days
-                )
-                
-                results.append(result)
-                logger.info(f"✅ {combo_name}: Sharpe={result.sharpe_ratio:.2f}, WR={result.win_rate:.1%}")
+                    # Create StrategyBacktestResult from BacktestResult
+                    result = StrategyBacktestResult(
+                        strategy_name=combo_name,
+                        timestamp=end_date,
+                        timeframe=timeframe,
+                        
+                        # Performance (from BacktestResult)
+                        total_return=backtest_result.total_return,
+                        cagr=backtest_result.cagr,
+                        sharpe_ratio=backtest_result.sharpe_ratio,
+                        max_drawdown=backtest_result.max_drawdown,
+                        win_rate=backtest_result.win_rate,
+                        profit_factor=backtest_result.profit_factor,
+                        expectancy=backtest_result.expectancy,
+                        
+                        # Risk (from BacktestResult)
+                        volatility=backtest_result.volatility,
+                        calmar_ratio=backtest_result.calmar_ratio,
+                        sortino_ratio=backtest_result.sortino_ratio,
+                        
+                        # Trade stats (from BacktestResult)
+                        total_trades=backtest_result.total_trades,
+                        winning_trades=backtest_result.winning_trades,
+                        losing_trades=backtest_result.losing_trades,
+                        avg_win=backtest_result.avg_win,
+                        avg_loss=backtest_result.avg_loss,
+                        
+                        # Config
+                        capital=self.capital,
+                        risk_pct=self.max_risk_pct,
+                        lookback_days=self.lookback_days
+                    )
+                    
+                    results.append(result)
+                    logger.info(f"✅ {combo_name}: Sharpe={result.sharpe_ratio:.2f}, WR={result.win_rate:.1%}")
                 
-            except Exception as e:
-                logger.error(f"Failed to backtest combination {combo_name}: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"Failed to backtest combination {combo_name}: {e}")
+                    continue
         
         return results
     
@@ -451,14 +586,11 @@ class StrategyOrchestrator:
             # Get target number of candles for this timeframe
             max_bars = settings.TIMEFRAME_CANDLE_TARGETS.get(timeframe, 365)
             
-            bars = self.store.read_bars(symbol, timeframe, max_bars=max_bars)
+            df = read_frame(self.store, symbol, timeframe, max_bars=max_bars)
             
-            if not bars:
+            if df.empty:
                 return None
             
-            df = pd.DataFrame([bar.to_dict() for bar in bars])
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            
             # Only filter by end_date if provided, otherwise use all available data
             if end_date:
                 end_timestamp = int(end_date.timestamp() * 1000)
@@ -477,14 +609,8 @@ class StrategyOrchestrator:
         symbol: str,
         timeframe: str
     ) -> Optional[StrategyBacktestResult]:
-        """Run backtest for a single strategy."""
+        """Run backtest for a single strategy (cached by strategy, params, config and bars)."""
         try:
-            # Generate signals
-            signals = self._generate_signals(strategy_def, df)
-            if signals is None:
-                return None
-            
-            # Run backtest
             config = BacktestConfig(
                 initial_capital=self.capital,
                 risk_per_trade=self.max_risk_pct,
@@ -494,8 +620,18 @@ class StrategyOrchestrator:
                 use_trading_windows=(timeframe not in ['1d', '1w', '1M'])
             )
             
-            engine = BacktestEngine(config)
-            backtest_result = engine.run(df, signals.signal, strategy_def.name, verbose=True)
+            def run_backtest():
+                # Generate signals
+                signals = self._generate_signals(strategy_def, df)
+                if signals is None:
+                    return None
+                
+                engine = BacktestEngine(config)
+                return engine.run(df, signals.signal, strategy_def.name, verbose=True)
+            
+            backtest_result = get_backtest_cache().get_or_run(
+                strategy_def.name, strategy_def.params, config, df, run_backtest
+            )
             
             if not backtest_result or backtest_result.total_trades == 0:
                 logger.warning(f"No trades for {strategy_def.name}")
@@ -505,6 +641,7 @@ class StrategyOrchestrator:
             result = StrategyBacktestResult(
                 strategy_name=strategy_def.name,
                 timestamp=datetime.now(),
+                timeframe=timeframe,
                 
                 # Performance (from BacktestResult)
                 total_return=backtest_result.total_return,
@@ -787,3 +924,41 @@ class StrategyOrchestrator:
         
         return None
 
+
+def _timed_backtest(
+    orchestrator: StrategyOrchestrator,
+    strategy_def: StrategyDefinition,
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str
+) -> Tuple[Optional[StrategyBacktestResult], float]:
+    """Backtest one strategy and measure how long it took."""
+    started = time.perf_counter()
+    result = orchestrator._backtest_strategy(strategy_def, df, symbol, timeframe)
+    return result, time.perf_counter() - started
+
+
+def _report_task(
+    progress: Optional[ProgressCallback],
+    done: int,
+    total: int,
+    timeframe: str,
+    strategy_def: StrategyDefinition
+) -> None:
+    """Report a completed (timeframe, strategy) backtest to a progress callback."""
+    if progress is not None:
+        progress(done / total, f"Backtested {strategy_def.name} on {timeframe} ({done}/{total})")
+
+
+def _backtest_shared_strategy(
+    frame_spec: Dict[str, Any],
+    capital: float,
+    max_risk_pct: float,
+    lookback_days: int,
+    strategy_def: StrategyDefinition,
+    symbol: str,
+    timeframe: str
+) -> Tuple[Optional[StrategyBacktestResult], float]:
+    """Worker entry point: attach to a timeframe's bars and backtest one strategy."""
+    orchestrator = StrategyOrchestrator(capital=capital, max_risk_pct=max_risk_pct, lookback_days=lookback_days)
+    return _timed_backtest(orchestrator, strategy_def, attach_frame(frame_spec), symbol, timeframe)
@@ -16,6 +16,7 @@ from app.service.strategy_orchestrator import StrategyOrchestrator, StrategyBack
 from app.service.paper_trading import PaperTradingDB
 from app.service.decision import DecisionEngine, DailyDecision
 from app.data.store import DataStore
+from app.data.frames import read_frame
 
 logger = logging.getLogger(__name__)
 
@@ -163,27 +164,28 @@ class StrategyRankingService:
         symbol: str,
         timeframe: str
     ):
-        """Save strategy rankings to database."""
-        for i, (result, score) in enumerate(ranked):
-            # Update result with symbol/timeframe (for database)
-            # We'll need to modify save_strategy_ranking to accept these
-            try:
-                # Save to database with rank
-                self.db.save_strategy_ranking(result, score, i + 1)
-                
-                # Also save individual metrics for trending
-                today = datetime.now().strftime('%Y-%m-%d')
-                self.db.save_strategy_performance_metric(
-                    today, symbol, timeframe, result.strategy_name, 'sharpe_ratio', result.sharpe_ratio
-                )
-                self.db.save_strategy_performance_metric(
-                    today, symbol, timeframe, result.strategy_name, 'win_rate', result.win_rate
-                )
-                self.db.save_strategy_performance_metric(
-                    today, symbol, timeframe, result.strategy_name, 'max_drawdown', result.max_drawdown
-                )
-            except Exception as e:
-                logger.error(f"Failed to save ranking for {result.strategy_name}: {e}")
+        """Save strategy rankings to database (one commit for all rows)."""
+        with self.db.batch():
+            for i, (result, score) in enumerate(ranked):
+                # Update result with symbol/timeframe (for database)
+                # We'll need to modify save_strategy_ranking to accept these
+                try:
+                    # Save to database with rank
+                    self.db.save_strategy_ranking(result, score, i + 1)
+                    
+                    # Also save individual metrics for trending
+                    today = datetime.now().strftime('%Y-%m-%d')
+                    self.db.save_strategy_performance_metric(
+                        today, symbol, timeframe, result.strategy_name, 'sharpe_ratio', result.sharpe_ratio
+                    )
+                    self.db.save_strategy_performance_metric(
+                        today, symbol, timeframe, result.strategy_name, 'win_rate', result.win_rate
+                    )
+                    self.db.save_strategy_performance_metric(
+                        today, symbol, timeframe, result.strategy_name, 'max_drawdown', result.max_drawdown
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to save ranking for {result.strategy_name}: {e}")
     
     def _generate_trade_plan(
         self,
@@ -195,14 +197,10 @@ class StrategyRankingService:
         """Generate specific trade plan using the selected strategy."""
         try:
             # Load data
-            bars = self.store.read_bars(symbol, timeframe)
-            if not bars or len(bars) < 100:
+            df = read_frame(self.store, symbol, timeframe, max_bars=500)
+            if len(df) < 100:
                 return {'signal': 0}
             
-            df = pd.DataFrame([bar.to_dict() for bar in bars])
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            df = df.tail(500)
-            
             # Generate signals for selected strategy
             signals = self.orchestrator._generate_signals(
                 self._get_strategy_def(strategy_name),
@@ -8,7 +8,8 @@ from app.simulation.stress_testing import (
     ShockScenario,
     ShockType,
     StressTestResult,
-    StressTestReport
+    StressTestReport,
+    PlacementSweepResult
 )
 
 __all__ = [
@@ -16,7 +17,8 @@ __all__ = [
     "ShockScenario",
     "ShockType",
     "StressTestResult",
-    "StressTestReport"
+    "StressTestReport",
+    "PlacementSweepResult"
 ]
 
 
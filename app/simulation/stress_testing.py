@@ -10,12 +10,15 @@ This module implements stress testing and scenario analysis:
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
 import logging
 
 from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.indicator_cache import indicator_cache
+from app.research.optimization.parallel import SharedFrame, attach_frame, resolve_n_jobs
 from app.research.signals import generate_signal
 
 logger = logging.getLogger(__name__)
@@ -52,11 +55,31 @@ class StressTestResult(BaseModel):
     recovery_time_bars: Optional[int] = None
     total_trades_during_stress: int = 0
     worst_trade_pct: float = 0.0
+    error: Optional[str] = Field(default=None, description="Why the strategy could not be evaluated")
     
     class Config:
         arbitrary_types_allowed = True
 
 
+class PlacementSweepResult(BaseModel):
+    """Stress test outcomes of one strategy over many shock placements."""
+    scenario_name: str
+    strategy_name: str
+    num_placements: int
+    failed: int = Field(default=0, description="Placements where the strategy could not be evaluated (excluded from the statistics)")
+    survival_probability: float = Field(..., description="Share of evaluated placements survived")
+    mean_max_drawdown: float
+    median_max_drawdown: float
+    worst_max_drawdown: float
+    max_drawdown_5th_percentile: float = Field(..., description="5th percentile of max drawdown (tail)")
+    mean_final_capital: float
+    
+    # Raw results, one per evaluated placement
+    start_indices: List[int] = Field(default_factory=list)
+    max_drawdowns: List[float] = Field(default_factory=list)
+    final_capitals: List[float] = Field(default_factory=list)
+
+
 class StressTestReport(BaseModel):
     """Comprehensive stress test report."""
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -157,94 +180,211 @@ class StressTestEngine:
             )
         ]
     
+    def _shock_returns(
+        self,
+        scenario: ShockScenario,
+        steps: np.ndarray,
+        base_volatility: float,
+        rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Per-bar returns of the shock phase.
+        
+        Args:
+            scenario: Shock scenario
+            steps: Bar number within the shock (1 = first shocked bar)
+            base_volatility: Standard deviation of the original returns
+            rng: Random generator for volatility noise (default: global np.random)
+        
+        Returns:
+            Shock return for each step
+        """
+        progress = steps / scenario.duration_bars
+        noise_scale = base_volatility * scenario.volatility_multiplier
+        normal = rng.normal if rng is not None else np.random.normal
+        
+        if scenario.shock_type in (ShockType.CRASH, ShockType.TRENDING_REVERSAL):
+            # Gradual move
+            return scenario.price_change_pct * progress
+        if scenario.shock_type == ShockType.FLASH_CRASH:
+            # Immediate drop
+            return np.full(len(steps), scenario.price_change_pct)
+        if scenario.shock_type == ShockType.VOLATILITY_SPIKE:
+            # No directional bias, just higher volatility
+            return normal(0, noise_scale, len(steps))
+        if scenario.shock_type == ShockType.LIQUIDITY_CRUNCH:
+            # Price drop with high volatility
+            return scenario.price_change_pct * progress + normal(0, noise_scale, len(steps))
+        if scenario.shock_type == ShockType.GRADUAL_DECLINE:
+            # Slow decline
+            return np.full(len(steps), scenario.price_change_pct / scenario.duration_bars)
+        return np.zeros(len(steps))
+    
     def apply_shock_to_data(
         self,
         df: pd.DataFrame,
         scenario: ShockScenario,
-        start_idx: int
+        start_idx: int,
+        rng: Optional[np.random.Generator] = None
     ) -> pd.DataFrame:
         """Apply shock scenario to price data.
         
+        The shock is applied as a multiplicative return path from the close
+        before start_idx, followed by a linear recovery towards the close at
+        start_idx. Shocked bars get open = previous close and a +/-1% range.
+        
         Args:
-            df: Original DataFrame
+            df: Original DataFrame (positional index)
             scenario: Shock scenario to apply
             start_idx: Index to start applying shock
+            rng: Random generator for volatility noise (default: global np.random)
             
         Returns:
             Modified DataFrame with shock applied
         """
         df_shocked = df.copy()
+        n_bars = len(df)
         
-        if start_idx >= len(df):
+        if start_idx >= n_bars:
             logger.warning("Start index beyond data length")
             return df_shocked
         
-        # Calculate base volatility
-        returns = df['close'].pct_change()
-        base_volatility = returns.std()
-        
-        # Apply shock
-        shock_end_idx = min(start_idx + scenario.duration_bars, len(df))
+        close = df['close'].to_numpy(dtype=np.float64).copy()
         
-        for i in range(start_idx, shock_end_idx):
-            if i == 0:
-                continue
-            
-            # Price shock
-            if scenario.shock_type == ShockType.CRASH:
-                # Gradual crash
-                progress = (i - start_idx + 1) / scenario.duration_bars
-                shock_return = scenario.price_change_pct * progress
-            
-            elif scenario.shock_type == ShockType.FLASH_CRASH:
-                # Immediate drop
-                shock_return = scenario.price_change_pct
-            
-            elif scenario.shock_type == ShockType.VOLATILITY_SPIKE:
-                # No directional bias, just higher volatility
-                shock_return = np.random.normal(0, base_volatility * scenario.volatility_multiplier)
-            
-            elif scenario.shock_type == ShockType.LIQUIDITY_CRUNCH:
-                # Price drop with high volatility
-                progress = (i - start_idx + 1) / scenario.duration_bars
-                shock_return = scenario.price_change_pct * progress + np.random.normal(0, base_volatility * scenario.volatility_multiplier)
-            
-            elif scenario.shock_type == ShockType.TRENDING_REVERSAL:
-                # Gradual reversal
-                progress = (i - start_idx + 1) / scenario.duration_bars
-                shock_return = scenario.price_change_pct * progress
-            
-            elif scenario.shock_type == ShockType.GRADUAL_DECLINE:
-                # Slow decline
-                shock_return = scenario.price_change_pct / scenario.duration_bars
-            
-            else:
-                shock_return = 0.0
-            
-            # Apply to prices
-            df_shocked.loc[i, 'close'] = df_shocked.loc[i-1, 'close'] * (1 + shock_return)
-            df_shocked.loc[i, 'open'] = df_shocked.loc[i-1, 'close']
-            df_shocked.loc[i, 'high'] = df_shocked.loc[i, 'close'] * 1.01
-            df_shocked.loc[i, 'low'] = df_shocked.loc[i, 'close'] * 0.99
+        # Shock phase (the first bar has no previous close to shock from)
+        first_idx = max(start_idx, 1)
+        shock_end_idx = min(start_idx + scenario.duration_bars, n_bars)
+        if first_idx < shock_end_idx:
+            base_volatility = df['close'].pct_change().std()
+            steps = np.arange(first_idx, shock_end_idx) - start_idx + 1
+            growth = 1 + self._shock_returns(scenario, steps, base_volatility, rng)
+            path = np.multiply.accumulate(np.concatenate(([close[first_idx - 1]], growth)))
+            close[first_idx:shock_end_idx] = path[1:]
         
-        # Recovery phase
+        # Recovery phase: linear path back to the pre-shock close
+        end_idx = shock_end_idx
         if scenario.recovery_bars > 0:
-            recovery_end_idx = min(shock_end_idx + scenario.recovery_bars, len(df))
-            recovery_target = df.loc[start_idx, 'close']  # Original price before shock
+            end_idx = min(shock_end_idx + scenario.recovery_bars, n_bars)
+            recovery_start_idx = max(shock_end_idx, 1)
+            if recovery_start_idx < end_idx:
+                shocked_close = close[recovery_start_idx - 1]
+                recovery_target = df['close'].iloc[start_idx]
+                progress = (np.arange(recovery_start_idx, end_idx) - shock_end_idx + 1) / scenario.recovery_bars
+                close[recovery_start_idx:end_idx] = shocked_close + (recovery_target - shocked_close) * progress
             
-            for i in range(shock_end_idx, recovery_end_idx):
-                if i == 0:
-                    continue
-                progress = (i - shock_end_idx + 1) / scenario.recovery_bars
-                target_price = df_shocked.loc[shock_end_idx - 1, 'close'] + (recovery_target - df_shocked.loc[shock_end_idx - 1, 'close']) * progress
-                
-                df_shocked.loc[i, 'close'] = target_price
-                df_shocked.loc[i, 'open'] = df_shocked.loc[i-1, 'close']
-                df_shocked.loc[i, 'high'] = df_shocked.loc[i, 'close'] * 1.01
-                df_shocked.loc[i, 'low'] = df_shocked.loc[i, 'close'] * 0.99
+        if first_idx < end_idx:
+            bars = slice(first_idx, end_idx)
+            df_shocked['close'] = close
+            for col, values in (
+                ('open', close[first_idx - 1:end_idx - 1]),
+                ('high', close[bars] * 1.01),
+                ('low', close[bars] * 0.99)
+            ):
+                column = df_shocked[col].to_numpy(dtype=np.float64).copy()
+                column[bars] = values
+                df_shocked[col] = column
         
         return df_shocked
     
+    def _backtest_config(self) -> BacktestConfig:
+        """Backtest configuration used for every stress test."""
+        return BacktestConfig(
+            initial_capital=self.capital,
+            risk_per_trade=0.02,
+            commission_pct=0.001
+        )
+    
+    def _failed_result(self, strategy_name: str, scenario: ShockScenario, error: str) -> StressTestResult:
+        """Result for a strategy that could not be evaluated."""
+        return StressTestResult(
+            scenario_name=scenario.name,
+            strategy_name=strategy_name,
+            survived=False,
+            final_capital=0.0,
+            max_drawdown=-1.0,
+            error=error
+        )
+    
+    def _result_from_metrics(
+        self,
+        strategy_name: str,
+        scenario: ShockScenario,
+        metrics: pd.Series
+    ) -> StressTestResult:
+        """Build a StressTestResult from one row of BacktestEngine.run_batch."""
+        max_drawdown = float(metrics['max_drawdown'])
+        total_return = float(metrics['total_return'])
+        avg_loss = float(metrics['avg_loss'])
+        
+        # Determine survival
+        loss_pct = abs(max_drawdown) if max_drawdown < 0 else 0.0
+        survived = loss_pct < self.ruin_threshold
+        
+        # Calculate recovery time
+        recovery_time = None
+        if not survived:
+            # Strategy was ruined, no recovery
+            recovery_time = None
+        elif max_drawdown < 0:
+            # Try to estimate recovery time (simplified)
+            recovery_time = int(abs(max_drawdown) * 100)  # Rough estimate
+        
+        return StressTestResult(
+            scenario_name=scenario.name,
+            strategy_name=strategy_name,
+            survived=survived,
+            final_capital=self.capital * (1 + total_return),
+            max_drawdown=max_drawdown,
+            recovery_time_bars=recovery_time,
+            total_trades_during_stress=int(metrics['total_trades']),
+            worst_trade_pct=avg_loss if avg_loss else 0.0
+        )
+    
+    def evaluate_shocked_data(
+        self,
+        df_shocked: pd.DataFrame,
+        strategies: List[str],
+        scenario: ShockScenario
+    ) -> List[StressTestResult]:
+        """Backtest several strategies on one shocked DataFrame.
+        
+        Signals are generated per strategy and all strategies are backtested
+        together with BacktestEngine.run_batch.
+        
+        Args:
+            df_shocked: DataFrame with the shock applied
+            strategies: Strategy names
+            scenario: Scenario the data was shocked with
+        
+        Returns:
+            One StressTestResult per strategy, in order
+        """
+        results: List[Optional[StressTestResult]] = [None] * len(strategies)
+        signals = []
+        evaluated = []
+        
+        # Strategies share indicators computed on the same shocked frame
+        with indicator_cache():
+            for k, strategy_name in enumerate(strategies):
+                try:
+                    signal_output = generate_signal(strategy_name, df_shocked)
+                    signals.append(signal_output.signal.to_numpy(dtype=np.float64))
+                    evaluated.append(k)
+                except Exception as e:
+                    logger.error(f"Error generating signals for {strategy_name}: {e}")
+                    results[k] = self._failed_result(strategy_name, scenario, str(e))
+        
+            if evaluated:
+                try:
+                    table = BacktestEngine(self._backtest_config()).run_batch(df_shocked, np.column_stack(signals))
+                    for row, k in enumerate(evaluated):
+                        results[k] = self._result_from_metrics(strategies[k], scenario, table.iloc[row])
+                except Exception as e:
+                    logger.error(f"Error running backtest: {e}")
+                    for k in evaluated:
+                        results[k] = self._failed_result(strategies[k], scenario, str(e))
+        
+        return results
+    
     def run_stress_test(
         self,
         df: pd.DataFrame,
@@ -271,68 +411,7 @@ class StressTestEngine:
         # Apply shock
         df_shocked = self.apply_shock_to_data(df, scenario, start_idx)
         
-        # Generate signals
-        try:
-            signal_output = generate_signal(strategy_name, df_shocked)
-        except Exception as e:
-            logger.error(f"Error generating signals for {strategy_name}: {e}")
-            return StressTestResult(
-                scenario_name=scenario.name,
-                strategy_name=strategy_name,
-                survived=False,
-                final_capital=0.0,
-                max_drawdown=-1.0
-            )
-        
-        # Run backtest
-        config = BacktestConfig(
-            initial_capital=self.capital,
-            risk_per_trade=0.02,
-            commission_pct=0.001
-        )
-        engine = BacktestEngine(config)
-        
-        try:
-            result = engine.run(
-                df=df_shocked,
-                signals=signal_output.signal,
-                strategy_name=strategy_name,
-                verbose=False
-            )
-            
-            # Determine survival
-            loss_pct = abs(result.max_drawdown) if result.max_drawdown < 0 else 0.0
-            survived = loss_pct < self.ruin_threshold
-            
-            # Calculate recovery time
-            recovery_time = None
-            if not survived:
-                # Strategy was ruined, no recovery
-                recovery_time = None
-            elif result.max_drawdown < 0:
-                # Try to estimate recovery time (simplified)
-                recovery_time = int(abs(result.max_drawdown) * 100)  # Rough estimate
-            
-            return StressTestResult(
-                scenario_name=scenario.name,
-                strategy_name=strategy_name,
-                survived=survived,
-                final_capital=self.capital * (1 + result.total_return),
-                max_drawdown=result.max_drawdown,
-                recovery_time_bars=recovery_time,
-                total_trades_during_stress=result.total_trades,
-                worst_trade_pct=result.avg_loss if result.avg_loss else 0.0
-            )
-            
-        except Exception as e:
-            logger.error(f"Error running backtest: {e}")
-            return StressTestResult(
-                scenario_name=scenario.name,
-                strategy_name=strategy_name,
-                survived=False,
-                final_capital=0.0,
-                max_drawdown=-1.0
-            )
+        return self.evaluate_shocked_data(df_shocked, [strategy_name], scenario)[0]
     
     def run_comprehensive_stress_test(
         self,
@@ -340,16 +419,22 @@ class StressTestEngine:
         strategies: List[str],
         scenarios: Optional[List[ShockScenario]] = None,
         symbol: str = "Unknown",
-        timeframe: str = "1h"
+        timeframe: str = "1h",
+        n_jobs: int = 1
     ) -> StressTestReport:
         """Run comprehensive stress test across multiple strategies and scenarios.
         
+        Each scenario's shocked data is built once and shared by all
+        strategies. With n_jobs != 1, scenarios are evaluated in a process
+        pool that reads the shocked frames from memory-mapped files.
+        
         Args:
             df: DataFrame with OHLCV data
             strategies: List of strategy names to test
             scenarios: Custom scenarios (defaults to standard scenarios)
             symbol: Trading symbol
             timeframe: Timeframe
+            n_jobs: Worker processes (-1 = all cores)
             
         Returns:
             StressTestReport with comprehensive results
@@ -359,6 +444,19 @@ class StressTestEngine:
         
         logger.info(f"Running comprehensive stress test: {len(strategies)} strategies × {len(scenarios)} scenarios")
         
+        # Shocked data, built once per scenario
+        start_idx = len(df) // 2
+        shocked_frames = [self.apply_shock_to_data(df, scenario, start_idx) for scenario in scenarios]
+        
+        n_workers = min(resolve_n_jobs(n_jobs), len(scenarios)) if scenarios else 1
+        if n_workers == 1:
+            scenario_results = [
+                self.evaluate_shocked_data(df_shocked, strategies, scenario)
+                for df_shocked, scenario in zip(shocked_frames, scenarios)
+            ]
+        else:
+            scenario_results = self._evaluate_parallel(shocked_frames, strategies, scenarios, n_workers)
+        
         results = []
         survival_count = 0
         total_tests = 0
@@ -366,9 +464,9 @@ class StressTestEngine:
         strategy_scores = {s: 0 for s in strategies}
         scenario_difficulty = {sc.name: 0 for sc in scenarios}
         
-        for strategy in strategies:
-            for scenario in scenarios:
-                result = self.run_stress_test(df, strategy, scenario)
+        for i, strategy in enumerate(strategies):
+            for scenario, by_strategy in zip(scenarios, scenario_results):
+                result = by_strategy[i]
                 results.append(result)
                 
                 total_tests += 1
@@ -411,6 +509,202 @@ class StressTestEngine:
         
         return report
     
+    def _evaluate_parallel(
+        self,
+        shocked_frames: List[pd.DataFrame],
+        strategies: List[str],
+        scenarios: List[ShockScenario],
+        n_workers: int
+    ) -> List[List[StressTestResult]]:
+        """Evaluate scenarios in a process pool, one task per scenario.
+        
+        Args:
+            shocked_frames: Shocked DataFrame per scenario
+            strategies: Strategy names
+            scenarios: Scenarios
+            n_workers: Worker processes
+        
+        Returns:
+            Per scenario, one StressTestResult per strategy
+        """
+        shared = [
+            SharedFrame(df_shocked, list(df_shocked.select_dtypes(include=['number', 'datetime']).columns))
+            for df_shocked in shocked_frames
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _evaluate_shared_scenario,
+                        frame.spec, self.capital, self.ruin_threshold, strategies, scenario
+                    )
+                    for frame, scenario in zip(shared, scenarios)
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for frame in shared:
+                frame.close()
+    
+    def sample_shock_placements(
+        self,
+        n_bars: int,
+        scenario: ShockScenario,
+        num_placements: int,
+        rng: np.random.Generator,
+        min_start_idx: Optional[int] = None
+    ) -> np.ndarray:
+        """Draw random shock start indices.
+        
+        Placements are drawn without replacement while there are enough
+        candidate bars, and always leave room for the whole shock phase.
+        
+        Args:
+            n_bars: Number of bars
+            scenario: Shock scenario
+            num_placements: Number of placements
+            rng: Random generator
+            min_start_idx: Earliest start (default: n_bars // 4, leaving
+                history for indicator warm-up)
+        
+        Returns:
+            Sorted array of start indices
+        """
+        if min_start_idx is None:
+            min_start_idx = n_bars // 4
+        
+        candidates = np.arange(max(min_start_idx, 1), n_bars - scenario.duration_bars + 1)
+        if len(candidates) == 0:
+            raise ValueError(f"No room for a {scenario.duration_bars}-bar shock in {n_bars} bars after bar {min_start_idx}")
+        
+        replace = num_placements > len(candidates)
+        return np.sort(rng.choice(candidates, size=num_placements, replace=replace))
+    
+    def _evaluate_placements(
+        self,
+        df: pd.DataFrame,
+        strategies: List[str],
+        scenario: ShockScenario,
+        start_indices: List[int],
+        seeds: List[np.random.SeedSequence]
+    ) -> List[List[StressTestResult]]:
+        """Shock the data at each start index and evaluate every strategy.
+        
+        Args:
+            df: Original DataFrame
+            strategies: Strategy names
+            scenario: Shock scenario
+            start_indices: Shock start indices
+            seeds: Volatility noise seed per placement
+        
+        Returns:
+            Per placement, one StressTestResult per strategy
+        """
+        return [
+            self.evaluate_shocked_data(
+                self.apply_shock_to_data(df, scenario, start_idx, np.random.default_rng(seed)),
+                strategies,
+                scenario
+            )
+            for start_idx, seed in zip(start_indices, seeds)
+        ]
+    
+    def run_placement_sweep(
+        self,
+        df: pd.DataFrame,
+        strategies: List[str],
+        scenario: ShockScenario,
+        num_placements: int = 200,
+        seed: Optional[int] = None,
+        min_start_idx: Optional[int] = None,
+        n_jobs: int = 1
+    ) -> List[PlacementSweepResult]:
+        """Evaluate a scenario at many random start offsets.
+        
+        Instead of a single shock in the middle of the data, the scenario is
+        applied at num_placements random start indices. Each placement
+        backtests all strategies in one batch (evaluate_shocked_data), and
+        the outcomes are summarized as survival probability and drawdown
+        distributions per strategy. Placements where a strategy could not be
+        evaluated are counted in PlacementSweepResult.failed and left out of
+        its statistics (NaN when no placement was evaluated).
+        
+        Placements and volatility noise are drawn from SeedSequence(seed),
+        one child per placement, so results do not depend on n_jobs.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            strategies: Strategy names
+            scenario: Shock scenario
+            num_placements: Number of shock placements
+            seed: Random seed
+            min_start_idx: Earliest shock start (default: len(df) // 4)
+            n_jobs: Worker processes (-1 = all cores)
+        
+        Returns:
+            One PlacementSweepResult per strategy
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        placement_seed, *shock_seeds = seed_sequence.spawn(num_placements + 1)
+        start_indices = self.sample_shock_placements(
+            len(df), scenario, num_placements, np.random.default_rng(placement_seed), min_start_idx
+        ).tolist()
+        
+        logger.info(f"Placement sweep: {scenario.name} × {num_placements} placements × {len(strategies)} strategies")
+        
+        n_workers = min(resolve_n_jobs(n_jobs), num_placements)
+        if n_workers == 1:
+            placements = self._evaluate_placements(df, strategies, scenario, start_indices, shock_seeds)
+        else:
+            # Several chunks per worker to balance load
+            chunk_size = max(1, -(-num_placements // (n_workers * 4)))
+            chunks = range(0, num_placements, chunk_size)
+            columns = list(df.select_dtypes(include=['number', 'datetime']).columns)
+            
+            with SharedFrame(df, columns) as shared:
+                with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _evaluate_shared_placements,
+                            shared.spec, self.capital, self.ruin_threshold, strategies, scenario,
+                            start_indices[i:i + chunk_size], shock_seeds[i:i + chunk_size]
+                        )
+                        for i in chunks
+                    ]
+                    placements = [result for future in futures for result in future.result()]
+        
+        sweeps = []
+        for k, strategy_name in enumerate(strategies):
+            # Failed evaluations carry placeholder values; keep them out of the statistics
+            evaluated = [
+                (start_idx, by_strategy[k]) for start_idx, by_strategy in zip(start_indices, placements)
+                if by_strategy[k].error is None
+            ]
+            failed = num_placements - len(evaluated)
+            if failed:
+                logger.warning(f"{strategy_name}: {failed}/{num_placements} placements could not be evaluated")
+            
+            max_drawdowns = np.array([r.max_drawdown for _, r in evaluated])
+            final_capitals = np.array([r.final_capital for _, r in evaluated])
+            has_results = len(evaluated) > 0
+            
+            sweeps.append(PlacementSweepResult(
+                scenario_name=scenario.name,
+                strategy_name=strategy_name,
+                num_placements=num_placements,
+                failed=failed,
+                survival_probability=float(np.mean([r.survived for _, r in evaluated])) if has_results else np.nan,
+                mean_max_drawdown=float(np.mean(max_drawdowns)) if has_results else np.nan,
+                median_max_drawdown=float(np.median(max_drawdowns)) if has_results else np.nan,
+                worst_max_drawdown=float(np.min(max_drawdowns)) if has_results else np.nan,
+                max_drawdown_5th_percentile=float(np.percentile(max_drawdowns, 5)) if has_results else np.nan,
+                mean_final_capital=float(np.mean(final_capitals)) if has_results else np.nan,
+                start_indices=[start_idx for start_idx, _ in evaluated],
+                max_drawdowns=max_drawdowns.tolist(),
+                final_capitals=final_capitals.tolist()
+            ))
+        
+        return sweeps
+    
     def get_survival_matrix(
         self,
         report: StressTestReport
@@ -487,3 +781,28 @@ class StressTestEngine:
         
         return "\n".join(lines)
 
+
+def _evaluate_shared_scenario(
+    frame_spec: Dict[str, Any],
+    capital: float,
+    ruin_threshold: float,
+    strategies: List[str],
+    scenario: ShockScenario
+) -> List[StressTestResult]:
+    """Worker entry point: attach to a shocked frame and evaluate all strategies."""
+    engine = StressTestEngine(capital=capital, ruin_threshold=ruin_threshold)
+    return engine.evaluate_shocked_data(attach_frame(frame_spec), strategies, scenario)
+
+
+def _evaluate_shared_placements(
+    frame_spec: Dict[str, Any],
+    capital: float,
+    ruin_threshold: float,
+    strategies: List[str],
+    scenario: ShockScenario,
+    start_indices: List[int],
+    seeds: List[np.random.SeedSequence]
+) -> List[List[StressTestResult]]:
+    """Worker entry point: attach to the original frame and evaluate a chunk of placements."""
+    engine = StressTestEngine(capital=capital, ruin_threshold=ruin_threshold)
+    return engine._evaluate_placements(attach_frame(frame_spec), strategies, scenario, start_indices, seeds)
@@ -17,6 +17,7 @@ import logging
 
 from app.research.signals import generate_signal, get_strategy_list
 from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.backtest.result_cache import get_backtest_cache
 from app.service.decision import DecisionEngine, DailyDecision
 from app.core.risk import calculate_position_size_fixed_risk
 
@@ -143,18 +144,22 @@ class MultiStrategyEngine:
             risk_per_trade=self.risk_per_strategy_pct,
             commission_pct=0.001
         ))
+        cache = get_backtest_cache()
         
         for strategy_name in self.strategy_weights.keys():
             try:
-                # Generate signals
-                signal_output = generate_signal(strategy_name, df)
-                
-                # Run backtest
-                result = backtest_engine.run(
-                    df=df,
-                    signals=signal_output.signal,
-                    strategy_name=strategy_name,
-                    verbose=False
+                # Generate signals and run backtest (reused while the bars are unchanged)
+                result = cache.get_or_run(
+                    strategy_name,
+                    None,
+                    backtest_engine.config,
+                    df,
+                    lambda: backtest_engine.run(
+                        df=df,
+                        signals=generate_signal(strategy_name, df).signal,
+                        strategy_name=strategy_name,
+                        verbose=False
+                    )
                 )
                 
                 # Update performance
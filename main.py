@@ -7,10 +7,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 from app.config.settings import settings
+from app.api.executor import get_compute_executor
+from app.core.job_queue import shutdown_job_queue
 from app.data import DataStore, DataFetcher, FetchRequest
+from app.data.frames import read_frame
 
 # Include new data API routes
 from app.api.routes.data import router as data_router
@@ -18,6 +22,8 @@ from app.api.routes.backtest import router as backtest_router
 from app.api.routes.recommendation import router as recommendation_router
 from app.api.routes.ranking_simple import router as ranking_router
 from app.api.routes.test_recommendation import router as test_router
+from app.api.routes.global_ranking import router as global_ranking_router
+from app.api.routes.jobs import router as jobs_router
 
 # Service
 from app.service import DecisionEngine, MarketAdvisor, PaperTradingDB
@@ -26,7 +32,6 @@ from app.service.tp_sl_engine import TPSLConfig
 # Research
 from app.research.signals import generate_signal, get_strategy_list
 from app.research.combine import combine_signals
-from app.research.backtest import BacktestEngine, BacktestConfig
 
 # Logging
 from app.utils.structured_logging import logger, event_logger
@@ -57,6 +62,8 @@ app.include_router(backtest_router)
 app.include_router(recommendation_router)
 app.include_router(ranking_router)
 app.include_router(test_router)
+app.include_router(global_ranking_router)
+app.include_router(jobs_router)
 
 
 # ============================================================
@@ -133,6 +140,12 @@ async def health_check():
     }
 
 
+@app.get("/health/compute")
+async def get_compute_stats():
+    """Get compute pool queue depths and per-endpoint request counters."""
+    return get_compute_executor().stats()
+
+
 @app.get("/symbols", response_model=SymbolsResponse)
 async def get_symbols():
     """Get available trading symbols from configuration."""
@@ -192,180 +205,196 @@ async def get_strategies():
         raise HTTPException(status_code=500, detail=f"Error fetching strategies: {str(e)}")
 
 
+def _load_frame(
+    symbol: str,
+    timeframe: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Read bars into a DataFrame (blocking, run in the I/O pool)."""
+    return read_frame(DataStore(), symbol, timeframe, since=since, until=until)
+
+
+def _compute_signal(request: SignalRequest) -> SignalResponse:
+    """Load data and generate the current signal (blocking)."""
+    df = _load_frame(request.symbol, request.timeframe)
+    
+    if len(df) < 50:
+        raise HTTPException(status_code=400, detail="Insufficient data for signal generation")
+    
+    # Generate signal
+    signal_output = generate_signal(request.strategy, df, request.params)
+    
+    # Get current values
+    current_signal = int(signal_output.signal.iloc[-1])
+    current_strength = float(signal_output.strength.iloc[-1]) if signal_output.strength is not None else 0.0
+    current_price = float(df['close'].iloc[-1])
+    
+    return SignalResponse(
+        symbol=request.symbol,
+        timeframe=request.timeframe,
+        signal=current_signal,
+        strength=current_strength,
+        strategy=request.strategy,
+        timestamp=datetime.now(),
+        market_price=current_price
+    )
+
+
 @app.post("/signal", response_model=SignalResponse)
 async def generate_trading_signal(request: SignalRequest):
     """Generate trading signal for a symbol using specified strategy."""
     try:
-        # Load data
-        store = DataStore()
-        bars = store.read_bars(request.symbol, request.timeframe)
-        
-        if len(bars) < 50:
-            raise HTTPException(status_code=400, detail="Insufficient data for signal generation")
-        
-        # Convert to DataFrame
-        df = pd.DataFrame([bar.to_dict() for bar in bars])
-        df = df.sort_values('timestamp').reset_index(drop=True)
+        return await get_compute_executor().run_io("signal", _compute_signal, request)
         
-        # Generate signal
-        signal_output = generate_signal(request.strategy, df, request.params)
-        
-        # Get current values
-        current_signal = int(signal_output.signal.iloc[-1])
-        current_strength = float(signal_output.strength.iloc[-1]) if signal_output.strength is not None else 0.0
-        current_price = float(df['close'].iloc[-1])
-        
-        return SignalResponse(
-            symbol=request.symbol,
-            timeframe=request.timeframe,
-            signal=current_signal,
-            strength=current_strength,
-            strategy=request.strategy,
-            timestamp=datetime.now(),
-            market_price=current_price
-        )
-    
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating signal: {str(e)}")
 
 
+def _compute_decision(request: DecisionRequest) -> Dict[str, Any]:
+    """Combine strategy signals and make the daily decision (blocking)."""
+    df = _load_frame(request.symbol, request.timeframe)
+    
+    if len(df) < 100:
+        raise HTTPException(status_code=400, detail="Insufficient data")
+    
+    # Generate signals from strategies
+    if request.strategies:
+        strategy_signals = {}
+        for strat in request.strategies:
+            sig = generate_signal(strat, df)
+            strategy_signals[strat] = sig.signal
+    else:
+        # Use default strategies
+        from app.research.signals import ma_crossover, rsi_regime_pullback
+        sig1 = ma_crossover(df['close'])
+        sig2 = rsi_regime_pullback(df['close'])
+        strategy_signals = {'ma_cross': sig1.signal, 'rsi_regime': sig2.signal}
+    
+    # Combine signals
+    returns = df['close'].pct_change()
+    combined = combine_signals(
+        strategy_signals,
+        method=request.combination_method,
+        returns=returns if request.combination_method == "sharpe_weighted" else None
+    )
+    
+    # Get advisor recommendation
+    advisor = MarketAdvisor(default_risk_pct=settings.DEFAULT_RISK_PCT)
+    advice = advisor.get_advice(
+        df_intraday=df,
+        current_signal=int(combined.signal.iloc[-1]),
+        signal_strength=float(combined.confidence.iloc[-1]),
+        symbol=request.symbol
+    )
+    
+    # Make decision
+    engine = DecisionEngine()
+    decision = engine.make_decision(
+        df,
+        combined.signal,
+        signal_strength=combined.confidence,
+        signal_source="combined",
+        capital=request.capital,
+        risk_pct=advice.recommended_risk_pct
+    )
+    
+    return {
+        "decision": {
+            "signal": decision.signal,
+            "should_execute": decision.should_execute,
+            "entry_price": decision.entry_price,
+            "stop_loss": decision.stop_loss,
+            "take_profit": decision.take_profit,
+            "position_size": decision.position_size.quantity if decision.position_size else 0,
+            "risk_amount": decision.position_size.risk_amount if decision.position_size else 0,
+            "skip_reason": decision.skip_reason,
+            "window": decision.window
+        },
+        "advice": {
+            "consensus": advice.consensus_direction,
+            "confidence": advice.confidence_score,
+            "recommended_risk": advice.recommended_risk_pct,
+            "short_term": advice.short_term.model_dump(),
+            "medium_term": advice.medium_term.model_dump(),
+            "long_term": advice.long_term.model_dump()
+        }
+    }
+
+
 @app.post("/decision")
 async def make_daily_decision(request: DecisionRequest):
     """Make daily trading decision with multi-horizon analysis."""
     try:
-        # Load data
-        store = DataStore()
-        bars = store.read_bars(request.symbol, request.timeframe)
-        
-        if len(bars) < 100:
-            raise HTTPException(status_code=400, detail="Insufficient data")
+        return await get_compute_executor().run_io("decision", _compute_decision, request)
         
-        df = pd.DataFrame([bar.to_dict() for bar in bars])
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        # Generate signals from strategies
-        if request.strategies:
-            strategy_signals = {}
-            for strat in request.strategies:
-                sig = generate_signal(strat, df)
-                strategy_signals[strat] = sig.signal
-        else:
-            # Use default strategies
-            from app.research.signals import ma_crossover, rsi_regime_pullback
-            sig1 = ma_crossover(df['close'])
-            sig2 = rsi_regime_pullback(df['close'])
-            strategy_signals = {'ma_cross': sig1.signal, 'rsi_regime': sig2.signal}
-        
-        # Combine signals
-        returns = df['close'].pct_change()
-        combined = combine_signals(
-            strategy_signals,
-            method=request.combination_method,
-            returns=returns if request.combination_method == "sharpe_weighted" else None
-        )
-        
-        # Get advisor recommendation
-        advisor = MarketAdvisor(default_risk_pct=settings.DEFAULT_RISK_PCT)
-        advice = advisor.get_advice(
-            df_intraday=df,
-            current_signal=int(combined.signal.iloc[-1]),
-            signal_strength=float(combined.confidence.iloc[-1]),
-            symbol=request.symbol
-        )
-        
-        # Make decision
-        engine = DecisionEngine()
-        decision = engine.make_decision(
-            df,
-            combined.signal,
-            signal_strength=combined.confidence,
-            signal_source="combined",
-            capital=request.capital,
-            risk_pct=advice.recommended_risk_pct
-        )
-        
-        return {
-            "decision": {
-                "signal": decision.signal,
-                "should_execute": decision.should_execute,
-                "entry_price": decision.entry_price,
-                "stop_loss": decision.stop_loss,
-                "take_profit": decision.take_profit,
-                "position_size": decision.position_size.quantity if decision.position_size else 0,
-                "risk_amount": decision.position_size.risk_amount if decision.position_size else 0,
-                "skip_reason": decision.skip_reason,
-                "window": decision.window
-            },
-            "advice": {
-                "consensus": advice.consensus_direction,
-                "confidence": advice.confidence_score,
-                "recommended_risk": advice.recommended_risk_pct,
-                "short_term": advice.short_term.model_dump(),
-                "medium_term": advice.medium_term.model_dump(),
-                "long_term": advice.long_term.model_dump()
-            }
-        }
-    
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error making decision: {str(e)}")
 
 
+def _vectorized_backtest(
+    df: pd.DataFrame,
+    strategy: str,
+    params: Optional[Dict[str, Any]],
+    initial_capital: float
+) -> Dict[str, Any]:
+    """Simplified vectorized backtest (runs in the compute process pool)."""
+    # Generate signals
+    signal_output = generate_signal(strategy, df, params)
+    
+    # Simplified backtest (vectorbt optional)
+    returns = df['close'].pct_change()
+    strategy_returns = signal_output.signal.shift(1) * returns
+    
+    total_return = (1 + strategy_returns).prod() - 1
+    sharpe = (strategy_returns.mean() / strategy_returns.std() * np.sqrt(252)) if strategy_returns.std() > 0 else 0
+    
+    equity = initial_capital * (1 + strategy_returns).cumprod()
+    running_max = equity.expanding().max()
+    drawdown = (equity - running_max) / running_max
+    max_dd = abs(drawdown.min())
+    
+    num_trades = (signal_output.signal != signal_output.signal.shift(1)).sum()
+    
+    return {
+        "total_return": float(total_return),
+        "sharpe_ratio": float(sharpe),
+        "max_drawdown": float(max_dd),
+        "total_trades": int(num_trades),
+        "final_capital": float(equity.iloc[-1]),
+        "strategy": strategy,
+        "period": {
+            "start": df['timestamp'].iloc[0],
+            "end": df['timestamp'].iloc[-1]
+        }
+    }
+
+
 @app.post("/backtest")
 async def run_backtest(request: BacktestRequest):
     """Run backtest on a strategy."""
     try:
-        # Load data
-        store = DataStore()
-        bars = store.read_bars(request.symbol, request.timeframe)
-        
-        if len(bars) < 100:
-            raise HTTPException(status_code=400, detail="Insufficient data for backtest")
-        
-        df = pd.DataFrame([bar.to_dict() for bar in bars])
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        # Filter by date if provided
-        if request.start_date:
-            start_ts = int(datetime.fromisoformat(request.start_date).timestamp() * 1000)
-            df = df[df['timestamp'] >= start_ts]
-        if request.end_date:
-            end_ts = int(datetime.fromisoformat(request.end_date).timestamp() * 1000)
-            df = df[df['timestamp'] <= end_ts]
-        
-        # Generate signals
-        signal_output = generate_signal(request.strategy, df, request.params)
+        executor = get_compute_executor()
         
-        # Run backtest
-        config = BacktestConfig(initial_capital=request.initial_capital)
-        engine = BacktestEngine(config)
+        # Date filters are pushed down to the Parquet reader
+        since = datetime.fromisoformat(request.start_date) if request.start_date else None
+        until = datetime.fromisoformat(request.end_date) if request.end_date else None
+        df = await executor.run_io("backtest", _load_frame, request.symbol, request.timeframe, since, until)
         
-        # Simplified backtest (vectorbt optional)
-        returns = df['close'].pct_change()
-        strategy_returns = signal_output.signal.shift(1) * returns
-        
-        total_return = (1 + strategy_returns).prod() - 1
-        sharpe = (strategy_returns.mean() / strategy_returns.std() * np.sqrt(252)) if strategy_returns.std() > 0 else 0
-        
-        equity = request.initial_capital * (1 + strategy_returns).cumprod()
-        running_max = equity.expanding().max()
-        drawdown = (equity - running_max) / running_max
-        max_dd = abs(drawdown.min())
+        if len(df) < 100:
+            raise HTTPException(status_code=400, detail="Insufficient data for backtest")
         
-        num_trades = (signal_output.signal != signal_output.signal.shift(1)).sum()
+        # Signals and returns are computed in the process pool
+        return await executor.run_cpu(
+            "backtest", _vectorized_backtest, df, request.strategy, request.params, request.initial_capital
+        )
         
-        return {
-            "total_return": float(total_return),
-            "sharpe_ratio": float(sharpe),
-            "max_drawdown": float(max_dd),
-            "total_trades": int(num_trades),
-            "final_capital": float(equity.iloc[-1]),
-            "strategy": request.strategy,
-            "period": {
-                "start": df['timestamp'].iloc[0],
-                "end": df['timestamp'].iloc[-1]
-            }
-        }
-    
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running backtest: {str(e)}")
 
@@ -449,7 +478,9 @@ async def get_best_strategy(
         from app.service.strategy_ranking import StrategyRankingService
         
         service = StrategyRankingService(capital=capital, max_risk_pct=0.02, lookback_days=90)
-        recommendation = service.get_daily_recommendation(
+        recommendation = await get_compute_executor().run_io(
+            "strategy_ranking",
+            service.get_daily_recommendation,
             symbol=symbol,
             timeframe=timeframe,
             capital=capital,
@@ -461,6 +492,8 @@ async def get_best_strategy(
         
         return recommendation.model_dump()
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("api", f"Error getting best strategy: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -477,7 +510,9 @@ async def compare_strategies(
         from app.service.strategy_ranking import StrategyRankingService
         
         service = StrategyRankingService(capital=capital)
-        comparison_df = service.compare_strategies(symbol, timeframe)
+        comparison_df = await get_compute_executor().run_io(
+            "strategy_ranking", service.compare_strategies, symbol, timeframe
+        )
         
         if comparison_df.empty:
             return {"strategies": [], "count": 0}
@@ -910,6 +945,9 @@ async def shutdown_event():
         loop = asyncio.get_event_loop()
         loop.create_task(stop_scheduler())
 
+    get_compute_executor().shutdown()
+    shutdown_job_queue()
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,78 @@
+"""Benchmark indicator and feature calculations on long series.
+
+Times each indicator on random-walk OHLC data at increasing lengths
+(default up to 1M bars) to check that runtime scales linearly.
+
+Usage:
+    python scripts/benchmark_indicators.py
+    python scripts/benchmark_indicators.py --sizes 10000 100000 --repeat 5
+"""
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.research import indicators, features
+
+
+BENCHMARKS = {
+    "ema": lambda h, l, c: indicators.ema(c, 20),
+    "rsi": lambda h, l, c: indicators.rsi(c, 14),
+    "atr": lambda h, l, c: indicators.atr(h, l, c, 14),
+    "adx": lambda h, l, c: indicators.adx(h, l, c, 14),
+    "supertrend": lambda h, l, c: indicators.supertrend(h, l, c, 10, 3.0),
+    "keltner_channels": lambda h, l, c: indicators.keltner_channels(h, l, c, 20, 2.0),
+    "consecutive_closes": lambda h, l, c: features.consecutive_closes(c),
+}
+
+
+def make_ohlc(n_bars: int, seed: int = 0):
+    """Generate random-walk (high, low, close) series."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    spread = rng.uniform(0, 0.002, n_bars)
+    return pd.Series(close * (1 + spread)), pd.Series(close * (1 - spread)), pd.Series(close)
+
+
+def time_call(func, args, repeat: int) -> float:
+    """Best wall time of repeat calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indicator scaling")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    print(f"numba available: {indicators.NUMBA_AVAILABLE}")
+    
+    # Warm up (numba compilation, pandas caches)
+    warmup = make_ohlc(1_000)
+    for func in BENCHMARKS.values():
+        func(*warmup)
+    
+    header = f"{'indicator':<20}" + "".join(f"{n:>14,}" for n in args.sizes) + f"{'ns/bar':>10}"
+    print(header)
+    print("-" * len(header))
+    
+    data = {n: make_ohlc(n) for n in args.sizes}
+    for name, func in BENCHMARKS.items():
+        timings = [time_call(func, data[n], args.repeat) for n in args.sizes]
+        ns_per_bar = timings[-1] / args.sizes[-1] * 1e9
+        print(f"{name:<20}" + "".join(f"{t * 1000:>12.1f}ms" for t in timings) + f"{ns_per_bar:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ import logging
 from app.data.fetch import DataFetcher
 from app.data.store import DataStore
 from app.data.last_update import record_data_update
+from app.data.frame_cache import invalidate_frames
 from app.config.settings import settings
 import sqlite3
 
@@ -120,6 +121,7 @@ def sync_data(
             if not dry_run:
                 # Store data
                 store.write_bars(bars)
+                invalidate_frames(symbol, timeframe)
                 logger.info(f"Stored {len(bars)} bars")
                 result['bars_stored'] = len(bars)
             
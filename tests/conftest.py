@@ -0,0 +1,29 @@
+"""Shared fixtures for the test suite."""
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timezone
+
+from app.research.optimization.storage import OptimizationStorage
+
+
+@pytest.fixture
+def bars():
+    """Random walk over ~10 days of hourly bars."""
+    rng = np.random.default_rng(21)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, 240)))
+    start = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    return pd.DataFrame({
+        'timestamp': start + np.arange(len(close)) * 60 * 60 * 1000,
+        'open': close,
+        'high': close * 1.002,
+        'low': close * 0.998,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Optimization storage in a temporary directory."""
+    return OptimizationStorage(str(tmp_path / "optimization"))
@@ -0,0 +1,107 @@
+"""Tests for api.executor module."""
+import asyncio
+import threading
+import time
+import pytest
+from fastapi import HTTPException
+from app.api.executor import ComputeExecutor
+
+
+def _square(x: int) -> int:
+    """Module-level function for the process pool."""
+    return x * x
+
+
+def _fail():
+    """Raise inside a worker."""
+    raise ValueError("boom")
+
+
+@pytest.fixture
+def executor():
+    """Small executor shut down after each test."""
+    executor = ComputeExecutor(io_workers=4, cpu_workers=1, max_queue=2, timeout=5.0, endpoint_limits={"slow": 1})
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestComputeExecutor:
+    """Tests for ComputeExecutor."""
+    
+    def test_endpoint_limit_respected(self, executor):
+        """Test that no more than the endpoint limit run at once."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+        
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+        
+        async def main():
+            await asyncio.gather(*(executor.run_io("slow", work) for _ in range(3)))
+        
+        asyncio.run(main())
+        
+        assert max(peak) == 1
+        assert executor.stats()['endpoints']['slow']['completed'] == 3
+    
+    def test_full_queue_rejected(self, executor):
+        """Test that calls beyond the queue bound fail with 503."""
+        async def main():
+            return await asyncio.gather(*(executor.run_io("slow", time.sleep, 0.05) for _ in range(4)), return_exceptions=True)
+        
+        results = asyncio.run(main())
+        
+        rejected = [r for r in results if isinstance(r, HTTPException)]
+        assert [r.status_code for r in rejected] == [503]
+        assert executor.stats()['endpoints']['slow']['rejected'] == 1
+    
+    def test_timeout_keeps_slot_until_done(self, executor):
+        """Test that a timed-out call fails with 504 but holds its slot until it finishes."""
+        async def main():
+            with pytest.raises(HTTPException) as exc_info:
+                await executor.run_io("slow", time.sleep, 0.3, timeout=0.05)
+            assert exc_info.value.status_code == 504
+            assert executor.stats()['endpoints']['slow']['active'] == 1
+            
+            started = time.perf_counter()
+            await executor.run_io("slow", time.sleep, 0)
+            return time.perf_counter() - started
+        
+        waited = asyncio.run(main())
+        
+        stats = executor.stats()['endpoints']['slow']
+        assert waited > 0.15
+        assert stats['timeouts'] == 1
+        assert stats['active'] == 0
+    
+    def test_errors_propagate_and_count(self, executor):
+        """Test that worker errors reach the caller and are counted as failed."""
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run_io("other", _fail))
+        
+        stats = executor.stats()
+        assert stats['endpoints']['other']['failed'] == 1
+        assert stats['endpoints']['other']['limit'] == 4
+        assert stats['io']['pending'] == 0
+    
+    def test_run_cpu_in_process_pool(self, executor):
+        """Test that module-level functions run in the process pool."""
+        async def main():
+            return await asyncio.gather(*(executor.run_cpu("cpu", _square, x) for x in range(4)))
+        
+        assert asyncio.run(main()) == [0, 1, 4, 9]
+        assert executor.stats()['cpu']['pending'] == 0
+    
+    def test_process_pool_shared(self, executor):
+        """Test that process_pool() returns the long-lived pool run_cpu() uses."""
+        pool = executor.process_pool()
+        
+        assert pool.submit(_square, 3).result() == 9
+        assert asyncio.run(executor.run_cpu("cpu", _square, 2)) == 4
+        assert executor.process_pool() is pool
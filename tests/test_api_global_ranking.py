@@ -0,0 +1,68 @@
+"""Tests for the global ranking API endpoints."""
+import time
+from datetime import datetime
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import global_ranking, jobs
+from app.core.job_queue import JobQueue
+from app.service.global_ranking import GlobalRankingResult
+
+
+class _StubRankingService:
+    """Ranking service returning a fixed result."""
+    
+    def run_global_ranking(self, symbol, date=None, executor=None, progress=None):
+        if progress is not None:
+            progress(1.0, "Backtested MA Crossover on 1h (1/1)")
+        return GlobalRankingResult(
+            timestamp=datetime(2024, 1, 1),
+            symbol=symbol,
+            total_strategies=3,
+            valid_strategies=2,
+            rankings=[{'strategy_name': 'MA Crossover', 'score': 0.8}],
+            consolidated_metrics={'best_strategy': 'MA Crossover', 'best_score': 0.8},
+            execution_time=1.5
+        )
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client for an app with the global ranking and jobs routers on a temporary queue."""
+    queue = JobQueue(tmp_path / "jobs.db", workers=1)
+    monkeypatch.setattr(global_ranking, "get_job_queue", lambda: queue)
+    monkeypatch.setattr(jobs, "get_job_queue", lambda: queue)
+    monkeypatch.setattr(global_ranking, "get_ranking_service", lambda: _StubRankingService())
+    
+    app = FastAPI()
+    app.include_router(global_ranking.router)
+    app.include_router(jobs.router)
+    yield TestClient(app)
+    queue.shutdown(wait=True)
+
+
+class TestGlobalRankingJobs:
+    """Tests for POST /global-ranking/jobs."""
+    
+    def test_job_result_matches_run(self, client):
+        """Test that a queued ranking finishes with the same response as /run."""
+        response = client.post("/global-ranking/jobs", json={'symbol': 'BTC/USDT', 'date': '2024-01-01'})
+        
+        assert response.status_code == 202
+        job_id = response.json()['job_id']
+        
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            job = client.get(f"/jobs/{job_id}").json()
+            if job['status'] in ('succeeded', 'failed', 'cancelled'):
+                break
+            time.sleep(0.02)
+        
+        assert job['status'] == 'succeeded'
+        assert job['result']['best_strategy'] == 'MA Crossover'
+        assert job['result']['valid_strategies'] == 2
+        
+        run = client.post("/global-ranking/run", json={'symbol': 'BTC/USDT', 'date': '2024-01-01'})
+        assert run.status_code == 200
+        assert run.json() == job['result']
@@ -0,0 +1,146 @@
+"""Tests for research.backtest.monte_carlo module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research.backtest.monte_carlo import (
+    _simulate_paths, block_permutation_indices, bootstrap_indices,
+    stationary_bootstrap_indices, simulate_block_bootstrap,
+    calculate_risk_of_ruin, run_monte_carlo
+)
+
+
+@pytest.fixture
+def returns():
+    """Daily returns with a couple of gaps."""
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.normal(0.0005, 0.01, 500))
+    values.iloc[[0, 251]] = np.nan
+    return values
+
+
+def _reference_metrics(path: pd.Series, initial_capital: float):
+    """Per-path metrics computed with pandas."""
+    total_return = (1 + path).prod() - 1
+    sharpe = path.mean() / path.std() * np.sqrt(252) if path.std() > 0 else 0
+    equity = (1 + path).cumprod() * initial_capital
+    running_max = equity.expanding().max()
+    max_dd = abs(((equity - running_max) / running_max).min())
+    return total_return, sharpe, max_dd
+
+
+class TestMonteCarloSimulation:
+    """Tests for the batched simulation kernel."""
+    
+    def test_matches_per_path_reference(self, returns):
+        """Test that matrix metrics equal per-path pandas metrics."""
+        values = returns.to_numpy()
+        index = bootstrap_indices(len(values), 5, 50, np.random.default_rng(1))
+        
+        metrics = _simulate_paths(values, index, 100000.0)
+        
+        for i, row in enumerate(index):
+            expected = _reference_metrics(pd.Series(values[row]), 100000.0)
+            assert metrics['total_return'][i] == pytest.approx(expected[0], rel=1e-9)
+            assert metrics['sharpe'][i] == pytest.approx(expected[1], rel=1e-9)
+            assert metrics['max_dd'][i] == pytest.approx(expected[2], rel=1e-9)
+    
+    def test_orderings_are_permutations(self):
+        """Test that every simulation uses each block exactly once."""
+        order = block_permutation_indices(20, 100, np.random.default_rng(0))
+        
+        assert order.shape == (100, 20)
+        assert (np.sort(order, axis=1) == np.arange(20)).all()
+    
+    def test_results_independent_of_threads(self, returns):
+        """Test that the thread count does not change seeded results."""
+        serial = simulate_block_bootstrap(returns, num_simulations=1000, seed=7, chunk_size=100)
+        threaded = simulate_block_bootstrap(returns, num_simulations=1000, seed=7, chunk_size=100, n_jobs=4)
+        
+        for key in serial:
+            np.testing.assert_array_equal(serial[key], threaded[key])
+    
+    def test_short_series_raises(self):
+        """Test that fewer returns than one block raises."""
+        with pytest.raises(ValueError):
+            simulate_block_bootstrap(pd.Series([0.01, 0.02]), block_size=5)
+
+
+class TestBlockBootstrap:
+    """Tests for circular and stationary bootstrap resampling."""
+    
+    def test_circular_blocks_wrap_around(self):
+        """Test that circular blocks are contiguous modulo the series length."""
+        index = bootstrap_indices(10, 4, 200, np.random.default_rng(0), method="circular")
+        
+        assert index.shape == (200, 10)
+        blocks = index[:, :8].reshape(200, 2, 4)
+        assert ((np.diff(blocks, axis=2) % 10) == 1).all()
+    
+    def test_stationary_mean_block_length(self):
+        """Test that stationary blocks have geometric lengths with the requested mean."""
+        index = stationary_bootstrap_indices(1000, 10, 200, np.random.default_rng(0))
+        
+        continues = (np.diff(index, axis=1) % 1000) == 1
+        mean_length = index.size / (index.shape[0] + (~continues).sum())
+        
+        assert index.shape == (200, 1000)
+        assert index.min() >= 0 and index.max() < 1000
+        assert mean_length == pytest.approx(10, rel=0.05)
+    
+    @pytest.mark.parametrize("method", ["circular", "stationary"])
+    def test_seeded_runs_are_reproducible(self, returns, method):
+        """Test that bootstrap runs depend only on the seed and chunking."""
+        serial = simulate_block_bootstrap(returns, num_simulations=400, method=method, seed=11, chunk_size=64)
+        threaded = simulate_block_bootstrap(returns, num_simulations=400, method=method, seed=11, chunk_size=64, n_jobs=3)
+        
+        np.testing.assert_array_equal(serial['total_return'], threaded['total_return'])
+        assert not np.array_equal(serial['total_return'], simulate_block_bootstrap(returns, num_simulations=400, method=method, seed=12, chunk_size=64)['total_return'])
+    
+    def test_spawned_seeds_split_across_workers(self, returns):
+        """Test that runs seeded from spawned children are reproducible from the parent."""
+        first = [simulate_block_bootstrap(returns, num_simulations=50, method="stationary", seed=child)['sharpe'] for child in np.random.SeedSequence(5).spawn(3)]
+        second = [simulate_block_bootstrap(returns, num_simulations=50, method="stationary", seed=child)['sharpe'] for child in np.random.SeedSequence(5).spawn(3)]
+        
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+    
+    def test_unknown_method_raises(self, returns):
+        """Test that an unknown method raises."""
+        with pytest.raises(ValueError):
+            simulate_block_bootstrap(returns, method="iid")
+
+
+class TestMonteCarloSummary:
+    """Tests for risk of ruin and the full run."""
+    
+    def test_risk_of_ruin_list_and_matrix(self):
+        """Test that series lists and matrices give the same probability."""
+        curves = np.array([
+            [100.0, 120.0, 50.0, 60.0],
+            [100.0, 90.0, 95.0, 110.0],
+            [100.0, np.nan, 40.0, 45.0],
+            [100.0, 101.0, 102.0, 103.0]
+        ])
+        
+        assert calculate_risk_of_ruin(curves, 0.5) == 0.5
+        assert calculate_risk_of_ruin([pd.Series(c) for c in curves], 0.5) == 0.5
+        assert calculate_risk_of_ruin([pd.Series(curves[0]), pd.Series(curves[1][:2])], 0.5) == 0.5
+    
+    def test_run_is_reproducible(self, returns):
+        """Test that a seeded run is reproducible and internally consistent."""
+        first = run_monte_carlo(returns, num_simulations=500, seed=3, verbose=False)
+        second = run_monte_carlo(returns, num_simulations=500, seed=3, verbose=False)
+        
+        assert first.all_returns == second.all_returns
+        assert len(first.all_returns) == 500
+        assert first.probability_of_profit == np.mean(np.array(first.all_returns) > 0)
+        assert first.worst_dd == max(first.all_max_dds)
+    
+    def test_unseeded_run_records_entropy(self, returns):
+        """Test that an unseeded run can be replayed from the recorded seed."""
+        first = run_monte_carlo(returns, num_simulations=100, method="circular", verbose=False)
+        replay = run_monte_carlo(returns, num_simulations=100, method="circular", seed=first.seed, verbose=False)
+        
+        assert first.method == "circular"
+        assert first.seed is not None
+        assert replay.all_returns == first.all_returns
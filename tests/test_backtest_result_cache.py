@@ -0,0 +1,112 @@
+"""Tests for research.backtest.result_cache module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research.backtest.engine import BacktestEngine, BacktestConfig
+from app.research.backtest.result_cache import BacktestResultCache, make_key
+from app.research.signals import ma_crossover
+
+
+@pytest.fixture
+def bars():
+    """Random-walk hourly bars."""
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+    return pd.DataFrame({
+        'timestamp': 1704067200000 + np.arange(500) * 3600000,
+        'open': close,
+        'high': close * 1.005,
+        'low': close * 0.995,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+@pytest.fixture
+def config():
+    """Config without trading windows."""
+    return BacktestConfig(initial_capital=10000.0, use_trading_windows=False)
+
+
+def _runner(bars, config, calls):
+    """Backtest MA crossover, counting runs."""
+    def run():
+        calls.append(1)
+        return BacktestEngine(config).run(bars, ma_crossover(bars['close']).signal, "MA Crossover", verbose=False)
+    return run
+
+
+class TestBacktestResultCache:
+    """Tests for BacktestResultCache."""
+    
+    def test_hit_returns_same_result_without_running(self, tmp_path, bars, config):
+        """Test that a repeated backtest is served from memory."""
+        cache = BacktestResultCache(tmp_path)
+        calls = []
+        
+        first = cache.get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        second = cache.get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        
+        assert len(calls) == 1
+        assert second.model_dump() == first.model_dump()
+        assert second is not first
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['stores']) == (1, 1, 1)
+        assert stats['hit_rate'] == 0.5
+    
+    def test_disk_shared_across_instances(self, tmp_path, bars, config):
+        """Test that another cache on the same directory reads the stored result."""
+        calls = []
+        BacktestResultCache(tmp_path).get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        
+        other = BacktestResultCache(tmp_path)
+        other.get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        
+        assert len(calls) == 1
+        assert other.stats()['disk_hits'] == 1
+        assert other.stats()['entries'] == 1
+    
+    def test_key_changes_with_inputs(self, bars, config):
+        """Test that strategy, params, config and every bar value are part of the key."""
+        key = make_key("MA Crossover", {'fast_period': 10, 'slow_period': 20}, config, bars)
+        
+        changed_bar = bars.copy()
+        changed_bar.loc[250, 'close'] *= 1.0001
+        
+        assert make_key("MA Crossover", {'slow_period': 20, 'fast_period': 10}, config, bars) == key
+        assert make_key("RSI Regime Pullback", {'fast_period': 10, 'slow_period': 20}, config, bars) != key
+        assert make_key("MA Crossover", {'fast_period': 12, 'slow_period': 20}, config, bars) != key
+        assert make_key("MA Crossover", {'fast_period': 10, 'slow_period': 20}, config.model_copy(update={'commission': 0.002}), bars) != key
+        assert make_key("MA Crossover", {'fast_period': 10, 'slow_period': 20}, config, changed_bar) != key
+        assert make_key("MA Crossover", {'fast_period': 10, 'slow_period': 20}, config, bars.iloc[:-1]) != key
+    
+    def test_memory_and_disk_budgets(self, tmp_path, bars, config):
+        """Test that least recently used results are evicted from memory and disk."""
+        result = _runner(bars, config, [])()
+        size = len(result.model_dump_json().encode('utf-8'))
+        cache = BacktestResultCache(tmp_path, max_bytes=2 * size, max_disk_bytes=2 * size)
+        
+        for key in ("aa1", "bb2", "cc3"):
+            cache.put(key, result)
+        
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['disk_evictions'] == 1
+        assert stats['disk_bytes'] <= 2 * size
+        assert sorted(path.stem for path in tmp_path.glob("*/*.json")) == ["bb2", "cc3"]
+        assert cache.get("aa1") is None
+    
+    def test_disabled_and_none_results_not_cached(self, tmp_path, bars, config):
+        """Test that a disabled cache always runs and None results are not stored."""
+        calls = []
+        disabled = BacktestResultCache(tmp_path, enabled=False)
+        disabled.get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        disabled.get_or_run("MA Crossover", {}, config, bars, _runner(bars, config, calls))
+        
+        cache = BacktestResultCache(tmp_path)
+        assert cache.get_or_run("none", {}, config, bars, lambda: None) is None
+        
+        assert len(calls) == 2
+        assert cache.stats()['stores'] == 0
+        assert list(tmp_path.glob("*/*.json")) == []
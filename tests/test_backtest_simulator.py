@@ -0,0 +1,203 @@
+"""Tests for the native array backtest engine.
+
+This module tests simulate_signals and the BacktestEngine fallback path:
+- Long/short entries and reversals
+- TP/SL fills (including gaps)
+- Forced close
+- Commission, slippage and position sizing
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from app.research.backtest import simulator
+from app.research.backtest.simulator import simulate_signals, TRADE_FIELD_INDEX, EXIT_REASONS
+from app.research.backtest.engine import BacktestEngine, BacktestConfig
+
+
+HOUR_MS = 60 * 60 * 1000
+
+
+def _bars(close, high=None, low=None, open_=None) -> pd.DataFrame:
+    """Build hourly bars from price lists."""
+    close = np.asarray(close, dtype=float)
+    start = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    return pd.DataFrame({
+        'timestamp': start + np.arange(len(close)) * HOUR_MS,
+        'open': open_ if open_ is not None else close,
+        'high': high if high is not None else close,
+        'low': low if low is not None else close,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+def _field(records, name):
+    return records[:, TRADE_FIELD_INDEX[name]]
+
+
+class TestSimulateSignals:
+    """Tests for simulate_signals."""
+    
+    def test_long_take_profit(self):
+        """Test that a long exits at the TP level when high touches it."""
+        df = _bars([100, 101, 103, 104], high=[100, 101, 106, 104])
+        signals = pd.Series([1, 0, 0, 0])
+        tp = pd.Series(0.05, index=df.index)
+        
+        equity, records = simulate_signals(df, signals, tp_pct=tp, commission=0, slippage=0, risk_per_trade=1.0)
+        
+        assert len(records) == 1
+        assert EXIT_REASONS[int(_field(records, 'exit_reason')[0])] == 'take_profit'
+        assert _field(records, 'exit_idx')[0] == 2
+        assert _field(records, 'exit_price')[0] == pytest.approx(105.0)
+        assert equity[-1] == pytest.approx(100000 * 1.05)
+    
+    def test_short_stop_loss_gap_fills_at_open(self):
+        """Test that a short stopped through a gap fills at the open."""
+        df = _bars([100, 101, 110, 110], open_=[100, 100, 108, 110], high=[100, 101, 111, 110])
+        signals = pd.Series([-1, 0, 0, 0])
+        sl = pd.Series(0.05, index=df.index)
+        
+        _, records = simulate_signals(df, signals, sl_pct=sl, commission=0, slippage=0, risk_per_trade=0.01)
+        
+        assert EXIT_REASONS[int(_field(records, 'exit_reason')[0])] == 'stop_loss'
+        assert _field(records, 'side')[0] == -1
+        assert _field(records, 'exit_price')[0] == pytest.approx(108.0)
+        # Sized so that the 5% stop risks 1% of capital
+        assert _field(records, 'quantity')[0] == pytest.approx(100000 * 0.01 / (100 * 0.05))
+    
+    def test_reversal_on_opposite_signal(self):
+        """Test that an opposite signal closes and reverses the position."""
+        df = _bars([100, 102, 104, 100])
+        signals = pd.Series([1, 0, -1, 0])
+        
+        _, records = simulate_signals(df, signals, commission=0, slippage=0)
+        
+        assert list(_field(records, 'side')) == [1, -1]
+        assert [EXIT_REASONS[int(r)] for r in _field(records, 'exit_reason')] == ['signal', 'end_of_data']
+        assert _field(records, 'entry_idx')[1] == 2
+    
+    def test_forced_close(self):
+        """Test that forced close exits and blocks entries on flagged bars."""
+        df = _bars([100, 101, 102, 103, 104])
+        signals = pd.Series([1, 0, 0, 1, 0])
+        force_close = np.array([False, False, True, True, False])
+        
+        _, records = simulate_signals(df, signals, force_close=force_close)
+        
+        assert len(records) == 1
+        assert EXIT_REASONS[int(_field(records, 'exit_reason')[0])] == 'forced_close'
+        assert _field(records, 'exit_idx')[0] == 2
+    
+    def test_costs_reduce_pnl(self):
+        """Test that net PnL equals gross PnL minus commission and slippage."""
+        df = _bars([100, 100, 110, 110])
+        signals = pd.Series([1, 0, -1, 0])
+        
+        equity, records = simulate_signals(df, signals, commission=0.001, slippage=0.0005)
+        
+        pnl = _field(records, 'pnl')
+        expected = _field(records, 'pnl_gross') - _field(records, 'commission') - _field(records, 'slippage')
+        np.testing.assert_allclose(pnl, expected)
+        assert equity[-1] == pytest.approx(100000 + pnl.sum())
+    
+    def test_compiled_and_python_kernels_agree(self, monkeypatch):
+        """Test that the numba and pure Python loops give the same result."""
+        rng = np.random.default_rng(3)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 2000)))
+        df = _bars(close, high=close * 1.01, low=close * 0.99)
+        signals = pd.Series(rng.choice([-1, 0, 1], size=2000, p=[0.05, 0.9, 0.05]))
+        stops = pd.Series(0.015, index=df.index)
+        
+        equity_a, records_a = simulate_signals(df, signals, tp_pct=stops * 2, sl_pct=stops)
+        monkeypatch.setattr(simulator, 'NUMBA_AVAILABLE', False)
+        equity_b, records_b = simulate_signals(df, signals, tp_pct=stops * 2, sl_pct=stops)
+        
+        np.testing.assert_allclose(equity_a, equity_b)
+        np.testing.assert_allclose(records_a, records_b)
+
+
+class TestFallbackEngine:
+    """Tests for BacktestEngine without vectorbt."""
+    
+    def test_fallback_returns_trade_ledger(self):
+        """Test that the fallback path trades both sides and fills the ledger."""
+        rng = np.random.default_rng(5)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, 500)))
+        df = _bars(close, high=close * 1.003, low=close * 0.997)
+        signals = pd.Series(rng.choice([-1, 0, 1], size=500, p=[0.05, 0.9, 0.05]))
+        config = BacktestConfig(one_trade_per_day=False, use_trading_windows=False)
+        
+        with patch('app.research.backtest.engine.VBT_AVAILABLE', False):
+            result = BacktestEngine(config).run(df, signals, "Fallback", verbose=False)
+        
+        assert result.total_trades == len(result.trades) > 0
+        assert {t['side'] for t in result.trades} == {'LONG', 'SHORT'}
+        assert result.final_capital == pytest.approx(config.initial_capital + sum(t['pnl'] for t in result.trades))
+        assert 0 < result.exposure_time <= 1
+    
+    def test_fallback_empty_dataframe(self):
+        """Test that an empty dataset yields a zero result."""
+        df = _bars([])
+        
+        with patch('app.research.backtest.engine.VBT_AVAILABLE', False):
+            result = BacktestEngine().run(df, pd.Series([], dtype=int), "Empty", verbose=False)
+        
+        assert result.total_trades == 0
+        assert result.final_capital == result.initial_capital
+
+
+class TestRunBatch:
+    """Tests for BacktestEngine.run_batch."""
+    
+    @pytest.fixture
+    def bars(self):
+        """Random walk over 20 days of 15m bars."""
+        rng = np.random.default_rng(11)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.003, 2000)))
+        df = _bars(close, high=close * 1.003, low=close * 0.997)
+        df['timestamp'] = df['timestamp'].iloc[0] + np.arange(len(df)) * 15 * 60 * 1000
+        return df
+    
+    def test_batch_matches_single_runs(self, bars):
+        """Test that each row equals a single native run with the same config."""
+        rng = np.random.default_rng(12)
+        matrix = rng.choice([-1, 0, 1], size=(len(bars), 4), p=[0.03, 0.94, 0.03])
+        configs = [
+            BacktestConfig(),
+            BacktestConfig(one_trade_per_day=False, use_trading_windows=False),
+            BacktestConfig(window_a_start="07:00", atr_multiplier_tp=2.0),
+            BacktestConfig(use_atr_stops=False, commission=0.0),
+        ]
+        
+        results = BacktestEngine().run_batch(bars, matrix, configs)
+        
+        assert list(results.index) == [f"variant_{i}" for i in range(4)]
+        for j, config in enumerate(configs):
+            single = BacktestEngine(config)._run_fallback_backtest(bars, pd.Series(matrix[:, j]), verbose=False)
+            row = results.iloc[j]
+            assert row['total_trades'] == single.total_trades
+            assert row['final_capital'] == pytest.approx(single.final_capital)
+            assert row['sharpe_ratio'] == pytest.approx(single.sharpe_ratio)
+            assert row['max_drawdown'] == pytest.approx(single.max_drawdown)
+    
+    def test_dataframe_columns_become_names(self, bars):
+        """Test that DataFrame signal columns name the result rows."""
+        signals = pd.DataFrame({'fast': np.sign(np.sin(np.arange(len(bars)) / 7)), 'slow': 0})
+        
+        results = BacktestEngine(BacktestConfig(use_trading_windows=False)).run_batch(bars, signals)
+        
+        assert list(results.index) == ['fast', 'slow']
+        assert results.loc['slow', 'total_trades'] == 0
+        assert results.loc['slow', 'final_capital'] == results.loc['slow', 'initial_capital']
+    
+    def test_shape_mismatch_raises(self, bars):
+        """Test that a matrix not aligned with the bars is rejected."""
+        with pytest.raises(ValueError):
+            BacktestEngine().run_batch(bars, np.zeros((len(bars) - 1, 2)))
+        
+        with pytest.raises(ValueError):
+            BacktestEngine().run_batch(bars, np.zeros((len(bars), 2)), [BacktestConfig()] * 3)
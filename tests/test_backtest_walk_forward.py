@@ -0,0 +1,106 @@
+"""Tests for research.backtest.walk_forward module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research.backtest.walk_forward import WalkForwardOptimizer, WalkForwardConfig
+
+
+def ma_signals(df: pd.DataFrame, fast: int, slow: int) -> pd.Series:
+    """Long/short moving average crossover (module level so workers can pickle it)."""
+    fast_ma = df['close'].rolling(fast).mean()
+    slow_ma = df['close'].rolling(slow).mean()
+    return pd.Series(np.where(fast_ma > slow_ma, 1, -1), index=df.index)
+
+
+@pytest.fixture
+def bars():
+    """Daily random-walk bars."""
+    rng = np.random.default_rng(4)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2022-01-01', periods=400, freq='D').astype('int64') // 10**6,
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': 1.0,
+        'symbol': 'BTC/USDT'
+    })
+
+
+PARAM_GRID = {'fast': [5, 10], 'slow': [20, 40]}
+
+
+class TestWalkForwardOptimizer:
+    """Tests for WalkForwardOptimizer."""
+    
+    def test_parallel_matches_serial(self, bars, monkeypatch):
+        """Test that running folds in a process pool gives the serial results."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        config = WalkForwardConfig(train_period=120, test_period=30, step_size=30)
+        
+        serial = WalkForwardOptimizer(config).optimize(bars, ma_signals, PARAM_GRID, verbose=False)
+        parallel = WalkForwardOptimizer(config.model_copy(update={'n_jobs': 2})).optimize(
+            bars, ma_signals, PARAM_GRID, verbose=False
+        )
+        
+        assert serial.total_iterations == parallel.total_iterations == 9
+        for a, b in zip(serial.iterations, parallel.iterations):
+            assert a.model_dump() == b.model_dump()
+    
+    def test_anchored_folds_start_at_first_bar(self, bars):
+        """Test that anchored folds share the first training bar."""
+        config = WalkForwardConfig(train_period=120, test_period=30, step_size=60, anchored=True)
+        
+        summary = WalkForwardOptimizer(config).optimize(bars, ma_signals, PARAM_GRID, verbose=False)
+        
+        assert len({result.train_start for result in summary.iterations}) == 1
+        assert [result.test_start for result in summary.iterations] == sorted(result.test_start for result in summary.iterations)
+
+
+def bar_signals(df: pd.DataFrame, threshold: float) -> pd.Series:
+    """Signal from each bar alone (identical on any slice of the data)."""
+    return pd.Series(np.where(df['close'] > threshold, 1, -1), index=df.index)
+
+
+class TestPrecomputedSignals:
+    """Tests for precompute_signals mode."""
+    
+    def test_matches_sliced_signals_for_pointwise_strategy(self, bars):
+        """Test that precomputed and per-slice signals agree when signals need no history."""
+        config = WalkForwardConfig(train_period=120, test_period=30, step_size=30)
+        grid = {'threshold': [90.0, 100.0, 110.0]}
+        
+        sliced = WalkForwardOptimizer(config).optimize(bars, bar_signals, grid, verbose=False)
+        precomputed = WalkForwardOptimizer(config.model_copy(update={'precompute_signals': True})).optimize(
+            bars, bar_signals, grid, verbose=False
+        )
+        
+        for a, b in zip(sliced.iterations, precomputed.iterations):
+            assert a.model_dump() == b.model_dump()
+    
+    def test_signals_generated_once_per_combination(self, bars):
+        """Test that each combination is generated once, not per fold."""
+        calls = []
+        
+        def counting_signals(df, fast, slow):
+            calls.append(len(df))
+            return ma_signals(df, fast, slow)
+        
+        config = WalkForwardConfig(train_period=120, test_period=30, step_size=30, precompute_signals=True)
+        WalkForwardOptimizer(config).optimize(bars, counting_signals, PARAM_GRID, verbose=False)
+        
+        assert calls == [len(bars)] * 4
+    
+    def test_parallel_matches_serial(self, bars, monkeypatch):
+        """Test that workers slice the shared precomputed signals like a serial run."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        config = WalkForwardConfig(train_period=120, test_period=30, step_size=30, precompute_signals=True, warmup_bars=40)
+        
+        serial = WalkForwardOptimizer(config).optimize(bars, ma_signals, PARAM_GRID, verbose=False)
+        parallel = WalkForwardOptimizer(config.model_copy(update={'n_jobs': 2})).optimize(
+            bars, ma_signals, PARAM_GRID, verbose=False
+        )
+        
+        for a, b in zip(serial.iterations, parallel.iterations):
+            assert a.model_dump() == b.model_dump()
@@ -11,6 +11,7 @@ from app.core.calendar import (
     is_weekend,
     get_next_trading_day,
     validate_timestamp_order,
+    local_time_of_day_us,
     UTC_TZ,
     ARG_TZ,
     DEFAULT_WINDOW_A_START,
@@ -216,6 +217,63 @@ class TestTradingCalendar:
         assert isinstance(start_time, datetime)
 
 
+class TestVectorizedMasks:
+    """Tests for the array-based calendar checks."""
+    
+    @staticmethod
+    def _minutes(start: datetime, count: int, step_seconds: int = 60) -> list:
+        return [int((start + timedelta(seconds=i * step_seconds)).timestamp() * 1000) for i in range(count)]
+    
+    def test_local_time_of_day(self):
+        """Test local wall-clock time of day in microseconds."""
+        ts = int(datetime(2024, 1, 1, 13, 30, 15, tzinfo=UTC_TZ).timestamp() * 1000)
+        
+        result = local_time_of_day_us([ts])
+        
+        # 13:30:15 UTC = 10:30:15 in Buenos Aires
+        assert result[0] == ((10 * 60 + 30) * 60 + 15) * 1_000_000
+    
+    def test_trading_hours_mask_matches_scalar(self):
+        """Test trading_hours_mask and window_masks against the per-timestamp checks."""
+        calendar = TradingCalendar()
+        timestamps = self._minutes(datetime(2024, 3, 4, tzinfo=UTC_TZ), 2 * 24 * 60, step_seconds=61)
+        
+        mask = calendar.trading_hours_mask(timestamps)
+        in_a, in_b = calendar.window_masks(timestamps)
+        
+        for ts, expected, a, b in zip(timestamps, mask, in_a, in_b):
+            check_time = datetime.fromtimestamp(ts / 1000, tz=UTC_TZ)
+            assert expected == calendar.is_trading_hours(check_time)
+            assert a == calendar.window_a.is_within_window(check_time)
+            assert b == calendar.window_b.is_within_window(check_time)
+    
+    def test_cross_midnight_window_mask(self):
+        """Test vectorized check for a window crossing midnight."""
+        window = TradingWindow(name="Night", start_time=time(22, 0), end_time=time(2, 0))
+        times = local_time_of_day_us(self._minutes(datetime(2024, 3, 4, tzinfo=UTC_TZ), 24 * 60), window.timezone)
+        
+        mask = window.within_window_mask(times)
+        
+        # 22:00..23:59 and 00:00..02:00 local, both ends inclusive
+        assert mask.sum() == 2 * 60 + 2 * 60 + 1
+    
+    def test_disabled_window_mask(self):
+        """Test that a disabled window never matches."""
+        window = TradingWindow(name="Off", start_time=time(0, 0), end_time=time(23, 59), enabled=False)
+        
+        assert not window.within_window_mask(local_time_of_day_us([0, 3_600_000])).any()
+    
+    def test_force_close_mask_matches_scalar(self):
+        """Test force_close_mask against should_force_close."""
+        calendar = TradingCalendar(forced_close_time=time(16, 45, 30))
+        timestamps = self._minutes(datetime(2024, 3, 4, 19, 40, tzinfo=UTC_TZ), 600, step_seconds=1)
+        
+        mask = calendar.force_close_mask(timestamps)
+        
+        expected = [calendar.should_force_close(datetime.fromtimestamp(ts / 1000, tz=UTC_TZ)) for ts in timestamps]
+        assert list(mask) == expected
+
+
 class TestTimezoneConversions:
     """Tests for timezone conversion utilities."""
     
@@ -0,0 +1,119 @@
+"""Tests for core.database module."""
+import sqlite3
+import threading
+import pytest
+
+from app.core.database import SQLiteConnectionManager
+
+
+@pytest.fixture
+def manager():
+    """Connection manager closed after each test."""
+    manager = SQLiteConnectionManager()
+    yield manager
+    manager.close_all()
+
+
+@pytest.fixture
+def db_path(tmp_path, manager):
+    """Database with a single key/value table."""
+    path = tmp_path / "test.db"
+    with manager.transaction(path) as conn:
+        conn.execute("CREATE TABLE items (key TEXT PRIMARY KEY, value INTEGER)")
+    return path
+
+
+def _count(path) -> int:
+    """Count committed rows through an independent connection."""
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestSQLiteConnectionManager:
+    """Tests for SQLiteConnectionManager."""
+    
+    def test_connection_reused_and_configured(self, manager, db_path):
+        """Test that a thread gets one persistent connection in WAL mode."""
+        with manager.connection(db_path) as first:
+            mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+        with manager.connection(str(db_path)) as second:
+            pass
+        
+        assert second is first
+        assert mode == "wal"
+        assert manager.stats()['opened'] == 1
+    
+    def test_threads_get_own_connections(self, manager, db_path):
+        """Test that connections are not shared between threads."""
+        connections = []
+        
+        def borrow():
+            with manager.connection(db_path) as conn:
+                connections.append(conn)
+        
+        threads = [threading.Thread(target=borrow) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        borrow()
+        
+        assert len({id(conn) for conn in connections}) == 4
+    
+    def test_exited_threads_release_connections(self, manager, db_path):
+        """Test that connections of short-lived threads are closed once the threads exit."""
+        connections = []
+        
+        def write(run, i):
+            with manager.transaction(db_path) as conn:
+                conn.execute("INSERT INTO items VALUES (?, ?)", (f"{run}-{i}", i))
+                connections.append(conn)
+        
+        for run in range(5):
+            threads = [threading.Thread(target=write, args=(run, i)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        stats = manager.stats()
+        assert _count(db_path) == 20
+        assert stats['opened'] == 21
+        assert stats['open_connections'] == 1
+        assert stats['released'] == 20
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+    
+    def test_nested_transactions_commit_once(self, manager, db_path):
+        """Test that nested blocks are committed together by the outermost one."""
+        with manager.transaction(db_path):
+            for i in range(5):
+                with manager.transaction(db_path) as conn:
+                    conn.execute("INSERT INTO items VALUES (?, ?)", (f"k{i}", i))
+            assert _count(db_path) == 0
+        
+        assert _count(db_path) == 5
+        assert manager.stats()['commits'] == 2
+    
+    def test_error_rolls_back(self, manager, db_path):
+        """Test that an error in the outermost block discards its writes."""
+        with pytest.raises(ValueError):
+            with manager.transaction(db_path) as conn:
+                conn.execute("INSERT INTO items VALUES ('a', 1)")
+                raise ValueError("boom")
+        
+        with manager.transaction(db_path) as conn:
+            conn.execute("INSERT INTO items VALUES ('b', 2)")
+        
+        assert _count(db_path) == 1
+    
+    def test_idle_connections_evicted(self, tmp_path):
+        """Test that each thread keeps at most max_connections_per_thread connections."""
+        manager = SQLiteConnectionManager(max_connections_per_thread=2)
+        for i in range(5):
+            with manager.connection(tmp_path / f"{i}.db"):
+                pass
+        
+        assert manager.stats()['open_connections'] == 2
+        manager.close_all()
+        assert manager.stats()['open_connections'] == 0
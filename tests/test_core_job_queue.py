@@ -0,0 +1,141 @@
+"""Tests for core.job_queue module."""
+import threading
+import time
+import pytest
+from app.core.database import get_connection_manager
+from app.core.job_queue import JobQueue, JobStatus
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Single-worker queue shut down after each test."""
+    queue = JobQueue(tmp_path / "jobs.db", workers=1)
+    yield queue
+    queue.shutdown(wait=True)
+
+
+def _wait(queue: JobQueue, job_id: str, timeout: float = 5.0):
+    """Poll until a job finishes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job is not None and job.is_finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def _add(params, progress):
+    """Job handler adding two numbers."""
+    progress(0.5, "Adding")
+    return {'sum': params['a'] + params['b']}
+
+
+def _fail(params, progress):
+    """Job handler that raises."""
+    raise ValueError("no data")
+
+
+class TestJobQueue:
+    """Tests for JobQueue."""
+    
+    def test_result_persisted(self, queue, tmp_path):
+        """Test that a finished job's result is readable from another queue."""
+        job = queue.submit("add", _add, {'a': 1, 'b': 2})
+        
+        assert job.status == JobStatus.QUEUED
+        finished = _wait(queue, job.job_id)
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.progress == 1.0
+        assert finished.result == {'sum': 3}
+        
+        reopened = JobQueue(tmp_path / "jobs.db").get(job.job_id)
+        assert reopened.result == {'sum': 3}
+        assert reopened.params == {'a': 1, 'b': 2}
+        assert reopened.expires_at > reopened.finished_at
+    
+    def test_failure_recorded(self, queue):
+        """Test that handler errors mark the job failed with the error message."""
+        job = _wait(queue, queue.submit("fail", _fail).job_id)
+        
+        assert job.status == JobStatus.FAILED
+        assert job.error == "no data"
+        assert job.result is None
+    
+    def test_progress_and_cancel(self, queue):
+        """Test that progress is visible while running and queued jobs can be cancelled."""
+        release = threading.Event()
+        
+        def blocking(params, progress):
+            progress(0.25, "Waiting")
+            release.wait(5)
+            return {}
+        
+        running = queue.submit("block", blocking)
+        queued = queue.submit("add", _add, {'a': 1, 'b': 1})
+        while queue.get(running.job_id).progress < 0.25:
+            time.sleep(0.01)
+        
+        assert queue.get(running.job_id).message == "Waiting"
+        assert queue.cancel(queued.job_id) is True
+        assert queue.cancel(running.job_id) is False
+        
+        release.set()
+        assert _wait(queue, running.job_id).status == JobStatus.SUCCEEDED
+        assert queue.get(queued.job_id).status == JobStatus.CANCELLED
+    
+    def test_expired_results_purged(self, tmp_path):
+        """Test that jobs past their result TTL are hidden and deleted."""
+        queue = JobQueue(tmp_path / "jobs.db", workers=1, result_ttl_hours=1e-6)
+        job = queue.submit("add", _add, {'a': 1, 'b': 2})
+        while queue.stats()['queued'] + queue.stats()['running'] > 0:
+            time.sleep(0.01)
+        time.sleep(0.01)
+        
+        assert queue.get(job.job_id) is None
+        assert queue.purge_expired() == 1
+        queue.shutdown(wait=True)
+    
+    def test_interrupted_jobs_failed_on_restart(self, queue, tmp_path):
+        """Test that jobs left queued by a previous process are marked failed."""
+        release = threading.Event()
+        running = queue.submit("block", lambda params, progress: release.wait(5) and {})
+        queued = queue.submit("add", _add, {'a': 1, 'b': 1})
+        with get_connection_manager().transaction(tmp_path / "jobs.db") as conn:
+            conn.execute("UPDATE jobs SET owner = ? WHERE job_id = ?", ("previous-boot:4242", queued.job_id))
+        
+        restarted = JobQueue(tmp_path / "jobs.db")
+        job = restarted.get(queued.job_id)
+        release.set()
+        _wait(queue, running.job_id)
+        
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Interrupted by server restart"
+    
+    def test_live_jobs_kept_by_second_queue(self, queue, tmp_path):
+        """Test that a queue opened on the same database leaves jobs of a running process alone."""
+        release = threading.Event()
+        running = queue.submit("block", lambda params, progress: release.wait(5) and {})
+        queued = queue.submit("add", _add, {'a': 1, 'b': 1})
+        while queue.get(running.job_id).status != JobStatus.RUNNING:
+            time.sleep(0.01)
+        
+        other = JobQueue(tmp_path / "jobs.db")
+        statuses = [other.get(running.job_id).status, other.get(queued.job_id).status]
+        release.set()
+        
+        assert statuses == [JobStatus.RUNNING, JobStatus.QUEUED]
+        assert _wait(queue, running.job_id).status == JobStatus.SUCCEEDED
+        assert _wait(queue, queued.job_id).result == {'sum': 2}
+    
+    def test_list_jobs_filters_and_omits_results(self, queue):
+        """Test that listing filters by kind and leaves results out."""
+        first = queue.submit("add", _add, {'a': 1, 'b': 2})
+        _wait(queue, queue.submit("fail", _fail).job_id)
+        _wait(queue, first.job_id)
+        
+        jobs = queue.list_jobs(kind="add")
+        
+        assert [job.job_id for job in jobs] == [first.job_id]
+        assert jobs[0].result is None
+        assert [job.kind for job in queue.list_jobs(status=JobStatus.FAILED)] == ["fail"]
@@ -0,0 +1,201 @@
+"""Tests for the columnar DataFrame read path.
+
+This module tests read_frame against the partitioned Parquet layout:
+- Typed columns and timestamp ordering
+- since/until filtering and max_bars
+- Column projection and empty stores
+- Partition cache hits, invalidation and eviction
+"""
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.data.frames import read_frame, list_partition_files
+from app.data.frame_cache import FrameCache
+
+
+HOUR_MS = 60 * 60 * 1000
+
+
+def _write_partition(base_path: Path, symbol: str, tf: str, year: int, month: int, timestamps: list):
+    """Write bars for one partition in the DataStore layout."""
+    partition = base_path / f"symbol={symbol.replace('/', '-')}" / f"tf={tf}" / f"year={year}" / f"month={month:02d}"
+    partition.mkdir(parents=True, exist_ok=True)
+    n = len(timestamps)
+    table = pa.table({
+        'timestamp': pa.array(timestamps, type=pa.int64()),
+        'open': [100.0 + i for i in range(n)],
+        'high': [101.0 + i for i in range(n)],
+        'low': [99.0 + i for i in range(n)],
+        'close': [100.5 + i for i in range(n)],
+        'volume': [10.0] * n,
+        'symbol': [symbol] * n,
+        'timeframe': [tf] * n,
+    })
+    pq.write_table(table, partition / "data.parquet")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store stub with two monthly partitions (written out of order)."""
+    sep_start = int(datetime(2024, 9, 30, 20, tzinfo=timezone.utc).timestamp() * 1000)
+    oct_start = int(datetime(2024, 10, 1, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+    _write_partition(tmp_path, "BTC/USDT", "1h", 2024, 10, [oct_start + i * HOUR_MS for i in range(10)][::-1])
+    _write_partition(tmp_path, "BTC/USDT", "1h", 2024, 9, [sep_start + i * HOUR_MS for i in range(4)])
+
+    return SimpleNamespace(base_path=tmp_path)
+
+
+class TestReadFrame:
+    """Tests for read_frame."""
+
+    def test_reads_all_partitions_sorted(self, store):
+        """Test that bars from all partitions come back sorted and typed."""
+        df = read_frame(store, "BTC/USDT", "1h")
+
+        assert len(df) == 14
+        assert df['timestamp'].is_monotonic_increasing
+        assert df['timestamp'].dtype == 'int64'
+        assert df['close'].dtype == 'float64'
+        assert list(df.index) == list(range(14))
+
+    def test_since_until_filter(self, store):
+        """Test that since/until bounds are inclusive."""
+        full = read_frame(store, "BTC/USDT", "1h")
+        since = int(full['timestamp'].iloc[2])
+        until = int(full['timestamp'].iloc[6])
+
+        df = read_frame(store, "BTC/USDT", "1h", since=since, until=until)
+
+        assert len(df) == 5
+        assert df['timestamp'].iloc[0] == since
+        assert df['timestamp'].iloc[-1] == until
+
+    def test_datetime_bounds(self, store):
+        """Test that datetime bounds are accepted."""
+        df = read_frame(store, "BTC/USDT", "1h", since=datetime(2024, 10, 1, 5, tzinfo=timezone.utc))
+
+        assert len(df) == 5
+
+    def test_max_bars_keeps_most_recent(self, store):
+        """Test that max_bars returns the latest bars only."""
+        full = read_frame(store, "BTC/USDT", "1h")
+        df = read_frame(store, "BTC/USDT", "1h", max_bars=3)
+
+        assert len(df) == 3
+        assert list(df['timestamp']) == list(full['timestamp'].iloc[-3:])
+
+    def test_max_bars_spanning_partitions(self, store):
+        """Test that max_bars reads older partitions when needed."""
+        df = read_frame(store, "BTC/USDT", "1h", max_bars=12)
+
+        assert len(df) == 12
+        assert df['timestamp'].is_monotonic_increasing
+
+    def test_column_projection(self, store):
+        """Test that only requested columns are returned."""
+        df = read_frame(store, "BTC/USDT", "1h", columns=['close', 'volume'])
+
+        assert list(df.columns) == ['close', 'volume']
+        assert len(df) == 14
+
+    def test_missing_symbol_returns_empty_frame(self, store):
+        """Test that a missing symbol yields an empty typed frame."""
+        df = read_frame(store, "ETH/USDT", "1h")
+
+        assert df.empty
+        assert 'timestamp' in df.columns
+
+    def test_partition_pruning(self, store):
+        """Test that partitions outside the requested range are skipped."""
+        since = int(datetime(2024, 10, 15, tzinfo=timezone.utc).timestamp() * 1000)
+        files = list_partition_files(store.base_path, "BTC/USDT", "1h", since_ms=since)
+
+        assert len(files) == 1
+        assert files[0].parent.name == "month=10"
+
+
+class TestFrameCache:
+    """Tests for the partition frame cache."""
+
+    def test_second_read_hits_cache(self, store):
+        """Test that repeated reads are served from memory."""
+        cache = FrameCache()
+        files = list_partition_files(store.base_path, "BTC/USDT", "1h")
+
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        stats = cache.stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 2
+        assert stats['partitions'] == 2
+
+    def test_rewritten_partition_is_reloaded(self, store):
+        """Test that a partition rewritten on disk is not served stale."""
+        cache = FrameCache()
+        path = list_partition_files(store.base_path, "BTC/USDT", "1h")[-1]
+        before = cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        oct_start = int(datetime(2024, 10, 1, 0, tzinfo=timezone.utc).timestamp() * 1000)
+        _write_partition(store.base_path, "BTC/USDT", "1h", 2024, 10, [oct_start + i * HOUR_MS for i in range(12)])
+
+        after = cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        assert before.num_rows == 10
+        assert after.num_rows == 12
+
+    def test_invalidate_by_symbol(self, store):
+        """Test explicit invalidation after a sync."""
+        cache = FrameCache()
+        for path in list_partition_files(store.base_path, "BTC/USDT", "1h"):
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        assert cache.invalidate("ETH/USDT") == 0
+        assert cache.invalidate("BTC/USDT", "1h") == 2
+        assert cache.stats()['partitions'] == 0
+
+    def test_invalidate_matches_either_symbol_form(self, store):
+        """Test that 'BTC/USDT' and 'BTC-USDT' name the same cached partitions."""
+        cache = FrameCache()
+        files = list_partition_files(store.base_path, "BTC/USDT", "1h")
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC-USDT", "1h")
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        assert cache.stats()['hits'] == 2
+        assert cache.invalidate("BTC/USDT") == 2
+
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        assert cache.invalidate("BTC-USDT", "1h") == 2
+
+    def test_byte_budget_evicts_lru(self, store):
+        """Test that the least recently used partition is evicted over budget."""
+        files = list_partition_files(store.base_path, "BTC/USDT", "1h")
+        sizes = [FrameCache(enabled=False).get_partition(p, store.base_path, "BTC/USDT", "1h").nbytes for p in files]
+        cache = FrameCache(max_bytes=max(sizes))
+
+        for path in files:
+            cache.get_partition(path, store.base_path, "BTC/USDT", "1h")
+
+        stats = cache.stats()
+        assert stats['partitions'] == 1
+        assert stats['evictions'] == 1
+        assert stats['bytes'] <= cache.max_bytes
+
+    def test_read_frame_uncached_matches_cached(self, store):
+        """Test that cached and direct reads return identical frames."""
+        cached = read_frame(store, "BTC/USDT", "1h", since=1727740800000, max_bars=8)
+        direct = read_frame(store, "BTC/USDT", "1h", since=1727740800000, max_bars=8, use_cache=False)
+
+        pd.testing.assert_frame_equal(cached, direct)
@@ -0,0 +1,112 @@
+"""Tests for jobs.fanout module."""
+import asyncio
+import threading
+import time
+import pytest
+from app.jobs.fanout import FanOutReport, RateLimiter, RateLimitExceeded, fan_out, is_rate_limit_error
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+    
+    def test_concurrency_bounded_and_order_kept(self):
+        """Test that no more than `concurrency` calls run at once and outcomes keep item order."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+        
+        def work(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(item)
+            return item * 10
+        
+        report = asyncio.run(fan_out(work, list(range(8)), concurrency=3))
+        
+        assert max(peak) == 3
+        assert [outcome.result for outcome in report.outcomes] == [i * 10 for i in range(8)]
+        assert report.elapsed_seconds < 8 * 0.02
+    
+    def test_failures_isolated(self):
+        """Test that one failing item does not affect the others and is counted."""
+        def work(symbol):
+            if symbol == "BAD/USDT":
+                raise ValueError("no market")
+            return symbol
+        
+        report = asyncio.run(fan_out(work, ["BTC/USDT", "BAD/USDT", "ETH/USDT"], concurrency=2))
+        
+        metrics = report.metrics()
+        assert [outcome.key for outcome in report.failed] == ["BAD/USDT"]
+        assert report.failed[0].error == "no market"
+        assert (metrics['succeeded'], metrics['failed'], metrics['retries']) == (2, 1, 0)
+    
+    def test_rate_limit_retried_with_shared_backoff(self):
+        """Test that rate-limit errors are retried and back off the shared limiter."""
+        calls = []
+        
+        def work(item):
+            calls.append(item)
+            if calls.count(item) == 1 and item == "a":
+                raise RateLimitExceeded("429 Too Many Requests")
+            return item
+        
+        limiter = RateLimiter(requests_per_minute=0)
+        report = asyncio.run(fan_out(work, ["a", "b"], concurrency=2, rate_limiter=limiter, backoff_seconds=0.05))
+        
+        assert [outcome.success for outcome in report.outcomes] == [True, True]
+        assert report.outcomes[0].attempts == 2
+        assert report.outcomes[0].duration >= 0.05
+        assert report.metrics()['rate_limit_backoffs'] == 1
+    
+    def test_rate_limit_gives_up_after_max_retries(self):
+        """Test that an item still rate limited after max_retries fails."""
+        def work(item):
+            raise RuntimeError("binance DDoSProtection")
+        
+        report = asyncio.run(fan_out(work, ["a"], concurrency=1, max_retries=2, backoff_seconds=0.001))
+        
+        assert report.outcomes[0].success is False
+        assert report.outcomes[0].attempts == 3
+    
+    def test_empty_items(self):
+        """Test that an empty fan-out returns an empty report."""
+        report = asyncio.run(fan_out(lambda item: item, [], concurrency=4))
+        
+        assert isinstance(report, FanOutReport)
+        assert report.metrics()['tasks'] == 0
+        assert report.metrics()['slowest'] is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter and is_rate_limit_error."""
+    
+    def test_calls_spaced_by_cooldown(self):
+        """Test that call starts are at least the cooldown apart."""
+        limiter = RateLimiter(requests_per_minute=6000, cooldown=0.02)
+        
+        async def main():
+            starts = []
+            for _ in range(4):
+                await limiter.acquire()
+                starts.append(time.monotonic())
+            return starts
+        
+        starts = asyncio.run(main())
+        
+        assert limiter.min_interval == pytest.approx(0.02)
+        assert all(b - a >= 0.019 for a, b in zip(starts, starts[1:]))
+    
+    @pytest.mark.parametrize("error,expected", [
+        (RateLimitExceeded("slow down"), True),
+        ("HTTP 429: Too Many Requests", True),
+        (type("RateLimitExceeded", (Exception,), {})("binance"), True),
+        (ValueError("Symbol not found"), False),
+        ("Insufficient data", False),
+    ])
+    def test_is_rate_limit_error(self, error, expected):
+        """Test rate-limit detection on exceptions and messages."""
+        assert is_rate_limit_error(error) is expected
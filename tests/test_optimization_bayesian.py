@@ -0,0 +1,126 @@
+"""Tests for Bayesian optimization.
+
+This module tests:
+- Batched ask/tell rounds persisted to storage
+- Process pool runs giving the same results as serial runs
+- Distinct batch suggestions
+- The ask/tell loop against a stub optimizer (runs without scikit-optimize)
+"""
+import pytest
+import numpy as np
+
+from app.research.backtest.engine import BacktestConfig
+from app.research.optimization import bayesian
+from app.research.optimization.bayesian import (
+    FAILED_OBJECTIVE, SKOPT_AVAILABLE, BayesianConfig, bayesian_optimize, suggest_next_parameters
+)
+
+requires_skopt = pytest.mark.skipif(not SKOPT_AVAILABLE, reason="scikit-optimize not installed")
+
+
+PARAM_SPACE = {
+    'fast_period': {'type': 'integer', 'low': 3, 'high': 12},
+    'slow_period': {'type': 'integer', 'low': 15, 'high': 40}
+}
+
+BACKTEST_CONFIG = BacktestConfig(use_trading_windows=False, one_trade_per_day=False)
+
+
+def _config(**kwargs) -> BayesianConfig:
+    kwargs.setdefault('n_calls', 12)
+    return BayesianConfig(
+        strategy_name="ma_crossover",
+        symbol="BTC/USDT",
+        timeframe="1h",
+        param_space=PARAM_SPACE,
+        n_initial_points=4,
+        random_state=7,
+        **kwargs
+    )
+
+
+class _StubOptimizer:
+    """Proposes a fixed sequence of points and records what it is told."""
+    
+    points = [[np.int64(3), np.int64(15)], [5, 21], [8, 0], [12, 40], [4, 30]]
+    
+    def __init__(self, dimensions, **kwargs):
+        self.pending = list(self.points)
+        self.told = []
+        _StubOptimizer.last = self
+    
+    def ask(self, n_points=None, strategy=None):
+        if n_points is None:
+            return self.pending.pop(0)
+        batch, self.pending = self.pending[:n_points], self.pending[n_points:]
+        return batch
+    
+    def tell(self, points, objectives):
+        self.told.append((points, objectives))
+
+
+@pytest.fixture
+def stub_optimizer(monkeypatch):
+    """Run bayesian_optimize against _StubOptimizer instead of scikit-optimize."""
+    monkeypatch.setattr(bayesian, "SKOPT_AVAILABLE", True)
+    monkeypatch.setattr(bayesian, "Optimizer", _StubOptimizer, raising=False)
+    monkeypatch.setattr(bayesian, "_create_skopt_space", lambda space: (list(space.values()), list(space)))
+    return _StubOptimizer
+
+
+class TestBayesianLoop:
+    """Tests for the ask/tell loop with a stub optimizer."""
+    
+    def test_rounds_told_and_persisted(self, bars, storage, stub_optimizer):
+        """Test batched rounds: scores told as objectives, failed points as FAILED_OBJECTIVE."""
+        results = bayesian_optimize(
+            bars, _config(n_calls=5, batch_size=2, scoring_metric="cagr"), BACKTEST_CONFIG, storage, verbose=False
+        )
+        
+        told = stub_optimizer.last.told
+        assert [len(points) for points, _ in told] == [2, 2, 1]
+        assert told[1][1][0] == FAILED_OBJECTIVE
+        
+        by_params = {tuple(r.parameters.values()): r for r in results}
+        assert set(by_params) == {(3, 15), (5, 21), (12, 40), (4, 30)}
+        assert all(isinstance(v, int) for r in results for v in r.parameters.values())
+        assert told[0][1] == [-by_params[(3, 15)].score, -by_params[(5, 21)].score]
+        assert by_params[(3, 15)].score == by_params[(3, 15)].metrics['cagr']
+        assert len(storage.get_all_results(strategy_name="ma_crossover")) == 4
+    
+    def test_unknown_scoring_metric_rejected(self):
+        """Test that a metric no backtest reports is an error, not a failed objective."""
+        with pytest.raises(ValueError, match="Unknown scoring metric"):
+            _config(scoring_metric="sharpe")
+
+
+@requires_skopt
+class TestBayesianOptimize:
+    """Tests for bayesian_optimize."""
+    
+    def test_batches_persisted_to_storage(self, bars, storage):
+        """Test that every evaluated point of every round is saved."""
+        results = bayesian_optimize(bars, _config(batch_size=5), BACKTEST_CONFIG, storage, verbose=False)
+        
+        stored = storage.get_all_results(strategy_name="ma_crossover")
+        assert len(results) == len(stored) == 12
+        assert all(isinstance(v, int) for r in results for v in r.parameters.values())
+        assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    
+    def test_parallel_matches_serial(self, bars, storage, monkeypatch):
+        """Test that n_jobs=2 proposes and scores the same points as a serial run."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        serial = bayesian_optimize(bars, _config(batch_size=4), BACKTEST_CONFIG, storage, verbose=False)
+        parallel = bayesian_optimize(bars, _config(batch_size=4, n_jobs=2), BACKTEST_CONFIG, storage, verbose=False)
+        
+        assert [r.parameters for r in serial] == [r.parameters for r in parallel]
+        assert [r.score for r in serial] == pytest.approx([r.score for r in parallel])
+    
+    def test_suggestions_are_distinct(self, bars, storage):
+        """Test that batch suggestions do not repeat the same point."""
+        results = bayesian_optimize(bars, _config(), BACKTEST_CONFIG, storage, verbose=False)
+        
+        suggestions = suggest_next_parameters(results, PARAM_SPACE, n_suggestions=4)
+        
+        assert len(suggestions) == 4
+        assert len({tuple(s.values()) for s in suggestions}) == 4
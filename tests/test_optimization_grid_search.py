@@ -0,0 +1,110 @@
+"""Tests for grid search optimization.
+
+This module tests:
+- Serial and process pool runs giving the same results
+- Streaming result batches to storage
+- Early cancellation
+- SharedFrame / attach_frame round-trip
+"""
+import threading
+import pytest
+import pandas as pd
+
+from app.research.backtest.engine import BacktestConfig
+from app.research.optimization.grid_search import GridSearchConfig, grid_search_optimize
+from app.research.optimization.parallel import SharedFrame, attach_frame, resolve_n_jobs
+
+
+def _config(**kwargs) -> GridSearchConfig:
+    return GridSearchConfig(
+        strategy_name="ma_crossover",
+        symbol="BTC/USDT",
+        timeframe="1h",
+        param_grid={'fast_period': [3, 5, 8], 'slow_period': [13, 21]},
+        **kwargs
+    )
+
+
+BACKTEST_CONFIG = BacktestConfig(use_trading_windows=False, one_trade_per_day=False)
+
+
+class TestGridSearch:
+    """Tests for grid_search_optimize."""
+    
+    def test_parallel_matches_serial(self, bars, storage, monkeypatch):
+        """Test that n_jobs=2 gives the same ranking and metrics as a serial run."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        serial = grid_search_optimize(bars, _config(chunk_size=2), BACKTEST_CONFIG, storage, verbose=False)
+        parallel = grid_search_optimize(bars, _config(chunk_size=2, n_jobs=2), BACKTEST_CONFIG, storage, verbose=False)
+        
+        assert len(serial) == len(parallel) == 6
+        for a, b in zip(serial, parallel):
+            assert a.parameters == b.parameters
+            assert a.score == pytest.approx(b.score)
+            assert a.metrics == pytest.approx(b.metrics)
+    
+    def test_results_streamed_to_storage(self, bars, storage):
+        """Test that every result is saved when batches are smaller than the grid."""
+        results = grid_search_optimize(
+            bars, _config(chunk_size=1, save_batch_size=2), BACKTEST_CONFIG, storage, verbose=False
+        )
+        
+        stored = storage.get_all_results(strategy_name="ma_crossover")
+        assert len(stored) == len(results) == 6
+    
+    def test_minimize_negates_score(self, bars, storage):
+        """Test that maximize=False ranks by the negated metric."""
+        results = grid_search_optimize(
+            bars, _config(scoring_metric="max_drawdown", maximize=False), BACKTEST_CONFIG, storage, verbose=False
+        )
+        
+        assert results[0].score == pytest.approx(-results[0].metrics['max_drawdown'])
+        assert results[0].metrics['max_drawdown'] == min(r.metrics['max_drawdown'] for r in results)
+    
+    def test_scores_any_batch_metric(self, bars, storage):
+        """Test that every BacktestResult metric run_batch reports can be scored, e.g. cagr."""
+        results = grid_search_optimize(bars, _config(scoring_metric="cagr"), BACKTEST_CONFIG, storage, verbose=False)
+        
+        assert len(results) == 6
+        assert results[0].score == results[0].metrics['cagr'] == max(r.metrics['cagr'] for r in results)
+        assert {'volatility', 'recovery_factor', 'total_return_pct'} <= set(results[0].metrics)
+    
+    def test_unknown_scoring_metric_rejected(self):
+        """Test that a metric no backtest reports is rejected up front."""
+        with pytest.raises(ValueError, match="Unknown scoring metric"):
+            _config(scoring_metric="sharpe")
+    
+    def test_cancel_event_stops_early(self, bars, storage):
+        """Test that a set cancel event returns without evaluating the grid."""
+        cancel = threading.Event()
+        cancel.set()
+        
+        results = grid_search_optimize(bars, _config(), BACKTEST_CONFIG, storage, verbose=False, cancel_event=cancel)
+        
+        assert results == []
+    
+    def test_invalid_combinations_are_skipped(self, bars, storage):
+        """Test that parameters the strategy rejects do not abort the search."""
+        config = _config()
+        config.param_grid['slow_period'] = [13, 0]
+        
+        results = grid_search_optimize(bars, config, BACKTEST_CONFIG, storage, verbose=False)
+        
+        assert {r.parameters['slow_period'] for r in results} == {13}
+
+
+class TestSharedFrame:
+    """Tests for the memory-mapped frame helpers."""
+    
+    def test_attach_round_trip(self, bars):
+        """Test that an attached frame matches the published columns."""
+        with SharedFrame(bars, columns=['timestamp', 'close']) as shared:
+            attached = attach_frame(shared.spec)
+            
+            pd.testing.assert_frame_equal(attached, bars[['timestamp', 'close']])
+            assert attach_frame(shared.spec) is attached
+    
+    def test_resolve_n_jobs(self):
+        """Test that non-positive values mean all cores."""
+        assert resolve_n_jobs(1) == 1
+        assert resolve_n_jobs(-1) == resolve_n_jobs(0) >= 1
@@ -0,0 +1,171 @@
+"""Tests for optimization result storage.
+
+This module tests:
+- Parquet and SQLite backends returning the same results
+- Top-N queries skipping row groups that cannot qualify
+- Typed parameter and metric columns
+- Parameters whose type changes between runs
+- Migrating an SQLite database into the columnar store
+"""
+import pytest
+import numpy as np
+import pyarrow.parquet as pq
+from datetime import datetime, timedelta
+
+from app.research.optimization import storage as storage_module
+from app.research.optimization.storage import OptimizationStorage, OptimizationResult
+
+
+def _results(n: int, seed: int = 0):
+    """Random results spread over two symbols and two timeframes."""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        OptimizationResult(
+            run_id=f"run-{seed}-{i}",
+            strategy_name="ma_crossover",
+            symbol=["BTC/USDT", "ETH/USDT"][i % 2],
+            timeframe=["1h", "4h"][(i // 2) % 2],
+            parameters={'fast_period': int(rng.integers(2, 20)), 'mode': ["ema", "sma"][i % 2]},
+            metrics={'sharpe_ratio': float(rng.normal()), 'total_trades': float(rng.integers(0, 50))},
+            score=float(rng.normal()),
+            timestamp=start + timedelta(minutes=i)
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """SQLite and Parquet storages holding the same results."""
+    sqlite_store = OptimizationStorage(str(tmp_path / "sqlite"))
+    parquet_store = OptimizationStorage(str(tmp_path / "parquet"), backend="parquet")
+    for batch in (_results(200, seed=0), _results(150, seed=1)):
+        sqlite_store.save_results_batch(batch)
+        parquet_store.save_results_batch(batch)
+    return sqlite_store, parquet_store
+
+
+def _dump(results):
+    return [r.model_dump() for r in results]
+
+
+class TestParquetBackend:
+    """Tests for the columnar storage backend."""
+    
+    def test_matches_sqlite(self, stores):
+        """Test that both backends return the same results for every query."""
+        sqlite_store, parquet_store = stores
+        
+        assert _dump(parquet_store.get_best_parameters("ma_crossover", "BTC/USDT", "1h", top_n=10)) == \
+            _dump(sqlite_store.get_best_parameters("ma_crossover", "BTC/USDT", "1h", top_n=10))
+        assert _dump(parquet_store.get_all_results(symbol="ETH/USDT", min_score=0.5)) == \
+            _dump(sqlite_store.get_all_results(symbol="ETH/USDT", min_score=0.5))
+        assert len(parquet_store.get_all_results()) == 350
+    
+    def test_top_n_prunes_row_groups(self, tmp_path, monkeypatch):
+        """Test that top-N reads only row groups whose max score can qualify."""
+        monkeypatch.setattr(storage_module, 'ROW_GROUP_SIZE', 10)
+        store = OptimizationStorage(str(tmp_path), backend="parquet")
+        results = [r.model_copy(update={'symbol': "BTC/USDT", 'timeframe': "1h"}) for r in _results(100)]
+        store.save_results_batch(results[:50])
+        store.save_results_batch(results[50:])
+        
+        reads = []
+        read_row_group = pq.ParquetFile.read_row_group
+        
+        def counting_read(self, i, *args, **kwargs):
+            reads.append(i)
+            return read_row_group(self, i, *args, **kwargs)
+        
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_group', counting_read)
+        best = store.get_best_parameters("ma_crossover", "BTC/USDT", "1h", top_n=5)
+        
+        assert [r.score for r in best] == sorted((r.score for r in results), reverse=True)[:5]
+        assert len(reads) <= 2
+    
+    def test_typed_columns(self, stores):
+        """Test that parameters and metrics are stored as typed columns."""
+        _, parquet_store = stores
+        
+        df = parquet_store.get_results_frame(strategy_name="ma_crossover")
+        
+        assert df['param_fast_period'].dtype == np.int64
+        assert df['param_mode'].dtype == object
+        assert df['metric_sharpe_ratio'].dtype == np.float64
+        assert df['score'].is_monotonic_decreasing
+    
+    def test_parameter_type_changes_between_runs(self, tmp_path):
+        """Test that a parameter saved as 'ema' by one run and 3 by another reads back unchanged."""
+        store = OptimizationStorage(str(tmp_path), backend="parquet")
+        results = [r.model_copy(update={'symbol': "BTC/USDT", 'timeframe': "1h"}) for r in _results(6)]
+        results[0].parameters['ma_type'] = "ema"
+        results[1].parameters['ma_type'] = 3
+        results[2].parameters['ma_type'] = None
+        results[3].parameters['ma_type'] = "sma"
+        results[4].parameters['ma_type'] = [5, 8]
+        
+        store.save_results_batch(results[:1])
+        store.save_results_batch(results[1:2])
+        store.save_results_batch(results[2:4])
+        store.save_results_batch(results[4:])
+        
+        expected = sorted(_dump(results), key=lambda r: r['score'], reverse=True)
+        for r in expected:
+            if r['parameters'].get('ma_type', 0) is None:
+                del r['parameters']['ma_type']
+        
+        assert _dump(store.get_all_results()) == expected
+        assert _dump(store.get_best_parameters("ma_crossover", "BTC/USDT", "1h", top_n=6)) == expected
+        frame = store.get_results_frame()
+        assert sorted(frame['param_ma_type'].dropna().astype(str)) == ['3', '[5, 8]', 'ema', 'sma']
+        assert frame['param_fast_period'].dtype == np.int64
+        
+        store.columnar.compact()
+        assert _dump(store.get_all_results()) == expected
+    
+    def test_mixed_parameter_types_in_one_batch(self, tmp_path):
+        """Test that one batch holding 'ema' and 3 for the same parameter is stored."""
+        store = OptimizationStorage(str(tmp_path), backend="parquet")
+        results = [r.model_copy(update={'symbol': "BTC/USDT", 'timeframe': "1h"}) for r in _results(2)]
+        results[0].parameters['ma_type'] = "ema"
+        results[1].parameters['ma_type'] = 3
+        
+        store.save_results_batch(results)
+        
+        assert {r.run_id: r.parameters['ma_type'] for r in store.get_all_results()} == {
+            results[0].run_id: "ema", results[1].run_id: 3
+        }
+    
+    def test_top_n_zero(self, stores):
+        """Test that asking for no results returns an empty list."""
+        _, parquet_store = stores
+        
+        assert parquet_store.get_best_parameters("ma_crossover", "BTC/USDT", "1h", top_n=0) == []
+    
+    def test_clear_and_compact(self, stores):
+        """Test that clearing drops one partition and compaction keeps every row."""
+        _, parquet_store = stores
+        before = parquet_store.get_best_parameters("ma_crossover", "ETH/USDT", "4h", top_n=3)
+        
+        parquet_store.clear_results(symbol="BTC/USDT")
+        removed = parquet_store.columnar.compact()
+        
+        assert removed == 2
+        assert {r.symbol for r in parquet_store.get_all_results()} == {"ETH/USDT"}
+        assert _dump(parquet_store.get_best_parameters("ma_crossover", "ETH/USDT", "4h", top_n=3)) == _dump(before)
+    
+    def test_migrate_from_sqlite(self, stores, tmp_path):
+        """Test that an SQLite database copies into the columnar store unchanged."""
+        sqlite_store, _ = stores
+        
+        copied = sqlite_store.migrate_to_parquet(batch_size=64)
+        migrated = OptimizationStorage(str(sqlite_store.storage_path), backend="parquet")
+        
+        assert copied == 350
+        assert _dump(migrated.get_all_results()) == _dump(sqlite_store.get_all_results())
+    
+    def test_unknown_backend_raises(self, tmp_path):
+        """Test that an unknown backend name raises."""
+        with pytest.raises(ValueError):
+            OptimizationStorage(str(tmp_path), backend="csv")
@@ -9,6 +9,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from app.research.backtest import rules
 from app.research.backtest.rules import (
     enforce_one_trade_per_day,
     filter_by_trading_windows,
@@ -242,6 +243,72 @@ class TestIntegrationRules:
         assert is_valid is True
 
 
+class TestRuleKernels:
+    """Tests for the array-based rule implementations."""
+    
+    @staticmethod
+    def _hourly(start: str, periods: int) -> pd.Series:
+        dates = pd.date_range(start, periods=periods, freq='h', tz='UTC')
+        return pd.Series([int(d.timestamp() * 1000) for d in dates])
+    
+    def test_same_side_signal_holds_position(self):
+        """Test that a repeated same-side signal keeps the position open for one bar."""
+        timestamps = self._hourly('2023-10-01 00:00', 6)
+        signals = pd.Series([1, 1, 1, 0, 1, 1])
+        
+        result = enforce_one_trade_per_day(signals, timestamps)
+        
+        # Only the first entry of the day is kept
+        assert list(result) == [1, 0, 0, 0, 0, 0]
+        assert result.dtype == np.int64
+    
+    def test_days_are_utc(self):
+        """Test that the day boundary is midnight UTC."""
+        timestamps = self._hourly('2023-10-01 22:00', 4)
+        signals = pd.Series([1, 0, 0, -1])
+        
+        result = enforce_one_trade_per_day(signals, timestamps)
+        
+        assert list(result) == [1, 0, 0, -1]
+    
+    def test_numpy_kernel_matches_numba(self, monkeypatch):
+        """Test that the pure Python and compiled kernels agree."""
+        rng = np.random.default_rng(7)
+        timestamps = self._hourly('2023-10-01', 500)
+        signals = pd.Series(rng.choice([-1, 0, 1], size=500))
+        
+        compiled = enforce_one_trade_per_day(signals, timestamps)
+        monkeypatch.setattr(rules, 'NUMBA_AVAILABLE', False)
+        interpreted = enforce_one_trade_per_day(signals, timestamps)
+        
+        pd.testing.assert_series_equal(compiled, interpreted)
+    
+    def test_window_filter_preserves_index(self):
+        """Test that filtering keeps the signal index and dtype."""
+        calendar = TradingCalendar()
+        timestamps = self._hourly('2023-10-01', 24)
+        timestamps.index = range(100, 124)
+        signals = pd.Series(1.0, index=range(100, 124))
+        
+        result = filter_by_trading_windows(signals, timestamps, calendar)
+        
+        assert list(result.index) == list(signals.index)
+        assert result.dtype == signals.dtype
+        # 10:00..15:00 UTC (A) and 17:00..20:00 UTC (B)
+        assert (result != 0).sum() == 10
+    
+    def test_forced_close_flattens_late_bars(self):
+        """Test that held positions are flattened at or after forced close."""
+        calendar = TradingCalendar()
+        timestamps = self._hourly('2023-10-01 18:00', 4)
+        signals = pd.Series([1, 1, 0, -1])
+        
+        result = apply_forced_close(signals, timestamps, calendar)
+        
+        # 16:45 local = 19:45 UTC
+        assert list(result) == [1, 1, 0, 0]
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
     
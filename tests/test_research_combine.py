@@ -0,0 +1,44 @@
+"""Tests for research.combine module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research.combine import logistic_model
+
+
+@pytest.fixture
+def inputs():
+    """Returns, momentum signals and a feature with NaN gaps."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0, 0.01, 1500))
+    signals = {
+        f"ma_{window}": np.sign(returns.rolling(window).mean().shift(1)).fillna(0)
+        for window in (5, 20, 60)
+    }
+    volatility = returns.rolling(20).std()
+    volatility.iloc[700:720] = np.nan
+    return signals, returns, pd.DataFrame({'volatility': volatility})
+
+
+class TestLogisticModel:
+    """Tests for the rolling logistic combiner."""
+    
+    def test_warm_start_matches_cold_fits(self, inputs):
+        """Test that warm-started refits converge to the cold-start probabilities."""
+        signals, returns, features = inputs
+        
+        cold = logistic_model(signals, returns, features, train_period=252, refit_frequency=21)
+        warm = logistic_model(signals, returns, features, train_period=252, refit_frequency=21, warm_start=True)
+        
+        pd.testing.assert_series_equal(cold.confidence.isna(), warm.confidence.isna())
+        np.testing.assert_allclose(warm.confidence, cold.confidence, atol=1e-3)
+        assert warm.weights == pytest.approx(cold.weights, abs=1e-3)
+        assert warm.metadata['warm_start'] is True
+    
+    def test_warm_start_with_sparse_refits(self, inputs):
+        """Test windows that do not overlap (refit_frequency > train_period)."""
+        signals, returns, features = inputs
+        
+        cold = logistic_model(signals, returns, features, train_period=100, refit_frequency=150)
+        warm = logistic_model(signals, returns, features, train_period=100, refit_frequency=150, warm_start=True)
+        
+        np.testing.assert_allclose(warm.confidence, cold.confidence, atol=1e-3)
@@ -0,0 +1,89 @@
+"""Tests for research.indicator_cache module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research import indicators
+from app.research.indicator_cache import indicator_cache, IndicatorCache
+from app.research.signals import generate_signal
+
+
+@pytest.fixture
+def df():
+    """Random walk OHLCV frame."""
+    rng = np.random.default_rng(2)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+    return pd.DataFrame({
+        'timestamp': np.arange(500) * 3600000,
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+class TestIndicatorCache:
+    """Tests for the scoped indicator memo."""
+    
+    def test_reuses_result_for_same_column(self, df):
+        """Test that repeated column access hits the cache."""
+        with indicator_cache() as cache:
+            first = indicators.ema(df['close'], 20)
+            second = indicators.ema(df['close'], period=20)
+        
+        assert second is first
+        assert cache.get_stats() == {'entries': 1, 'hits': 1, 'misses': 1}
+    
+    def test_defaults_share_entry(self, df):
+        """Test that explicit and default parameters map to one entry."""
+        with indicator_cache() as cache:
+            indicators.rsi(df['close'])
+            indicators.rsi(df['close'], 14)
+            indicators.rsi(df['close'], 21)
+        
+        assert cache.hits == 1
+        assert cache.misses == 2
+    
+    def test_different_data_misses(self, df):
+        """Test that other columns and slices are computed separately."""
+        with indicator_cache() as cache:
+            indicators.sma(df['close'], 10)
+            indicators.sma(df['open'].copy(), 10)
+            indicators.sma(df['close'].iloc[:-1], 10)
+        
+        assert cache.hits == 0
+        assert cache.misses == 3
+    
+    def test_no_caching_outside_block(self, df):
+        """Test that calls outside a block are computed every time."""
+        assert indicators.atr(df['high'], df['low'], df['close']) is not indicators.atr(df['high'], df['low'], df['close'])
+    
+    def test_nested_blocks_share_cache(self, df):
+        """Test that an inner block reuses the outer cache."""
+        with indicator_cache() as outer:
+            indicators.ema(df['close'], 10)
+            with indicator_cache() as inner:
+                indicators.ema(df['close'], 10)
+        
+        assert inner is outer
+        assert outer.hits == 1
+    
+    def test_strategies_share_indicators(self, df):
+        """Test that strategy signals are unchanged and shared primitives are reused."""
+        strategies = ["ma_crossover", "trend_following_ema", "ema_triple_momentum", "rsi_regime_pullback"]
+        expected = [generate_signal(name, df).signal for name in strategies]
+        
+        with indicator_cache() as cache:
+            results = [generate_signal(name, df).signal for name in strategies]
+        
+        for a, b in zip(expected, results):
+            pd.testing.assert_series_equal(a, b)
+        assert cache.hits > 0
+    
+    def test_fingerprint_tracks_buffer_and_index(self, df):
+        """Test that fingerprints differ for copies and re-indexed views."""
+        close = df['close']
+        
+        assert IndicatorCache.fingerprint(close) == IndicatorCache.fingerprint(df['close'])
+        assert IndicatorCache.fingerprint(close) != IndicatorCache.fingerprint(close.copy())
+        assert IndicatorCache.fingerprint(close) != IndicatorCache.fingerprint(close.reset_index(drop=True))
@@ -8,6 +8,8 @@ from app.research.indicators import (
     momentum, roc, obv, supertrend, keltner_channels,
     validate_series
 )
+from app.research import indicators
+from app.research.features import consecutive_closes, trend_strength, rolling_max_dd
 
 
 class TestIndicatorValidation:
@@ -128,6 +130,118 @@ class TestTrendIndicators:
         assert lower.iloc[2] == 98   # Min of first 3 lows
 
 
+class TestSupertrend:
+    """Tests for the compiled supertrend recursion."""
+    
+    @staticmethod
+    def _reference(upper, lower, close):
+        """Scalar reference implementation of the supertrend recursion."""
+        st = [upper[0]]
+        direction = [1]
+        for i in range(1, len(close)):
+            if np.isnan(upper[i]) or np.isnan(lower[i]):
+                st.append(st[-1])
+                direction.append(direction[-1])
+                continue
+            if close[i - 1] <= st[-1]:
+                value, d = upper[i], -1
+            else:
+                value, d = lower[i], 1
+            if d == 1 and close[i] < value:
+                value, d = upper[i], -1
+            elif d == -1 and close[i] > value:
+                value, d = lower[i], 1
+            st.append(value)
+            direction.append(d)
+        return np.array(st), np.array(direction, dtype=float)
+    
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_matches_reference(self, monkeypatch, numba_available):
+        """Test compiled and pure Python paths against the scalar recursion."""
+        if numba_available and not indicators.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(indicators, 'NUMBA_AVAILABLE', numba_available)
+        
+        rng = np.random.default_rng(4)
+        close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500))))
+        prev_close = close.shift(1).fillna(close.iloc[0])
+        high = np.maximum(close, prev_close) * 1.002
+        low = np.minimum(close, prev_close) * 0.998
+        
+        st, direction = supertrend(high, low, close, period=10, multiplier=0.5)
+        
+        atr_val = atr(high, low, close, 10)
+        upper = ((high + low) / 2 + 0.5 * atr_val).to_numpy()
+        lower = ((high + low) / 2 - 0.5 * atr_val).to_numpy()
+        expected_st, expected_direction = self._reference(upper, lower, close.to_numpy())
+        
+        np.testing.assert_array_equal(st.to_numpy(), expected_st)
+        np.testing.assert_array_equal(direction.to_numpy(), expected_direction)
+        assert set(direction.unique()) == {1.0, -1.0}
+
+
+class TestConsecutiveCloses:
+    """Tests for consecutive_closes."""
+    
+    def test_run_lengths(self):
+        """Test that counts grow along runs and reset on flat or NaN changes."""
+        close = pd.Series([10, 11, 12, 13, 12, 11, 11, 12, np.nan, 13, 14])
+        
+        up, down = consecutive_closes(close)
+        
+        assert up.tolist() == [0, 1, 2, 3, 0, 0, 0, 1, 0, 0, 1]
+        assert down.tolist() == [0, 0, 0, 0, 1, 2, 0, 0, 0, 0, 0]
+        assert up.dtype == np.int64
+
+
+class TestRollingFeatures:
+    """Tests for the closed-form rolling features against rolling().apply."""
+    
+    @pytest.fixture
+    def returns(self):
+        rng = np.random.default_rng(8)
+        returns = pd.Series(rng.normal(0, 0.02, 300))
+        returns.iloc[0] = np.nan
+        returns.iloc[150] = np.nan
+        return returns
+    
+    @pytest.mark.parametrize("period", [2, 5, 20, 64])
+    def test_trend_strength_matches_regression(self, returns, period):
+        """Test R-squared against a per-window correlation."""
+        close = 100 * (1 + returns.fillna(0)).cumprod()
+        close.iloc[200] = np.nan
+        
+        expected = close.rolling(period, min_periods=period).apply(
+            lambda w: np.corrcoef(np.arange(len(w)), w)[0, 1] ** 2, raw=True
+        )
+        
+        result = trend_strength(close, period)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+    
+    def test_trend_strength_flat_window_is_nan(self):
+        """Test that windows without price variance have no R-squared."""
+        close = pd.Series([100.0] * 10 + [101.0, 102.0, 103.0])
+        
+        result = trend_strength(close, period=5)
+        
+        assert result.iloc[4:10].isna().all()
+        assert result.iloc[12] == pytest.approx(0.9, abs=0.1)
+    
+    @pytest.mark.parametrize("period", [2, 7, 30, 64])
+    def test_rolling_max_dd_matches_window_scan(self, returns, period):
+        """Test rolling max drawdown against a per-window scan."""
+        cum_returns = (1 + returns).cumprod()
+        expected = cum_returns.rolling(period, min_periods=period).apply(
+            lambda w: ((w - np.maximum.accumulate(w)) / np.maximum.accumulate(w)).min(), raw=True
+        )
+        
+        result = rolling_max_dd(returns, period)
+        
+        np.testing.assert_allclose(result, expected)
+        assert (result.dropna() <= 0).all()
+
+
 class TestMACDIndicator:
     """Tests for MACD indicator."""
     
@@ -0,0 +1,114 @@
+"""Tests for research.streaming_indicators module.
+
+Each streaming indicator is fed bar by bar and compared with the batch
+function in research.indicators.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from app.research import indicators
+from app.research.streaming_indicators import (
+    StreamingEWM, StreamingRollingExtreme,
+    StreamingEMA, StreamingSMA, StreamingRSI, StreamingATR, StreamingADX,
+    StreamingMACD, StreamingBollingerBands, StreamingStochastic,
+    StreamingSupertrend, StreamingKeltnerChannels
+)
+
+
+@pytest.fixture(scope="module")
+def ohlc():
+    """Random walk with a flat stretch (zero ranges and zero variance)."""
+    rng = np.random.default_rng(0)
+    n = 1500
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    high = close * (1 + rng.uniform(0, 0.01, n))
+    low = close * (1 - rng.uniform(0, 0.01, n))
+    close[500:540] = high[500:540] = low[500:540] = close[500]
+    return pd.Series(high), pd.Series(low), pd.Series(close)
+
+
+def _stream(indicator, *columns) -> np.ndarray:
+    """Feed columns bar by bar and stack the outputs."""
+    values = [indicator.update(*bar) for bar in zip(*(c.to_numpy() for c in columns))]
+    return np.array(values, dtype=float).reshape(len(values), -1)
+
+
+def _assert_matches(batch, streamed):
+    """Assert streamed outputs equal the batch outputs (NaNs included)."""
+    if not isinstance(batch, tuple):
+        batch = (batch,)
+    expected = np.column_stack([np.asarray(b, dtype=float) for b in batch])
+    np.testing.assert_allclose(streamed, expected, rtol=1e-9, atol=1e-9)
+
+
+class TestStreamingMatchesBatch:
+    """Tests that streaming indicators reproduce the batch functions."""
+    
+    def test_ema(self, ohlc):
+        """Test streaming EMA against the batch function."""
+        _, _, close = ohlc
+        _assert_matches(indicators.ema(close, 20), _stream(StreamingEMA(20), close))
+    
+    def test_sma(self, ohlc):
+        """Test streaming SMA against the batch function."""
+        _, _, close = ohlc
+        _assert_matches(indicators.sma(close, 20), _stream(StreamingSMA(20), close))
+    
+    def test_rsi(self, ohlc):
+        """Test streaming RSI against the batch function."""
+        _, _, close = ohlc
+        _assert_matches(indicators.rsi(close, 14), _stream(StreamingRSI(14), close))
+    
+    def test_atr(self, ohlc):
+        """Test streaming ATR against the batch function."""
+        _assert_matches(indicators.atr(*ohlc, 14), _stream(StreamingATR(14), *ohlc))
+    
+    def test_adx(self, ohlc):
+        """Test streaming ADX against the batch function."""
+        _assert_matches(indicators.adx(*ohlc, 14), _stream(StreamingADX(14), *ohlc))
+    
+    def test_macd(self, ohlc):
+        """Test streaming MACD against the batch function."""
+        _, _, close = ohlc
+        _assert_matches(indicators.macd(close, 12, 26, 9), _stream(StreamingMACD(12, 26, 9), close))
+    
+    def test_bollinger_bands(self, ohlc):
+        """Test streaming Bollinger Bands against the batch function."""
+        _, _, close = ohlc
+        _assert_matches(indicators.bollinger_bands(close, 20, 2.0), _stream(StreamingBollingerBands(20, 2.0), close))
+    
+    def test_stochastic(self, ohlc):
+        """Test streaming Stochastic against the batch function."""
+        _assert_matches(indicators.stochastic(*ohlc, 14, 3), _stream(StreamingStochastic(14, 3), *ohlc))
+    
+    def test_supertrend(self, ohlc):
+        """Test streaming Supertrend against the batch function."""
+        _assert_matches(indicators.supertrend(*ohlc, 10, 3.0), _stream(StreamingSupertrend(10, 3.0), *ohlc))
+    
+    def test_keltner_channels(self, ohlc):
+        """Test streaming Keltner Channels against the batch function."""
+        _assert_matches(indicators.keltner_channels(*ohlc, 20, 2.0), _stream(StreamingKeltnerChannels(20, 2.0), *ohlc))
+
+
+class TestStreamingPrimitives:
+    """Tests for the streaming building blocks."""
+    
+    def test_ewm_carries_through_nan(self):
+        """Test that NaN gaps are weighted like pandas ewm(ignore_na=False)."""
+        values = pd.Series([1.0, np.nan, np.nan, 4.0, 2.0, np.nan, 7.0])
+        expected = values.ewm(span=3, adjust=False, min_periods=2).mean()
+        
+        ewm = StreamingEWM(3, min_periods=2)
+        streamed = [ewm.update(v) for v in values]
+        
+        np.testing.assert_allclose(streamed, expected)
+    
+    def test_rolling_extreme_with_nan(self):
+        """Test rolling max/min against pandas, NaN windows included."""
+        values = pd.Series([3.0, 1.0, np.nan, 5.0, 4.0, 2.0, 2.0, 6.0, 1.0])
+        
+        for mode in ("max", "min"):
+            expected = getattr(values.rolling(3, min_periods=3), mode)()
+            extreme = StreamingRollingExtreme(3, mode)
+            streamed = [extreme.update(v) for v in values]
+            np.testing.assert_allclose(streamed, expected)
@@ -0,0 +1,94 @@
+"""Tests for service.strategy_orchestrator module."""
+import pytest
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from app.research.backtest.result_cache import BacktestResultCache
+from app.service.strategy_orchestrator import StrategyOrchestrator
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    """Orchestrator reading random-walk bars (none for 1d)."""
+    rng = np.random.default_rng(4)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 800)))
+    bars = pd.DataFrame({
+        'timestamp': 1704067200000 + np.arange(800) * 3600000,
+        'open': close,
+        'high': close * 1.005,
+        'low': close * 0.995,
+        'close': close,
+        'volume': 1.0
+    })
+    frames = {'1h': bars, '4h': bars.iloc[::4].reset_index(drop=True), '1d': bars.iloc[:50]}
+    
+    # Run every backtest (tests opt in to a cache of their own)
+    monkeypatch.setattr('app.research.backtest.result_cache._backtest_cache', BacktestResultCache(enabled=False))
+    
+    orchestrator = StrategyOrchestrator(capital=10000.0)
+    monkeypatch.setattr(orchestrator, '_load_data', lambda symbol, timeframe, end_date=None: frames[timeframe])
+    return orchestrator
+
+
+class TestBacktestGrid:
+    """Tests for run_backtest_grid."""
+    
+    def test_tasks_timed_per_timeframe_and_strategy(self, orchestrator):
+        """Test that every (timeframe, strategy) task is timed and short timeframes are skipped."""
+        results, task_times = orchestrator.run_backtest_grid("BTC/USDT", ["1h", "4h", "1d"])
+        
+        names = [s.name for s in orchestrator.STRATEGY_REGISTRY]
+        assert list(task_times) == [f"{tf}/{name}" for tf in ["1h", "4h"] for name in names]
+        assert all(seconds >= 0 for seconds in task_times.values())
+        assert {r.timeframe for r in results} <= {"1h", "4h"}
+    
+    def test_parallel_matches_serial(self, orchestrator, monkeypatch):
+        """Test that the process pool returns the serial results in the same order."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        
+        serial, _ = orchestrator.run_backtest_grid("BTC/USDT", ["1h", "4h"])
+        parallel, task_times = orchestrator.run_backtest_grid("BTC/USDT", ["1h", "4h"], n_jobs=2)
+        
+        exclude = {'timestamp'}
+        assert [r.model_dump(exclude=exclude) for r in serial] == [r.model_dump(exclude=exclude) for r in parallel]
+        assert len(task_times) == 2 * len(orchestrator.STRATEGY_REGISTRY)
+    
+    def test_progress_reported_per_task(self, orchestrator, monkeypatch):
+        """Test that serial and parallel grids report progress after every task."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        total = 2 * len(orchestrator.STRATEGY_REGISTRY)
+        
+        for n_jobs in (1, 2):
+            reports = []
+            orchestrator.run_backtest_grid(
+                "BTC/USDT", ["1h", "4h"], n_jobs=n_jobs,
+                progress=lambda fraction, message: reports.append((fraction, message))
+            )
+            
+            assert [fraction for fraction, _ in reports] == [done / total for done in range(1, total + 1)]
+            assert reports[-1][1].endswith(f"({total}/{total})")
+    
+    def test_shared_executor_left_running(self, orchestrator):
+        """Test that a caller's pool gets the grid tasks and stays usable for other symbols."""
+        serial, _ = orchestrator.run_backtest_grid("BTC/USDT", ["1h"])
+        
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            first, _ = orchestrator.run_backtest_grid("BTC/USDT", ["1h"], executor=pool)
+            second, _ = orchestrator.run_backtest_grid("ETH/USDT", ["1h"], executor=pool)
+        
+        exclude = {'timestamp'}
+        assert [r.model_dump(exclude=exclude) for r in first] == [r.model_dump(exclude=exclude) for r in serial]
+        assert len(second) == len(first)
+    
+    def test_repeated_backtests_served_from_cache(self, orchestrator, monkeypatch, tmp_path):
+        """Test that unchanged bars reuse the previous results."""
+        cache = BacktestResultCache(tmp_path)
+        monkeypatch.setattr('app.research.backtest.result_cache._backtest_cache', cache)
+        
+        first = orchestrator.run_all_backtests("BTC/USDT", "1h")
+        second = orchestrator.run_all_backtests("BTC/USDT", "1h")
+        
+        exclude = {'timestamp'}
+        n_strategies = len(orchestrator.STRATEGY_REGISTRY)
+        assert [r.model_dump(exclude=exclude) for r in second] == [r.model_dump(exclude=exclude) for r in first]
+        assert (cache.stats()['misses'], cache.stats()['hits']) == (n_strategies, n_strategies)
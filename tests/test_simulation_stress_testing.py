@@ -0,0 +1,194 @@
+"""Tests for simulation.stress_testing module."""
+import pytest
+import pandas as pd
+import numpy as np
+from app.simulation.stress_testing import StressTestEngine, ShockScenario, ShockType
+
+
+STRATEGIES = ["ma_crossover", "rsi_regime_pullback", "trend_following_ema"]
+
+
+@pytest.fixture
+def bars():
+    """Random-walk hourly OHLCV bars."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600)))
+    return pd.DataFrame({
+        'timestamp': np.arange(600) * 3600000,
+        'open': close,
+        'high': close * 1.005,
+        'low': close * 0.995,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+def _reference_shock(df: pd.DataFrame, returns: list, start_idx: int, recovery_bars: int) -> pd.DataFrame:
+    """Apply shock returns and a linear recovery bar by bar."""
+    shocked = df.copy()
+    shock_end_idx = start_idx + len(returns)
+    end_idx = shock_end_idx + recovery_bars
+    
+    for i, shock_return in zip(range(start_idx, shock_end_idx), returns):
+        shocked.loc[i, 'close'] = shocked.loc[i - 1, 'close'] * (1 + shock_return)
+    
+    shocked_close = shocked.loc[shock_end_idx - 1, 'close']
+    for i in range(shock_end_idx, end_idx):
+        progress = (i - shock_end_idx + 1) / recovery_bars
+        shocked.loc[i, 'close'] = shocked_close + (df.loc[start_idx, 'close'] - shocked_close) * progress
+    
+    for i in range(start_idx, end_idx):
+        shocked.loc[i, 'open'] = shocked.loc[i - 1, 'close']
+        shocked.loc[i, 'high'] = shocked.loc[i, 'close'] * 1.01
+        shocked.loc[i, 'low'] = shocked.loc[i, 'close'] * 0.99
+    
+    return shocked
+
+
+class TestShockApplication:
+    """Tests for apply_shock_to_data."""
+    
+    def test_crash_matches_bar_by_bar_reference(self, bars):
+        """Test the cumulative crash path and linear recovery against a per-bar loop."""
+        scenario = ShockScenario(
+            name="crash", shock_type=ShockType.CRASH, price_change_pct=-0.2, duration_bars=5, recovery_bars=10
+        )
+        returns = [-0.2 * step / 5 for step in range(1, 6)]
+        
+        shocked = StressTestEngine().apply_shock_to_data(bars, scenario, 300)
+        
+        pd.testing.assert_frame_equal(shocked, _reference_shock(bars, returns, 300, 10))
+    
+    def test_shock_truncated_at_end_of_data(self, bars):
+        """Test that shocks running past the last bar are cut off."""
+        scenario = ShockScenario(
+            name="decline", shock_type=ShockType.GRADUAL_DECLINE, price_change_pct=-0.3, duration_bars=50
+        )
+        
+        shocked = StressTestEngine().apply_shock_to_data(bars, scenario, 590)
+        
+        pd.testing.assert_frame_equal(shocked, _reference_shock(bars, [-0.3 / 50] * 10, 590, 0))
+        pd.testing.assert_frame_equal(shocked.iloc[:590], bars.iloc[:590])
+
+
+class TestStressTestEngine:
+    """Tests for strategy evaluation under shocks."""
+    
+    def test_unknown_strategy_fails(self, bars):
+        """Test that a strategy without signals is reported as not surviving."""
+        engine = StressTestEngine()
+        
+        results = engine.evaluate_shocked_data(bars, ["ma_crossover", "missing"], engine.standard_scenarios[0])
+        
+        assert [r.strategy_name for r in results] == ["ma_crossover", "missing"]
+        assert results[1].survived is False
+        assert results[1].final_capital == 0.0
+    
+    def test_scenario_frame_shared_by_strategies(self, bars, monkeypatch):
+        """Test that each scenario's shocked data is built once for all strategies."""
+        engine = StressTestEngine()
+        calls = []
+        apply_shock = engine.apply_shock_to_data
+        
+        def counting_apply_shock(df, scenario, start_idx):
+            calls.append(scenario.name)
+            return apply_shock(df, scenario, start_idx)
+        
+        monkeypatch.setattr(engine, 'apply_shock_to_data', counting_apply_shock)
+        
+        report = engine.run_comprehensive_stress_test(bars, STRATEGIES)
+        
+        assert calls == [scenario.name for scenario in engine.standard_scenarios]
+        assert len(report.results) == len(STRATEGIES) * len(engine.standard_scenarios)
+        assert [r.strategy_name for r in report.results[:6]] == ["ma_crossover"] * 6
+    
+    def test_parallel_matches_serial(self, bars, monkeypatch):
+        """Test that evaluating scenarios in a process pool gives the serial report."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        engine = StressTestEngine()
+        
+        np.random.seed(3)
+        serial = engine.run_comprehensive_stress_test(bars, STRATEGIES)
+        np.random.seed(3)
+        parallel = engine.run_comprehensive_stress_test(bars, STRATEGIES, n_jobs=2)
+        
+        assert [r.model_dump() for r in serial.results] == [r.model_dump() for r in parallel.results]
+        assert serial.strategy_rankings == parallel.strategy_rankings
+
+
+class TestPlacementSweep:
+    """Tests for run_placement_sweep."""
+    
+    def test_placements_leave_room_for_shock(self):
+        """Test that placements are distinct, sorted and keep the shock inside the data."""
+        engine = StressTestEngine()
+        scenario = engine.standard_scenarios[0]
+        
+        starts = engine.sample_shock_placements(600, scenario, 200, np.random.default_rng(0))
+        
+        assert len(set(starts)) == 200
+        assert (np.diff(starts) > 0).all()
+        assert starts.min() >= 150
+        assert starts.max() <= 600 - scenario.duration_bars
+    
+    def test_no_room_raises(self):
+        """Test that a shock longer than the available data raises."""
+        engine = StressTestEngine()
+        scenario = ShockScenario(name="long", shock_type=ShockType.GRADUAL_DECLINE, price_change_pct=-0.3, duration_bars=500)
+        
+        with pytest.raises(ValueError):
+            engine.sample_shock_placements(600, scenario, 10, np.random.default_rng(0))
+    
+    def test_sweep_summarizes_each_placement(self, bars):
+        """Test that the sweep distribution matches single stress tests at the same placements."""
+        engine = StressTestEngine()
+        scenario = engine.standard_scenarios[0]
+        
+        sweep = engine.run_placement_sweep(bars, STRATEGIES[:2], scenario, num_placements=20, seed=1)
+        
+        assert [s.strategy_name for s in sweep] == STRATEGIES[:2]
+        for summary in sweep:
+            single = [engine.run_stress_test(bars, summary.strategy_name, scenario, start) for start in summary.start_indices]
+            assert summary.max_drawdowns == [r.max_drawdown for r in single]
+            assert summary.survival_probability == np.mean([r.survived for r in single])
+            assert summary.worst_max_drawdown == min(summary.max_drawdowns)
+    
+    def test_failed_placements_excluded(self, bars, monkeypatch):
+        """Test that placements a strategy failed on are counted but not in its statistics."""
+        engine = StressTestEngine()
+        scenario = engine.standard_scenarios[0]
+        evaluate = engine.evaluate_shocked_data
+        calls = []
+        
+        def flaky_evaluate(df_shocked, strategies, scenario):
+            calls.append(1)
+            results = evaluate(df_shocked, strategies, scenario)
+            if len(calls) % 2 == 0:
+                results[0] = engine._failed_result(strategies[0], scenario, "backtest failed")
+            return results
+        
+        monkeypatch.setattr(engine, 'evaluate_shocked_data', flaky_evaluate)
+        
+        flaky, missing = engine.run_placement_sweep(bars, ["ma_crossover", "missing"], scenario, num_placements=10, seed=1)
+        
+        assert flaky.num_placements == 10
+        assert flaky.failed == 5
+        assert len(flaky.start_indices) == len(flaky.max_drawdowns) == 5
+        assert -1.0 not in flaky.max_drawdowns
+        assert 0.0 not in flaky.final_capitals
+        assert flaky.mean_max_drawdown == pytest.approx(np.mean(flaky.max_drawdowns))
+        
+        assert missing.failed == 10
+        assert missing.max_drawdowns == []
+        assert np.isnan(missing.survival_probability)
+    
+    def test_parallel_sweep_matches_serial(self, bars, monkeypatch):
+        """Test that seeded sweeps with random shocks do not depend on n_jobs."""
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        engine = StressTestEngine()
+        scenario = engine.standard_scenarios[2]
+        
+        serial = engine.run_placement_sweep(bars, STRATEGIES, scenario, num_placements=16, seed=5)
+        parallel = engine.run_placement_sweep(bars, STRATEGIES, scenario, num_placements=16, seed=5, n_jobs=2)
+        
+        assert [s.model_dump() for s in serial] == [s.model_dump() for s in parallel]
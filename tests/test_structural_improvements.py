@@ -66,8 +66,8 @@ class TestHomogeneousDataLoading:
             'volume': [1000.0] * 365
         })
         
-        with patch.object(orchestrator.store, 'read_bars') as mock_read:
-            mock_read.return_value = [Mock(to_dict=lambda: mock_df.iloc[0].to_dict()) for _ in range(365)]
+        with patch('app.service.strategy_orchestrator.read_frame') as mock_read:
+            mock_read.return_value = mock_df
             
             df = orchestrator._load_data("BTC/USDT", "1d", datetime.now())
             
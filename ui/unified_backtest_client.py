@@ -5,6 +5,7 @@ ensuring the UI uses the same engine as the API.
 """
 import requests
 import json
+import time
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 import logging
@@ -28,6 +29,49 @@ class UnifiedBacktestClient:
             'Accept': 'application/json'
         })
     
+    @staticmethod
+    def _build_request_data(
+        symbol: str,
+        timeframe: str,
+        strategy: str,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        initial_capital: float = 10000.0,
+        risk_per_trade: float = 0.02,
+        commission: float = 0.001,
+        slippage: float = 0.0005,
+        use_trading_windows: bool = True,
+        force_close: bool = True,
+        one_trade_per_day: bool = True,
+        atr_sl_multiplier: float = 2.0,
+        atr_tp_multiplier: float = 3.0,
+        atr_period: int = 14
+    ) -> Dict[str, Any]:
+        """Build the JSON body of a backtest request."""
+        request_data = {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "strategy": strategy,
+            "initial_capital": initial_capital,
+            "risk_per_trade": risk_per_trade,
+            "commission": commission,
+            "slippage": slippage,
+            "use_trading_windows": use_trading_windows,
+            "force_close": force_close,
+            "one_trade_per_day": one_trade_per_day,
+            "atr_sl_multiplier": atr_sl_multiplier,
+            "atr_tp_multiplier": atr_tp_multiplier,
+            "atr_period": atr_period
+        }
+        
+        # Add dates if provided
+        if from_date:
+            request_data["from_date"] = from_date.isoformat()
+        if to_date:
+            request_data["to_date"] = to_date.isoformat()
+        
+        return request_data
+    
     def run_backtest(
         self,
         symbol: str,
@@ -69,28 +113,19 @@ class UnifiedBacktestClient:
             Backtest results or None if failed
         """
         try:
-            # Prepare request data
-            request_data = {
-                "symbol": symbol,
-                "timeframe": timeframe,
-                "strategy": strategy,
-                "initial_capital": initial_capital,
-                "risk_per_trade": risk_per_trade,
-                "commission": commission,
-                "slippage": slippage,
-                "use_trading_windows": use_trading_windows,
-                "force_close": force_close,
-                "one_trade_per_day": one_trade_per_day,
-                "atr_sl_multiplier": atr_sl_multiplier,
-                "atr_tp_multiplier": atr_tp_multiplier,
-                "atr_period": atr_period
-            }
-            
-            # Add dates if provided
-            if from_date:
-                request_data["from_date"] = from_date.isoformat()
-            if to_date:
-                request_data["to_date"] = to_date.isoformat()
+            request_data = self._build_request_data(
+                symbol, timeframe, strategy, from_date, to_date,
+                initial_capital=initial_capital,
+                risk_per_trade=risk_per_trade,
+                commission=commission,
+                slippage=slippage,
+                use_trading_windows=use_trading_windows,
+                force_close=force_close,
+                one_trade_per_day=one_trade_per_day,
+                atr_sl_multiplier=atr_sl_multiplier,
+                atr_tp_multiplier=atr_tp_multiplier,
+                atr_period=atr_period
+            )
             
             # Make API request
             response = self.session.post(
@@ -169,19 +204,132 @@ class UnifiedBacktestClient:
         Returns:
             Dictionary mapping strategy names to results
         """
+        # Queue every backtest first so the server runs them concurrently
+        job_ids = {}
+        for strategy in strategies:
+            logger.info(f"Queueing backtest for {strategy}")
+            job_ids[strategy] = self.submit_backtest_job(symbol, timeframe, strategy, **kwargs)
+        
         results = {}
+        for strategy, job_id in job_ids.items():
+            if job_id is None:
+                # Job API unavailable: run synchronously
+                results[strategy] = self.run_backtest(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    strategy=strategy,
+                    **kwargs
+                )
+            else:
+                results[strategy] = self.wait_for_job(job_id)
+            
+        return results
+    
+    def submit_backtest_job(
+        self,
+        symbol: str,
+        timeframe: str,
+        strategy: str,
+        **kwargs
+    ) -> Optional[str]:
+        """Queue a backtest on the server without waiting for it.
         
-        for strategy in strategies:
-            logger.info(f"Running backtest for {strategy}")
-            result = self.run_backtest(
-                symbol=symbol,
-                timeframe=timeframe,
-                strategy=strategy,
-                **kwargs
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            strategy: Strategy name
+            **kwargs: Additional backtest parameters (see run_backtest)
+        
+        Returns:
+            Job id or None if the job could not be queued
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/backtest/jobs",
+                json=self._build_request_data(symbol, timeframe, strategy, **kwargs),
+                timeout=30
             )
-            results[strategy] = result
             
-        return results
+            if response.status_code == 202:
+                return response.json()["job_id"]
+            else:
+                logger.error(f"Backtest job submission failed: {response.status_code} - {response.text}")
+                return None
+        
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API request failed: {e}")
+            return None
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job's status, progress and result.
+        
+        Args:
+            job_id: Job identifier
+        
+        Returns:
+            Job data or None if not found
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/jobs/{job_id}", timeout=10)
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Failed to get job {job_id}: {response.status_code}")
+                return None
+        
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API request failed: {e}")
+            return None
+    
+    def wait_for_job(
+        self,
+        job_id: str,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Poll a job until it finishes.
+        
+        Args:
+            job_id: Job identifier
+            poll_interval: Seconds between polls
+            timeout: Seconds to wait before giving up (None = no limit)
+        
+        Polling errors other than 404 (e.g. a 503 while the API restarts)
+        are retried until the timeout.
+        
+        Returns:
+            Job result or None if the job failed, was cancelled, was not
+            found or timed out
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        
+        while True:
+            try:
+                response = self.session.get(f"{self.base_url}/jobs/{job_id}", timeout=10)
+                
+                if response.status_code == 404:
+                    logger.error(f"Job {job_id} not found")
+                    return None
+                
+                if response.status_code == 200:
+                    job = response.json()
+                    if job["status"] == "succeeded":
+                        return job["result"]
+                    if job["status"] in ("failed", "cancelled"):
+                        logger.error(f"Job {job_id} {job['status']}: {job.get('error')}")
+                        return None
+                else:
+                    logger.warning(f"Polling job {job_id} failed: {response.status_code}, retrying")
+            
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Polling job {job_id} failed: {e}, retrying")
+            
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.error(f"Timed out waiting for job {job_id}")
+                return None
+            
+            time.sleep(poll_interval)
     
     def compare_strategies(
         self,